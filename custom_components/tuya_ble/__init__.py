@@ -4,20 +4,27 @@ from __future__ import annotations
 
 import logging
 
-from bleak_retry_connector import BLEAK_RETRY_EXCEPTIONS as BLEAK_EXCEPTIONS, get_device
+from bleak_retry_connector import BLEAK_RETRY_EXCEPTIONS as BLEAK_EXCEPTIONS
 
 from homeassistant.components import bluetooth
-from homeassistant.components.bluetooth.match import ADDRESS, BluetoothCallbackMatcher
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_ADDRESS, EVENT_HOMEASSISTANT_STOP, Platform
-from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.core import Event, HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
 
 from .tuya_ble import TuyaBLEDevice
 
 from .cloud import HASSTuyaBLEDeviceManager
-from .const import DOMAIN
+from .const import (
+    CONF_HEARTBEAT,
+    CONF_HISTORY_DEPTH,
+    CONF_WORKER,
+    DEFAULT_HISTORY_DEPTH,
+    DOMAIN,
+)
 from .devices import TuyaBLECoordinator, TuyaBLEData, get_device_product_info
+from .scanning import TuyaBLEScanning, async_get_client_source, async_get_routes
+from .startup import async_get_startup
 
 PLATFORMS: list[Platform] = [
     Platform.BUTTON,
@@ -30,6 +37,7 @@ PLATFORMS: list[Platform] = [
     Platform.SWITCH,
     Platform.TEXT,
     Platform.COVER,
+    Platform.UPDATE,
 ]
 
 _LOGGER = logging.getLogger(__name__)
@@ -37,17 +45,36 @@ _LOGGER = logging.getLogger(__name__)
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Tuya BLE from a config entry."""
-    address: str = entry.data[CONF_ADDRESS]
-    ble_device = bluetooth.async_ble_device_from_address(
-        hass, address.upper(), True
-    ) or await get_device(address)
-    if not ble_device:
-        raise ConfigEntryNotReady(
-            f"Could not find Tuya BLE device with address {address}"
-        )
+    address: str = entry.data[CONF_ADDRESS].upper()
+    # The BLE device is attached by the advertisement callback
+    # when bluetooth has not seen it yet
+    ble_device = bluetooth.async_ble_device_from_address(hass, address, True)
     manager = HASSTuyaBLEDeviceManager(hass, entry.options.copy())
-    device = TuyaBLEDevice(manager, ble_device)
-    await device.initialize()
+    device: TuyaBLEDevice | None = None
+    worker_adapter: str | None = None
+    if entry.options.get(CONF_WORKER, False):
+        device, worker_adapter = await _async_create_remote_device(
+            hass, entry, manager, address
+        )
+    if device is None:
+        device = TuyaBLEDevice(manager, ble_device or address)
+        device.set_route_provider(
+            lambda: async_get_routes(hass, address),
+            lambda client: async_get_client_source(hass, client),
+        )
+    device.datapoints.enable_history(
+        entry.options.get(CONF_HISTORY_DEPTH, DEFAULT_HISTORY_DEPTH)
+    )
+    device.enable_heartbeat(entry.options.get(CONF_HEARTBEAT, False))
+    has_credentials = manager.has_credentials()
+    if has_credentials:
+        await device.initialize()
+    else:
+        entry.async_create_background_task(
+            hass,
+            _async_fetch_credentials(hass, entry, manager),
+            f"{DOMAIN} credentials {address}",
+        )
     product_info = get_device_product_info(device)
 
     coordinator = TuyaBLECoordinator(hass, device)
@@ -60,26 +87,17 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             f"Could not communicate with Tuya BLE device with address {address}"
         ) from ex
     """
-    hass.add_job(device.update())
-
-    @callback
-    def _async_update_ble(
-        service_info: bluetooth.BluetoothServiceInfoBleak,
-        change: bluetooth.BluetoothChange,
-    ) -> None:
-        """Update from a ble callback."""
-        device.set_ble_device_and_advertisement_data(
-            service_info.device, service_info.advertisement
-        )
-
-    entry.async_on_unload(
-        bluetooth.async_register_callback(
-            hass,
-            _async_update_ble,
-            BluetoothCallbackMatcher({ADDRESS: address}),
-            bluetooth.BluetoothScanningMode.ACTIVE,
-        )
-    )
+    if has_credentials:
+        startup = async_get_startup(hass)
+        startup.async_add(device)
+        entry.async_on_unload(lambda: startup.async_remove(device))
+    if has_credentials and coordinator.poller:
+        coordinator.poller.start()
+        entry.async_on_unload(coordinator.poller.stop)
+
+    scanning = TuyaBLEScanning(hass, device)
+    scanning.start()
+    entry.async_on_unload(scanning.stop)
 
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = TuyaBLEData(
         entry.title,
@@ -87,6 +105,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         product_info,
         manager,
         coordinator,
+        worker_adapter,
     )
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
@@ -102,11 +121,60 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return True
 
 
+async def _async_create_remote_device(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    manager: HASSTuyaBLEDeviceManager,
+    address: str,
+) -> tuple[TuyaBLEDevice | None, str | None]:
+    """Device run by the worker of the local adapter hearing it best.
+
+    Returns None when no local adapter heard the device, it is run in Home
+    Assistant then.
+    """
+    # Imported only when enabled, the worker pulls in the gateway and bleak
+    from .tuya_ble.worker import TuyaBLERemoteDevice
+    from .workers import async_get_workers
+
+    workers = async_get_workers(hass)
+    adapter = workers.async_adapter(address)
+    if adapter is None:
+        _LOGGER.warning(
+            "%s: Not heard by a local adapter, running it without a worker process",
+            address,
+        )
+        return None, None
+    worker = await workers.async_get(adapter)
+    entry.async_on_unload(lambda: hass.async_create_task(workers.async_release(worker)))
+    return TuyaBLERemoteDevice(worker, manager, address), adapter
+
+
+async def _async_fetch_credentials(
+    hass: HomeAssistant, entry: ConfigEntry, manager: HASSTuyaBLEDeviceManager
+) -> None:
+    """Fetch missing credentials from the cloud and reload the entry with them."""
+    address: str = entry.data[CONF_ADDRESS].upper()
+    credentials = await manager.get_device_credentials(address, False, True)
+    if credentials is None:
+        _LOGGER.warning("%s: Credentials not found in the Tuya cloud", address)
+        return
+    hass.config_entries.async_update_entry(entry, options=manager.data)
+    # Not bound to the entry, the reload cancels its background tasks
+    hass.async_create_task(hass.config_entries.async_reload(entry.entry_id))
+
+
 async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Handle options update."""
     data: TuyaBLEData = hass.data[DOMAIN][entry.entry_id]
-    if entry.title != data.title:
+    if (
+        entry.title != data.title
+        or entry.options.get(CONF_HISTORY_DEPTH)
+        != data.manager.data.get(CONF_HISTORY_DEPTH)
+        or entry.options.get(CONF_WORKER) != data.manager.data.get(CONF_WORKER)
+    ):
         await hass.config_entries.async_reload(entry.entry_id)
+    else:
+        data.device.enable_heartbeat(entry.options.get(CONF_HEARTBEAT, False))
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
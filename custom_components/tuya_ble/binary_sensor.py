@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import cache
 
 import logging
 from typing import Callable
@@ -56,68 +57,71 @@ class TuyaBLECategoryBinarySensorMapping:
     mapping: list[TuyaBLEBinarySensorMapping] | None = None
 
 
-mapping: dict[str, TuyaBLECategoryBinarySensorMapping] = {
-    "dcb": TuyaBLECategoryBinarySensorMapping(
-        products={
-            **dict.fromkeys(
-                [
-                    "ajrhf1aj",
-                    "z5ztlw3k",
-                ],  # PARKSIDE Smart battery
-                [
-                    TuyaBLEBinarySensorMapping(
-                        dp_id=171,
-                        description=BinarySensorEntityDescription(
-                            key="cw_or_ccw_display",
-                            icon="mdi:rotate-3d-variant",
+@cache
+def _build_mapping() -> dict[str, TuyaBLECategoryBinarySensorMapping]:
+    """Mappings of all categories, built on first lookup."""
+    return {
+        "dcb": TuyaBLECategoryBinarySensorMapping(
+            products={
+                **dict.fromkeys(
+                    [
+                        "ajrhf1aj",
+                        "z5ztlw3k",
+                    ],  # PARKSIDE Smart battery
+                    [
+                        TuyaBLEBinarySensorMapping(
+                            dp_id=171,
+                            description=BinarySensorEntityDescription(
+                                key="cw_or_ccw_display",
+                                icon="mdi:rotate-3d-variant",
+                            ),
                         ),
-                    ),
-                ],
-            ),
-        },
-    ),
-    "wk": TuyaBLECategoryBinarySensorMapping(
-        products={
-            **dict.fromkeys(
-                [
-                    "drlajpqc",
-                    "nhj2j7su",
-                    "zmachryv",
-                ],
-                [  # Thermostatic Radiator Valve
-                    TuyaBLEBinarySensorMapping(
-                        dp_id=105,
-                        description=BinarySensorEntityDescription(
-                            key="battery",
-                            # icon="mdi:battery-alert",
-                            device_class=BinarySensorDeviceClass.BATTERY,
-                            entity_category=EntityCategory.DIAGNOSTIC,
+                    ],
+                ),
+            },
+        ),
+        "wk": TuyaBLECategoryBinarySensorMapping(
+            products={
+                **dict.fromkeys(
+                    [
+                        "drlajpqc",
+                        "nhj2j7su",
+                        "zmachryv",
+                    ],
+                    [  # Thermostatic Radiator Valve
+                        TuyaBLEBinarySensorMapping(
+                            dp_id=105,
+                            description=BinarySensorEntityDescription(
+                                key="battery",
+                                # icon="mdi:battery-alert",
+                                device_class=BinarySensorDeviceClass.BATTERY,
+                                entity_category=EntityCategory.DIAGNOSTIC,
+                            ),
+                        )
+                    ],
+                ),
+            },
+        ),
+        "ms": TuyaBLECategoryBinarySensorMapping(
+            products={
+                **dict.fromkeys(
+                    ["okkyfgfs"],  # Smart Lock
+                    [
+                        TuyaBLEBinarySensorMapping(
+                            dp_id=47,
+                            description=BinarySensorEntityDescription(
+                                key="lock_motor_state",
+                            ),
                         ),
-                    )
-                ],
-            ),
-        },
-    ),
-    "ms": TuyaBLECategoryBinarySensorMapping(
-        products={
-            **dict.fromkeys(
-                ["okkyfgfs"],  # Smart Lock
-                [
-                    TuyaBLEBinarySensorMapping(
-                        dp_id=47,
-                        description=BinarySensorEntityDescription(
-                            key="lock_motor_state",
-                        ),
-                    ),
-                ],
-            ),
-        }
-    ),
-}
+                    ],
+                ),
+            }
+        ),
+    }
 
 
 def get_mapping_by_device(device: TuyaBLEDevice) -> list[TuyaBLEBinarySensorMapping]:
-    category = mapping.get(device.category)
+    category = _build_mapping().get(device.category)
     if category is not None and category.products is not None:
         product_mapping = category.products.get(device.product_id)
         if product_mapping is not None:
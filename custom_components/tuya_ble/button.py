@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from functools import cache
 
 import logging
 from typing import Callable
@@ -80,134 +81,137 @@ class TuyaBLECategoryButtonMapping:
     mapping: list[TuyaBLEButtonMapping] | None = None
 
 
-mapping: dict[str, TuyaBLECategoryButtonMapping] = {
-    "dcb": TuyaBLECategoryButtonMapping(
-        products={
-            **dict.fromkeys(
-                ["ajrhf1aj", "z5ztlw3k"],  # PARKSIDE Smart battery
-                [
-                    TuyaBLEButtonMapping(
-                        dp_id=115,
-                        description=ButtonEntityDescription(
-                            key="battery_finder",
-                            icon="mdi:find-replace",
-                            entity_category=EntityCategory.DIAGNOSTIC,
+@cache
+def _build_mapping() -> dict[str, TuyaBLECategoryButtonMapping]:
+    """Mappings of all categories, built on first lookup."""
+    return {
+        "dcb": TuyaBLECategoryButtonMapping(
+            products={
+                **dict.fromkeys(
+                    ["ajrhf1aj", "z5ztlw3k"],  # PARKSIDE Smart battery
+                    [
+                        TuyaBLEButtonMapping(
+                            dp_id=115,
+                            description=ButtonEntityDescription(
+                                key="battery_finder",
+                                icon="mdi:find-replace",
+                                entity_category=EntityCategory.DIAGNOSTIC,
+                            ),
                         ),
-                    ),
+                        TuyaBLEButtonMapping(
+                            dp_id=162,
+                            description=ButtonEntityDescription(
+                                key="factory_data_reset",
+                                device_class=ButtonDeviceClass.RESTART,
+                                icon="mdi:restore",
+                                entity_category=EntityCategory.CONFIG,
+                            ),
+                            dp_type=TuyaBLEDataPointType.DT_RAW,
+                        ),
+                    ],
+                ),
+            },
+        ),
+        "szjqr": TuyaBLECategoryButtonMapping(
+            products={
+                **dict.fromkeys(
+                    ["3yqdo5yt", "xhf790if"],  # CubeTouch 1s and II
+                    [
+                        TuyaBLEFingerbotModeMapping(dp_id=1),
+                    ],
+                ),
+                **dict.fromkeys(
+                    [
+                        "blliqpsj",
+                        "ndvkgsrm",
+                        "riecov42",
+                        "yiihr7zh",
+                        "neq16kgd",
+                        "6jcvqwh0",
+                        "h8kdwywx",
+                    ],  # Fingerbot Plus
+                    [
+                        TuyaBLEFingerbotModeMapping(dp_id=2),
+                    ],
+                ),
+                **dict.fromkeys(
+                    [
+                        "ltak7e1p",
+                        "y6kttvd6",
+                        "yrnk7mnn",
+                        "nvr2rocq",
+                        "bnt7wajf",
+                        "rvdceqjh",
+                        "5xhbk964",
+                    ],  # Fingerbot
+                    [
+                        TuyaBLEFingerbotModeMapping(dp_id=2),
+                    ],
+                ),
+            },
+        ),
+        "kg": TuyaBLECategoryButtonMapping(
+            products={
+                **dict.fromkeys(
+                    ["mknd4lci", "riecov42", "bs3ubslo"],  # Fingerbot Plus
+                    [
+                        TuyaBLEFingerbotModeMapping(dp_id=108),
+                    ],
+                ),
+            },
+        ),
+        "znhsb": TuyaBLECategoryButtonMapping(
+            products={
+                "cdlandip": [  # Smart water bottle
                     TuyaBLEButtonMapping(
-                        dp_id=162,
+                        dp_id=109,
                         description=ButtonEntityDescription(
-                            key="factory_data_reset",
-                            device_class=ButtonDeviceClass.RESTART,
-                            icon="mdi:restore",
-                            entity_category=EntityCategory.CONFIG,
+                            key="bright_lid_screen",
                         ),
-                        dp_type=TuyaBLEDataPointType.DT_RAW,
                     ),
                 ],
-            ),
-        },
-    ),
-    "szjqr": TuyaBLECategoryButtonMapping(
-        products={
-            **dict.fromkeys(
-                ["3yqdo5yt", "xhf790if"],  # CubeTouch 1s and II
-                [
-                    TuyaBLEFingerbotModeMapping(dp_id=1),
-                ],
-            ),
-            **dict.fromkeys(
-                [
-                    "blliqpsj",
-                    "ndvkgsrm",
-                    "riecov42",
-                    "yiihr7zh",
-                    "neq16kgd",
-                    "6jcvqwh0",
-                    "h8kdwywx",
-                ],  # Fingerbot Plus
-                [
-                    TuyaBLEFingerbotModeMapping(dp_id=2),
-                ],
-            ),
-            **dict.fromkeys(
-                [
-                    "ltak7e1p",
-                    "y6kttvd6",
-                    "yrnk7mnn",
-                    "nvr2rocq",
-                    "bnt7wajf",
-                    "rvdceqjh",
-                    "5xhbk964",
-                ],  # Fingerbot
-                [
-                    TuyaBLEFingerbotModeMapping(dp_id=2),
-                ],
-            ),
-        },
-    ),
-    "kg": TuyaBLECategoryButtonMapping(
-        products={
-            **dict.fromkeys(
-                ["mknd4lci", "riecov42", "bs3ubslo"],  # Fingerbot Plus
-                [
-                    TuyaBLEFingerbotModeMapping(dp_id=108),
-                ],
-            ),
-        },
-    ),
-    "znhsb": TuyaBLECategoryButtonMapping(
-        products={
-            "cdlandip": [  # Smart water bottle
-                TuyaBLEButtonMapping(
-                    dp_id=109,
-                    description=ButtonEntityDescription(
-                        key="bright_lid_screen",
-                    ),
-                ),
-            ],
-        },
-    ),
-    "jtmspro": TuyaBLECategoryButtonMapping(
-        products={
-            "xicdxood": [  # Raycube K7 Pro+
-                TuyaBLEButtonMapping(
-                    dp_id=71,  # On click it opens the lock, just like connecting via Smart Life App
-                    # and holding the center button
-                    description=ButtonEntityDescription(
-                        key="bluetooth_unlock",
-                        icon="mdi:lock-open-variant-outline",
-                    ),
-                ),
-            ],
-        },
-    ),
-    "ms": TuyaBLECategoryButtonMapping(
-        products={
-            **dict.fromkeys(
-                ["okkyfgfs", "k53ok3u9"],  # Smart Lock
-                [
+            },
+        ),
+        "jtmspro": TuyaBLECategoryButtonMapping(
+            products={
+                "xicdxood": [  # Raycube K7 Pro+
                     TuyaBLEButtonMapping(
-                        dp_id=6,
+                        dp_id=71,  # On click it opens the lock, just like connecting via Smart Life App
+                        # and holding the center button
                         description=ButtonEntityDescription(
                             key="bluetooth_unlock",
+                            icon="mdi:lock-open-variant-outline",
                         ),
                     ),
-                    # TuyaBLEButtonMapping(
-                    #    dp_id=12,
-                    #    description=ButtonEntityDescription(
-                    #        key="unlock_fingerprint",
-                    #    ),
-                    # ),
                 ],
-            ),
-        }
-    ),
-}
+            },
+        ),
+        "ms": TuyaBLECategoryButtonMapping(
+            products={
+                **dict.fromkeys(
+                    ["okkyfgfs", "k53ok3u9"],  # Smart Lock
+                    [
+                        TuyaBLEButtonMapping(
+                            dp_id=6,
+                            description=ButtonEntityDescription(
+                                key="bluetooth_unlock",
+                            ),
+                        ),
+                        # TuyaBLEButtonMapping(
+                        #    dp_id=12,
+                        #    description=ButtonEntityDescription(
+                        #        key="unlock_fingerprint",
+                        #    ),
+                        # ),
+                    ],
+                ),
+            }
+        ),
+    }
 
 
 def get_mapping_by_device(device: TuyaBLEDevice) -> list[TuyaBLECategoryButtonMapping]:
-    category = mapping.get(device.category)
+    category = _build_mapping().get(device.category)
     if category is not None and category.products is not None:
         product_mapping = category.products.get(device.product_id)
         if product_mapping is not None:
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import cache
 
 import logging
 
@@ -67,76 +68,79 @@ class TuyaBLECategoryClimateMapping:
     mapping: list[TuyaBLEClimateMapping] | None = None
 
 
-mapping: dict[str, TuyaBLECategoryClimateMapping] = {
-    "wk": TuyaBLECategoryClimateMapping(
-        products={
-            **dict.fromkeys(
-                [
-                    "drlajpqc",
-                    "nhj2j7su",
-                    "zmachryv",
-                ],  # Thermostatic Radiator Valve
-                [
-                    # Thermostatic Radiator Valve
-                    # - [x] 8   - Window
-                    # - [x] 10  - Antifreeze
-                    # - [x] 27  - Calibration
-                    # - [x] 40  - Lock
-                    # - [x] 101 - Switch
-                    # - [x] 102 - Current
-                    # - [x] 103 - Target
-                    # - [ ] 104 - Heating time
-                    # - [x] 105 - Battery power alarm
-                    # - [x] 106 - Away
-                    # - [x] 107 - Programming mode
-                    # - [x] 108 - Programming switch
-                    # - [ ] 109 - Programming data (deprecated - do not delete)
-                    # - [ ] 110 - Historical data protocol (Day-Target temperature)
-                    # - [ ] 111 - System Time Synchronization
-                    # - [ ] 112 - Historical data (Week-Target temperature)
-                    # - [ ] 113 - Historical data (Month-Target temperature)
-                    # - [ ] 114 - Historical data (Year-Target temperature)
-                    # - [ ] 115 - Historical data (Day-Current temperature)
-                    # - [ ] 116 - Historical data (Week-Current temperature)
-                    # - [ ] 117 - Historical data (Month-Current temperature)
-                    # - [ ] 118 - Historical data (Year-Current temperature)
-                    # - [ ] 119 - Historical data (Day-motor opening degree)
-                    # - [ ] 120 - Historical data (Week-motor opening degree)
-                    # - [ ] 121 - Historical data (Month-motor opening degree)
-                    # - [ ] 122 - Historical data (Year-motor opening degree)
-                    # - [ ] 123 - Programming data (Monday)
-                    # - [ ] 124 - Programming data (Tuseday)
-                    # - [ ] 125 - Programming data (Wednesday)
-                    # - [ ] 126 - Programming data (Thursday)
-                    # - [ ] 127 - Programming data (Friday)
-                    # - [ ] 128 - Programming data (Saturday)
-                    # - [ ] 129 - Programming data (Sunday)
-                    # - [x] 130 - Water scale
-                    TuyaBLEClimateMapping(
-                        description=ClimateEntityDescription(
-                            key="thermostatic_radiator_valve",
+@cache
+def _build_mapping() -> dict[str, TuyaBLECategoryClimateMapping]:
+    """Mappings of all categories, built on first lookup."""
+    return {
+        "wk": TuyaBLECategoryClimateMapping(
+            products={
+                **dict.fromkeys(
+                    [
+                        "drlajpqc",
+                        "nhj2j7su",
+                        "zmachryv",
+                    ],  # Thermostatic Radiator Valve
+                    [
+                        # Thermostatic Radiator Valve
+                        # - [x] 8   - Window
+                        # - [x] 10  - Antifreeze
+                        # - [x] 27  - Calibration
+                        # - [x] 40  - Lock
+                        # - [x] 101 - Switch
+                        # - [x] 102 - Current
+                        # - [x] 103 - Target
+                        # - [ ] 104 - Heating time
+                        # - [x] 105 - Battery power alarm
+                        # - [x] 106 - Away
+                        # - [x] 107 - Programming mode
+                        # - [x] 108 - Programming switch
+                        # - [ ] 109 - Programming data (deprecated - do not delete)
+                        # - [ ] 110 - Historical data protocol (Day-Target temperature)
+                        # - [ ] 111 - System Time Synchronization
+                        # - [ ] 112 - Historical data (Week-Target temperature)
+                        # - [ ] 113 - Historical data (Month-Target temperature)
+                        # - [ ] 114 - Historical data (Year-Target temperature)
+                        # - [ ] 115 - Historical data (Day-Current temperature)
+                        # - [ ] 116 - Historical data (Week-Current temperature)
+                        # - [ ] 117 - Historical data (Month-Current temperature)
+                        # - [ ] 118 - Historical data (Year-Current temperature)
+                        # - [ ] 119 - Historical data (Day-motor opening degree)
+                        # - [ ] 120 - Historical data (Week-motor opening degree)
+                        # - [ ] 121 - Historical data (Month-motor opening degree)
+                        # - [ ] 122 - Historical data (Year-motor opening degree)
+                        # - [ ] 123 - Programming data (Monday)
+                        # - [ ] 124 - Programming data (Tuseday)
+                        # - [ ] 125 - Programming data (Wednesday)
+                        # - [ ] 126 - Programming data (Thursday)
+                        # - [ ] 127 - Programming data (Friday)
+                        # - [ ] 128 - Programming data (Saturday)
+                        # - [ ] 129 - Programming data (Sunday)
+                        # - [x] 130 - Water scale
+                        TuyaBLEClimateMapping(
+                            description=ClimateEntityDescription(
+                                key="thermostatic_radiator_valve",
+                            ),
+                            hvac_switch_dp_id=101,
+                            hvac_switch_mode=HVACMode.HEAT,
+                            hvac_modes=[HVACMode.OFF, HVACMode.HEAT],
+                            preset_mode_dp_ids={PRESET_AWAY: 106, PRESET_NONE: 106},
+                            current_temperature_dp_id=102,  # Merge conflict: current_temperature_dp_id=3 for zmachryv?
+                            current_temperature_coefficient=10.0,
+                            target_temperature_coefficient=10.0,
+                            target_temperature_step=0.5,
+                            target_temperature_dp_id=103,  # Merge conflict: current_temperature_dp_id=2 for zmachryv?
+                            target_temperature_min=5.0,
+                            target_temperature_max=30.0,
                         ),
-                        hvac_switch_dp_id=101,
-                        hvac_switch_mode=HVACMode.HEAT,
-                        hvac_modes=[HVACMode.OFF, HVACMode.HEAT],
-                        preset_mode_dp_ids={PRESET_AWAY: 106, PRESET_NONE: 106},
-                        current_temperature_dp_id=102,  # Merge conflict: current_temperature_dp_id=3 for zmachryv?
-                        current_temperature_coefficient=10.0,
-                        target_temperature_coefficient=10.0,
-                        target_temperature_step=0.5,
-                        target_temperature_dp_id=103,  # Merge conflict: current_temperature_dp_id=2 for zmachryv?
-                        target_temperature_min=5.0,
-                        target_temperature_max=30.0,
-                    ),
-                ],
-            ),
-        },
-    ),
-}
+                    ],
+                ),
+            },
+        ),
+    }
 
 
 def get_mapping_by_device(device: TuyaBLEDevice) -> list[TuyaBLECategoryClimateMapping]:
-    category = mapping.get(device.category)
+    category = _build_mapping().get(device.category)
     if category is not None and category.products is not None:
         product_mapping = category.products.get(device.product_id)
         if product_mapping is not None:
@@ -160,6 +160,10 @@ class HASSTuyaBLEDeviceManager(AbstaractTuyaBLEDeviceManager):
 
         return response
 
+    def has_credentials(self) -> bool:
+        """Credentials of the device are stored, no cloud access is needed."""
+        return self._has_credentials(self._data)
+
     def _check_login(self) -> bool:
         cache_key = self._get_cache_key(self._data)
         return _cache.get(cache_key) is not None
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import logging
-import pycountry
 from typing import Any
 
 import voluptuous as vol
@@ -30,7 +29,6 @@ from homeassistant.data_entry_flow import FlowHandler, FlowResult
 from .tuya_ble import SERVICE_UUID, TuyaBLEDeviceCredentials
 
 from .const import (
-    TUYA_COUNTRIES,
     TUYA_SMART_APP,
     SMARTLIFE_APP,
     TUYA_RESPONSE_SUCCESS,
@@ -41,7 +39,13 @@ from .const import (
     CONF_APP_TYPE,
     CONF_AUTH_TYPE,
     CONF_ENDPOINT,
+    CONF_HEARTBEAT,
+    CONF_WORKER,
+    CONF_HISTORY_DEPTH,
+    DEFAULT_HISTORY_DEPTH,
     DOMAIN,
+    MAX_HISTORY_DEPTH,
+    get_tuya_countries,
 )
 from .devices import TuyaBLEData, get_device_readable_name
 from .cloud import HASSTuyaBLEDeviceManager
@@ -60,7 +64,7 @@ async def _try_login(
 
     country = [
         country
-        for country in TUYA_COUNTRIES
+        for country in get_tuya_countries()
         if country.name == user_input[CONF_COUNTRY_CODE]
     ][0]
 
@@ -106,13 +110,16 @@ def _show_login_form(
 ) -> FlowResult:
     """Shows the Tuya IOT platform login form."""
     if user_input is not None and user_input.get(CONF_COUNTRY_CODE) is not None:
-        for country in TUYA_COUNTRIES:
+        for country in get_tuya_countries():
             if country.country_code == user_input[CONF_COUNTRY_CODE]:
                 user_input[CONF_COUNTRY_CODE] = country.name
                 break
 
     def_country_name: str | None = None
     try:
+        # The ISO database is loaded only when the form is shown
+        import pycountry
+
         def_country = pycountry.countries.get(alpha_2=flow.hass.config.country)
         if def_country:
             def_country_name = def_country.name
@@ -128,7 +135,7 @@ def _show_login_form(
                     default=user_input.get(CONF_COUNTRY_CODE, def_country_name),
                 ): vol.In(
                     # We don't pass a dict {code:name} because country codes can be duplicate.
-                    [country.name for country in TUYA_COUNTRIES]
+                    [country.name for country in get_tuya_countries()]
                 ),
                 vol.Required(
                     CONF_ACCESS_ID, default=user_input.get(CONF_ACCESS_ID, "")
@@ -161,7 +168,45 @@ class TuyaBLEOptionsFlow(OptionsFlowWithConfigEntry):
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
         """Manage the options."""
-        return await self.async_step_login(user_input)
+        return self.async_show_menu(
+            step_id="init",
+            menu_options=["login", "settings"],
+        )
+
+    async def async_step_settings(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Handle the integration settings step."""
+        if user_input is not None:
+            self.options.update(user_input)
+            return self.async_create_entry(
+                title=self.config_entry.title,
+                data=self.options,
+            )
+
+        return self.async_show_form(
+            step_id="settings",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        CONF_HISTORY_DEPTH,
+                        default=self.options.get(
+                            CONF_HISTORY_DEPTH, DEFAULT_HISTORY_DEPTH
+                        ),
+                    ): vol.All(
+                        vol.Coerce(int), vol.Range(min=0, max=MAX_HISTORY_DEPTH)
+                    ),
+                    vol.Required(
+                        CONF_HEARTBEAT,
+                        default=self.options.get(CONF_HEARTBEAT, False),
+                    ): bool,
+                    vol.Required(
+                        CONF_WORKER,
+                        default=self.options.get(CONF_WORKER, False),
+                    ): bool,
+                }
+            ),
+        )
 
     async def async_step_login(
         self, user_input: dict[str, Any] | None = None
@@ -2,10 +2,9 @@
 
 from __future__ import annotations
 
-import asyncio
 from dataclasses import dataclass
+from functools import cache
 
-from datetime import datetime, timezone
 from enum import IntEnum
 import logging
 
@@ -82,45 +81,50 @@ class TuyaBLECategoryCoverMapping:
 # - [X] 13  - Battery (RAW)
 
 
-mapping: dict[str, TuyaBLECategoryCoverMapping] = {
-    "cl": TuyaBLECategoryCoverMapping(
-        products={
-            **dict.fromkeys(
-                ["4pbr8eig", "qqdxfdht", "ulughw4g", "vlwf3ud6"],
-                [
-                    TuyaBLECoverMapping(  # BLE Blind Controller
+@cache
+def _build_mapping() -> dict[str, TuyaBLECategoryCoverMapping]:
+    """Mappings of all categories, built on first lookup."""
+    return {
+        "cl": TuyaBLECategoryCoverMapping(
+            products={
+                **dict.fromkeys(
+                    ["4pbr8eig", "qqdxfdht", "ulughw4g", "vlwf3ud6"],
+                    [
+                        TuyaBLECoverMapping(  # BLE Blind Controller
+                            description=CoverEntityDescription(
+                                key="ble_blind_controller",
+                            ),
+                            cover_state_dp_id=1,
+                            cover_position_set_dp=2,
+                            cover_position_dp_id=3,
+                            cover_opening_mode_dp_id=4,
+                            cover_work_state_dp_id=7,
+                            cover_battery_dp_id=13,
+                            cover_motor_direction_dp_id=101,
+                            cover_set_upper_limit_dp_id=102,
+                            cover_factory_reset_dp_id=107,
+                        )
+                    ],
+                ),
+                "kcy0x4pi": [
+                    TuyaBLECoverMapping(
                         description=CoverEntityDescription(
-                            key="ble_blind_controller",
+                            key="ble_curtain_controller"
                         ),
                         cover_state_dp_id=1,
                         cover_position_set_dp=2,
                         cover_position_dp_id=3,
-                        cover_opening_mode_dp_id=4,
-                        cover_work_state_dp_id=7,
                         cover_battery_dp_id=13,
-                        cover_motor_direction_dp_id=101,
-                        cover_set_upper_limit_dp_id=102,
-                        cover_factory_reset_dp_id=107,
                     )
                 ],
-            ),
-            "kcy0x4pi": [
-                TuyaBLECoverMapping(
-                    description=CoverEntityDescription(key="ble_curtain_controller"),
-                    cover_state_dp_id=1,
-                    cover_position_set_dp=2,
-                    cover_position_dp_id=3,
-                    cover_battery_dp_id=13,
-                )
-            ],
-        },
-    ),
-}
+            },
+        ),
+    }
 
 
 def get_mapping_by_device(device: TuyaBLEDevice) -> list[TuyaBLECategoryCoverMapping]:
     """For a given device, work out the category cover mapping"""
-    category = mapping.get(device.category)
+    category = _build_mapping().get(device.category)
     if category is not None and category.products is not None:
         product_mapping = category.products.get(device.product_id)
         if product_mapping is not None:
@@ -213,14 +217,9 @@ class TuyaBLECover(TuyaBLEEntity, CoverEntity):
         if self._mapping.cover_state_dp_id != 0:
             # In some circumstances (presumably due to a communication error in between where packets were lost)
             # It can be the case that the device does not update the state of the cover and does not accept new commands.
-            # This is why a timer is here to verify that the state is updated and to manually request the status update
-            # if no new data has come in within 1 second as it points to a communication error (as happened in tests with
-            # the kcy0x4pi product).
-            self._hass.add_job(
-                self._validate_data_update_from_device_and_reconnect_if_needed(
-                    time_now=datetime.now(timezone.utc)
-                )
-            )
+            # The poller of the coordinator verifies that the state is updated and manually requests the status update
+            # if no new data has come in within COMMAND_POLL_DELAY as it points to a communication error (as happened
+            # in tests with the kcy0x4pi product).
             self._update_cover_state_without_validation(state)
             self._update_ha_state_for_cover_state(state)
 
@@ -232,25 +231,7 @@ class TuyaBLECover(TuyaBLEEntity, CoverEntity):
                 state.value,
             )
             if datapoint:
-                self._hass.create_task(datapoint.set_value(state.value))
-
-    async def _validate_data_update_from_device_and_reconnect_if_needed(
-        self,
-        sleep_ms: int = 1000,
-        time_now: datetime | None = None,
-    ) -> None:
-        time_now = time_now or datetime.now(timezone.utc)
-        await asyncio.sleep(sleep_ms / 1000.0)
-        if self._device._is_paired and (
-            not self._device.last_data_received
-            or self._device.last_data_received < time_now
-        ):
-            _LOGGER.warning(
-                "No data received from device (cover) %s within %dms, manually requesting status update",
-                self._device.name,
-                sleep_ms,
-            )
-            await self._device.update()
+                self.set_dp_value(datapoint, state.value)
 
     def _update_ha_state_for_cover_state(self, state: TuyaCoverState) -> None:
         # sometimes the device does not update DP 1 so force the current state
@@ -277,7 +258,7 @@ class TuyaBLECover(TuyaBLEEntity, CoverEntity):
                 position,
             )
             if datapoint:
-                self._hass.create_task(datapoint.set_value(position))
+                self.set_dp_value(datapoint, position)
 
 
 async def async_setup_entry(
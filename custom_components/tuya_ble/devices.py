@@ -5,6 +5,7 @@ from dataclasses import dataclass
 from typing import Any
 
 import logging
+from bleak_retry_connector import BLEAK_RETRY_EXCEPTIONS as BLEAK_EXCEPTIONS
 from homeassistant.const import CONF_ADDRESS, CONF_DEVICE_ID
 
 from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
@@ -20,11 +21,6 @@ from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
 )
 
-from homeassistant.components.tuya.const import (
-    DPCode,
-    DPType,
-)
-
 from home_assistant_bluetooth import BluetoothServiceInfoBleak
 from .tuya_ble import (
     AbstaractTuyaBLEDeviceManager,
@@ -33,18 +29,22 @@ from .tuya_ble import (
     TuyaBLEDevice,
     TuyaBLEDeviceCredentials,
 )
+from .tuya_ble.exceptions import TuyaBLEError
+from .tuya_ble.optimistic import TuyaBLECommandStats, TuyaBLEOptimisticValues
 
 from .cloud import HASSTuyaBLEDeviceManager
 from .const import (
     DEVICE_DEF_MANUFACTURER,
     DOMAIN,
     FINGERBOT_BUTTON_EVENT,
+    OPTIMISTIC_TIMEOUT,
     SET_DISCONNECTED_DELAY,
     DPCode,
     DPType,
 )
 
 from .base import IntegerTypeData, EnumTypeData
+from .poller import TuyaBLEPoller
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -110,6 +110,20 @@ class TuyaBLEEntity(CoordinatorEntity):
         self.entity_id = generate_entity_id(
             "sensor.{}", self._attr_unique_id, hass=hass
         )
+        self._optimistic = TuyaBLEOptimisticValues(
+            device.address,
+            OPTIMISTIC_TIMEOUT,
+            coordinator.command_stats,
+            self._handle_coordinator_update,
+        )
+
+    async def async_added_to_hass(self) -> None:
+        """Confirm pending values on reports of the device."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self._coordinator.async_add_listener(self._optimistic.check)
+        )
+        self.async_on_remove(self._optimistic.cancel)
 
     @property
     def available(self) -> bool:
@@ -139,7 +153,34 @@ class TuyaBLEEntity(CoordinatorEntity):
                 dp_type,
                 value,
             )
-            self._hass.create_task(datapoint.set_value(value))
+            self.set_dp_value(datapoint, value)
+
+    def set_dp_value(
+        self, datapoint: TuyaBLEDataPoint, value: bytes | bool | int | str
+    ) -> None:
+        """Set the datapoint and show the new state until the device answers.
+
+        The value is confirmed when the device acknowledges it or reports
+        the datapoint, and rolled back on an error or after
+        OPTIMISTIC_TIMEOUT seconds without either.
+        """
+        self._hass.create_task(self._async_set_dp_value(datapoint, value))
+
+    async def _async_set_dp_value(
+        self, datapoint: TuyaBLEDataPoint, value: bytes | bool | int | str
+    ) -> None:
+        pending = self._optimistic.set(datapoint, value)
+        try:
+            acknowledged = await datapoint.set_value(value)
+        except (*BLEAK_EXCEPTIONS, TuyaBLEError) as error:
+            _LOGGER.warning(
+                "%s: Setting datapoint %s failed: %s",
+                self._device.address,
+                datapoint.id,
+                error,
+            )
+            acknowledged = False
+        self._optimistic.settle(pending, acknowledged)
 
     def _send_command(self, commands: list[dict[str, Any]]) -> None:
         """Send the commands to the device"""
@@ -275,9 +316,12 @@ class TuyaBLECoordinator(DataUpdateCoordinator[None]):
         self._device = device
         self._disconnected: bool = True
         self._unsub_disconnect: CALLBACK_TYPE | None = None
+        self.poller = TuyaBLEPoller.for_device(hass, device)
+        self.command_stats = TuyaBLECommandStats()
         device.register_connected_callback(self._async_handle_connect)
         device.register_callback(self._async_handle_update)
         device.register_disconnected_callback(self._async_handle_disconnect)
+        device.register_command_callback(self._async_handle_command)
 
     @property
     def connected(self) -> bool:
@@ -295,6 +339,8 @@ class TuyaBLECoordinator(DataUpdateCoordinator[None]):
     def _async_handle_update(self, updates: list[TuyaBLEDataPoint]) -> None:
         """Just trigger the callbacks."""
         self._async_handle_connect()
+        if self.poller:
+            self.poller.on_data()
         self.async_set_updated_data(None)
         info = get_device_product_info(self._device)
         if info and info.fingerbot and info.fingerbot.manual_control != 0:
@@ -308,6 +354,11 @@ class TuyaBLECoordinator(DataUpdateCoordinator[None]):
                         },
                     )
 
+    @callback
+    def _async_handle_command(self) -> None:
+        if self.poller:
+            self.poller.on_command()
+
     @callback
     def _set_disconnected(self, _: None) -> None:
         """Invoke the idle timeout callback, called when the alarm fires."""
@@ -334,6 +385,9 @@ class TuyaBLEData:
     product: TuyaBLEProductInfo
     manager: HASSTuyaBLEDeviceManager
     coordinator: TuyaBLECoordinator
+    # Adapter of the worker process running the device, None when it runs in
+    # Home Assistant
+    worker: str | None = None
 
 
 @dataclass
@@ -2,6 +2,9 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.components.diagnostics import async_redact_data
 
+from .const import DOMAIN
+from .startup import async_get_startup
+
 TO_REDACT = {
     "username",
     "password",
@@ -18,7 +21,31 @@ async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry):
         "entry": entry.as_dict(),
         "data": entry.data,
         "options": entry.options,
+        "startup": async_get_startup(hass).stats,
     }
+    if entry_data := hass.data.get(DOMAIN, {}).get(entry.entry_id):
+        data["presence"] = entry_data.device.presence.as_dict()
+        data["commands"] = entry_data.coordinator.command_stats.as_dict()
+        if history := entry_data.device.datapoints.history:
+            data["history"] = history.as_dict()
+        if entry_data.worker is not None:
+            # The link is run and measured by the worker process
+            data["worker"] = {
+                "adapter": entry_data.worker,
+                "connected": entry_data.device.is_connected,
+            }
+        else:
+            data["connection"] = entry_data.device.connection_stats
+            data["heartbeat"] = entry_data.device.heartbeat_stats
+            data["pacing"] = entry_data.device.pacing_stats
+            data["input"] = entry_data.device.input_stats
+            router = entry_data.device.router
+            data["routes"] = {
+                "preferred": router.preferred,
+                "stats": {
+                    source: stats.as_dict() for source, stats in router.stats.items()
+                },
+            }
     return async_redact_data(data, TO_REDACT)
 
 
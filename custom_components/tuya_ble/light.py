@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from functools import cache
 
 import logging
 import json
@@ -144,308 +145,314 @@ ProductsMapping: dict[str, dict[str, tuple[TuyaLightEntityDescription, ...]]] =
     }
 }
 
+
 # Copied from standard Tuya light component - we could add some default values here too
-LIGHTS: dict[str, tuple[TuyaLightEntityDescription, ...]] = {
-    # Curtain Switch
-    # https://developer.tuya.com/en/docs/iot/category-clkg?id=Kaiuz0gitil39
-    "clkg": (
-        TuyaLightEntityDescription(
-            key=DPCode.SWITCH_BACKLIGHT,
-            translation_key="backlight",
-            entity_category=EntityCategory.CONFIG,
-        ),
-    ),
-    # String Lights
-    # https://developer.tuya.com/en/docs/iot/dc?id=Kaof7taxmvadu
-    "dc": (
-        TuyaLightEntityDescription(
-            key=DPCode.SWITCH_LED,
-            name=None,
-            color_mode=DPCode.WORK_MODE,
-            brightness=DPCode.BRIGHT_VALUE,
-            color_temp=DPCode.TEMP_VALUE,
-            color_data=DPCode.COLOUR_DATA,
-        ),
-    ),
-    # Strip Lights
-    # https://developer.tuya.com/en/docs/iot/dd?id=Kaof804aibg2l
-    "dd": (
-        TuyaLightEntityDescription(
-            key=DPCode.SWITCH_LED,
-            name=None,
-            color_mode=DPCode.WORK_MODE,
-            brightness=DPCode.BRIGHT_VALUE,
-            color_temp=DPCode.TEMP_VALUE,
-            color_data=DPCode.COLOUR_DATA,
-            default_color_type=DEFAULT_COLOR_TYPE_DATA_V2,
-        ),
-    ),
-    # Light
-    # https://developer.tuya.com/en/docs/iot/categorydj?id=Kaiuyzy3eheyy
-    "dj": (
-        TuyaLightEntityDescription(
-            key=DPCode.SWITCH_LED,
-            name=None,
-            color_mode=DPCode.WORK_MODE,
-            brightness=(DPCode.BRIGHT_VALUE_V2, DPCode.BRIGHT_VALUE),
-            color_temp=(DPCode.TEMP_VALUE_V2, DPCode.TEMP_VALUE),
-            color_data=(DPCode.COLOUR_DATA_V2, DPCode.COLOUR_DATA),
-        ),
-        # Not documented
-        # Based on multiple reports: manufacturer customized Dimmer 2 switches
-        TuyaLightEntityDescription(
-            key=DPCode.SWITCH_1,
-            translation_key="light",
-            brightness=DPCode.BRIGHT_VALUE_1,
-        ),
-    ),
-    # Ceiling Fan Light
-    # https://developer.tuya.com/en/docs/iot/fsd?id=Kaof8eiei4c2v
-    "fsd": (
-        TuyaLightEntityDescription(
-            key=DPCode.SWITCH_LED,
-            name=None,
-            color_mode=DPCode.WORK_MODE,
-            brightness=DPCode.BRIGHT_VALUE,
-            color_temp=DPCode.TEMP_VALUE,
-            color_data=DPCode.COLOUR_DATA,
-        ),
-        # Some ceiling fan lights use LIGHT for DPCode instead of SWITCH_LED
-        TuyaLightEntityDescription(
-            key=DPCode.LIGHT,
-            name=None,
-        ),
-    ),
-    # Ambient Light
-    # https://developer.tuya.com/en/docs/iot/ambient-light?id=Kaiuz06amhe6g
-    "fwd": (
-        TuyaLightEntityDescription(
-            key=DPCode.SWITCH_LED,
-            name=None,
-            color_mode=DPCode.WORK_MODE,
-            brightness=DPCode.BRIGHT_VALUE,
-            color_temp=DPCode.TEMP_VALUE,
-            color_data=DPCode.COLOUR_DATA,
-        ),
-    ),
-    # Motion Sensor Light
-    # https://developer.tuya.com/en/docs/iot/gyd?id=Kaof8a8hycfmy
-    "gyd": (
-        TuyaLightEntityDescription(
-            key=DPCode.SWITCH_LED,
-            name=None,
-            color_mode=DPCode.WORK_MODE,
-            brightness=DPCode.BRIGHT_VALUE,
-            color_temp=DPCode.TEMP_VALUE,
-            color_data=DPCode.COLOUR_DATA,
-        ),
-    ),
-    # Humidifier Light
-    # https://developer.tuya.com/en/docs/iot/categoryjsq?id=Kaiuz1smr440b
-    "jsq": (
-        TuyaLightEntityDescription(
-            key=DPCode.SWITCH_LED,
-            name=None,
-            color_mode=DPCode.WORK_MODE,
-            brightness=DPCode.BRIGHT_VALUE,
-            color_data=DPCode.COLOUR_DATA_HSV,
+@cache
+def _build_lights() -> dict[str, tuple[TuyaLightEntityDescription, ...]]:
+    """Descriptions of all categories, built on first lookup."""
+    lights: dict[str, tuple[TuyaLightEntityDescription, ...]] = {
+        # Curtain Switch
+        # https://developer.tuya.com/en/docs/iot/category-clkg?id=Kaiuz0gitil39
+        "clkg": (
+            TuyaLightEntityDescription(
+                key=DPCode.SWITCH_BACKLIGHT,
+                translation_key="backlight",
+                entity_category=EntityCategory.CONFIG,
+            ),
         ),
-    ),
-    # Switch
-    # https://developer.tuya.com/en/docs/iot/s?id=K9gf7o5prgf7s
-    "kg": (
-        TuyaLightEntityDescription(
-            key=DPCode.SWITCH_BACKLIGHT,
-            translation_key="backlight",
-            entity_category=EntityCategory.CONFIG,
+        # String Lights
+        # https://developer.tuya.com/en/docs/iot/dc?id=Kaof7taxmvadu
+        "dc": (
+            TuyaLightEntityDescription(
+                key=DPCode.SWITCH_LED,
+                name=None,
+                color_mode=DPCode.WORK_MODE,
+                brightness=DPCode.BRIGHT_VALUE,
+                color_temp=DPCode.TEMP_VALUE,
+                color_data=DPCode.COLOUR_DATA,
+            ),
         ),
-    ),
-    # Air Purifier
-    # https://developer.tuya.com/en/docs/iot/f?id=K9gf46h2s6dzm
-    "kj": (
-        TuyaLightEntityDescription(
-            key=DPCode.LIGHT,
-            translation_key="backlight",
-            entity_category=EntityCategory.CONFIG,
+        # Strip Lights
+        # https://developer.tuya.com/en/docs/iot/dd?id=Kaof804aibg2l
+        "dd": (
+            TuyaLightEntityDescription(
+                key=DPCode.SWITCH_LED,
+                name=None,
+                color_mode=DPCode.WORK_MODE,
+                brightness=DPCode.BRIGHT_VALUE,
+                color_temp=DPCode.TEMP_VALUE,
+                color_data=DPCode.COLOUR_DATA,
+                default_color_type=DEFAULT_COLOR_TYPE_DATA_V2,
+            ),
         ),
-    ),
-    # Air conditioner
-    # https://developer.tuya.com/en/docs/iot/categorykt?id=Kaiuz0z71ov2n
-    "kt": (
-        TuyaLightEntityDescription(
-            key=DPCode.LIGHT,
-            translation_key="backlight",
-            entity_category=EntityCategory.CONFIG,
+        # Light
+        # https://developer.tuya.com/en/docs/iot/categorydj?id=Kaiuyzy3eheyy
+        "dj": (
+            TuyaLightEntityDescription(
+                key=DPCode.SWITCH_LED,
+                name=None,
+                color_mode=DPCode.WORK_MODE,
+                brightness=(DPCode.BRIGHT_VALUE_V2, DPCode.BRIGHT_VALUE),
+                color_temp=(DPCode.TEMP_VALUE_V2, DPCode.TEMP_VALUE),
+                color_data=(DPCode.COLOUR_DATA_V2, DPCode.COLOUR_DATA),
+            ),
+            # Not documented
+            # Based on multiple reports: manufacturer customized Dimmer 2 switches
+            TuyaLightEntityDescription(
+                key=DPCode.SWITCH_1,
+                translation_key="light",
+                brightness=DPCode.BRIGHT_VALUE_1,
+            ),
         ),
-    ),
-    # Unknown light product
-    # Found as VECINO RGBW as provided by diagnostics
-    # Not documented
-    "mbd": (
-        TuyaLightEntityDescription(
-            key=DPCode.SWITCH_LED,
-            name=None,
-            color_mode=DPCode.WORK_MODE,
-            brightness=DPCode.BRIGHT_VALUE,
-            color_data=DPCode.COLOUR_DATA,
+        # Ceiling Fan Light
+        # https://developer.tuya.com/en/docs/iot/fsd?id=Kaof8eiei4c2v
+        "fsd": (
+            TuyaLightEntityDescription(
+                key=DPCode.SWITCH_LED,
+                name=None,
+                color_mode=DPCode.WORK_MODE,
+                brightness=DPCode.BRIGHT_VALUE,
+                color_temp=DPCode.TEMP_VALUE,
+                color_data=DPCode.COLOUR_DATA,
+            ),
+            # Some ceiling fan lights use LIGHT for DPCode instead of SWITCH_LED
+            TuyaLightEntityDescription(
+                key=DPCode.LIGHT,
+                name=None,
+            ),
         ),
-    ),
-    # Unknown product with light capabilities
-    # Fond in some diffusers, plugs and PIR flood lights
-    # Not documented
-    "qjdcz": (
-        TuyaLightEntityDescription(
-            key=DPCode.SWITCH_LED,
-            name=None,
-            color_mode=DPCode.WORK_MODE,
-            brightness=DPCode.BRIGHT_VALUE,
-            color_data=DPCode.COLOUR_DATA,
+        # Ambient Light
+        # https://developer.tuya.com/en/docs/iot/ambient-light?id=Kaiuz06amhe6g
+        "fwd": (
+            TuyaLightEntityDescription(
+                key=DPCode.SWITCH_LED,
+                name=None,
+                color_mode=DPCode.WORK_MODE,
+                brightness=DPCode.BRIGHT_VALUE,
+                color_temp=DPCode.TEMP_VALUE,
+                color_data=DPCode.COLOUR_DATA,
+            ),
         ),
-    ),
-    # Heater
-    # https://developer.tuya.com/en/docs/iot/categoryqn?id=Kaiuz18kih0sm
-    "qn": (
-        TuyaLightEntityDescription(
-            key=DPCode.LIGHT,
-            translation_key="backlight",
-            entity_category=EntityCategory.CONFIG,
+        # Motion Sensor Light
+        # https://developer.tuya.com/en/docs/iot/gyd?id=Kaof8a8hycfmy
+        "gyd": (
+            TuyaLightEntityDescription(
+                key=DPCode.SWITCH_LED,
+                name=None,
+                color_mode=DPCode.WORK_MODE,
+                brightness=DPCode.BRIGHT_VALUE,
+                color_temp=DPCode.TEMP_VALUE,
+                color_data=DPCode.COLOUR_DATA,
+            ),
         ),
-    ),
-    # Smart Camera
-    # https://developer.tuya.com/en/docs/iot/categorysp?id=Kaiuz35leyo12
-    "sp": (
-        TuyaLightEntityDescription(
-            key=DPCode.FLOODLIGHT_SWITCH,
-            brightness=DPCode.FLOODLIGHT_LIGHTNESS,
-            name="Floodlight",
+        # Humidifier Light
+        # https://developer.tuya.com/en/docs/iot/categoryjsq?id=Kaiuz1smr440b
+        "jsq": (
+            TuyaLightEntityDescription(
+                key=DPCode.SWITCH_LED,
+                name=None,
+                color_mode=DPCode.WORK_MODE,
+                brightness=DPCode.BRIGHT_VALUE,
+                color_data=DPCode.COLOUR_DATA_HSV,
+            ),
         ),
-        TuyaLightEntityDescription(
-            key=DPCode.BASIC_INDICATOR,
-            name="Indicator light",
-            entity_category=EntityCategory.CONFIG,
+        # Switch
+        # https://developer.tuya.com/en/docs/iot/s?id=K9gf7o5prgf7s
+        "kg": (
+            TuyaLightEntityDescription(
+                key=DPCode.SWITCH_BACKLIGHT,
+                translation_key="backlight",
+                entity_category=EntityCategory.CONFIG,
+            ),
         ),
-    ),
-    # Dimmer Switch
-    # https://developer.tuya.com/en/docs/iot/categorytgkg?id=Kaiuz0ktx7m0o
-    "tgkg": (
-        TuyaLightEntityDescription(
-            key=DPCode.SWITCH_LED_1,
-            translation_key="light",
-            brightness=DPCode.BRIGHT_VALUE_1,
-            brightness_max=DPCode.BRIGHTNESS_MAX_1,
-            brightness_min=DPCode.BRIGHTNESS_MIN_1,
+        # Air Purifier
+        # https://developer.tuya.com/en/docs/iot/f?id=K9gf46h2s6dzm
+        "kj": (
+            TuyaLightEntityDescription(
+                key=DPCode.LIGHT,
+                translation_key="backlight",
+                entity_category=EntityCategory.CONFIG,
+            ),
         ),
-        TuyaLightEntityDescription(
-            key=DPCode.SWITCH_LED_2,
-            translation_key="light_2",
-            brightness=DPCode.BRIGHT_VALUE_2,
-            brightness_max=DPCode.BRIGHTNESS_MAX_2,
-            brightness_min=DPCode.BRIGHTNESS_MIN_2,
+        # Air conditioner
+        # https://developer.tuya.com/en/docs/iot/categorykt?id=Kaiuz0z71ov2n
+        "kt": (
+            TuyaLightEntityDescription(
+                key=DPCode.LIGHT,
+                translation_key="backlight",
+                entity_category=EntityCategory.CONFIG,
+            ),
         ),
-        TuyaLightEntityDescription(
-            key=DPCode.SWITCH_LED_3,
-            translation_key="light_3",
-            brightness=DPCode.BRIGHT_VALUE_3,
-            brightness_max=DPCode.BRIGHTNESS_MAX_3,
-            brightness_min=DPCode.BRIGHTNESS_MIN_3,
+        # Unknown light product
+        # Found as VECINO RGBW as provided by diagnostics
+        # Not documented
+        "mbd": (
+            TuyaLightEntityDescription(
+                key=DPCode.SWITCH_LED,
+                name=None,
+                color_mode=DPCode.WORK_MODE,
+                brightness=DPCode.BRIGHT_VALUE,
+                color_data=DPCode.COLOUR_DATA,
+            ),
         ),
-    ),
-    # Dimmer
-    # https://developer.tuya.com/en/docs/iot/tgq?id=Kaof8ke9il4k4
-    "tgq": (
-        TuyaLightEntityDescription(
-            key=DPCode.SWITCH_LED,
-            translation_key="light",
-            brightness=(DPCode.BRIGHT_VALUE_V2, DPCode.BRIGHT_VALUE),
-            brightness_max=DPCode.BRIGHTNESS_MAX_1,
-            brightness_min=DPCode.BRIGHTNESS_MIN_1,
+        # Unknown product with light capabilities
+        # Fond in some diffusers, plugs and PIR flood lights
+        # Not documented
+        "qjdcz": (
+            TuyaLightEntityDescription(
+                key=DPCode.SWITCH_LED,
+                name=None,
+                color_mode=DPCode.WORK_MODE,
+                brightness=DPCode.BRIGHT_VALUE,
+                color_data=DPCode.COLOUR_DATA,
+            ),
         ),
-        TuyaLightEntityDescription(
-            key=DPCode.SWITCH_LED_1,
-            translation_key="light",
-            brightness=DPCode.BRIGHT_VALUE_1,
+        # Heater
+        # https://developer.tuya.com/en/docs/iot/categoryqn?id=Kaiuz18kih0sm
+        "qn": (
+            TuyaLightEntityDescription(
+                key=DPCode.LIGHT,
+                translation_key="backlight",
+                entity_category=EntityCategory.CONFIG,
+            ),
         ),
-        TuyaLightEntityDescription(
-            key=DPCode.SWITCH_LED_2,
-            translation_key="light_2",
-            brightness=DPCode.BRIGHT_VALUE_2,
+        # Smart Camera
+        # https://developer.tuya.com/en/docs/iot/categorysp?id=Kaiuz35leyo12
+        "sp": (
+            TuyaLightEntityDescription(
+                key=DPCode.FLOODLIGHT_SWITCH,
+                brightness=DPCode.FLOODLIGHT_LIGHTNESS,
+                name="Floodlight",
+            ),
+            TuyaLightEntityDescription(
+                key=DPCode.BASIC_INDICATOR,
+                name="Indicator light",
+                entity_category=EntityCategory.CONFIG,
+            ),
         ),
-    ),
-    # Wake Up Light II
-    # Not documented
-    "hxd": (
-        TuyaLightEntityDescription(
-            key=DPCode.SWITCH_LED,
-            translation_key="light",
-            brightness=(DPCode.BRIGHT_VALUE_V2, DPCode.BRIGHT_VALUE),
-            brightness_max=DPCode.BRIGHTNESS_MAX_1,
-            brightness_min=DPCode.BRIGHTNESS_MIN_1,
+        # Dimmer Switch
+        # https://developer.tuya.com/en/docs/iot/categorytgkg?id=Kaiuz0ktx7m0o
+        "tgkg": (
+            TuyaLightEntityDescription(
+                key=DPCode.SWITCH_LED_1,
+                translation_key="light",
+                brightness=DPCode.BRIGHT_VALUE_1,
+                brightness_max=DPCode.BRIGHTNESS_MAX_1,
+                brightness_min=DPCode.BRIGHTNESS_MIN_1,
+            ),
+            TuyaLightEntityDescription(
+                key=DPCode.SWITCH_LED_2,
+                translation_key="light_2",
+                brightness=DPCode.BRIGHT_VALUE_2,
+                brightness_max=DPCode.BRIGHTNESS_MAX_2,
+                brightness_min=DPCode.BRIGHTNESS_MIN_2,
+            ),
+            TuyaLightEntityDescription(
+                key=DPCode.SWITCH_LED_3,
+                translation_key="light_3",
+                brightness=DPCode.BRIGHT_VALUE_3,
+                brightness_max=DPCode.BRIGHTNESS_MAX_3,
+                brightness_min=DPCode.BRIGHTNESS_MIN_3,
+            ),
         ),
-    ),
-    # Solar Light
-    # https://developer.tuya.com/en/docs/iot/tynd?id=Kaof8j02e1t98
-    "tyndj": (
-        TuyaLightEntityDescription(
-            key=DPCode.SWITCH_LED,
-            name=None,
-            color_mode=DPCode.WORK_MODE,
-            brightness=DPCode.BRIGHT_VALUE,
-            color_temp=DPCode.TEMP_VALUE,
-            color_data=DPCode.COLOUR_DATA,
+        # Dimmer
+        # https://developer.tuya.com/en/docs/iot/tgq?id=Kaof8ke9il4k4
+        "tgq": (
+            TuyaLightEntityDescription(
+                key=DPCode.SWITCH_LED,
+                translation_key="light",
+                brightness=(DPCode.BRIGHT_VALUE_V2, DPCode.BRIGHT_VALUE),
+                brightness_max=DPCode.BRIGHTNESS_MAX_1,
+                brightness_min=DPCode.BRIGHTNESS_MIN_1,
+            ),
+            TuyaLightEntityDescription(
+                key=DPCode.SWITCH_LED_1,
+                translation_key="light",
+                brightness=DPCode.BRIGHT_VALUE_1,
+            ),
+            TuyaLightEntityDescription(
+                key=DPCode.SWITCH_LED_2,
+                translation_key="light_2",
+                brightness=DPCode.BRIGHT_VALUE_2,
+            ),
         ),
-    ),
-    # Ceiling Light
-    # https://developer.tuya.com/en/docs/iot/ceiling-light?id=Kaiuz03xxfc4r
-    "xdd": (
-        TuyaLightEntityDescription(
-            key=DPCode.SWITCH_LED,
-            name=None,
-            color_mode=DPCode.WORK_MODE,
-            brightness=DPCode.BRIGHT_VALUE,
-            color_temp=DPCode.TEMP_VALUE,
-            color_data=DPCode.COLOUR_DATA,
+        # Wake Up Light II
+        # Not documented
+        "hxd": (
+            TuyaLightEntityDescription(
+                key=DPCode.SWITCH_LED,
+                translation_key="light",
+                brightness=(DPCode.BRIGHT_VALUE_V2, DPCode.BRIGHT_VALUE),
+                brightness_max=DPCode.BRIGHTNESS_MAX_1,
+                brightness_min=DPCode.BRIGHTNESS_MIN_1,
+            ),
         ),
-        TuyaLightEntityDescription(
-            key=DPCode.SWITCH_NIGHT_LIGHT,
-            translation_key="night_light",
+        # Solar Light
+        # https://developer.tuya.com/en/docs/iot/tynd?id=Kaof8j02e1t98
+        "tyndj": (
+            TuyaLightEntityDescription(
+                key=DPCode.SWITCH_LED,
+                name=None,
+                color_mode=DPCode.WORK_MODE,
+                brightness=DPCode.BRIGHT_VALUE,
+                color_temp=DPCode.TEMP_VALUE,
+                color_data=DPCode.COLOUR_DATA,
+            ),
         ),
-    ),
-    # Remote Control
-    # https://developer.tuya.com/en/docs/iot/ykq?id=Kaof8ljn81aov
-    "ykq": (
-        TuyaLightEntityDescription(
-            key=DPCode.SWITCH_CONTROLLER,
-            name=None,
-            color_mode=DPCode.WORK_MODE,
-            brightness=DPCode.BRIGHT_CONTROLLER,
-            color_temp=DPCode.TEMP_CONTROLLER,
+        # Ceiling Light
+        # https://developer.tuya.com/en/docs/iot/ceiling-light?id=Kaiuz03xxfc4r
+        "xdd": (
+            TuyaLightEntityDescription(
+                key=DPCode.SWITCH_LED,
+                name=None,
+                color_mode=DPCode.WORK_MODE,
+                brightness=DPCode.BRIGHT_VALUE,
+                color_temp=DPCode.TEMP_VALUE,
+                color_data=DPCode.COLOUR_DATA,
+            ),
+            TuyaLightEntityDescription(
+                key=DPCode.SWITCH_NIGHT_LIGHT,
+                translation_key="night_light",
+            ),
         ),
-    ),
-    # Fan
-    # https://developer.tuya.com/en/docs/iot/categoryfs?id=Kaiuz1xweel1c
-    "fs": (
-        TuyaLightEntityDescription(
-            key=DPCode.LIGHT,
-            name=None,
-            color_mode=DPCode.WORK_MODE,
-            brightness=DPCode.BRIGHT_VALUE,
-            color_temp=DPCode.TEMP_VALUE,
+        # Remote Control
+        # https://developer.tuya.com/en/docs/iot/ykq?id=Kaof8ljn81aov
+        "ykq": (
+            TuyaLightEntityDescription(
+                key=DPCode.SWITCH_CONTROLLER,
+                name=None,
+                color_mode=DPCode.WORK_MODE,
+                brightness=DPCode.BRIGHT_CONTROLLER,
+                color_temp=DPCode.TEMP_CONTROLLER,
+            ),
         ),
-        TuyaLightEntityDescription(
-            key=DPCode.SWITCH_LED,
-            translation_key="light_2",
-            brightness=DPCode.BRIGHT_VALUE_1,
+        # Fan
+        # https://developer.tuya.com/en/docs/iot/categoryfs?id=Kaiuz1xweel1c
+        "fs": (
+            TuyaLightEntityDescription(
+                key=DPCode.LIGHT,
+                name=None,
+                color_mode=DPCode.WORK_MODE,
+                brightness=DPCode.BRIGHT_VALUE,
+                color_temp=DPCode.TEMP_VALUE,
+            ),
+            TuyaLightEntityDescription(
+                key=DPCode.SWITCH_LED,
+                translation_key="light_2",
+                brightness=DPCode.BRIGHT_VALUE_1,
+            ),
         ),
-    ),
-}
+    }
 
-# Socket (duplicate of `kg`)
-# https://developer.tuya.com/en/docs/iot/s?id=K9gf7o5prgf7s
-LIGHTS["cz"] = LIGHTS["kg"]
+    # Socket (duplicate of `kg`)
+    # https://developer.tuya.com/en/docs/iot/s?id=K9gf7o5prgf7s
+    lights["cz"] = lights["kg"]
+
+    # Power Socket (duplicate of `kg`)
+    # https://developer.tuya.com/en/docs/iot/s?id=K9gf7o5prgf7s
+    lights["pc"] = lights["kg"]
 
-# Power Socket (duplicate of `kg`)
-# https://developer.tuya.com/en/docs/iot/s?id=K9gf7o5prgf7s
-LIGHTS["pc"] = LIGHTS["kg"]
+    return lights
 
 
 # update the category mapping using the product mapping overrides
@@ -503,7 +510,7 @@ def update_mapping(
 
 
 def get_mapping_by_device(device: TuyaBLEDevice) -> tuple[TuyaLightEntityDescription]:
-    category_mapping = LIGHTS.get(device.category)
+    category_mapping = _build_lights().get(device.category)
 
     category = ProductsMapping.get(device.category)
     if category is not None:
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from functools import cache
 
 import logging
 from typing import Callable
@@ -140,7 +141,7 @@ def set_fingerbot_program_repeat_count(
         datapoint = self._device.datapoints[product.fingerbot.program]
         if datapoint and isinstance(datapoint.value, bytes):
             new_value = int.to_bytes(int(value), 2, "big") + datapoint.value[2:]
-            self._hass.create_task(datapoint.set_value(new_value))
+            self.set_dp_value(datapoint, new_value)
 
 
 def get_fingerbot_program_position(
@@ -166,7 +167,7 @@ def set_fingerbot_program_position(
         if datapoint and isinstance(datapoint.value, bytes):
             new_value = bytearray(datapoint.value)
             new_value[2] = int(value)
-            self._hass.create_task(datapoint.set_value(new_value))
+            self.set_dp_value(datapoint, new_value)
 
 
 @dataclass
@@ -218,416 +219,387 @@ class TuyaBLECategoryNumberMapping:
     mapping: list[TuyaBLENumberMapping] | None = None
 
 
-mapping: dict[str, TuyaBLECategoryNumberMapping] = {
-    "co2bj": TuyaBLECategoryNumberMapping(
-        products={
-            "59s19z5m": [  # CO2 Detector
-                TuyaBLENumberMapping(
-                    dp_id=17,
-                    description=NumberEntityDescription(
-                        key="brightness",
-                        icon="mdi:brightness-percent",
-                        native_max_value=100,
-                        native_min_value=0,
-                        native_unit_of_measurement=PERCENTAGE,
-                        native_step=1,
-                        entity_category=EntityCategory.CONFIG,
-                    ),
-                    mode=NumberMode.SLIDER,
-                ),
-                TuyaBLENumberMapping(
-                    dp_id=26,
-                    description=NumberEntityDescription(
-                        key="carbon_dioxide_alarm_level",
-                        icon="mdi:molecule-co2",
-                        native_max_value=5000,
-                        native_min_value=400,
-                        native_unit_of_measurement=CONCENTRATION_PARTS_PER_MILLION,
-                        native_step=100,
-                        entity_category=EntityCategory.CONFIG,
-                    ),
-                ),
-            ],
-        },
-    ),
-    "dcb": TuyaBLECategoryNumberMapping(
-        products={
-            **dict.fromkeys(
-                ["ajrhf1aj", "z5ztlw3k"],  # PARKSIDE Smart battery
-                [
+@cache
+def _build_mapping() -> dict[str, TuyaBLECategoryNumberMapping]:
+    """Mappings of all categories, built on first lookup."""
+    return {
+        "co2bj": TuyaBLECategoryNumberMapping(
+            products={
+                "59s19z5m": [  # CO2 Detector
                     TuyaBLENumberMapping(
-                        dp_id=116,
+                        dp_id=17,
                         description=NumberEntityDescription(
-                            key="low_discharge_voltage",
-                            device_class=NumberDeviceClass.VOLTAGE,
-                            native_unit_of_measurement=UnitOfElectricPotential.MILLIVOLT,
+                            key="brightness",
+                            icon="mdi:brightness-percent",
+                            native_max_value=100,
+                            native_min_value=0,
+                            native_unit_of_measurement=PERCENTAGE,
+                            native_step=1,
                             entity_category=EntityCategory.CONFIG,
                         ),
+                        mode=NumberMode.SLIDER,
                     ),
                     TuyaBLENumberMapping(
-                        dp_id=117,
+                        dp_id=26,
                         description=NumberEntityDescription(
-                            key="discharge_current_limit",
-                            device_class=NumberDeviceClass.CURRENT,
-                            native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
+                            key="carbon_dioxide_alarm_level",
+                            icon="mdi:molecule-co2",
+                            native_max_value=5000,
+                            native_min_value=400,
+                            native_unit_of_measurement=CONCENTRATION_PARTS_PER_MILLION,
+                            native_step=100,
                             entity_category=EntityCategory.CONFIG,
                         ),
                     ),
-                    TuyaBLENumberMapping(
-                        dp_id=118,
-                        description=NumberEntityDescription(
-                            key="power_indicator_time",
-                            device_class=NumberDeviceClass.DURATION,
-                            native_unit_of_measurement=UnitOfTime.SECONDS,
-                            entity_category=EntityCategory.CONFIG,
+                ],
+            },
+        ),
+        "dcb": TuyaBLECategoryNumberMapping(
+            products={
+                **dict.fromkeys(
+                    ["ajrhf1aj", "z5ztlw3k"],  # PARKSIDE Smart battery
+                    [
+                        TuyaBLENumberMapping(
+                            dp_id=116,
+                            description=NumberEntityDescription(
+                                key="low_discharge_voltage",
+                                device_class=NumberDeviceClass.VOLTAGE,
+                                native_unit_of_measurement=UnitOfElectricPotential.MILLIVOLT,
+                                entity_category=EntityCategory.CONFIG,
+                            ),
                         ),
-                    ),
-                    TuyaBLENumberMapping(
-                        dp_id=164,
-                        description=NumberEntityDescription(
-                            key="lamp_brightness_percentage",
-                            native_unit_of_measurement=PERCENTAGE,
-                            icon="mdi:brightness-percent",
-                            entity_category=EntityCategory.CONFIG,
+                        TuyaBLENumberMapping(
+                            dp_id=117,
+                            description=NumberEntityDescription(
+                                key="discharge_current_limit",
+                                device_class=NumberDeviceClass.CURRENT,
+                                native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
+                                entity_category=EntityCategory.CONFIG,
+                            ),
                         ),
-                    ),
-                    TuyaBLENumberMapping(
-                        dp_id=165,
-                        description=NumberEntityDescription(
-                            key="lamp_delay_time",
-                            device_class=NumberDeviceClass.DURATION,
-                            native_unit_of_measurement=UnitOfTime.SECONDS,
-                            icon="mdi:camera-timer",
-                            entity_category=EntityCategory.CONFIG,
+                        TuyaBLENumberMapping(
+                            dp_id=118,
+                            description=NumberEntityDescription(
+                                key="power_indicator_time",
+                                device_class=NumberDeviceClass.DURATION,
+                                native_unit_of_measurement=UnitOfTime.SECONDS,
+                                entity_category=EntityCategory.CONFIG,
+                            ),
                         ),
-                    ),
-                    TuyaBLENumberMapping(
-                        dp_id=173,
-                        description=NumberEntityDescription(
-                            key="kick_back_adjust",
-                            icon="mdi:car-esp",
-                            entity_category=EntityCategory.CONFIG,
+                        TuyaBLENumberMapping(
+                            dp_id=164,
+                            description=NumberEntityDescription(
+                                key="lamp_brightness_percentage",
+                                native_unit_of_measurement=PERCENTAGE,
+                                icon="mdi:brightness-percent",
+                                entity_category=EntityCategory.CONFIG,
+                            ),
                         ),
-                    ),
-                    TuyaBLENumberMapping(
-                        dp_id=178,
-                        description=NumberEntityDescription(
-                            key="speed_percentage",
-                            native_unit_of_measurement=PERCENTAGE,
-                            icon="mdi:speedometer",
-                            entity_category=EntityCategory.CONFIG,
+                        TuyaBLENumberMapping(
+                            dp_id=165,
+                            description=NumberEntityDescription(
+                                key="lamp_delay_time",
+                                device_class=NumberDeviceClass.DURATION,
+                                native_unit_of_measurement=UnitOfTime.SECONDS,
+                                icon="mdi:camera-timer",
+                                entity_category=EntityCategory.CONFIG,
+                            ),
                         ),
-                    ),
-                ],
-            ),
-        },
-    ),
-    "szjqr": TuyaBLECategoryNumberMapping(
-        products={
-            **dict.fromkeys(
-                ["3yqdo5yt", "xhf790if"],  # CubeTouch 1s and II
-                [
-                    TuyaBLEHoldTimeMapping(dp_id=3),
-                    TuyaBLENumberMapping(
-                        dp_id=5,
-                        description=TuyaBLEUpPositionDescription(
-                            native_max_value=100,
+                        TuyaBLENumberMapping(
+                            dp_id=173,
+                            description=NumberEntityDescription(
+                                key="kick_back_adjust",
+                                icon="mdi:car-esp",
+                                entity_category=EntityCategory.CONFIG,
+                            ),
                         ),
-                    ),
-                    TuyaBLENumberMapping(
-                        dp_id=6,
-                        description=TuyaBLEDownPositionDescription(
-                            native_min_value=0,
+                        TuyaBLENumberMapping(
+                            dp_id=178,
+                            description=NumberEntityDescription(
+                                key="speed_percentage",
+                                native_unit_of_measurement=PERCENTAGE,
+                                icon="mdi:speedometer",
+                                entity_category=EntityCategory.CONFIG,
+                            ),
                         ),
-                    ),
-                ],
-            ),
-            **dict.fromkeys(
-                [
-                    "blliqpsj",
-                    "ndvkgsrm",
-                    "yiihr7zh",
-                    "neq16kgd",
-                    "6jcvqwh0",
-                    "riecov42",
-                    "h8kdwywx",
-                ],  # Fingerbot Plus
-                [
-                    TuyaBLENumberMapping(
-                        dp_id=9,
-                        description=TuyaBLEDownPositionDescription(),
-                        is_available=is_fingerbot_not_in_program_mode,
-                    ),
-                    TuyaBLEHoldTimeMapping(dp_id=10),
-                    TuyaBLENumberMapping(
-                        dp_id=15,
-                        description=TuyaBLEUpPositionDescription(),
-                        is_available=is_fingerbot_not_in_program_mode,
+                    ],
+                ),
+            },
+        ),
+        "szjqr": TuyaBLECategoryNumberMapping(
+            products={
+                **dict.fromkeys(
+                    ["3yqdo5yt", "xhf790if"],  # CubeTouch 1s and II
+                    [
+                        TuyaBLEHoldTimeMapping(dp_id=3),
+                        TuyaBLENumberMapping(
+                            dp_id=5,
+                            description=TuyaBLEUpPositionDescription(
+                                native_max_value=100,
+                            ),
+                        ),
+                        TuyaBLENumberMapping(
+                            dp_id=6,
+                            description=TuyaBLEDownPositionDescription(
+                                native_min_value=0,
+                            ),
+                        ),
+                    ],
+                ),
+                **dict.fromkeys(
+                    [
+                        "blliqpsj",
+                        "ndvkgsrm",
+                        "yiihr7zh",
+                        "neq16kgd",
+                        "6jcvqwh0",
+                        "riecov42",
+                        "h8kdwywx",
+                    ],  # Fingerbot Plus
+                    [
+                        TuyaBLENumberMapping(
+                            dp_id=9,
+                            description=TuyaBLEDownPositionDescription(),
+                            is_available=is_fingerbot_not_in_program_mode,
+                        ),
+                        TuyaBLEHoldTimeMapping(dp_id=10),
+                        TuyaBLENumberMapping(
+                            dp_id=15,
+                            description=TuyaBLEUpPositionDescription(),
+                            is_available=is_fingerbot_not_in_program_mode,
+                        ),
+                        TuyaBLENumberMapping(
+                            dp_id=121,
+                            description=NumberEntityDescription(
+                                key="program_repeats_count",
+                                icon="mdi:repeat",
+                                native_max_value=0xFFFE,
+                                native_min_value=1,
+                                native_step=1,
+                                entity_category=EntityCategory.CONFIG,
+                            ),
+                            is_available=is_fingerbot_repeat_count_available,
+                            getter=get_fingerbot_program_repeat_count,
+                            setter=set_fingerbot_program_repeat_count,
+                        ),
+                        TuyaBLENumberMapping(
+                            dp_id=121,
+                            description=NumberEntityDescription(
+                                key="program_idle_position",
+                                icon="mdi:repeat",
+                                native_max_value=100,
+                                native_min_value=0,
+                                native_step=1,
+                                native_unit_of_measurement=PERCENTAGE,
+                                entity_category=EntityCategory.CONFIG,
+                            ),
+                            is_available=is_fingerbot_in_program_mode,
+                            getter=get_fingerbot_program_position,
+                            setter=set_fingerbot_program_position,
+                        ),
+                    ],
+                ),
+                **dict.fromkeys(
+                    [
+                        "ltak7e1p",
+                        "y6kttvd6",
+                        "yrnk7mnn",
+                        "nvr2rocq",
+                        "bnt7wajf",
+                        "rvdceqjh",
+                        "5xhbk964",
+                    ],  # Fingerbot
+                    [
+                        TuyaBLENumberMapping(
+                            dp_id=9,
+                            description=TuyaBLEDownPositionDescription(),
+                            is_available=is_fingerbot_not_in_program_mode,
+                        ),
+                        TuyaBLENumberMapping(
+                            dp_id=10,
+                            description=TuyaBLEHoldTimeDescription(
+                                native_step=0.1,
+                            ),
+                            coefficient=10.0,
+                            is_available=is_fingerbot_in_push_mode,
+                        ),
+                        TuyaBLENumberMapping(
+                            dp_id=15,
+                            description=TuyaBLEUpPositionDescription(),
+                            is_available=is_fingerbot_not_in_program_mode,
+                        ),
+                    ],
+                ),
+                "yn4x5fa7": [
+                    TuyaBLEHoldTimeMapping(
+                        dp_id=3,
+                        description=TuyaBLEHoldTimeDescription(
+                            native_min_value=0.3,
+                            native_max_value=10.0,
+                            native_step=0.1,
+                        ),
+                        coefficient=10.0,
                     ),
                     TuyaBLENumberMapping(
-                        dp_id=121,
+                        dp_id=4,
                         description=NumberEntityDescription(
-                            key="program_repeats_count",
-                            icon="mdi:repeat",
-                            native_max_value=0xFFFE,
-                            native_min_value=1,
+                            key="up_position",
+                            icon="mdi:arrow-up-bold",
+                            native_max_value=30,
+                            native_min_value=0,
+                            native_unit_of_measurement=PERCENTAGE,
                             native_step=1,
                             entity_category=EntityCategory.CONFIG,
                         ),
-                        is_available=is_fingerbot_repeat_count_available,
-                        getter=get_fingerbot_program_repeat_count,
-                        setter=set_fingerbot_program_repeat_count,
+                        is_available=is_fingerbot_not_in_program_mode,
                     ),
                     TuyaBLENumberMapping(
-                        dp_id=121,
+                        dp_id=5,
                         description=NumberEntityDescription(
-                            key="program_idle_position",
-                            icon="mdi:repeat",
-                            native_max_value=100,
+                            key="down_position",
+                            icon="mdi:arrow-down-bold",
+                            native_max_value=30,
                             native_min_value=0,
-                            native_step=1,
                             native_unit_of_measurement=PERCENTAGE,
+                            native_step=1,
                             entity_category=EntityCategory.CONFIG,
                         ),
-                        is_available=is_fingerbot_in_program_mode,
-                        getter=get_fingerbot_program_position,
-                        setter=set_fingerbot_program_position,
-                    ),
-                ],
-            ),
-            **dict.fromkeys(
-                [
-                    "ltak7e1p",
-                    "y6kttvd6",
-                    "yrnk7mnn",
-                    "nvr2rocq",
-                    "bnt7wajf",
-                    "rvdceqjh",
-                    "5xhbk964",
-                ],  # Fingerbot
-                [
-                    TuyaBLENumberMapping(
-                        dp_id=9,
-                        description=TuyaBLEDownPositionDescription(),
-                        is_available=is_fingerbot_not_in_program_mode,
-                    ),
-                    TuyaBLENumberMapping(
-                        dp_id=10,
-                        description=TuyaBLEHoldTimeDescription(
-                            native_step=0.1,
-                        ),
-                        coefficient=10.0,
-                        is_available=is_fingerbot_in_push_mode,
-                    ),
-                    TuyaBLENumberMapping(
-                        dp_id=15,
-                        description=TuyaBLEUpPositionDescription(),
                         is_available=is_fingerbot_not_in_program_mode,
                     ),
                 ],
-            ),
-            "yn4x5fa7": [
-                TuyaBLEHoldTimeMapping(
-                    dp_id=3,
-                    description=TuyaBLEHoldTimeDescription(
-                        native_min_value=0.3,
-                        native_max_value=10.0,
-                        native_step=0.1,
-                    ),
-                    coefficient=10.0,
-                ),
-                TuyaBLENumberMapping(
-                    dp_id=4,
-                    description=NumberEntityDescription(
-                        key="up_position",
-                        icon="mdi:arrow-up-bold",
-                        native_max_value=30,
-                        native_min_value=0,
-                        native_unit_of_measurement=PERCENTAGE,
-                        native_step=1,
-                        entity_category=EntityCategory.CONFIG,
-                    ),
-                    is_available=is_fingerbot_not_in_program_mode,
+            },
+        ),
+        "kg": TuyaBLECategoryNumberMapping(
+            products={
+                **dict.fromkeys(
+                    ["mknd4lci", "riecov42", "bs3ubslo"],  # Fingerbot Plus
+                    [
+                        TuyaBLENumberMapping(
+                            dp_id=102,
+                            description=TuyaBLEDownPositionDescription(),
+                            is_available=is_fingerbot_not_in_program_mode,
+                        ),
+                        TuyaBLEHoldTimeMapping(dp_id=103),
+                        TuyaBLENumberMapping(
+                            dp_id=106,
+                            description=TuyaBLEUpPositionDescription(),
+                            is_available=is_fingerbot_not_in_program_mode,
+                        ),
+                        TuyaBLENumberMapping(
+                            dp_id=109,
+                            description=NumberEntityDescription(
+                                key="program_repeats_count",
+                                icon="mdi:repeat",
+                                native_max_value=0xFFFE,
+                                native_min_value=1,
+                                native_step=1,
+                                entity_category=EntityCategory.CONFIG,
+                            ),
+                            is_available=is_fingerbot_repeat_count_available,
+                            getter=get_fingerbot_program_repeat_count,
+                            setter=set_fingerbot_program_repeat_count,
+                        ),
+                        TuyaBLENumberMapping(
+                            dp_id=109,
+                            description=NumberEntityDescription(
+                                key="program_idle_position",
+                                icon="mdi:repeat",
+                                native_max_value=100,
+                                native_min_value=0,
+                                native_step=1,
+                                native_unit_of_measurement=PERCENTAGE,
+                                entity_category=EntityCategory.CONFIG,
+                            ),
+                            is_available=is_fingerbot_in_program_mode,
+                            getter=get_fingerbot_program_position,
+                            setter=set_fingerbot_program_position,
+                        ),
+                    ],
                 ),
-                TuyaBLENumberMapping(
-                    dp_id=5,
-                    description=NumberEntityDescription(
-                        key="down_position",
-                        icon="mdi:arrow-down-bold",
-                        native_max_value=30,
-                        native_min_value=0,
-                        native_unit_of_measurement=PERCENTAGE,
-                        native_step=1,
-                        entity_category=EntityCategory.CONFIG,
-                    ),
-                    is_available=is_fingerbot_not_in_program_mode,
+            },
+        ),
+        "wk": TuyaBLECategoryNumberMapping(
+            products={
+                **dict.fromkeys(
+                    [
+                        "drlajpqc",
+                        "nhj2j7su",
+                        "zmachryv",
+                    ],  # Thermostatic Radiator Valve
+                    [
+                        TuyaBLENumberMapping(
+                            dp_id=27,
+                            description=NumberEntityDescription(
+                                key="temperature_calibration",
+                                icon="mdi:thermometer-lines",
+                                native_max_value=6,
+                                native_min_value=-6,
+                                native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+                                native_step=1,
+                                entity_category=EntityCategory.CONFIG,
+                            ),
+                        ),
+                    ],
                 ),
-            ],
-        },
-    ),
-    "kg": TuyaBLECategoryNumberMapping(
-        products={
-            **dict.fromkeys(
-                ["mknd4lci", "riecov42", "bs3ubslo"],  # Fingerbot Plus
-                [
+            },
+        ),
+        "wsdcg": TuyaBLECategoryNumberMapping(
+            products={
+                "ojzlzzsw": [  # Soil moisture sensor
                     TuyaBLENumberMapping(
-                        dp_id=102,
-                        description=TuyaBLEDownPositionDescription(),
-                        is_available=is_fingerbot_not_in_program_mode,
-                    ),
-                    TuyaBLEHoldTimeMapping(dp_id=103),
-                    TuyaBLENumberMapping(
-                        dp_id=106,
-                        description=TuyaBLEUpPositionDescription(),
-                        is_available=is_fingerbot_not_in_program_mode,
-                    ),
-                    TuyaBLENumberMapping(
-                        dp_id=109,
+                        dp_id=17,
                         description=NumberEntityDescription(
-                            key="program_repeats_count",
-                            icon="mdi:repeat",
-                            native_max_value=0xFFFE,
+                            key="reporting_period",
+                            icon="mdi:timer",
+                            native_max_value=120,
                             native_min_value=1,
+                            native_unit_of_measurement=UnitOfTime.MINUTES,
                             native_step=1,
                             entity_category=EntityCategory.CONFIG,
                         ),
-                        is_available=is_fingerbot_repeat_count_available,
-                        getter=get_fingerbot_program_repeat_count,
-                        setter=set_fingerbot_program_repeat_count,
                     ),
+                ],
+            },
+        ),
+        "znhsb": TuyaBLECategoryNumberMapping(
+            products={
+                "cdlandip": [  # Smart water bottle
                     TuyaBLENumberMapping(
-                        dp_id=109,
+                        dp_id=103,
                         description=NumberEntityDescription(
-                            key="program_idle_position",
-                            icon="mdi:repeat",
-                            native_max_value=100,
+                            key="recommended_water_intake",
+                            device_class=NumberDeviceClass.WATER,
+                            native_max_value=5000,
                             native_min_value=0,
+                            native_unit_of_measurement=UnitOfVolume.MILLILITERS,
                             native_step=1,
-                            native_unit_of_measurement=PERCENTAGE,
                             entity_category=EntityCategory.CONFIG,
                         ),
-                        is_available=is_fingerbot_in_program_mode,
-                        getter=get_fingerbot_program_position,
-                        setter=set_fingerbot_program_position,
                     ),
                 ],
-            ),
-        },
-    ),
-    "wk": TuyaBLECategoryNumberMapping(
-        products={
-            **dict.fromkeys(
-                [
-                    "drlajpqc",
-                    "nhj2j7su",
-                    "zmachryv",
-                ],  # Thermostatic Radiator Valve
-                [
+            },
+        ),
+        "ggq": TuyaBLECategoryNumberMapping(
+            products={
+                "6pahkcau": [  # Irrigation computer PARKSIDE PPB A1
                     TuyaBLENumberMapping(
-                        dp_id=27,
+                        dp_id=5,
                         description=NumberEntityDescription(
-                            key="temperature_calibration",
-                            icon="mdi:thermometer-lines",
-                            native_max_value=6,
-                            native_min_value=-6,
-                            native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+                            key="countdown_duration",
+                            icon="mdi:timer",
+                            native_max_value=1440,
+                            native_min_value=1,
+                            native_unit_of_measurement=UnitOfTime.MINUTES,
                             native_step=1,
-                            entity_category=EntityCategory.CONFIG,
                         ),
                     ),
                 ],
-            ),
-        },
-    ),
-    "wsdcg": TuyaBLECategoryNumberMapping(
-        products={
-            "ojzlzzsw": [  # Soil moisture sensor
-                TuyaBLENumberMapping(
-                    dp_id=17,
-                    description=NumberEntityDescription(
-                        key="reporting_period",
-                        icon="mdi:timer",
-                        native_max_value=120,
-                        native_min_value=1,
-                        native_unit_of_measurement=UnitOfTime.MINUTES,
-                        native_step=1,
-                        entity_category=EntityCategory.CONFIG,
-                    ),
-                ),
-            ],
-        },
-    ),
-    "znhsb": TuyaBLECategoryNumberMapping(
-        products={
-            "cdlandip": [  # Smart water bottle
-                TuyaBLENumberMapping(
-                    dp_id=103,
-                    description=NumberEntityDescription(
-                        key="recommended_water_intake",
-                        device_class=NumberDeviceClass.WATER,
-                        native_max_value=5000,
-                        native_min_value=0,
-                        native_unit_of_measurement=UnitOfVolume.MILLILITERS,
-                        native_step=1,
-                        entity_category=EntityCategory.CONFIG,
-                    ),
-                ),
-            ],
-        },
-    ),
-    "ggq": TuyaBLECategoryNumberMapping(
-        products={
-            "6pahkcau": [  # Irrigation computer PARKSIDE PPB A1
-                TuyaBLENumberMapping(
-                    dp_id=5,
-                    description=NumberEntityDescription(
-                        key="countdown_duration",
-                        icon="mdi:timer",
-                        native_max_value=1440,
-                        native_min_value=1,
-                        native_unit_of_measurement=UnitOfTime.MINUTES,
-                        native_step=1,
-                    ),
-                ),
-            ],
-            "hfgdqhho": [  # Irrigation computer - SGW02, SGW08
-                TuyaBLENumberMapping(
-                    dp_id=106,
-                    description=NumberEntityDescription(
-                        key="countdown_duration_z1",
-                        name="CH1 Countdown",
-                        icon="mdi:timer",
-                        native_max_value=1440,
-                        native_min_value=1,
-                        native_unit_of_measurement=UnitOfTime.MINUTES,
-                        native_step=1,
-                    ),
-                ),
-                TuyaBLENumberMapping(
-                    dp_id=103,
-                    description=NumberEntityDescription(
-                        key="countdown_duration_z2",
-                        name="CH2 Countdown",
-                        icon="mdi:timer",
-                        native_max_value=1440,
-                        native_min_value=1,
-                        native_unit_of_measurement=UnitOfTime.MINUTES,
-                        native_step=1,
-                    ),
-                ),
-            ],
-            **dict.fromkeys(
-                [
-                    "hfgdqhho",
-                    "qycalacn",
-                    "fnlw6npo",
-                    "jjqi2syk",
-                ],  # Irrigation computer - dual outlet
-                [
+                "hfgdqhho": [  # Irrigation computer - SGW02, SGW08
                     TuyaBLENumberMapping(
                         dp_id=106,
                         description=NumberEntityDescription(
                             key="countdown_duration_z1",
+                            name="CH1 Countdown",
                             icon="mdi:timer",
                             native_max_value=1440,
                             native_min_value=1,
@@ -639,6 +611,7 @@ mapping: dict[str, TuyaBLECategoryNumberMapping] = {
                         dp_id=103,
                         description=NumberEntityDescription(
                             key="countdown_duration_z2",
+                            name="CH2 Countdown",
                             icon="mdi:timer",
                             native_max_value=1440,
                             native_min_value=1,
@@ -647,18 +620,63 @@ mapping: dict[str, TuyaBLECategoryNumberMapping] = {
                         ),
                     ),
                 ],
-            ),
-        },
-    ),
-    "sfkzq": TuyaBLECategoryNumberMapping(
-        products={
-            **dict.fromkeys(
-                ["46zia2nz", "1fcnd8xk", "0axr5s0b"],
-                [
+                **dict.fromkeys(
+                    [
+                        "hfgdqhho",
+                        "qycalacn",
+                        "fnlw6npo",
+                        "jjqi2syk",
+                    ],  # Irrigation computer - dual outlet
+                    [
+                        TuyaBLENumberMapping(
+                            dp_id=106,
+                            description=NumberEntityDescription(
+                                key="countdown_duration_z1",
+                                icon="mdi:timer",
+                                native_max_value=1440,
+                                native_min_value=1,
+                                native_unit_of_measurement=UnitOfTime.MINUTES,
+                                native_step=1,
+                            ),
+                        ),
+                        TuyaBLENumberMapping(
+                            dp_id=103,
+                            description=NumberEntityDescription(
+                                key="countdown_duration_z2",
+                                icon="mdi:timer",
+                                native_max_value=1440,
+                                native_min_value=1,
+                                native_unit_of_measurement=UnitOfTime.MINUTES,
+                                native_step=1,
+                            ),
+                        ),
+                    ],
+                ),
+            },
+        ),
+        "sfkzq": TuyaBLECategoryNumberMapping(
+            products={
+                **dict.fromkeys(
+                    ["46zia2nz", "1fcnd8xk", "0axr5s0b"],
+                    [
+                        TuyaBLENumberMapping(
+                            dp_id=11,
+                            description=NumberEntityDescription(
+                                key="countdown_duration",
+                                icon="mdi:timer",
+                                native_max_value=86400,
+                                native_min_value=1,
+                                native_unit_of_measurement=UnitOfTime.SECONDS,
+                                native_step=1,
+                            ),
+                        ),
+                    ],
+                ),
+                "svhikeyq": [
                     TuyaBLENumberMapping(
                         dp_id=11,
                         description=NumberEntityDescription(
-                            key="countdown_duration",
+                            key="countdown",
                             icon="mdi:timer",
                             native_max_value=86400,
                             native_min_value=1,
@@ -666,72 +684,58 @@ mapping: dict[str, TuyaBLECategoryNumberMapping] = {
                             native_step=1,
                         ),
                     ),
-                ],
-            ),
-            "svhikeyq": [
-                TuyaBLENumberMapping(
-                    dp_id=11,
-                    description=NumberEntityDescription(
-                        key="countdown",
-                        icon="mdi:timer",
-                        native_max_value=86400,
-                        native_min_value=1,
-                        native_unit_of_measurement=UnitOfTime.SECONDS,
-                        native_step=1,
-                    ),
-                ),
-                TuyaBLENumberMapping(
-                    dp_id=9,
-                    description=NumberEntityDescription(
-                        key="countdown_duration",
-                        icon="mdi:timer",
-                        native_max_value=2592000,
-                        native_min_value=1,
-                        native_unit_of_measurement=UnitOfTime.SECONDS,
-                        native_step=1,
-                    ),
-                ),
-            ],
-            "nxquc5lb": [  # Smart water timer - SOP10
-                TuyaBLENumberMapping(
-                    dp_id=11,
-                    description=NumberEntityDescription(
-                        key="countdown",
-                        icon="mdi:timer",
-                        native_max_value=86400,
-                        native_min_value=60,
-                        native_unit_of_measurement=UnitOfTime.SECONDS,
-                        native_step=1,
-                    ),
-                ),
-            ],
-        },
-    ),
-    "cl": TuyaBLECategoryNumberMapping(
-        products={
-            **dict.fromkeys(
-                ["4pbr8eig", "qqdxfdht", "kcy0x4pi", "vlwf3ud6"],
-                [
                     TuyaBLENumberMapping(
-                        dp_id=105,
+                        dp_id=9,
                         description=NumberEntityDescription(
-                            key="cover_speed",
-                            icon="mdi:speedometer",
-                            native_max_value=40,
+                            key="countdown_duration",
+                            icon="mdi:timer",
+                            native_max_value=2592000,
                             native_min_value=1,
+                            native_unit_of_measurement=UnitOfTime.SECONDS,
                             native_step=1,
-                            mode=NumberMode.BOX,
                         ),
-                    )
+                    ),
                 ],
-            )
-        },
-    ),
-}
+                "nxquc5lb": [  # Smart water timer - SOP10
+                    TuyaBLENumberMapping(
+                        dp_id=11,
+                        description=NumberEntityDescription(
+                            key="countdown",
+                            icon="mdi:timer",
+                            native_max_value=86400,
+                            native_min_value=60,
+                            native_unit_of_measurement=UnitOfTime.SECONDS,
+                            native_step=1,
+                        ),
+                    ),
+                ],
+            },
+        ),
+        "cl": TuyaBLECategoryNumberMapping(
+            products={
+                **dict.fromkeys(
+                    ["4pbr8eig", "qqdxfdht", "kcy0x4pi", "vlwf3ud6"],
+                    [
+                        TuyaBLENumberMapping(
+                            dp_id=105,
+                            description=NumberEntityDescription(
+                                key="cover_speed",
+                                icon="mdi:speedometer",
+                                native_max_value=40,
+                                native_min_value=1,
+                                native_step=1,
+                                mode=NumberMode.BOX,
+                            ),
+                        )
+                    ],
+                )
+            },
+        ),
+    }
 
 
 def get_mapping_by_device(device: TuyaBLEDevice) -> list[TuyaBLECategoryNumberMapping]:
-    category = mapping.get(device.category)
+    category = _build_mapping().get(device.category)
     if category is not None and category.products is not None:
         product_mapping = category.products.get(device.product_id)
         if product_mapping is not None:
@@ -781,7 +785,7 @@ class TuyaBLENumber(TuyaBLEEntity, NumberEntity):
             int(int_value),
         )
         if datapoint:
-            self._hass.create_task(datapoint.set_value(int_value))
+            self.set_dp_value(datapoint, int_value)
 
     @property
     def available(self) -> bool:
@@ -0,0 +1,140 @@
+"""The Tuya BLE integration."""
+
+from __future__ import annotations
+
+import logging
+import time
+
+from bleak_retry_connector import BLEAK_RETRY_EXCEPTIONS as BLEAK_EXCEPTIONS
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from .const import (
+    COMMAND_POLL_DELAY,
+    POLL_INTERVALS,
+    POLL_RESPONSE_WINDOW,
+    POLL_SPACING,
+)
+from .tuya_ble import TuyaBLEDevice
+from .tuya_ble.exceptions import TuyaBLEError
+from .tuya_ble.polling import TuyaBLEPollInterval, TuyaBLEPollStagger
+from .tuya_ble.tuya_ble import global_connect_lock
+
+_LOGGER = logging.getLogger(__name__)
+
+
+poll_stagger = TuyaBLEPollStagger(POLL_SPACING)
+
+
+class TuyaBLEPoller:
+    """Adaptive status polling of one device.
+
+    The interval follows TuyaBLEPollInterval. Polls of a disconnected device
+    wait while it is away.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        device: TuyaBLEDevice,
+        bounds: tuple[float, float],
+    ) -> None:
+        self._hass = hass
+        self._device = device
+        self._adaptive = TuyaBLEPollInterval(*bounds, POLL_RESPONSE_WINDOW)
+        self._unsub: CALLBACK_TYPE | None = None
+        self._started = False
+
+    @classmethod
+    def for_device(
+        cls, hass: HomeAssistant, device: TuyaBLEDevice
+    ) -> TuyaBLEPoller | None:
+        """Create poller when the device category needs polling."""
+        bounds = POLL_INTERVALS.get(device.category)
+        if bounds is None:
+            return None
+        return cls(hass, device, bounds)
+
+    @property
+    def interval(self) -> float:
+        return self._adaptive.interval
+
+    @callback
+    def start(self) -> None:
+        self._started = True
+        # Spread first polls of devices over the minimal interval
+        min_interval = self._adaptive.min_interval
+        offset = hash(self._device.address) % max(int(min_interval), 1)
+        self._schedule(min_interval + offset, True)
+
+    @callback
+    def stop(self) -> None:
+        self._started = False
+        self._cancel()
+
+    @callback
+    def _cancel(self) -> None:
+        if self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+
+    @callback
+    def _schedule(self, delay: float, stagger: bool) -> None:
+        self._cancel()
+        if not self._started:
+            return
+        if stagger:
+            now = time.monotonic()
+            delay = poll_stagger.reserve(now + delay) - now
+        self._unsub = async_call_later(self._hass, delay, self._async_fire)
+
+    @callback
+    def on_data(self) -> None:
+        """Data frame received from the device."""
+        self._adaptive.on_data(time.monotonic())
+
+    @callback
+    def on_command(self) -> None:
+        """User command sent to the device."""
+        self._adaptive.on_command()
+        self._schedule(COMMAND_POLL_DELAY, False)
+
+    @callback
+    def _async_fire(self, _: object) -> None:
+        self._unsub = None
+        if self._adaptive.back_off():
+            # The device reported on its own since the last poll or command
+            self._schedule(self._adaptive.interval, True)
+            return
+
+        if not self._device.is_connected and global_connect_lock.locked():
+            # Another device holds the connection slot, do not pile up on it
+            self._schedule(POLL_SPACING, True)
+            return
+
+        if not self._device.is_connected and not self._device.presence.is_present():
+            # Connecting would fail, check again after the interval
+            _LOGGER.debug("%s: Away, polling deferred", self._device.address)
+            self._schedule(self._adaptive.interval, True)
+            return
+
+        self._adaptive.tighten()
+        self._hass.async_create_task(self._async_poll())
+
+    async def _async_poll(self) -> None:
+        _LOGGER.debug(
+            "%s: Polling status, next in %ss",
+            self._device.address,
+            self._adaptive.interval,
+        )
+        self._adaptive.on_poll(time.monotonic())
+        try:
+            await self._device.update()
+        except (*BLEAK_EXCEPTIONS, TuyaBLEError):
+            _LOGGER.debug(
+                "%s: Polling status failed", self._device.address, exc_info=True
+            )
+        finally:
+            if self._unsub is None:
+                self._schedule(self._adaptive.interval, True)
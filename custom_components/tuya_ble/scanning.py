@@ -0,0 +1,137 @@
+"""The Tuya BLE integration."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+import logging
+from typing import Any
+
+from homeassistant.components import bluetooth
+from homeassistant.components.bluetooth.match import ADDRESS, BluetoothCallbackMatcher
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+
+from .const import PRESENCE_REFRESH_INTERVAL
+from .tuya_ble import TuyaBLEDevice, TuyaBLERoute
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class TuyaBLEScanning:
+    """Advertisement callback and presence refresh of one device.
+
+    The scanning mode is set per adapter in the options of the Bluetooth
+    integration, a callback cannot change it. Advertisements that did not
+    change are not passed to the callback, the presence of the device is
+    refreshed from the last one recorded by bluetooth instead.
+    """
+
+    def __init__(self, hass: HomeAssistant, device: TuyaBLEDevice) -> None:
+        self._hass = hass
+        self._device = device
+        self._unregister: CALLBACK_TYPE | None = None
+        self._unsub_refresh: CALLBACK_TYPE | None = None
+
+    @callback
+    def start(self) -> None:
+        self._unregister = bluetooth.async_register_callback(
+            self._hass,
+            self._async_advertisement,
+            BluetoothCallbackMatcher({ADDRESS: self._device.address}),
+            bluetooth.BluetoothScanningMode.ACTIVE,
+        )
+        self._unsub_refresh = async_track_time_interval(
+            self._hass,
+            self._async_refresh_presence,
+            timedelta(seconds=PRESENCE_REFRESH_INTERVAL),
+        )
+        # Presence decides the first connection, known advertisements count
+        self._async_refresh_presence()
+
+    @callback
+    def stop(self) -> None:
+        if self._unregister is not None:
+            self._unregister()
+            self._unregister = None
+        if self._unsub_refresh is not None:
+            self._unsub_refresh()
+            self._unsub_refresh = None
+
+    @callback
+    def _async_refresh_presence(self, _: object = None) -> None:
+        address = self._device.address
+        service_info = bluetooth.async_last_service_info(self._hass, address, False)
+        if service_info is None:
+            return
+        # Both times are on the monotonic clock
+        self._device.presence.refresh(
+            service_info.rssi,
+            service_info.time,
+            bluetooth.async_get_learned_advertising_interval(self._hass, address),
+        )
+
+    @callback
+    def _async_advertisement(
+        self,
+        service_info: bluetooth.BluetoothServiceInfoBleak,
+        change: bluetooth.BluetoothChange,
+    ) -> None:
+        """Update from a ble callback."""
+        self._device.set_ble_device_and_advertisement_data(
+            service_info.device, service_info.advertisement
+        )
+
+
+def _free_slots(scanner: bluetooth.BaseHaScanner) -> int | None:
+    # Slot allocations are reported by newer bluetooth versions only
+    get_allocations = getattr(scanner, "get_allocations", None)
+    if get_allocations is not None:
+        allocations = get_allocations()
+        if allocations is not None and allocations.slots > 0:
+            return allocations.free
+    if scanner.connector is not None and not scanner.connector.can_connect():
+        return 0
+    return None
+
+
+@callback
+def async_get_routes(hass: HomeAssistant, address: str) -> list[TuyaBLERoute]:
+    """Connectable scanners and proxies that recently heard the device."""
+    return [
+        TuyaBLERoute(
+            scanner_device.scanner.source,
+            scanner_device.ble_device,
+            scanner_device.advertisement.rssi,
+            _free_slots(scanner_device.scanner),
+        )
+        for scanner_device in bluetooth.async_scanner_devices_by_address(
+            hass, address, True
+        )
+    ]
+
+
+@callback
+def async_get_client_source(hass: HomeAssistant, client: Any) -> str | None:
+    """Scanner or proxy a client connected by bluetooth went through.
+
+    The BleakClient wrapper of bluetooth chooses the backend itself. Proxy
+    backends keep the source they connect through, a local adapter is found
+    from the device path of the BlueZ backend. None when neither is known.
+    """
+    backend = getattr(client, "_backend", None)
+    source = getattr(backend, "_source", None)
+    if isinstance(source, str):
+        return source
+    device_path = getattr(backend, "_device_path", None)
+    if not isinstance(device_path, str):
+        return None
+    # /org/bluez/<adapter>/dev_<address>
+    parts = device_path.split("/")
+    if len(parts) < 4:
+        return None
+    for scanner_device in bluetooth.async_scanner_devices_by_address(
+        hass, client.address, True
+    ):
+        if getattr(scanner_device.scanner, "adapter", None) == parts[3]:
+            return scanner_device.scanner.source
+    return None
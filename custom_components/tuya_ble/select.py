@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from functools import cache
 
 import logging
 
@@ -106,12 +107,43 @@ class TuyaBLECategorySelectMapping:
     mapping: list[TuyaBLESelectMapping] | None = None
 
 
-mapping: dict[str, TuyaBLECategorySelectMapping] = {
-    "sfkzq": TuyaBLECategorySelectMapping(
-        products={
-            **dict.fromkeys(
-                ["46zia2nz", "1fcnd8xk", "0axr5s0b"],
-                [
+@cache
+def _build_mapping() -> dict[str, TuyaBLECategorySelectMapping]:
+    """Mappings of all categories, built on first lookup."""
+    return {
+        "sfkzq": TuyaBLECategorySelectMapping(
+            products={
+                **dict.fromkeys(
+                    ["46zia2nz", "1fcnd8xk", "0axr5s0b"],
+                    [
+                        TuyaBLESelectMapping(
+                            dp_id=10,
+                            description=SelectEntityDescription(
+                                key="weather_delay",
+                                options=[
+                                    "cancel",
+                                    "24h",
+                                    "48h",
+                                    "72h",
+                                ],
+                                entity_category=EntityCategory.CONFIG,
+                            ),
+                        ),
+                        TuyaBLESelectMapping(
+                            dp_id=12,
+                            description=SelectEntityDescription(
+                                key="work_state",
+                                options=["auto", "manual", "idle"],
+                                entity_category=EntityCategory.CONFIG,
+                            ),
+                        ),
+                    ],
+                ),
+                "nxquc5lb": [  # Smart water timer - SOP10
+                    TuyaBLEWeatherDelayMapping(dp_id=10),
+                    TuyaBLESmartWeatherMapping(dp_id=13),
+                ],
+                "svhikeyq": [  # Smart water timer
                     TuyaBLESelectMapping(
                         dp_id=10,
                         description=SelectEntityDescription(
@@ -125,282 +157,254 @@ mapping: dict[str, TuyaBLECategorySelectMapping] = {
                             entity_category=EntityCategory.CONFIG,
                         ),
                     ),
+                    TuyaBLESmartWeatherMapping(dp_id=13),
+                ],
+            },
+        ),
+        "co2bj": TuyaBLECategorySelectMapping(
+            products={
+                "59s19z5m": [  # CO2 Detector
                     TuyaBLESelectMapping(
-                        dp_id=12,
-                        description=SelectEntityDescription(
-                            key="work_state",
-                            options=["auto", "manual", "idle"],
-                            entity_category=EntityCategory.CONFIG,
+                        dp_id=101,
+                        description=TemperatureUnitDescription(
+                            options=[
+                                UnitOfTemperature.CELSIUS,
+                                UnitOfTemperature.FAHRENHEIT,
+                            ],
                         ),
                     ),
                 ],
-            ),
-            "nxquc5lb": [  # Smart water timer - SOP10
-                TuyaBLEWeatherDelayMapping(dp_id=10),
-                TuyaBLESmartWeatherMapping(dp_id=13),
-            ],
-            "svhikeyq": [  # Smart water timer
-                TuyaBLESelectMapping(
-                    dp_id=10,
-                    description=SelectEntityDescription(
-                        key="weather_delay",
-                        options=[
-                            "cancel",
-                            "24h",
-                            "48h",
-                            "72h",
-                        ],
-                        entity_category=EntityCategory.CONFIG,
-                    ),
+            },
+        ),
+        "dcb": TuyaBLECategorySelectMapping(
+            products={
+                **dict.fromkeys(
+                    ["ajrhf1aj", "z5ztlw3k"],  # PARKSIDE Smart battery
+                    [
+                        TuyaBLESelectMapping(
+                            dp_id=105,
+                            description=SelectEntityDescription(
+                                key="battery_work_mode",
+                                icon="mdi:leaf-circle-outline",
+                                options=[
+                                    "Performance",
+                                    "Balanced",
+                                    "Eco",
+                                    "Expert",
+                                ],
+                                entity_category=EntityCategory.CONFIG,
+                            ),
+                        ),
+                        TuyaBLESelectMapping(
+                            dp_id=174,
+                            description=SelectEntityDescription(
+                                key="pack_work_mode",
+                                icon="mdi:leaf-circle-outline",
+                                options=[
+                                    "Performance",
+                                    "Balanced",
+                                    "Eco",
+                                    "Expert",
+                                ],
+                                entity_category=EntityCategory.CONFIG,
+                            ),
+                        ),
+                    ],
                 ),
-                TuyaBLESmartWeatherMapping(dp_id=13),
-            ],
-        },
-    ),
-    "co2bj": TuyaBLECategorySelectMapping(
-        products={
-            "59s19z5m": [  # CO2 Detector
-                TuyaBLESelectMapping(
-                    dp_id=101,
-                    description=TemperatureUnitDescription(
-                        options=[
-                            UnitOfTemperature.CELSIUS,
-                            UnitOfTemperature.FAHRENHEIT,
-                        ],
-                    ),
+            },
+        ),
+        "ms": TuyaBLECategorySelectMapping(
+            products={
+                **dict.fromkeys(
+                    [
+                        "ludzroix",
+                        "isk2p555",
+                        "gumrixyt",
+                        "uamrw6h3",
+                        "okkyfgfs",
+                    ],  # Smart Lock
+                    [
+                        TuyaBLESelectMapping(
+                            dp_id=31,
+                            description=SelectEntityDescription(
+                                key="beep_volume",
+                                options=[
+                                    "mute",
+                                    "low",
+                                    "normal",
+                                    "high",
+                                ],
+                                entity_category=EntityCategory.CONFIG,
+                            ),
+                        ),
+                    ],
                 ),
-            ],
-        },
-    ),
-    "dcb": TuyaBLECategorySelectMapping(
-        products={
-            **dict.fromkeys(
-                ["ajrhf1aj", "z5ztlw3k"],  # PARKSIDE Smart battery
-                [
+            }
+        ),
+        "jtmspro": TuyaBLECategorySelectMapping(
+            products={
+                "xicdxood": [  # Raycube K7 Pro+
                     TuyaBLESelectMapping(
-                        dp_id=105,
+                        dp_id=31,
                         description=SelectEntityDescription(
-                            key="battery_work_mode",
-                            icon="mdi:leaf-circle-outline",
+                            key="beep_volume",
                             options=[
-                                "Performance",
-                                "Balanced",
-                                "Eco",
-                                "Expert",
+                                "Mute",
+                                "Low",
+                                "Normal",
+                                "High",
                             ],
                             entity_category=EntityCategory.CONFIG,
                         ),
                     ),
                     TuyaBLESelectMapping(
-                        dp_id=174,
+                        dp_id=28,
                         description=SelectEntityDescription(
-                            key="pack_work_mode",
-                            icon="mdi:leaf-circle-outline",
+                            key="language",
                             options=[
-                                "Performance",
-                                "Balanced",
-                                "Eco",
-                                "Expert",
+                                "Chinese Simplified",
+                                "English",
+                                "Arabic",
+                                "Indonesian",
+                                "Portuguese",
                             ],
                             entity_category=EntityCategory.CONFIG,
                         ),
                     ),
                 ],
-            ),
-        },
-    ),
-    "ms": TuyaBLECategorySelectMapping(
-        products={
-            **dict.fromkeys(
-                [
-                    "ludzroix",
-                    "isk2p555",
-                    "gumrixyt",
-                    "uamrw6h3",
-                    "okkyfgfs",
-                ],  # Smart Lock
-                [
+            }
+        ),
+        "szjqr": TuyaBLECategorySelectMapping(
+            products={
+                **dict.fromkeys(
+                    ["3yqdo5yt", "xhf790if", "yn4x5fa7"],  # CubeTouch 1s and II
+                    [
+                        TuyaBLEFingerbotModeMapping(dp_id=2),
+                    ],
+                ),
+                **dict.fromkeys(
+                    [
+                        "blliqpsj",
+                        "ndvkgsrm",
+                        "yiihr7zh",
+                        "neq16kgd",
+                        "6jcvqwh0",
+                        "riecov42",
+                        "h8kdwywx",
+                    ],  # Fingerbot Plus
+                    [
+                        TuyaBLEFingerbotModeMapping(dp_id=8),
+                    ],
+                ),
+                **dict.fromkeys(
+                    [
+                        "ltak7e1p",
+                        "y6kttvd6",
+                        "yrnk7mnn",
+                        "nvr2rocq",
+                        "bnt7wajf",
+                        "rvdceqjh",
+                        "5xhbk964",
+                    ],  # Fingerbot
+                    [
+                        TuyaBLEFingerbotModeMapping(dp_id=8),
+                    ],
+                ),
+            },
+        ),
+        "kg": TuyaBLECategorySelectMapping(
+            products={
+                **dict.fromkeys(
+                    ["mknd4lci", "riecov42", "bs3ubslo"],  # Fingerbot Plus
+                    [
+                        TuyaBLEFingerbotModeMapping(dp_id=101),
+                    ],
+                ),
+            },
+        ),
+        "wsdcg": TuyaBLECategorySelectMapping(
+            products={
+                "ojzlzzsw": [  # Soil moisture sensor
                     TuyaBLESelectMapping(
-                        dp_id=31,
-                        description=SelectEntityDescription(
-                            key="beep_volume",
+                        dp_id=9,
+                        description=TemperatureUnitDescription(
                             options=[
-                                "mute",
-                                "low",
-                                "normal",
-                                "high",
+                                UnitOfTemperature.CELSIUS,
+                                UnitOfTemperature.FAHRENHEIT,
                             ],
-                            entity_category=EntityCategory.CONFIG,
+                            entity_registry_enabled_default=False,
                         ),
                     ),
                 ],
-            ),
-        }
-    ),
-    "jtmspro": TuyaBLECategorySelectMapping(
-        products={
-            "xicdxood": [  # Raycube K7 Pro+
-                TuyaBLESelectMapping(
-                    dp_id=31,
-                    description=SelectEntityDescription(
-                        key="beep_volume",
-                        options=[
-                            "Mute",
-                            "Low",
-                            "Normal",
-                            "High",
-                        ],
-                        entity_category=EntityCategory.CONFIG,
-                    ),
-                ),
-                TuyaBLESelectMapping(
-                    dp_id=28,
-                    description=SelectEntityDescription(
-                        key="language",
-                        options=[
-                            "Chinese Simplified",
-                            "English",
-                            "Arabic",
-                            "Indonesian",
-                            "Portuguese",
-                        ],
-                        entity_category=EntityCategory.CONFIG,
+                "iv7hudlj": [  # Bluetooth Temperature Humidity Sensor
+                    TuyaBLESelectMapping(
+                        dp_id=9,
+                        description=TemperatureUnitDescription(
+                            options=[
+                                UnitOfTemperature.CELSIUS,
+                                UnitOfTemperature.FAHRENHEIT,
+                            ],
+                            entity_registry_enabled_default=False,
+                        ),
                     ),
-                ),
-            ],
-        }
-    ),
-    "szjqr": TuyaBLECategorySelectMapping(
-        products={
-            **dict.fromkeys(
-                ["3yqdo5yt", "xhf790if", "yn4x5fa7"],  # CubeTouch 1s and II
-                [
-                    TuyaBLEFingerbotModeMapping(dp_id=2),
-                ],
-            ),
-            **dict.fromkeys(
-                [
-                    "blliqpsj",
-                    "ndvkgsrm",
-                    "yiihr7zh",
-                    "neq16kgd",
-                    "6jcvqwh0",
-                    "riecov42",
-                    "h8kdwywx",
-                ],  # Fingerbot Plus
-                [
-                    TuyaBLEFingerbotModeMapping(dp_id=8),
                 ],
-            ),
-            **dict.fromkeys(
-                [
-                    "ltak7e1p",
-                    "y6kttvd6",
-                    "yrnk7mnn",
-                    "nvr2rocq",
-                    "bnt7wajf",
-                    "rvdceqjh",
-                    "5xhbk964",
-                ],  # Fingerbot
-                [
-                    TuyaBLEFingerbotModeMapping(dp_id=8),
-                ],
-            ),
-        },
-    ),
-    "kg": TuyaBLECategorySelectMapping(
-        products={
-            **dict.fromkeys(
-                ["mknd4lci", "riecov42", "bs3ubslo"],  # Fingerbot Plus
-                [
-                    TuyaBLEFingerbotModeMapping(dp_id=101),
-                ],
-            ),
-        },
-    ),
-    "wsdcg": TuyaBLECategorySelectMapping(
-        products={
-            "ojzlzzsw": [  # Soil moisture sensor
-                TuyaBLESelectMapping(
-                    dp_id=9,
-                    description=TemperatureUnitDescription(
-                        options=[
-                            UnitOfTemperature.CELSIUS,
-                            UnitOfTemperature.FAHRENHEIT,
-                        ],
-                        entity_registry_enabled_default=False,
-                    ),
-                ),
-            ],
-            "iv7hudlj": [  # Bluetooth Temperature Humidity Sensor
-                TuyaBLESelectMapping(
-                    dp_id=9,
-                    description=TemperatureUnitDescription(
-                        options=[
-                            UnitOfTemperature.CELSIUS,
-                            UnitOfTemperature.FAHRENHEIT,
-                        ],
-                        entity_registry_enabled_default=False,
-                    ),
-                ),
-            ],
-            "jm6iasmb": [  # Bluetooth Temperature Humidity Sensor
-                TuyaBLESelectMapping(
-                    dp_id=9,
-                    description=TemperatureUnitDescription(
-                        options=[
-                            UnitOfTemperature.CELSIUS,
-                            UnitOfTemperature.FAHRENHEIT,
-                        ],
-                        entity_registry_enabled_default=False,
+                "jm6iasmb": [  # Bluetooth Temperature Humidity Sensor
+                    TuyaBLESelectMapping(
+                        dp_id=9,
+                        description=TemperatureUnitDescription(
+                            options=[
+                                UnitOfTemperature.CELSIUS,
+                                UnitOfTemperature.FAHRENHEIT,
+                            ],
+                            entity_registry_enabled_default=False,
+                        ),
                     ),
-                ),
-            ],
-            "vlzqwckk": [
-                TuyaBLESelectMapping(
-                    dp_id=9,
-                    description=TemperatureUnitDescription(
-                        options=[
-                            UnitOfTemperature.CELSIUS,
-                            UnitOfTemperature.FAHRENHEIT,
-                        ],
-                        entity_registry_enabled_default=False,
+                ],
+                "vlzqwckk": [
+                    TuyaBLESelectMapping(
+                        dp_id=9,
+                        description=TemperatureUnitDescription(
+                            options=[
+                                UnitOfTemperature.CELSIUS,
+                                UnitOfTemperature.FAHRENHEIT,
+                            ],
+                            entity_registry_enabled_default=False,
+                        ),
                     ),
-                ),
-            ],
-        },
-    ),
-    "znhsb": TuyaBLECategorySelectMapping(
-        products={
-            "cdlandip": [  # Smart water bottle
-                TuyaBLESelectMapping(
-                    dp_id=106,
-                    description=TemperatureUnitDescription(
-                        options=[
-                            UnitOfTemperature.CELSIUS,
-                            UnitOfTemperature.FAHRENHEIT,
-                        ],
+                ],
+            },
+        ),
+        "znhsb": TuyaBLECategorySelectMapping(
+            products={
+                "cdlandip": [  # Smart water bottle
+                    TuyaBLESelectMapping(
+                        dp_id=106,
+                        description=TemperatureUnitDescription(
+                            options=[
+                                UnitOfTemperature.CELSIUS,
+                                UnitOfTemperature.FAHRENHEIT,
+                            ],
+                        ),
                     ),
-                ),
-                TuyaBLESelectMapping(
-                    dp_id=107,
-                    description=SelectEntityDescription(
-                        key="reminder_mode",
-                        options=[
-                            "interval_reminder",
-                            "alarm_reminder",  # TODO: schedule_reminder?
-                        ],
-                        entity_category=EntityCategory.CONFIG,
+                    TuyaBLESelectMapping(
+                        dp_id=107,
+                        description=SelectEntityDescription(
+                            key="reminder_mode",
+                            options=[
+                                "interval_reminder",
+                                "alarm_reminder",  # TODO: schedule_reminder?
+                            ],
+                            entity_category=EntityCategory.CONFIG,
+                        ),
                     ),
-                ),
-            ],
-        },
-    ),
-}
+                ],
+            },
+        ),
+    }
 
 
 def get_mapping_by_device(device: TuyaBLEDevice) -> list[TuyaBLECategorySelectMapping]:
-    category = mapping.get(device.category)
+    category = _build_mapping().get(device.category)
     if category is not None and category.products is not None:
         product_mapping = category.products.get(device.product_id)
         if product_mapping is not None:
@@ -450,7 +454,7 @@ class TuyaBLESelect(TuyaBLEEntity, SelectEntity):
                 int_value,
             )
             if datapoint:
-                self._hass.create_task(datapoint.set_value(int_value))
+                self.set_dp_value(datapoint, int_value)
 
 
 async def async_setup_entry(
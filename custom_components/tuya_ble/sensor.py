@@ -2,8 +2,20 @@
 
 from __future__ import annotations
 from dataclasses import dataclass, field
+from functools import cache, partial
+from datetime import datetime, timedelta
 import logging
+import time
 from typing import Callable
+from homeassistant.components.recorder import DOMAIN as RECORDER_DOMAIN, get_instance
+from homeassistant.components.recorder.models import (
+    StatisticData,
+    StatisticMetaData,
+)
+from homeassistant.components.recorder.statistics import (
+    async_import_statistics,
+    statistics_during_period,
+)
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
@@ -24,7 +36,9 @@ from homeassistant.const import (
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_call_later, async_track_time_interval
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.util import dt as dt_util
 from .const import (
     BATTERY_STATE_HIGH,
     BATTERY_STATE_LOW,
@@ -35,9 +49,16 @@ from .const import (
     CO2_LEVEL_ALARM,
     CO2_LEVEL_NORMAL,
     DOMAIN,
+    HISTORY_COMPILE_DELAY,
+    HISTORY_IMPORT_DELAY,
+    HISTORY_IMPORT_RETENTION,
+    RSSI_UPDATE_INTERVAL,
+    SENSOR_MAX_SILENCE,
+    SENSOR_MIN_INTERVAL,
 )
 from .devices import TuyaBLEData, TuyaBLEEntity, TuyaBLEProductInfo
-from .tuya_ble import TuyaBLEDataPointType, TuyaBLEDevice
+from .tuya_ble import TuyaBLEDataPointRecord, TuyaBLEDataPointType, TuyaBLEDevice
+from .tuya_ble.throttle import TuyaBLEStateThrottle
 
 _LOGGER = logging.getLogger(__name__)
 SIGNAL_STRENGTH_DP_ID = -1
@@ -56,6 +77,24 @@ class TuyaBLESensorMapping:
     coefficient: float = 1.0
     icons: list[str] | None = None
     is_available: TuyaBLESensorIsAvailable = None
+    # Seconds between refreshes of values not reported in datapoints
+    update_interval: float | None = None
+    # Changes within max(deadband, deadband_relative * |value|) are not
+    # written, see TuyaBLEStateThrottle
+    deadband: float = 0.0
+    deadband_relative: float = 0.0
+    # Minimal seconds between state writes, later changes are delayed
+    min_interval: float | None = None
+    # Seconds after which the state is written even without significant change
+    max_silence: float | None = None
+
+    @property
+    def throttled(self) -> bool:
+        return (
+            self.deadband > 0
+            or self.deadband_relative > 0
+            or self.min_interval is not None
+        )
 
 
 @dataclass
@@ -72,7 +111,16 @@ class TuyaBLEBatteryMapping(TuyaBLESensorMapping):
 
 
 @dataclass
-class TuyaBLETemperatureMapping(TuyaBLESensorMapping):
+class TuyaBLEThrottledMapping(TuyaBLESensorMapping):
+    """Environment sensor pushing small changes often."""
+
+    deadband: float = 1.0
+    min_interval: float | None = SENSOR_MIN_INTERVAL
+    max_silence: float | None = SENSOR_MAX_SILENCE
+
+
+@dataclass
+class TuyaBLETemperatureMapping(TuyaBLEThrottledMapping):
     description: SensorEntityDescription = field(
         default_factory=lambda: SensorEntityDescription(
             key="temperature",
@@ -81,6 +129,7 @@ class TuyaBLETemperatureMapping(TuyaBLESensorMapping):
             state_class=SensorStateClass.MEASUREMENT,
         )
     )
+    deadband: float = 0.2
 
 
 def is_co2_alarm_enabled(self: TuyaBLESensor, product: TuyaBLEProductInfo) -> bool:
@@ -122,63 +171,111 @@ class TuyaBLEWorkStateMapping(TuyaBLESensorMapping):
     )
 
 
-mapping: dict[str, TuyaBLECategorySensorMapping] = {
-    "co2bj": TuyaBLECategorySensorMapping(
-        products={
-            "59s19z5m": [  # CO2 Detector
-                TuyaBLESensorMapping(
-                    dp_id=1,
-                    description=SensorEntityDescription(
-                        key="carbon_dioxide_alarm",
-                        icon="mdi:molecule-co2",
-                        device_class=SensorDeviceClass.ENUM,
-                        options=[
-                            CO2_LEVEL_ALARM,
-                            CO2_LEVEL_NORMAL,
-                        ],
+@cache
+def _build_mapping() -> dict[str, TuyaBLECategorySensorMapping]:
+    """Mappings of all categories, built on first lookup."""
+    return {
+        "co2bj": TuyaBLECategorySensorMapping(
+            products={
+                "59s19z5m": [  # CO2 Detector
+                    TuyaBLESensorMapping(
+                        dp_id=1,
+                        description=SensorEntityDescription(
+                            key="carbon_dioxide_alarm",
+                            icon="mdi:molecule-co2",
+                            device_class=SensorDeviceClass.ENUM,
+                            options=[
+                                CO2_LEVEL_ALARM,
+                                CO2_LEVEL_NORMAL,
+                            ],
+                        ),
+                        is_available=is_co2_alarm_enabled,
                     ),
-                    is_available=is_co2_alarm_enabled,
-                ),
-                TuyaBLESensorMapping(
-                    dp_id=2,
-                    description=SensorEntityDescription(
-                        key="carbon_dioxide",
-                        device_class=SensorDeviceClass.CO2,
-                        native_unit_of_measurement=CONCENTRATION_PARTS_PER_MILLION,
-                        state_class=SensorStateClass.MEASUREMENT,
+                    TuyaBLEThrottledMapping(
+                        dp_id=2,
+                        description=SensorEntityDescription(
+                            key="carbon_dioxide",
+                            device_class=SensorDeviceClass.CO2,
+                            native_unit_of_measurement=CONCENTRATION_PARTS_PER_MILLION,
+                            state_class=SensorStateClass.MEASUREMENT,
+                        ),
+                        deadband=10.0,
                     ),
-                ),
-                TuyaBLEBatteryMapping(dp_id=15),
-                TuyaBLETemperatureMapping(dp_id=18),
-                TuyaBLESensorMapping(
-                    dp_id=19,
-                    description=SensorEntityDescription(
-                        key="humidity",
-                        device_class=SensorDeviceClass.HUMIDITY,
-                        native_unit_of_measurement=PERCENTAGE,
-                        state_class=SensorStateClass.MEASUREMENT,
+                    TuyaBLEBatteryMapping(dp_id=15),
+                    TuyaBLETemperatureMapping(dp_id=18),
+                    TuyaBLEThrottledMapping(
+                        dp_id=19,
+                        description=SensorEntityDescription(
+                            key="humidity",
+                            device_class=SensorDeviceClass.HUMIDITY,
+                            native_unit_of_measurement=PERCENTAGE,
+                            state_class=SensorStateClass.MEASUREMENT,
+                        ),
                     ),
+                ]
+            }
+        ),
+        "ms": TuyaBLECategorySensorMapping(
+            products={
+                **dict.fromkeys(
+                    [
+                        "ludzroix",
+                        "isk2p555",
+                        "gumrixyt",
+                        "uamrw6h3",
+                        "okkyfgfs",
+                        "bvclwu9b",
+                        "k53ok3u9",
+                    ],  # Smart Lock
+                    [
+                        TuyaBLESensorMapping(
+                            dp_id=21,
+                            description=SensorEntityDescription(
+                                key="alarm_lock",
+                                device_class=SensorDeviceClass.ENUM,
+                                options=[
+                                    "wrong_finger",
+                                    "wrong_password",
+                                    "wrong_card",
+                                    "wrong_face",
+                                    "tongue_bad",
+                                    "too_hot",
+                                    "unclosed_time",
+                                    "tongue_not_out",
+                                    "pry",
+                                    "key_in",
+                                    "low_battery",
+                                    "power_off",
+                                    "shock",
+                                ],
+                            ),
+                        ),
+                        TuyaBLEBatteryMapping(dp_id=8),
+                        TuyaBLESensorMapping(
+                            dp_id=40,
+                            description=SensorEntityDescription(
+                                key="lock_door_status",
+                                entity_category=EntityCategory.DIAGNOSTIC,
+                                device_class=SensorDeviceClass.ENUM,
+                                options=[
+                                    "door_status_unknown",
+                                    "door_status_open",
+                                    "door_status_closed",
+                                ],
+                            ),
+                        ),
+                    ],
                 ),
-            ]
-        }
-    ),
-    "ms": TuyaBLECategorySensorMapping(
-        products={
-            **dict.fromkeys(
-                [
-                    "ludzroix",
-                    "isk2p555",
-                    "gumrixyt",
-                    "uamrw6h3",
-                    "okkyfgfs",
-                    "bvclwu9b",
-                    "k53ok3u9",
-                ],  # Smart Lock
-                [
+            }
+        ),
+        "jtmspro": TuyaBLECategorySensorMapping(
+            products={
+                "xicdxood": [  # Raycube K7 Pro+
                     TuyaBLESensorMapping(
-                        dp_id=21,
+                        dp_id=21,  # Requires more testing
                         description=SensorEntityDescription(
                             key="alarm_lock",
+                            icon="mdi:alarm-light-outline",
                             device_class=SensorDeviceClass.ENUM,
                             options=[
                                 "wrong_finger",
@@ -194,795 +291,756 @@ mapping: dict[str, TuyaBLECategorySensorMapping] = {
                                 "low_battery",
                                 "power_off",
                                 "shock",
+                                "defense",
                             ],
                         ),
                     ),
-                    TuyaBLEBatteryMapping(dp_id=8),
                     TuyaBLESensorMapping(
-                        dp_id=40,
+                        dp_id=12,  # Retrieve last fingerprint used
                         description=SensorEntityDescription(
-                            key="lock_door_status",
-                            entity_category=EntityCategory.DIAGNOSTIC,
-                            device_class=SensorDeviceClass.ENUM,
-                            options=[
-                                "door_status_unknown",
-                                "door_status_open",
-                                "door_status_closed",
-                            ],
+                            key="unlock_fingerprint",
+                            icon="mdi:fingerprint",
                         ),
                     ),
-                ],
-            ),
-        }
-    ),
-    "jtmspro": TuyaBLECategorySensorMapping(
-        products={
-            "xicdxood": [  # Raycube K7 Pro+
-                TuyaBLESensorMapping(
-                    dp_id=21,  # Requires more testing
-                    description=SensorEntityDescription(
-                        key="alarm_lock",
-                        icon="mdi:alarm-light-outline",
-                        device_class=SensorDeviceClass.ENUM,
-                        options=[
-                            "wrong_finger",
-                            "wrong_password",
-                            "wrong_card",
-                            "wrong_face",
-                            "tongue_bad",
-                            "too_hot",
-                            "unclosed_time",
-                            "tongue_not_out",
-                            "pry",
-                            "key_in",
-                            "low_battery",
-                            "power_off",
-                            "shock",
-                            "defense",
-                        ],
-                    ),
-                ),
-                TuyaBLESensorMapping(
-                    dp_id=12,  # Retrieve last fingerprint used
-                    description=SensorEntityDescription(
-                        key="unlock_fingerprint",
-                        icon="mdi:fingerprint",
-                    ),
-                ),
-                TuyaBLESensorMapping(
-                    dp_id=15,  # Retrieve last card used
-                    description=SensorEntityDescription(
-                        key="unlock_card",
-                        icon="mdi:nfc-variant",
-                    ),
-                ),
-                TuyaBLESensorMapping(
-                    dp_id=13,  # Retrieve last code used
-                    description=SensorEntityDescription(
-                        key="unlock_password",
-                        icon="mdi:keyboard-outline",
+                    TuyaBLESensorMapping(
+                        dp_id=15,  # Retrieve last card used
+                        description=SensorEntityDescription(
+                            key="unlock_card",
+                            icon="mdi:nfc-variant",
+                        ),
                     ),
-                ),
-                TuyaBLEBatteryMapping(dp_id=8),
-            ],
-        }
-    ),
-    "szjqr": TuyaBLECategorySensorMapping(
-        products={
-            **dict.fromkeys(
-                ["3yqdo5yt", "xhf790if", "okkyfgfs"],  # CubeTouch 1s and II
-                [
                     TuyaBLESensorMapping(
-                        dp_id=7,
+                        dp_id=13,  # Retrieve last code used
                         description=SensorEntityDescription(
-                            key="battery_charging",
-                            device_class=SensorDeviceClass.ENUM,
-                            entity_category=EntityCategory.DIAGNOSTIC,
-                            options=[
-                                BATTERY_NOT_CHARGING,
-                                BATTERY_CHARGING,
-                                BATTERY_CHARGED,
-                            ],
+                            key="unlock_password",
+                            icon="mdi:keyboard-outline",
                         ),
-                        icons=[
-                            "mdi:battery",
-                            "mdi:power-plug-battery",
-                            "mdi:battery-check",
-                        ],
                     ),
                     TuyaBLEBatteryMapping(dp_id=8),
                 ],
-            ),
-            **dict.fromkeys(
-                [
-                    "blliqpsj",
-                    "ndvkgsrm",
-                    "yiihr7zh",
-                    "neq16kgd",
-                    "6jcvqwh0",
-                    "riecov42",
-                    "h8kdwywx",
-                ],  # Fingerbot Plus
-                [
-                    TuyaBLEBatteryMapping(dp_id=12),
-                ],
-            ),
-            **dict.fromkeys(
-                [
-                    "ltak7e1p",
-                    "y6kttvd6",
-                    "yrnk7mnn",
-                    "nvr2rocq",
-                    "bnt7wajf",
-                    "rvdceqjh",
-                    "5xhbk964",
-                ],  # Fingerbot
-                [
-                    TuyaBLEBatteryMapping(dp_id=12),
-                ],
-            ),
-        },
-    ),
-    "kg": TuyaBLECategorySensorMapping(
-        products={
-            **dict.fromkeys(
-                ["mknd4lci", "riecov42"],  # Fingerbot Plus
-                [
-                    TuyaBLEBatteryMapping(dp_id=105),
-                ],
-            ),
-        },
-    ),
-    "wsdcg": TuyaBLECategorySensorMapping(
-        products={
-            "ojzlzzsw": [  # Soil moisture sensor
-                TuyaBLETemperatureMapping(
-                    dp_id=1,
-                    coefficient=10.0,
-                ),
-                TuyaBLESensorMapping(
-                    dp_id=2,
-                    description=SensorEntityDescription(
-                        key="moisture",
-                        device_class=SensorDeviceClass.MOISTURE,
-                        native_unit_of_measurement=PERCENTAGE,
-                        state_class=SensorStateClass.MEASUREMENT,
-                    ),
-                ),
-                TuyaBLESensorMapping(
-                    dp_id=3,
-                    description=SensorEntityDescription(
-                        key="battery_state",
-                        icon="mdi:battery",
-                        device_class=SensorDeviceClass.ENUM,
-                        entity_category=EntityCategory.DIAGNOSTIC,
-                        options=[
-                            BATTERY_STATE_LOW,
-                            BATTERY_STATE_NORMAL,
-                            BATTERY_STATE_HIGH,
-                        ],
-                    ),
-                    icons=[
-                        "mdi:battery-alert",
-                        "mdi:battery-50",
-                        "mdi:battery-check",
+            }
+        ),
+        "szjqr": TuyaBLECategorySensorMapping(
+            products={
+                **dict.fromkeys(
+                    ["3yqdo5yt", "xhf790if", "okkyfgfs"],  # CubeTouch 1s and II
+                    [
+                        TuyaBLESensorMapping(
+                            dp_id=7,
+                            description=SensorEntityDescription(
+                                key="battery_charging",
+                                device_class=SensorDeviceClass.ENUM,
+                                entity_category=EntityCategory.DIAGNOSTIC,
+                                options=[
+                                    BATTERY_NOT_CHARGING,
+                                    BATTERY_CHARGING,
+                                    BATTERY_CHARGED,
+                                ],
+                            ),
+                            icons=[
+                                "mdi:battery",
+                                "mdi:power-plug-battery",
+                                "mdi:battery-check",
+                            ],
+                        ),
+                        TuyaBLEBatteryMapping(dp_id=8),
                     ],
                 ),
-                TuyaBLEBatteryMapping(dp_id=4),
-            ],
-            "iv7hudlj": [  # Bluetooth Temperature Humidity Sensor
-                TuyaBLETemperatureMapping(
-                    dp_id=1,
-                    coefficient=10.0,
-                    description=SensorEntityDescription(
-                        key="va_temperature",
-                        device_class=SensorDeviceClass.TEMPERATURE,
-                        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-                        state_class=SensorStateClass.MEASUREMENT,
-                    ),
-                ),
-                TuyaBLESensorMapping(
-                    dp_id=2,
-                    description=SensorEntityDescription(
-                        key="va_moisture",
-                        device_class=SensorDeviceClass.MOISTURE,
-                        native_unit_of_measurement=PERCENTAGE,
-                        state_class=SensorStateClass.MEASUREMENT,
-                    ),
-                ),
-                TuyaBLEBatteryMapping(
-                    dp_id=4,
-                    description=SensorEntityDescription(
-                        key="battery_percentage",
-                        device_class=SensorDeviceClass.BATTERY,
-                        native_unit_of_measurement=PERCENTAGE,
-                        entity_category=EntityCategory.DIAGNOSTIC,
-                        state_class=SensorStateClass.MEASUREMENT,
-                    ),
-                ),
-            ],
-            "jm6iasmb": [  # Bluetooth Temperature Humidity Sensor
-                TuyaBLETemperatureMapping(
-                    dp_id=1,
-                    coefficient=10.0,
-                    description=SensorEntityDescription(
-                        key="va_temperature",
-                        device_class=SensorDeviceClass.TEMPERATURE,
-                        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-                        state_class=SensorStateClass.MEASUREMENT,
-                    ),
-                ),
-                TuyaBLESensorMapping(
-                    dp_id=2,
-                    description=SensorEntityDescription(
-                        key="va_moisture",
-                        device_class=SensorDeviceClass.MOISTURE,
-                        native_unit_of_measurement=PERCENTAGE,
-                        state_class=SensorStateClass.MEASUREMENT,
-                    ),
-                ),
-                TuyaBLEBatteryMapping(
-                    dp_id=4,
-                    description=SensorEntityDescription(
-                        key="battery_percentage",
-                        device_class=SensorDeviceClass.BATTERY,
-                        native_unit_of_measurement=PERCENTAGE,
-                        entity_category=EntityCategory.DIAGNOSTIC,
-                        state_class=SensorStateClass.MEASUREMENT,
-                    ),
-                ),
-            ],
-            "tv6peegl": [  # Soil moisture sensor
-                TuyaBLETemperatureMapping(
-                    dp_id=101,
-                ),
-                TuyaBLESensorMapping(
-                    dp_id=102,
-                    description=SensorEntityDescription(
-                        key="moisture",
-                        device_class=SensorDeviceClass.MOISTURE,
-                        native_unit_of_measurement=PERCENTAGE,
-                        state_class=SensorStateClass.MEASUREMENT,
-                    ),
-                ),
-            ],
-            "vlzqwckk": [
-                TuyaBLETemperatureMapping(
-                    dp_id=1,
-                    coefficient=10.0,
-                    description=SensorEntityDescription(
-                        key="va_temperature",
-                        device_class=SensorDeviceClass.TEMPERATURE,
-                        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-                        state_class=SensorStateClass.MEASUREMENT,
-                    ),
+                **dict.fromkeys(
+                    [
+                        "blliqpsj",
+                        "ndvkgsrm",
+                        "yiihr7zh",
+                        "neq16kgd",
+                        "6jcvqwh0",
+                        "riecov42",
+                        "h8kdwywx",
+                    ],  # Fingerbot Plus
+                    [
+                        TuyaBLEBatteryMapping(dp_id=12),
+                    ],
                 ),
-                TuyaBLESensorMapping(
-                    dp_id=2,
-                    description=SensorEntityDescription(
-                        key="va_humidity",
-                        device_class=SensorDeviceClass.HUMIDITY,
-                        native_unit_of_measurement=PERCENTAGE,
-                        state_class=SensorStateClass.MEASUREMENT,
-                    ),
+                **dict.fromkeys(
+                    [
+                        "ltak7e1p",
+                        "y6kttvd6",
+                        "yrnk7mnn",
+                        "nvr2rocq",
+                        "bnt7wajf",
+                        "rvdceqjh",
+                        "5xhbk964",
+                    ],  # Fingerbot
+                    [
+                        TuyaBLEBatteryMapping(dp_id=12),
+                    ],
                 ),
-                TuyaBLEBatteryMapping(
-                    dp_id=4,
-                    description=SensorEntityDescription(
-                        key="battery_percentage",
-                        device_class=SensorDeviceClass.BATTERY,
-                        native_unit_of_measurement=PERCENTAGE,
-                        entity_category=EntityCategory.DIAGNOSTIC,
-                        state_class=SensorStateClass.MEASUREMENT,
-                    ),
+            },
+        ),
+        "kg": TuyaBLECategorySensorMapping(
+            products={
+                **dict.fromkeys(
+                    ["mknd4lci", "riecov42"],  # Fingerbot Plus
+                    [
+                        TuyaBLEBatteryMapping(dp_id=105),
+                    ],
                 ),
-            ],
-        },
-    ),
-    "dcb": TuyaBLECategorySensorMapping(
-        products={
-            **dict.fromkeys(
-                [
-                    "z5ztlw3k",
-                    "ajrhf1aj",
-                ],  # PARKSIDE Smart battery
-                [
-                    TuyaBLEBatteryMapping(dp_id=16),
-                    TuyaBLETemperatureMapping(dp_id=11),
-                    TuyaBLESensorMapping(
-                        dp_id=172,
+            },
+        ),
+        "wsdcg": TuyaBLECategorySensorMapping(
+            products={
+                "ojzlzzsw": [  # Soil moisture sensor
+                    TuyaBLETemperatureMapping(
+                        dp_id=1,
+                        coefficient=10.0,
+                    ),
+                    TuyaBLEThrottledMapping(
+                        dp_id=2,
                         description=SensorEntityDescription(
-                            key="battery_temp_current",
-                            device_class=SensorDeviceClass.TEMPERATURE,
-                            native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+                            key="moisture",
+                            device_class=SensorDeviceClass.MOISTURE,
+                            native_unit_of_measurement=PERCENTAGE,
                             state_class=SensorStateClass.MEASUREMENT,
                         ),
                     ),
                     TuyaBLESensorMapping(
-                        dp_id=102,
+                        dp_id=3,
                         description=SensorEntityDescription(
-                            key="battery_status",
+                            key="battery_state",
+                            icon="mdi:battery",
                             device_class=SensorDeviceClass.ENUM,
+                            entity_category=EntityCategory.DIAGNOSTIC,
                             options=[
-                                "Ready",
-                                "Charging",
-                                "Discharging",
-                                "Full",
-                                "Sleep",
-                                "Error",
+                                BATTERY_STATE_LOW,
+                                BATTERY_STATE_NORMAL,
+                                BATTERY_STATE_HIGH,
                             ],
                         ),
+                        icons=[
+                            "mdi:battery-alert",
+                            "mdi:battery-50",
+                            "mdi:battery-check",
+                        ],
                     ),
-                    TuyaBLESensorMapping(
-                        dp_id=2,
+                    TuyaBLEBatteryMapping(dp_id=4),
+                ],
+                "iv7hudlj": [  # Bluetooth Temperature Humidity Sensor
+                    TuyaBLETemperatureMapping(
+                        dp_id=1,
+                        coefficient=10.0,
                         description=SensorEntityDescription(
-                            key="charge_current",
-                            device_class=SensorDeviceClass.CURRENT,
-                            native_unit_of_measurement=UnitOfElectricCurrent.MILLIAMPERE,
+                            key="va_temperature",
+                            device_class=SensorDeviceClass.TEMPERATURE,
+                            native_unit_of_measurement=UnitOfTemperature.CELSIUS,
                             state_class=SensorStateClass.MEASUREMENT,
-                            entity_category=EntityCategory.DIAGNOSTIC,
                         ),
                     ),
-                    TuyaBLESensorMapping(
-                        dp_id=3,
+                    TuyaBLEThrottledMapping(
+                        dp_id=2,
                         description=SensorEntityDescription(
-                            key="charge_voltage",
-                            device_class=SensorDeviceClass.VOLTAGE,
-                            native_unit_of_measurement=UnitOfElectricPotential.MILLIVOLT,
+                            key="va_moisture",
+                            device_class=SensorDeviceClass.MOISTURE,
+                            native_unit_of_measurement=PERCENTAGE,
                             state_class=SensorStateClass.MEASUREMENT,
-                            entity_category=EntityCategory.DIAGNOSTIC,
                         ),
                     ),
-                    TuyaBLESensorMapping(
-                        dp_id=101,
+                    TuyaBLEBatteryMapping(
+                        dp_id=4,
                         description=SensorEntityDescription(
-                            key="discharging_current",
-                            device_class=SensorDeviceClass.CURRENT,
-                            native_unit_of_measurement=UnitOfElectricCurrent.MILLIAMPERE,
+                            key="battery_percentage",
+                            device_class=SensorDeviceClass.BATTERY,
+                            native_unit_of_measurement=PERCENTAGE,
+                            entity_category=EntityCategory.DIAGNOSTIC,
                             state_class=SensorStateClass.MEASUREMENT,
                         ),
                     ),
-                    TuyaBLESensorMapping(
-                        dp_id=103,
+                ],
+                "jm6iasmb": [  # Bluetooth Temperature Humidity Sensor
+                    TuyaBLETemperatureMapping(
+                        dp_id=1,
+                        coefficient=10.0,
                         description=SensorEntityDescription(
-                            key="charge_to_full_time",
-                            device_class=SensorDeviceClass.DURATION,
-                            native_unit_of_measurement=UnitOfTime.MINUTES,
+                            key="va_temperature",
+                            device_class=SensorDeviceClass.TEMPERATURE,
+                            native_unit_of_measurement=UnitOfTemperature.CELSIUS,
                             state_class=SensorStateClass.MEASUREMENT,
-                            entity_category=EntityCategory.DIAGNOSTIC,
                         ),
                     ),
-                    TuyaBLESensorMapping(
-                        dp_id=104,
+                    TuyaBLEThrottledMapping(
+                        dp_id=2,
                         description=SensorEntityDescription(
-                            key="discharge_to_empty_time",
-                            device_class=SensorDeviceClass.DURATION,
-                            native_unit_of_measurement=UnitOfTime.SECONDS,
+                            key="va_moisture",
+                            device_class=SensorDeviceClass.MOISTURE,
+                            native_unit_of_measurement=PERCENTAGE,
                             state_class=SensorStateClass.MEASUREMENT,
-                            entity_category=EntityCategory.DIAGNOSTIC,
                         ),
                     ),
-                    TuyaBLESensorMapping(
-                        dp_id=8,
+                    TuyaBLEBatteryMapping(
+                        dp_id=4,
                         description=SensorEntityDescription(
-                            key="charge_times",
-                            icon="mdi:counter",
-                            state_class=SensorStateClass.TOTAL_INCREASING,
+                            key="battery_percentage",
+                            device_class=SensorDeviceClass.BATTERY,
+                            native_unit_of_measurement=PERCENTAGE,
                             entity_category=EntityCategory.DIAGNOSTIC,
+                            state_class=SensorStateClass.MEASUREMENT,
                         ),
                     ),
-                    TuyaBLESensorMapping(
-                        dp_id=9,
-                        description=SensorEntityDescription(
-                            key="discharge_times",
-                            icon="mdi:counter",
-                            state_class=SensorStateClass.TOTAL_INCREASING,
-                            entity_category=EntityCategory.DIAGNOSTIC,
-                        ),
+                ],
+                "tv6peegl": [  # Soil moisture sensor
+                    TuyaBLETemperatureMapping(
+                        dp_id=101,
                     ),
-                    TuyaBLESensorMapping(
-                        dp_id=14,
+                    TuyaBLEThrottledMapping(
+                        dp_id=102,
                         description=SensorEntityDescription(
-                            key="use_time",
-                            device_class=SensorDeviceClass.DURATION,
-                            native_unit_of_measurement=UnitOfTime.MINUTES,
+                            key="moisture",
+                            device_class=SensorDeviceClass.MOISTURE,
+                            native_unit_of_measurement=PERCENTAGE,
                             state_class=SensorStateClass.MEASUREMENT,
-                            entity_category=EntityCategory.DIAGNOSTIC,
                         ),
                     ),
-                    TuyaBLESensorMapping(
-                        dp_id=15,
+                ],
+                "vlzqwckk": [
+                    TuyaBLETemperatureMapping(
+                        dp_id=1,
+                        coefficient=10.0,
                         description=SensorEntityDescription(
-                            key="runtime_total",
-                            device_class=SensorDeviceClass.DURATION,
-                            native_unit_of_measurement=UnitOfTime.MINUTES,
-                            state_class=SensorStateClass.TOTAL_INCREASING,
-                            entity_category=EntityCategory.DIAGNOSTIC,
+                            key="va_temperature",
+                            device_class=SensorDeviceClass.TEMPERATURE,
+                            native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+                            state_class=SensorStateClass.MEASUREMENT,
                         ),
                     ),
-                    TuyaBLESensorMapping(
-                        dp_id=10,
+                    TuyaBLEThrottledMapping(
+                        dp_id=2,
                         description=SensorEntityDescription(
-                            key="peak_current_times",
-                            icon="mdi:counter",
-                            state_class=SensorStateClass.TOTAL_INCREASING,
-                            entity_category=EntityCategory.DIAGNOSTIC,
+                            key="va_humidity",
+                            device_class=SensorDeviceClass.HUMIDITY,
+                            native_unit_of_measurement=PERCENTAGE,
+                            state_class=SensorStateClass.MEASUREMENT,
                         ),
                     ),
-                    TuyaBLESensorMapping(
-                        dp_id=21,
+                    TuyaBLEBatteryMapping(
+                        dp_id=4,
                         description=SensorEntityDescription(
-                            key="fault",
-                            icon="mdi:alert-circle-outline",
+                            key="battery_percentage",
+                            device_class=SensorDeviceClass.BATTERY,
+                            native_unit_of_measurement=PERCENTAGE,
                             entity_category=EntityCategory.DIAGNOSTIC,
+                            state_class=SensorStateClass.MEASUREMENT,
                         ),
                     ),
-                    TuyaBLESensorMapping(
-                        dp_id=107,
-                        description=SensorEntityDescription(
-                            key="over_voltage_times",
-                            icon="mdi:counter",
-                            state_class=SensorStateClass.TOTAL_INCREASING,
-                            entity_category=EntityCategory.DIAGNOSTIC,
+                ],
+            },
+        ),
+        "dcb": TuyaBLECategorySensorMapping(
+            products={
+                **dict.fromkeys(
+                    [
+                        "z5ztlw3k",
+                        "ajrhf1aj",
+                    ],  # PARKSIDE Smart battery
+                    [
+                        TuyaBLEBatteryMapping(dp_id=16),
+                        TuyaBLETemperatureMapping(dp_id=11),
+                        TuyaBLESensorMapping(
+                            dp_id=172,
+                            description=SensorEntityDescription(
+                                key="battery_temp_current",
+                                device_class=SensorDeviceClass.TEMPERATURE,
+                                native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+                                state_class=SensorStateClass.MEASUREMENT,
+                            ),
                         ),
-                    ),
-                    TuyaBLESensorMapping(
-                        dp_id=108,
-                        description=SensorEntityDescription(
-                            key="under_voltage_times",
-                            icon="mdi:counter",
-                            state_class=SensorStateClass.TOTAL_INCREASING,
-                            entity_category=EntityCategory.DIAGNOSTIC,
+                        TuyaBLESensorMapping(
+                            dp_id=102,
+                            description=SensorEntityDescription(
+                                key="battery_status",
+                                device_class=SensorDeviceClass.ENUM,
+                                options=[
+                                    "Ready",
+                                    "Charging",
+                                    "Discharging",
+                                    "Full",
+                                    "Sleep",
+                                    "Error",
+                                ],
+                            ),
                         ),
-                    ),
-                    TuyaBLESensorMapping(
-                        dp_id=109,
-                        description=SensorEntityDescription(
-                            key="overtemp_discharge_times",
-                            icon="mdi:counter",
-                            state_class=SensorStateClass.TOTAL_INCREASING,
-                            entity_category=EntityCategory.DIAGNOSTIC,
+                        TuyaBLESensorMapping(
+                            dp_id=2,
+                            description=SensorEntityDescription(
+                                key="charge_current",
+                                device_class=SensorDeviceClass.CURRENT,
+                                native_unit_of_measurement=UnitOfElectricCurrent.MILLIAMPERE,
+                                state_class=SensorStateClass.MEASUREMENT,
+                                entity_category=EntityCategory.DIAGNOSTIC,
+                            ),
                         ),
-                    ),
-                    TuyaBLESensorMapping(
-                        dp_id=110,
-                        description=SensorEntityDescription(
-                            key="overtemp_charge_times",
-                            icon="mdi:counter",
-                            state_class=SensorStateClass.TOTAL_INCREASING,
-                            entity_category=EntityCategory.DIAGNOSTIC,
+                        TuyaBLESensorMapping(
+                            dp_id=3,
+                            description=SensorEntityDescription(
+                                key="charge_voltage",
+                                device_class=SensorDeviceClass.VOLTAGE,
+                                native_unit_of_measurement=UnitOfElectricPotential.MILLIVOLT,
+                                state_class=SensorStateClass.MEASUREMENT,
+                                entity_category=EntityCategory.DIAGNOSTIC,
+                            ),
                         ),
-                    ),
-                    TuyaBLESensorMapping(
-                        dp_id=111,
-                        description=SensorEntityDescription(
-                            key="undertemp_discharge_times",
-                            icon="mdi:counter",
-                            state_class=SensorStateClass.TOTAL_INCREASING,
-                            entity_category=EntityCategory.DIAGNOSTIC,
+                        TuyaBLESensorMapping(
+                            dp_id=101,
+                            description=SensorEntityDescription(
+                                key="discharging_current",
+                                device_class=SensorDeviceClass.CURRENT,
+                                native_unit_of_measurement=UnitOfElectricCurrent.MILLIAMPERE,
+                                state_class=SensorStateClass.MEASUREMENT,
+                            ),
                         ),
-                    ),
-                    TuyaBLESensorMapping(
-                        dp_id=112,
-                        description=SensorEntityDescription(
-                            key="undertemp_charge_times",
-                            icon="mdi:counter",
-                            state_class=SensorStateClass.TOTAL_INCREASING,
-                            entity_category=EntityCategory.DIAGNOSTIC,
+                        TuyaBLESensorMapping(
+                            dp_id=103,
+                            description=SensorEntityDescription(
+                                key="charge_to_full_time",
+                                device_class=SensorDeviceClass.DURATION,
+                                native_unit_of_measurement=UnitOfTime.MINUTES,
+                                state_class=SensorStateClass.MEASUREMENT,
+                                entity_category=EntityCategory.DIAGNOSTIC,
+                            ),
                         ),
-                    ),
-                    TuyaBLESensorMapping(
-                        dp_id=113,
-                        description=SensorEntityDescription(
-                            key="short_circuit_times",
-                            icon="mdi:counter",
-                            state_class=SensorStateClass.TOTAL_INCREASING,
-                            entity_category=EntityCategory.DIAGNOSTIC,
+                        TuyaBLESensorMapping(
+                            dp_id=104,
+                            description=SensorEntityDescription(
+                                key="discharge_to_empty_time",
+                                device_class=SensorDeviceClass.DURATION,
+                                native_unit_of_measurement=UnitOfTime.SECONDS,
+                                state_class=SensorStateClass.MEASUREMENT,
+                                entity_category=EntityCategory.DIAGNOSTIC,
+                            ),
                         ),
-                    ),
-                    TuyaBLESensorMapping(
-                        dp_id=114,
-                        description=SensorEntityDescription(
-                            key="over_current_times",
-                            icon="mdi:counter",
-                            state_class=SensorStateClass.TOTAL_INCREASING,
-                            entity_category=EntityCategory.DIAGNOSTIC,
+                        TuyaBLESensorMapping(
+                            dp_id=8,
+                            description=SensorEntityDescription(
+                                key="charge_times",
+                                icon="mdi:counter",
+                                state_class=SensorStateClass.TOTAL_INCREASING,
+                                entity_category=EntityCategory.DIAGNOSTIC,
+                            ),
                         ),
-                    ),
-                    TuyaBLESensorMapping(
-                        dp_id=19,
-                        description=SensorEntityDescription(
-                            key="product_type",
-                            entity_category=EntityCategory.DIAGNOSTIC,
+                        TuyaBLESensorMapping(
+                            dp_id=9,
+                            description=SensorEntityDescription(
+                                key="discharge_times",
+                                icon="mdi:counter",
+                                state_class=SensorStateClass.TOTAL_INCREASING,
+                                entity_category=EntityCategory.DIAGNOSTIC,
+                            ),
                         ),
-                    ),
-                    TuyaBLESensorMapping(
-                        dp_id=150,
-                        description=SensorEntityDescription(
-                            key="tool_product_type",
-                            entity_category=EntityCategory.DIAGNOSTIC,
+                        TuyaBLESensorMapping(
+                            dp_id=14,
+                            description=SensorEntityDescription(
+                                key="use_time",
+                                device_class=SensorDeviceClass.DURATION,
+                                native_unit_of_measurement=UnitOfTime.MINUTES,
+                                state_class=SensorStateClass.MEASUREMENT,
+                                entity_category=EntityCategory.DIAGNOSTIC,
+                            ),
                         ),
-                    ),
-                    TuyaBLESensorMapping(
-                        dp_id=152,
+                        TuyaBLESensorMapping(
+                            dp_id=15,
+                            description=SensorEntityDescription(
+                                key="runtime_total",
+                                device_class=SensorDeviceClass.DURATION,
+                                native_unit_of_measurement=UnitOfTime.MINUTES,
+                                state_class=SensorStateClass.TOTAL_INCREASING,
+                                entity_category=EntityCategory.DIAGNOSTIC,
+                            ),
+                        ),
+                        TuyaBLESensorMapping(
+                            dp_id=10,
+                            description=SensorEntityDescription(
+                                key="peak_current_times",
+                                icon="mdi:counter",
+                                state_class=SensorStateClass.TOTAL_INCREASING,
+                                entity_category=EntityCategory.DIAGNOSTIC,
+                            ),
+                        ),
+                        TuyaBLESensorMapping(
+                            dp_id=21,
+                            description=SensorEntityDescription(
+                                key="fault",
+                                icon="mdi:alert-circle-outline",
+                                entity_category=EntityCategory.DIAGNOSTIC,
+                            ),
+                        ),
+                        TuyaBLESensorMapping(
+                            dp_id=107,
+                            description=SensorEntityDescription(
+                                key="over_voltage_times",
+                                icon="mdi:counter",
+                                state_class=SensorStateClass.TOTAL_INCREASING,
+                                entity_category=EntityCategory.DIAGNOSTIC,
+                            ),
+                        ),
+                        TuyaBLESensorMapping(
+                            dp_id=108,
+                            description=SensorEntityDescription(
+                                key="under_voltage_times",
+                                icon="mdi:counter",
+                                state_class=SensorStateClass.TOTAL_INCREASING,
+                                entity_category=EntityCategory.DIAGNOSTIC,
+                            ),
+                        ),
+                        TuyaBLESensorMapping(
+                            dp_id=109,
+                            description=SensorEntityDescription(
+                                key="overtemp_discharge_times",
+                                icon="mdi:counter",
+                                state_class=SensorStateClass.TOTAL_INCREASING,
+                                entity_category=EntityCategory.DIAGNOSTIC,
+                            ),
+                        ),
+                        TuyaBLESensorMapping(
+                            dp_id=110,
+                            description=SensorEntityDescription(
+                                key="overtemp_charge_times",
+                                icon="mdi:counter",
+                                state_class=SensorStateClass.TOTAL_INCREASING,
+                                entity_category=EntityCategory.DIAGNOSTIC,
+                            ),
+                        ),
+                        TuyaBLESensorMapping(
+                            dp_id=111,
+                            description=SensorEntityDescription(
+                                key="undertemp_discharge_times",
+                                icon="mdi:counter",
+                                state_class=SensorStateClass.TOTAL_INCREASING,
+                                entity_category=EntityCategory.DIAGNOSTIC,
+                            ),
+                        ),
+                        TuyaBLESensorMapping(
+                            dp_id=112,
+                            description=SensorEntityDescription(
+                                key="undertemp_charge_times",
+                                icon="mdi:counter",
+                                state_class=SensorStateClass.TOTAL_INCREASING,
+                                entity_category=EntityCategory.DIAGNOSTIC,
+                            ),
+                        ),
+                        TuyaBLESensorMapping(
+                            dp_id=113,
+                            description=SensorEntityDescription(
+                                key="short_circuit_times",
+                                icon="mdi:counter",
+                                state_class=SensorStateClass.TOTAL_INCREASING,
+                                entity_category=EntityCategory.DIAGNOSTIC,
+                            ),
+                        ),
+                        TuyaBLESensorMapping(
+                            dp_id=114,
+                            description=SensorEntityDescription(
+                                key="over_current_times",
+                                icon="mdi:counter",
+                                state_class=SensorStateClass.TOTAL_INCREASING,
+                                entity_category=EntityCategory.DIAGNOSTIC,
+                            ),
+                        ),
+                        TuyaBLESensorMapping(
+                            dp_id=19,
+                            description=SensorEntityDescription(
+                                key="product_type",
+                                entity_category=EntityCategory.DIAGNOSTIC,
+                            ),
+                        ),
+                        TuyaBLESensorMapping(
+                            dp_id=150,
+                            description=SensorEntityDescription(
+                                key="tool_product_type",
+                                entity_category=EntityCategory.DIAGNOSTIC,
+                            ),
+                        ),
+                        TuyaBLESensorMapping(
+                            dp_id=152,
+                            description=SensorEntityDescription(
+                                key="tool_rotation_speed",
+                                icon="mdi:rotate-3d-variant",
+                                state_class=SensorStateClass.MEASUREMENT,
+                                entity_category=EntityCategory.DIAGNOSTIC,
+                            ),
+                        ),
+                        TuyaBLESensorMapping(
+                            dp_id=153,
+                            description=SensorEntityDescription(
+                                key="tool_torque",
+                                icon="mdi:screw-lag",
+                                state_class=SensorStateClass.MEASUREMENT,
+                                entity_category=EntityCategory.DIAGNOSTIC,
+                            ),
+                        ),
+                        TuyaBLESensorMapping(
+                            dp_id=154,
+                            description=SensorEntityDescription(
+                                key="tool_runtime_total",
+                                device_class=SensorDeviceClass.DURATION,
+                                native_unit_of_measurement=UnitOfTime.MINUTES,
+                                state_class=SensorStateClass.TOTAL_INCREASING,
+                                entity_category=EntityCategory.DIAGNOSTIC,
+                            ),
+                        ),
+                        TuyaBLESensorMapping(
+                            dp_id=156,
+                            description=SensorEntityDescription(
+                                key="tool_fault",
+                                icon="mdi:alert-circle-outline",
+                                entity_category=EntityCategory.DIAGNOSTIC,
+                            ),
+                        ),
+                        TuyaBLESensorMapping(
+                            dp_id=157,
+                            description=SensorEntityDescription(
+                                key="tools_current",
+                                device_class=SensorDeviceClass.CURRENT,
+                                state_class=SensorStateClass.MEASUREMENT,
+                                entity_category=EntityCategory.DIAGNOSTIC,
+                            ),
+                        ),
+                        TuyaBLESensorMapping(
+                            dp_id=158,
+                            description=SensorEntityDescription(
+                                key="tool_ot_times",
+                                state_class=SensorStateClass.TOTAL_INCREASING,
+                                entity_category=EntityCategory.DIAGNOSTIC,
+                            ),
+                        ),
+                        TuyaBLESensorMapping(
+                            dp_id=159,
+                            description=SensorEntityDescription(
+                                key="tool_locked_times",
+                                state_class=SensorStateClass.TOTAL_INCREASING,
+                                entity_category=EntityCategory.DIAGNOSTIC,
+                            ),
+                        ),
+                        TuyaBLESensorMapping(
+                            dp_id=160,
+                            description=SensorEntityDescription(
+                                key="tool_oc_times",
+                                state_class=SensorStateClass.TOTAL_INCREASING,
+                                entity_category=EntityCategory.DIAGNOSTIC,
+                            ),
+                        ),
+                    ],
+                ),
+            },
+        ),
+        "zwjcy": TuyaBLECategorySensorMapping(
+            products={
+                "gvygg3m8": [  # Smartlife Plant Sensor SGS01
+                    TuyaBLETemperatureMapping(
+                        dp_id=5,
+                        coefficient=10.0,
                         description=SensorEntityDescription(
-                            key="tool_rotation_speed",
-                            icon="mdi:rotate-3d-variant",
+                            key="temp_current",
+                            device_class=SensorDeviceClass.TEMPERATURE,
+                            native_unit_of_measurement=UnitOfTemperature.CELSIUS,
                             state_class=SensorStateClass.MEASUREMENT,
-                            entity_category=EntityCategory.DIAGNOSTIC,
                         ),
                     ),
-                    TuyaBLESensorMapping(
-                        dp_id=153,
+                    TuyaBLEThrottledMapping(
+                        dp_id=3,
                         description=SensorEntityDescription(
-                            key="tool_torque",
-                            icon="mdi:screw-lag",
+                            key="humidity",
+                            device_class=SensorDeviceClass.HUMIDITY,
+                            native_unit_of_measurement=PERCENTAGE,
                             state_class=SensorStateClass.MEASUREMENT,
-                            entity_category=EntityCategory.DIAGNOSTIC,
                         ),
                     ),
                     TuyaBLESensorMapping(
-                        dp_id=154,
+                        dp_id=14,
                         description=SensorEntityDescription(
-                            key="tool_runtime_total",
-                            device_class=SensorDeviceClass.DURATION,
-                            native_unit_of_measurement=UnitOfTime.MINUTES,
-                            state_class=SensorStateClass.TOTAL_INCREASING,
+                            key="battery_state",
+                            icon="mdi:battery",
+                            device_class=SensorDeviceClass.ENUM,
                             entity_category=EntityCategory.DIAGNOSTIC,
+                            options=[
+                                BATTERY_STATE_LOW,
+                                BATTERY_STATE_NORMAL,
+                                BATTERY_STATE_HIGH,
+                            ],
                         ),
+                        icons=[
+                            "mdi:battery-alert",
+                            "mdi:battery-50",
+                            "mdi:battery-check",
+                        ],
                     ),
-                    TuyaBLESensorMapping(
-                        dp_id=156,
+                    TuyaBLEBatteryMapping(
+                        dp_id=15,
                         description=SensorEntityDescription(
-                            key="tool_fault",
-                            icon="mdi:alert-circle-outline",
+                            key="battery_percentage",
+                            device_class=SensorDeviceClass.BATTERY,
+                            native_unit_of_measurement=PERCENTAGE,
                             entity_category=EntityCategory.DIAGNOSTIC,
-                        ),
-                    ),
-                    TuyaBLESensorMapping(
-                        dp_id=157,
-                        description=SensorEntityDescription(
-                            key="tools_current",
-                            device_class=SensorDeviceClass.CURRENT,
                             state_class=SensorStateClass.MEASUREMENT,
-                            entity_category=EntityCategory.DIAGNOSTIC,
                         ),
                     ),
-                    TuyaBLESensorMapping(
-                        dp_id=158,
-                        description=SensorEntityDescription(
-                            key="tool_ot_times",
-                            state_class=SensorStateClass.TOTAL_INCREASING,
-                            entity_category=EntityCategory.DIAGNOSTIC,
-                        ),
+                ],
+            },
+        ),
+        "znhsb": TuyaBLECategorySensorMapping(
+            products={
+                "cdlandip": [  # Smart water bottle
+                    TuyaBLETemperatureMapping(
+                        dp_id=101,
                     ),
                     TuyaBLESensorMapping(
-                        dp_id=159,
+                        dp_id=102,
                         description=SensorEntityDescription(
-                            key="tool_locked_times",
-                            state_class=SensorStateClass.TOTAL_INCREASING,
-                            entity_category=EntityCategory.DIAGNOSTIC,
+                            key="water_intake",
+                            device_class=SensorDeviceClass.WATER,
+                            native_unit_of_measurement=UnitOfVolume.MILLILITERS,
+                            state_class=SensorStateClass.MEASUREMENT,
                         ),
                     ),
                     TuyaBLESensorMapping(
-                        dp_id=160,
+                        dp_id=104,
                         description=SensorEntityDescription(
-                            key="tool_oc_times",
-                            state_class=SensorStateClass.TOTAL_INCREASING,
+                            key="battery",
+                            device_class=SensorDeviceClass.BATTERY,
+                            native_unit_of_measurement=PERCENTAGE,
                             entity_category=EntityCategory.DIAGNOSTIC,
+                            state_class=SensorStateClass.MEASUREMENT,
                         ),
+                        getter=battery_enum_getter,
                     ),
                 ],
-            ),
-        },
-    ),
-    "zwjcy": TuyaBLECategorySensorMapping(
-        products={
-            "gvygg3m8": [  # Smartlife Plant Sensor SGS01
-                TuyaBLETemperatureMapping(
-                    dp_id=5,
-                    coefficient=10.0,
-                    description=SensorEntityDescription(
-                        key="temp_current",
-                        device_class=SensorDeviceClass.TEMPERATURE,
-                        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-                        state_class=SensorStateClass.MEASUREMENT,
-                    ),
-                ),
-                TuyaBLESensorMapping(
-                    dp_id=3,
-                    description=SensorEntityDescription(
-                        key="humidity",
-                        device_class=SensorDeviceClass.HUMIDITY,
-                        native_unit_of_measurement=PERCENTAGE,
-                        state_class=SensorStateClass.MEASUREMENT,
-                    ),
-                ),
-                TuyaBLESensorMapping(
-                    dp_id=14,
-                    description=SensorEntityDescription(
-                        key="battery_state",
-                        icon="mdi:battery",
-                        device_class=SensorDeviceClass.ENUM,
-                        entity_category=EntityCategory.DIAGNOSTIC,
-                        options=[
-                            BATTERY_STATE_LOW,
-                            BATTERY_STATE_NORMAL,
-                            BATTERY_STATE_HIGH,
-                        ],
-                    ),
-                    icons=[
-                        "mdi:battery-alert",
-                        "mdi:battery-50",
-                        "mdi:battery-check",
-                    ],
-                ),
-                TuyaBLEBatteryMapping(
-                    dp_id=15,
-                    description=SensorEntityDescription(
-                        key="battery_percentage",
-                        device_class=SensorDeviceClass.BATTERY,
-                        native_unit_of_measurement=PERCENTAGE,
-                        entity_category=EntityCategory.DIAGNOSTIC,
-                        state_class=SensorStateClass.MEASUREMENT,
-                    ),
-                ),
-            ],
-        },
-    ),
-    "znhsb": TuyaBLECategorySensorMapping(
-        products={
-            "cdlandip": [  # Smart water bottle
-                TuyaBLETemperatureMapping(
-                    dp_id=101,
-                ),
-                TuyaBLESensorMapping(
-                    dp_id=102,
-                    description=SensorEntityDescription(
-                        key="water_intake",
-                        device_class=SensorDeviceClass.WATER,
-                        native_unit_of_measurement=UnitOfVolume.MILLILITERS,
-                        state_class=SensorStateClass.MEASUREMENT,
-                    ),
-                ),
-                TuyaBLESensorMapping(
-                    dp_id=104,
-                    description=SensorEntityDescription(
-                        key="battery",
-                        device_class=SensorDeviceClass.BATTERY,
-                        native_unit_of_measurement=PERCENTAGE,
-                        entity_category=EntityCategory.DIAGNOSTIC,
-                        state_class=SensorStateClass.MEASUREMENT,
-                    ),
-                    getter=battery_enum_getter,
-                ),
-            ],
-        },
-    ),
-    "ggq": TuyaBLECategorySensorMapping(
-        products={
-            "6pahkcau": [  # Irrigation computer PARKSIDE PPB A1
-                TuyaBLEBatteryMapping(dp_id=11),
-                TuyaBLESensorMapping(
-                    dp_id=6,
-                    description=SensorEntityDescription(
-                        key="time_left",
-                        device_class=SensorDeviceClass.DURATION,
-                        native_unit_of_measurement=UnitOfTime.MINUTES,
-                        state_class=SensorStateClass.MEASUREMENT,
-                    ),
-                ),
-            ],
-            **dict.fromkeys(
-                [
-                    "hfgdqhho",
-                    "qycalacn",
-                    "fnlw6npo",
-                    "jjqi2syk",
-                ],  # Irrigation computer - dual outlet
-                [
+            },
+        ),
+        "ggq": TuyaBLECategorySensorMapping(
+            products={
+                "6pahkcau": [  # Irrigation computer PARKSIDE PPB A1
                     TuyaBLEBatteryMapping(dp_id=11),
                     TuyaBLESensorMapping(
-                        dp_id=111,
-                        description=SensorEntityDescription(
-                            key="use_time_z1",
-                            device_class=SensorDeviceClass.DURATION,
-                            native_unit_of_measurement=UnitOfTime.SECONDS,
-                            state_class=SensorStateClass.MEASUREMENT,
-                        ),
-                    ),
-                    TuyaBLESensorMapping(
-                        dp_id=110,
+                        dp_id=6,
                         description=SensorEntityDescription(
-                            key="use_time_z2",
+                            key="time_left",
                             device_class=SensorDeviceClass.DURATION,
-                            native_unit_of_measurement=UnitOfTime.SECONDS,
+                            native_unit_of_measurement=UnitOfTime.MINUTES,
                             state_class=SensorStateClass.MEASUREMENT,
                         ),
                     ),
                 ],
-            ),
-        },
-    ),
-    "sfkzq": TuyaBLECategorySensorMapping(
-        products={
-            "0axr5s0b": [  # Valve Controller
-                TuyaBLEBatteryMapping(dp_id=7),
-                TuyaBLESensorMapping(
-                    # dp_id=15,
-                    dp_id=11,
-                    description=SensorEntityDescription(
-                        key="time_left",
-                        device_class=SensorDeviceClass.DURATION,
-                        native_unit_of_measurement=UnitOfTime.SECONDS,
-                        state_class=SensorStateClass.MEASUREMENT,
-                    ),
-                ),
-            ],
-            "hfgdqhho": [  # Irrigation computer - SGW02/SGW08
-                TuyaBLEBatteryMapping(dp_id=11),
-                TuyaBLESensorMapping(
-                    # dp_id=15,
-                    dp_id=11,
-                    description=SensorEntityDescription(
-                        key="time_left",
-                        device_class=SensorDeviceClass.DURATION,
-                        native_unit_of_measurement=UnitOfTime.SECONDS,
-                        state_class=SensorStateClass.MEASUREMENT,
-                    ),
+                **dict.fromkeys(
+                    [
+                        "hfgdqhho",
+                        "qycalacn",
+                        "fnlw6npo",
+                        "jjqi2syk",
+                    ],  # Irrigation computer - dual outlet
+                    [
+                        TuyaBLEBatteryMapping(dp_id=11),
+                        TuyaBLESensorMapping(
+                            dp_id=111,
+                            description=SensorEntityDescription(
+                                key="use_time_z1",
+                                device_class=SensorDeviceClass.DURATION,
+                                native_unit_of_measurement=UnitOfTime.SECONDS,
+                                state_class=SensorStateClass.MEASUREMENT,
+                            ),
+                        ),
+                        TuyaBLESensorMapping(
+                            dp_id=110,
+                            description=SensorEntityDescription(
+                                key="use_time_z2",
+                                device_class=SensorDeviceClass.DURATION,
+                                native_unit_of_measurement=UnitOfTime.SECONDS,
+                                state_class=SensorStateClass.MEASUREMENT,
+                            ),
+                        ),
+                    ],
                 ),
-            ],
-            **dict.fromkeys(
-                ["46zia2nz", "1fcnd8xk", "nxquc5lb", "svhikeyq"],
-                [
+            },
+        ),
+        "sfkzq": TuyaBLECategorySensorMapping(
+            products={
+                "0axr5s0b": [  # Valve Controller
                     TuyaBLEBatteryMapping(dp_id=7),
-                    TuyaBLEWorkStateMapping(dp_id=12),
                     TuyaBLESensorMapping(
-                        dp_id=15,
+                        # dp_id=15,
+                        dp_id=11,
                         description=SensorEntityDescription(
-                            key="use_time_one",
+                            key="time_left",
                             device_class=SensorDeviceClass.DURATION,
                             native_unit_of_measurement=UnitOfTime.SECONDS,
                             state_class=SensorStateClass.MEASUREMENT,
                         ),
                     ),
+                ],
+                "hfgdqhho": [  # Irrigation computer - SGW02/SGW08
+                    TuyaBLEBatteryMapping(dp_id=11),
                     TuyaBLESensorMapping(
-                        dp_id=9,
+                        # dp_id=15,
+                        dp_id=11,
                         description=SensorEntityDescription(
-                            key="time_use",
+                            key="time_left",
                             device_class=SensorDeviceClass.DURATION,
                             native_unit_of_measurement=UnitOfTime.SECONDS,
                             state_class=SensorStateClass.MEASUREMENT,
                         ),
                     ),
                 ],
-            ),
-        },
-    ),
-    "cl": TuyaBLECategorySensorMapping(
-        products={
-            **dict.fromkeys(
-                ["4pbr8eig", "qqdxfdht", "kcy0x4pi", "vlwf3ud6"],  # Blind Controller
-                [
-                    TuyaBLEBatteryMapping(dp_id=13),
-                    TuyaBLESensorMapping(
-                        dp_id=7,
-                        description=SensorEntityDescription(
-                            key="cover_work_state",
-                            entity_category=EntityCategory.DIAGNOSTIC,
-                            device_class=SensorDeviceClass.ENUM,
-                            options=["STANDBY", "SUCCESS", "LEARNING"],
+                **dict.fromkeys(
+                    ["46zia2nz", "1fcnd8xk", "nxquc5lb", "svhikeyq"],
+                    [
+                        TuyaBLEBatteryMapping(dp_id=7),
+                        TuyaBLEWorkStateMapping(dp_id=12),
+                        TuyaBLESensorMapping(
+                            dp_id=15,
+                            description=SensorEntityDescription(
+                                key="use_time_one",
+                                device_class=SensorDeviceClass.DURATION,
+                                native_unit_of_measurement=UnitOfTime.SECONDS,
+                                state_class=SensorStateClass.MEASUREMENT,
+                            ),
                         ),
-                    ),
-                ],
-            ),
-        }
-    ),
-}
+                        TuyaBLESensorMapping(
+                            dp_id=9,
+                            description=SensorEntityDescription(
+                                key="time_use",
+                                device_class=SensorDeviceClass.DURATION,
+                                native_unit_of_measurement=UnitOfTime.SECONDS,
+                                state_class=SensorStateClass.MEASUREMENT,
+                            ),
+                        ),
+                    ],
+                ),
+            },
+        ),
+        "cl": TuyaBLECategorySensorMapping(
+            products={
+                **dict.fromkeys(
+                    [
+                        "4pbr8eig",
+                        "qqdxfdht",
+                        "kcy0x4pi",
+                        "vlwf3ud6",
+                    ],  # Blind Controller
+                    [
+                        TuyaBLEBatteryMapping(dp_id=13),
+                        TuyaBLESensorMapping(
+                            dp_id=7,
+                            description=SensorEntityDescription(
+                                key="cover_work_state",
+                                entity_category=EntityCategory.DIAGNOSTIC,
+                                device_class=SensorDeviceClass.ENUM,
+                                options=["STANDBY", "SUCCESS", "LEARNING"],
+                            ),
+                        ),
+                    ],
+                ),
+            }
+        ),
+    }
 
 
 def rssi_getter(sensor: TuyaBLESensor) -> None:
-    sensor._attr_native_value = sensor._device.rssi
+    sensor._attr_native_value = sensor._device.presence.rssi
 
 
 rssi_mapping = TuyaBLESensorMapping(
@@ -996,11 +1054,12 @@ rssi_mapping = TuyaBLESensorMapping(
         entity_registry_enabled_default=False,
     ),
     getter=rssi_getter,
+    update_interval=RSSI_UPDATE_INTERVAL,
 )
 
 
 def get_mapping_by_device(device: TuyaBLEDevice) -> list[TuyaBLESensorMapping]:
-    category = mapping.get(device.category)
+    category = _build_mapping().get(device.category)
     if category is not None and category.products is not None:
         product_mapping = category.products.get(device.product_id)
         if product_mapping is not None:
@@ -1024,6 +1083,52 @@ class TuyaBLESensor(TuyaBLEEntity, SensorEntity):
     ) -> None:
         super().__init__(hass, coordinator, device, product, mapping.description)
         self._mapping = mapping
+        self._throttle = TuyaBLEStateThrottle(
+            mapping.deadband,
+            mapping.deadband_relative,
+            mapping.min_interval,
+            mapping.max_silence,
+        )
+        self._unsub_write: Callable[[], None] | None = None
+        # Count, sum, min, max and first and last timestamp of historical
+        # values per hour
+        self._history_hours: dict[datetime, list[float]] = {}
+        # Statistics the recorder compiled for those hours before the first
+        # import, None when it compiled none
+        self._history_compiled: dict[datetime, dict | None] = {}
+        self._unsub_import: Callable[[], None] | None = None
+        # Same for hours still running when their records were received,
+        # with the first record and the reception time
+        self._open_hours: dict[datetime, list[float]] = {}
+        self._unsub_open_imports: dict[datetime, Callable[[], None]] = {}
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        self.async_on_remove(self._cancel_write)
+        if (
+            self._mapping.getter is None
+            and self.entity_description.state_class == SensorStateClass.MEASUREMENT
+        ):
+            self.async_on_remove(
+                self._device.register_history_callback(self._async_add_history)
+            )
+            self.async_on_remove(self._cancel_import)
+        if self._mapping.update_interval is not None:
+            self.async_on_remove(
+                async_track_time_interval(
+                    self.hass,
+                    self._async_refresh,
+                    timedelta(seconds=self._mapping.update_interval),
+                )
+            )
+
+    @callback
+    def _async_refresh(self, _: datetime) -> None:
+        """Refresh the value, the state is written only when it changed."""
+        value = self._attr_native_value
+        self._mapping.getter(self)
+        if self._attr_native_value != value:
+            self.async_write_ha_state()
 
     @callback
     def _handle_coordinator_update(self) -> None:
@@ -1054,8 +1159,249 @@ class TuyaBLESensor(TuyaBLEEntity, SensorEntity):
                     )
                 else:
                     self._attr_native_value = datapoint.value
+        if self._mapping.throttled:
+            self._write_throttled()
+        else:
+            self.async_write_ha_state()
+
+    @callback
+    def _cancel_import(self) -> None:
+        if self._unsub_import is not None:
+            self._unsub_import()
+            self._unsub_import = None
+        for unsub in self._unsub_open_imports.values():
+            unsub()
+        self._unsub_open_imports.clear()
+
+    @callback
+    def _async_add_history(self, records: list[TuyaBLEDataPointRecord]) -> None:
+        """Collect values recorded by the device while it was offline."""
+        now = dt_util.utcnow()
+        added = False
+        for record in records:
+            if (
+                record.id != self._mapping.dp_id
+                or record.type != TuyaBLEDataPointType.DT_VALUE
+            ):
+                continue
+            start = dt_util.utc_from_timestamp(record.timestamp).replace(
+                minute=0, second=0, microsecond=0
+            )
+            value = record.value / self._mapping.coefficient
+            if start + timedelta(hours=1) > now:
+                self._add_open_hour(start, record.timestamp, value, now)
+                continue
+            hour = self._history_hours.get(start)
+            if hour is None:
+                self._history_hours[start] = [
+                    1,
+                    value,
+                    value,
+                    value,
+                    record.timestamp,
+                    record.timestamp,
+                ]
+            else:
+                hour[0] += 1
+                hour[1] += value
+                hour[2] = min(hour[2], value)
+                hour[3] = max(hour[3], value)
+                hour[4] = min(hour[4], record.timestamp)
+                hour[5] = max(hour[5], record.timestamp)
+            added = True
+        if added:
+            # Records arrive in bursts, they are imported once it ended
+            if self._unsub_import is not None:
+                self._unsub_import()
+            self._unsub_import = async_call_later(
+                self.hass, HISTORY_IMPORT_DELAY, self._async_import_history
+            )
+
+    @callback
+    def _add_open_hour(
+        self, start: datetime, timestamp: float, value: float, now: datetime
+    ) -> None:
+        """Collect a value of the current hour, merged once it is compiled."""
+        hour = self._open_hours.get(start)
+        if hour is None:
+            hour = self._open_hours[start] = [1, value, value, value, timestamp, 0]
+            # The recorder compiles the hour from the states, which miss the
+            # time the device was offline
+            delay = start + timedelta(hours=1, seconds=HISTORY_COMPILE_DELAY) - now
+            self._unsub_open_imports[start] = async_call_later(
+                self.hass, delay, partial(self._async_import_open_hour, start)
+            )
+        else:
+            hour[0] += 1
+            hour[1] += value
+            hour[2] = min(hour[2], value)
+            hour[3] = max(hour[3], value)
+            hour[4] = min(hour[4], timestamp)
+        hour[5] = now.timestamp()
+
+    async def _async_import_open_hour(self, start: datetime, _: datetime) -> None:
+        """Merge the values of an hour into the statistics compiled for it."""
+        self._unsub_open_imports.pop(start, None)
+        count, total, minimum, maximum, first, received = self._open_hours.pop(start)
+        if not self._can_import_history():
+            return
+        compiled = await self._async_compiled_hours(start, start + timedelta(hours=1))
+        async_import_statistics(
+            self.hass,
+            self._history_metadata(),
+            [
+                self._merge_compiled(
+                    start,
+                    compiled.get(start),
+                    total / count,
+                    minimum,
+                    maximum,
+                    received - first,
+                )
+            ],
+        )
+
+    async def _async_compiled_hours(
+        self, start: datetime, end: datetime
+    ) -> dict[datetime, dict]:
+        """Hourly statistics the recorder holds for the sensor, by start."""
+        compiled = await get_instance(self.hass).async_add_executor_job(
+            statistics_during_period,
+            self.hass,
+            start,
+            end,
+            {self.entity_id},
+            "hour",
+            None,
+            {"mean", "min", "max"},
+        )
+        return {
+            dt_util.utc_from_timestamp(row["start"]): row
+            for row in compiled.get(self.entity_id, [])
+            if row.get("mean") is not None
+        }
+
+    @staticmethod
+    def _merge_compiled(
+        start: datetime,
+        row: dict | None,
+        mean: float,
+        minimum: float,
+        maximum: float,
+        offline: float,
+    ) -> StatisticData:
+        """Statistics of an hour with the values of the offline seconds merged."""
+        if row is not None:
+            # Weighted by the part of the hour the device was offline
+            offline = min(max(offline / 3600, 0.0), 1.0)
+            mean = row["mean"] * (1 - offline) + mean * offline
+            minimum = min(minimum, row["min"])
+            maximum = max(maximum, row["max"])
+        return StatisticData(start=start, mean=mean, min=minimum, max=maximum)
+
+    def _can_import_history(self) -> bool:
+        if RECORDER_DOMAIN not in self.hass.config.components:
+            return False
+        if self.unit_of_measurement != self.native_unit_of_measurement:
+            _LOGGER.debug(
+                "%s: Historical values in converted units are not imported",
+                self.entity_id,
+            )
+            return False
+        return True
+
+    def _history_metadata(self) -> StatisticMetaData:
+        return StatisticMetaData(
+            has_mean=True,
+            has_sum=False,
+            name=None,
+            source=RECORDER_DOMAIN,
+            statistic_id=self.entity_id,
+            unit_of_measurement=self.native_unit_of_measurement,
+        )
+
+    async def _async_import_history(self, _: datetime) -> None:
+        """Merge the collected values into the long-term statistics."""
+        self._unsub_import = None
+        if not self._can_import_history():
+            return
+        hours = sorted(self._history_hours.items())
+        # Rows compiled from the states of the hours are read once, before
+        # the first import replaces them
+        pending = [start for start, _ in hours if start not in self._history_compiled]
+        if pending:
+            compiled = await self._async_compiled_hours(
+                pending[0], pending[-1] + timedelta(hours=1)
+            )
+            for start in pending:
+                self._history_compiled[start] = compiled.get(start)
+        async_import_statistics(
+            self.hass,
+            self._history_metadata(),
+            [
+                self._merge_compiled(
+                    start,
+                    self._history_compiled[start],
+                    total / count,
+                    minimum,
+                    maximum,
+                    last - first,
+                )
+                for start, (count, total, minimum, maximum, first, last) in hours
+            ],
+        )
+        # Later records of the same hours are merged with the imported ones
+        oldest = dt_util.utcnow() - timedelta(hours=HISTORY_IMPORT_RETENTION)
+        self._history_hours = {
+            start: hour
+            for start, hour in self._history_hours.items()
+            if start >= oldest
+        }
+        self._history_compiled = {
+            start: row
+            for start, row in self._history_compiled.items()
+            if start in self._history_hours
+        }
+
+    @callback
+    def _cancel_write(self) -> None:
+        if self._unsub_write is not None:
+            self._unsub_write()
+            self._unsub_write = None
+
+    @callback
+    def _schedule_write(self, delay: float) -> None:
+        self._cancel_write()
+        self._unsub_write = async_call_later(
+            self.hass, max(delay, 0), self._async_write_delayed
+        )
+
+    @callback
+    def _async_write_delayed(self, _: datetime) -> None:
+        self._unsub_write = None
+        self._write_state()
+
+    @callback
+    def _write_state(self) -> None:
+        self._cancel_write()
+        self._throttle.written(
+            self._attr_native_value, self.available, time.monotonic()
+        )
         self.async_write_ha_state()
 
+    @callback
+    def _write_throttled(self) -> None:
+        """Write the state unless the change is too small or too early."""
+        delay = self._throttle.check(
+            self._attr_native_value, self.available, time.monotonic()
+        )
+        if delay is None:
+            return
+        if delay <= 0:
+            self._write_state()
+        else:
+            self._schedule_write(delay)
+
     @property
     def available(self) -> bool:
         """Return if entity is available."""
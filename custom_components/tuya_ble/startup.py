@@ -0,0 +1,167 @@
+"""The Tuya BLE integration."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Any
+
+from bleak_retry_connector import BLEAK_RETRY_EXCEPTIONS as BLEAK_EXCEPTIONS
+
+from homeassistant.components import bluetooth
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from .const import (
+    DOMAIN,
+    PRESENCE_REFRESH_INTERVAL,
+    STARTUP_CATEGORY_PRIORITY,
+    STARTUP_COLLECT_DELAY,
+    STARTUP_CONCURRENCY,
+    STARTUP_CONNECT_TIMEOUT,
+    STARTUP_DEFAULT_PRIORITY,
+)
+from .tuya_ble import TuyaBLEDevice
+from .tuya_ble.exceptions import TuyaBLEError
+from .tuya_ble.startup import TuyaBLEStartupSlots, startup_sort_key
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_STARTUP = f"{DOMAIN}_startup"
+
+
+class TuyaBLEStartup:
+    """Orders and limits first connections of all configured devices.
+
+    Devices set up together are collected for a moment and connected by
+    category priority, then most recently heard and strongest first, with
+    only a few first connections in flight at a time. Devices that are away
+    wait until they advertise again without holding a slot.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._hass = hass
+        self._pending: dict[str, TuyaBLEDevice] = {}
+        self._waiting: dict[str, CALLBACK_TYPE] = {}
+        self._unsub: CALLBACK_TYPE | None = None
+        self._slots = TuyaBLEStartupSlots(STARTUP_CONCURRENCY, STARTUP_CONNECT_TIMEOUT)
+        self._started: float | None = None
+        self._total = 0
+        self._available = 0
+        self._duration: float | None = None
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        return {
+            "devices": self._total,
+            "available": self._available,
+            "duration": (
+                round(self._duration, 1) if self._duration is not None else None
+            ),
+        }
+
+    @callback
+    def async_add(self, device: TuyaBLEDevice) -> None:
+        """Queue the first connection of the device."""
+        address = device.address
+        if self._started is None:
+            self._started = time.monotonic()
+            self._total = 0
+            self._available = 0
+            self._duration = None
+        self._total += 1
+        self._pending[address] = device
+        self._waiting[address] = device.register_connected_callback(
+            lambda: self._async_available(address)
+        )
+        if self._unsub is not None:
+            self._unsub()
+        self._unsub = async_call_later(
+            self._hass, STARTUP_COLLECT_DELAY, self._async_start
+        )
+
+    @callback
+    def async_remove(self, device: TuyaBLEDevice) -> None:
+        """Forget the device when its entry is unloaded."""
+        address = device.address
+        if self._pending.pop(address, None) is not None:
+            self._total -= 1
+        if (unregister := self._waiting.pop(address, None)) is not None:
+            unregister()
+            self._async_check_done()
+
+    def _sort_key(self, device: TuyaBLEDevice) -> tuple[int, float, int]:
+        priority = STARTUP_CATEGORY_PRIORITY.get(
+            device.category, STARTUP_DEFAULT_PRIORITY
+        )
+        service_info = bluetooth.async_last_service_info(
+            self._hass, device.address, True
+        )
+        if service_info is None:
+            # Not heard since start, try it after the others
+            return startup_sort_key(priority, None, None)
+        return startup_sort_key(priority, service_info.time, service_info.rssi)
+
+    @callback
+    def _async_start(self, _: object) -> None:
+        self._unsub = None
+        devices = sorted(self._pending.values(), key=self._sort_key)
+        self._pending.clear()
+        _LOGGER.debug(
+            "Connecting %s devices: %s",
+            len(devices),
+            ", ".join(device.address for device in devices),
+        )
+        for device in devices:
+            self._hass.async_create_task(self._async_connect(device))
+
+    async def _async_connect(self, device: TuyaBLEDevice) -> None:
+        while not device.presence.is_present():
+            if device.address not in self._waiting:
+                # Removed, or connected by a command meanwhile
+                return
+            _LOGGER.debug("%s: Away, first connection deferred", device.address)
+            await asyncio.sleep(PRESENCE_REFRESH_INTERVAL)
+        if not await self._slots.run(
+            lambda: self._hass.async_create_task(self._async_update(device))
+        ):
+            _LOGGER.debug(
+                "%s: First connection still in progress after %ss",
+                device.address,
+                STARTUP_CONNECT_TIMEOUT,
+            )
+
+    async def _async_update(self, device: TuyaBLEDevice) -> None:
+        try:
+            await device.update()
+        except (*BLEAK_EXCEPTIONS, TuyaBLEError):
+            _LOGGER.debug("%s: First connection failed", device.address, exc_info=True)
+
+    @callback
+    def _async_available(self, address: str) -> None:
+        if (unregister := self._waiting.pop(address, None)) is None:
+            return
+        unregister()
+        self._available += 1
+        self._async_check_done()
+
+    @callback
+    def _async_check_done(self) -> None:
+        if self._waiting or self._pending or self._started is None:
+            return
+        self._duration = time.monotonic() - self._started
+        self._started = None
+        _LOGGER.info(
+            "%s Tuya BLE devices available in %.1fs",
+            self._available,
+            self._duration,
+        )
+
+
+@callback
+def async_get_startup(hass: HomeAssistant) -> TuyaBLEStartup:
+    """Get the startup orchestrator shared by all config entries."""
+    if DATA_STARTUP not in hass.data:
+        hass.data[DATA_STARTUP] = TuyaBLEStartup(hass)
+    return hass.data[DATA_STARTUP]
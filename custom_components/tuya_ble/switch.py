@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from functools import cache
 
 import logging
 from typing import Any, Callable
@@ -102,7 +103,7 @@ def set_fingerbot_program_repeat_forever(
             new_value = (
                 int.to_bytes(0xFFFF if value else 1, 2, "big") + datapoint.value[2:]
             )
-            self._hass.create_task(datapoint.set_value(new_value))
+            self.set_dp_value(datapoint, new_value)
 
 
 @dataclass
@@ -155,396 +156,399 @@ class TuyaBLECategorySwitchMapping:
     mapping: list[TuyaBLESwitchMapping] | None = None
 
 
-mapping: dict[str, TuyaBLECategorySwitchMapping] = {
-    "sfkzq": TuyaBLECategorySwitchMapping(
-        products={
-            **dict.fromkeys(
-                ["0axr5s0b", "46zia2nz", "1fcnd8xk"],
-                [
-                    TuyaBLESwitchMapping(
-                        dp_id=1,
-                        description=SwitchEntityDescription(
-                            key="water_valve",
-                            entity_registry_enabled_default=True,
+@cache
+def _build_mapping() -> dict[str, TuyaBLECategorySwitchMapping]:
+    """Mappings of all categories, built on first lookup."""
+    return {
+        "sfkzq": TuyaBLECategorySwitchMapping(
+            products={
+                **dict.fromkeys(
+                    ["0axr5s0b", "46zia2nz", "1fcnd8xk"],
+                    [
+                        TuyaBLESwitchMapping(
+                            dp_id=1,
+                            description=SwitchEntityDescription(
+                                key="water_valve",
+                                entity_registry_enabled_default=True,
+                            ),
                         ),
-                    ),
-                ],
-            ),
-            **dict.fromkeys(
-                ["nxquc5lb", "svhikeyq"],
-                [  # Smart water timer - SOP10
-                    TuyaBLEWaterValveSwitchMapping(dp_id=1),
-                    TuyaBLEWaterValveWeatherSwitchMapping(dp_id=14),
-                ],
-            ),
-        },
-    ),
-    "co2bj": TuyaBLECategorySwitchMapping(
-        products={
-            "59s19z5m": [  # CO2 Detector
-                TuyaBLESwitchMapping(
-                    dp_id=11,
-                    description=SwitchEntityDescription(
-                        key="carbon_dioxide_severely_exceed_alarm",
-                        icon="mdi:molecule-co2",
-                        entity_category=EntityCategory.CONFIG,
-                        entity_registry_enabled_default=False,
-                    ),
-                    bitmap_mask=b"\x01",
-                ),
-                TuyaBLESwitchMapping(
-                    dp_id=11,
-                    description=SwitchEntityDescription(
-                        key="low_battery_alarm",
-                        icon="mdi:battery-alert",
-                        entity_category=EntityCategory.CONFIG,
-                        entity_registry_enabled_default=False,
-                    ),
-                    bitmap_mask=b"\x02",
+                    ],
                 ),
-                TuyaBLESwitchMapping(
-                    dp_id=13,
-                    description=SwitchEntityDescription(
-                        key="carbon_dioxide_alarm_switch",
-                        icon="mdi:molecule-co2",
-                        entity_category=EntityCategory.CONFIG,
-                    ),
+                **dict.fromkeys(
+                    ["nxquc5lb", "svhikeyq"],
+                    [  # Smart water timer - SOP10
+                        TuyaBLEWaterValveSwitchMapping(dp_id=1),
+                        TuyaBLEWaterValveWeatherSwitchMapping(dp_id=14),
+                    ],
                 ),
-            ],
-        },
-    ),
-    "ms": TuyaBLECategorySwitchMapping(
-        products={
-            **dict.fromkeys(
-                ["ludzroix", "isk2p555", "gumrixyt"],  # Smart Lock
-                [
+            },
+        ),
+        "co2bj": TuyaBLECategorySwitchMapping(
+            products={
+                "59s19z5m": [  # CO2 Detector
                     TuyaBLESwitchMapping(
-                        dp_id=47,
+                        dp_id=11,
                         description=SwitchEntityDescription(
-                            key="lock_motor_state",
+                            key="carbon_dioxide_severely_exceed_alarm",
+                            icon="mdi:molecule-co2",
+                            entity_category=EntityCategory.CONFIG,
+                            entity_registry_enabled_default=False,
                         ),
+                        bitmap_mask=b"\x01",
                     ),
-                ],
-            ),
-            **dict.fromkeys(
-                ["uamrw6h3"],  # Smart Fechadura Positivo
-                [
                     TuyaBLESwitchMapping(
-                        dp_id=47,
+                        dp_id=11,
                         description=SwitchEntityDescription(
-                            key="lock_motor_state",
+                            key="low_battery_alarm",
+                            icon="mdi:battery-alert",
+                            entity_category=EntityCategory.CONFIG,
+                            entity_registry_enabled_default=False,
                         ),
+                        bitmap_mask=b"\x02",
                     ),
                     TuyaBLESwitchMapping(
-                        dp_id=46,
+                        dp_id=13,
                         description=SwitchEntityDescription(
-                            key="manual_lock",
+                            key="carbon_dioxide_alarm_switch",
+                            icon="mdi:molecule-co2",
+                            entity_category=EntityCategory.CONFIG,
                         ),
                     ),
                 ],
-            ),
-        }
-    ),
-    "szjqr": TuyaBLECategorySwitchMapping(
-        products={
-            **dict.fromkeys(
-                ["3yqdo5yt", "xhf790if"],  # CubeTouch 1s and II
-                [
-                    TuyaBLEFingerbotSwitchMapping(dp_id=1),
-                    TuyaBLEReversePositionsMapping(dp_id=4),
-                ],
-            ),
-            **dict.fromkeys(
-                [
-                    "blliqpsj",
-                    "ndvkgsrm",
-                    "yiihr7zh",
-                    "neq16kgd",
-                    "6jcvqwh0",
-                    "riecov42",
-                    "h8kdwywx",
-                ],  # Fingerbot Plus
-                [
-                    TuyaBLEFingerbotSwitchMapping(dp_id=2),
-                    TuyaBLEReversePositionsMapping(dp_id=11),
-                    TuyaBLESwitchMapping(
-                        dp_id=17,
-                        description=SwitchEntityDescription(
-                            key="manual_control",
-                            icon="mdi:gesture-tap-box",
-                            entity_category=EntityCategory.CONFIG,
+            },
+        ),
+        "ms": TuyaBLECategorySwitchMapping(
+            products={
+                **dict.fromkeys(
+                    ["ludzroix", "isk2p555", "gumrixyt"],  # Smart Lock
+                    [
+                        TuyaBLESwitchMapping(
+                            dp_id=47,
+                            description=SwitchEntityDescription(
+                                key="lock_motor_state",
+                            ),
                         ),
-                    ),
-                    TuyaBLESwitchMapping(
-                        dp_id=2,
-                        description=SwitchEntityDescription(
-                            key="program",
-                            icon="mdi:repeat",
+                    ],
+                ),
+                **dict.fromkeys(
+                    ["uamrw6h3"],  # Smart Fechadura Positivo
+                    [
+                        TuyaBLESwitchMapping(
+                            dp_id=47,
+                            description=SwitchEntityDescription(
+                                key="lock_motor_state",
+                            ),
                         ),
-                        is_available=is_fingerbot_in_program_mode,
-                    ),
-                    TuyaBLESwitchMapping(
-                        dp_id=121,
-                        description=SwitchEntityDescription(
-                            key="program_repeat_forever",
-                            icon="mdi:repeat",
-                            entity_category=EntityCategory.CONFIG,
+                        TuyaBLESwitchMapping(
+                            dp_id=46,
+                            description=SwitchEntityDescription(
+                                key="manual_lock",
+                            ),
                         ),
-                        getter=get_fingerbot_program_repeat_forever,
-                        is_available=is_fingerbot_in_program_mode,
-                        setter=set_fingerbot_program_repeat_forever,
-                    ),
-                ],
-            ),
-            **dict.fromkeys(
-                [
-                    "ltak7e1p",
-                    "y6kttvd6",
-                    "yrnk7mnn",
-                    "nvr2rocq",
-                    "bnt7wajf",
-                    "rvdceqjh",
-                    "5xhbk964",
-                ],  # Fingerbot
-                [
-                    TuyaBLEFingerbotSwitchMapping(dp_id=2),
-                    TuyaBLEReversePositionsMapping(dp_id=11),
-                ],
-            ),
-            "yn4x5fa7": [
-                TuyaBLEFingerbotSwitchMapping(dp_id=1),
-                TuyaBLEReversePositionsMapping(dp_id=6),
-            ],
-        },
-    ),
-    "kg": TuyaBLECategorySwitchMapping(
-        products={
-            **dict.fromkeys(
-                ["mknd4lci", "riecov42", "bs3ubslo"],  # Fingerbot Plus
-                [
-                    TuyaBLEFingerbotSwitchMapping(dp_id=1),
-                    TuyaBLEReversePositionsMapping(dp_id=104),
-                    TuyaBLESwitchMapping(
-                        dp_id=107,
-                        description=SwitchEntityDescription(
-                            key="manual_control",
-                            icon="mdi:gesture-tap-box",
-                            entity_category=EntityCategory.CONFIG,
+                    ],
+                ),
+            }
+        ),
+        "szjqr": TuyaBLECategorySwitchMapping(
+            products={
+                **dict.fromkeys(
+                    ["3yqdo5yt", "xhf790if"],  # CubeTouch 1s and II
+                    [
+                        TuyaBLEFingerbotSwitchMapping(dp_id=1),
+                        TuyaBLEReversePositionsMapping(dp_id=4),
+                    ],
+                ),
+                **dict.fromkeys(
+                    [
+                        "blliqpsj",
+                        "ndvkgsrm",
+                        "yiihr7zh",
+                        "neq16kgd",
+                        "6jcvqwh0",
+                        "riecov42",
+                        "h8kdwywx",
+                    ],  # Fingerbot Plus
+                    [
+                        TuyaBLEFingerbotSwitchMapping(dp_id=2),
+                        TuyaBLEReversePositionsMapping(dp_id=11),
+                        TuyaBLESwitchMapping(
+                            dp_id=17,
+                            description=SwitchEntityDescription(
+                                key="manual_control",
+                                icon="mdi:gesture-tap-box",
+                                entity_category=EntityCategory.CONFIG,
+                            ),
                         ),
-                    ),
-                    TuyaBLESwitchMapping(
-                        dp_id=1,
-                        description=SwitchEntityDescription(
-                            key="program",
-                            icon="mdi:repeat",
+                        TuyaBLESwitchMapping(
+                            dp_id=2,
+                            description=SwitchEntityDescription(
+                                key="program",
+                                icon="mdi:repeat",
+                            ),
+                            is_available=is_fingerbot_in_program_mode,
                         ),
-                        is_available=is_fingerbot_in_program_mode,
-                    ),
-                    TuyaBLESwitchMapping(
-                        dp_id=109,
-                        description=SwitchEntityDescription(
-                            key="program_repeat_forever",
-                            icon="mdi:repeat",
-                            entity_category=EntityCategory.CONFIG,
+                        TuyaBLESwitchMapping(
+                            dp_id=121,
+                            description=SwitchEntityDescription(
+                                key="program_repeat_forever",
+                                icon="mdi:repeat",
+                                entity_category=EntityCategory.CONFIG,
+                            ),
+                            getter=get_fingerbot_program_repeat_forever,
+                            is_available=is_fingerbot_in_program_mode,
+                            setter=set_fingerbot_program_repeat_forever,
                         ),
-                        getter=get_fingerbot_program_repeat_forever,
-                        is_available=is_fingerbot_in_program_mode,
-                        setter=set_fingerbot_program_repeat_forever,
-                    ),
+                    ],
+                ),
+                **dict.fromkeys(
+                    [
+                        "ltak7e1p",
+                        "y6kttvd6",
+                        "yrnk7mnn",
+                        "nvr2rocq",
+                        "bnt7wajf",
+                        "rvdceqjh",
+                        "5xhbk964",
+                    ],  # Fingerbot
+                    [
+                        TuyaBLEFingerbotSwitchMapping(dp_id=2),
+                        TuyaBLEReversePositionsMapping(dp_id=11),
+                    ],
+                ),
+                "yn4x5fa7": [
+                    TuyaBLEFingerbotSwitchMapping(dp_id=1),
+                    TuyaBLEReversePositionsMapping(dp_id=6),
                 ],
-            ),
-        },
-    ),
-    "wk": TuyaBLECategorySwitchMapping(
-        products={
-            **dict.fromkeys(
-                [
-                    "drlajpqc",
-                    "nhj2j7su",
-                    "zmachryv",
-                ],  # Thermostatic Radiator Valve
-                [
-                    TuyaBLESwitchMapping(
-                        dp_id=8,
-                        description=SwitchEntityDescription(
-                            key="window_check",
-                            icon="mdi:window-closed",
-                            entity_category=EntityCategory.CONFIG,
+            },
+        ),
+        "kg": TuyaBLECategorySwitchMapping(
+            products={
+                **dict.fromkeys(
+                    ["mknd4lci", "riecov42", "bs3ubslo"],  # Fingerbot Plus
+                    [
+                        TuyaBLEFingerbotSwitchMapping(dp_id=1),
+                        TuyaBLEReversePositionsMapping(dp_id=104),
+                        TuyaBLESwitchMapping(
+                            dp_id=107,
+                            description=SwitchEntityDescription(
+                                key="manual_control",
+                                icon="mdi:gesture-tap-box",
+                                entity_category=EntityCategory.CONFIG,
+                            ),
                         ),
-                    ),
-                    TuyaBLESwitchMapping(
-                        dp_id=10,
-                        description=SwitchEntityDescription(
-                            key="antifreeze",
-                            icon="mdi:snowflake-off",
-                            entity_category=EntityCategory.CONFIG,
+                        TuyaBLESwitchMapping(
+                            dp_id=1,
+                            description=SwitchEntityDescription(
+                                key="program",
+                                icon="mdi:repeat",
+                            ),
+                            is_available=is_fingerbot_in_program_mode,
                         ),
-                    ),
-                    TuyaBLESwitchMapping(
-                        dp_id=40,
-                        description=SwitchEntityDescription(
-                            key="child_lock",
-                            icon="mdi:account-lock",
-                            entity_category=EntityCategory.CONFIG,
+                        TuyaBLESwitchMapping(
+                            dp_id=109,
+                            description=SwitchEntityDescription(
+                                key="program_repeat_forever",
+                                icon="mdi:repeat",
+                                entity_category=EntityCategory.CONFIG,
+                            ),
+                            getter=get_fingerbot_program_repeat_forever,
+                            is_available=is_fingerbot_in_program_mode,
+                            setter=set_fingerbot_program_repeat_forever,
                         ),
-                    ),
-                    TuyaBLESwitchMapping(
-                        dp_id=130,
-                        description=SwitchEntityDescription(
-                            key="water_scale_proof",
-                            icon="mdi:water-check",
-                            entity_category=EntityCategory.CONFIG,
+                    ],
+                ),
+            },
+        ),
+        "wk": TuyaBLECategorySwitchMapping(
+            products={
+                **dict.fromkeys(
+                    [
+                        "drlajpqc",
+                        "nhj2j7su",
+                        "zmachryv",
+                    ],  # Thermostatic Radiator Valve
+                    [
+                        TuyaBLESwitchMapping(
+                            dp_id=8,
+                            description=SwitchEntityDescription(
+                                key="window_check",
+                                icon="mdi:window-closed",
+                                entity_category=EntityCategory.CONFIG,
+                            ),
                         ),
-                    ),
-                    TuyaBLESwitchMapping(
-                        dp_id=107,
-                        description=SwitchEntityDescription(
-                            key="programming_mode",
-                            icon="mdi:calendar-edit",
-                            entity_category=EntityCategory.CONFIG,
+                        TuyaBLESwitchMapping(
+                            dp_id=10,
+                            description=SwitchEntityDescription(
+                                key="antifreeze",
+                                icon="mdi:snowflake-off",
+                                entity_category=EntityCategory.CONFIG,
+                            ),
                         ),
-                    ),
-                    TuyaBLESwitchMapping(
-                        dp_id=108,
-                        description=SwitchEntityDescription(
-                            key="programming_switch",
-                            icon="mdi:calendar-clock",
-                            entity_category=EntityCategory.CONFIG,
+                        TuyaBLESwitchMapping(
+                            dp_id=40,
+                            description=SwitchEntityDescription(
+                                key="child_lock",
+                                icon="mdi:account-lock",
+                                entity_category=EntityCategory.CONFIG,
+                            ),
                         ),
-                    ),
-                ],
-            ),
-        },
-    ),
-    "wsdcg": TuyaBLECategorySwitchMapping(
-        products={
-            "ojzlzzsw": [  # Soil moisture sensor
-                TuyaBLESwitchMapping(
-                    dp_id=21,
-                    description=SwitchEntityDescription(
-                        key="switch",
-                        icon="mdi:thermometer",
-                        entity_category=EntityCategory.CONFIG,
-                        entity_registry_enabled_default=False,
-                    ),
-                ),
-            ],
-        },
-    ),
-    "ggq": TuyaBLECategorySwitchMapping(
-        products={
-            "6pahkcau": [  # Irrigation computer PARKSIDE PPB A1
-                TuyaBLESwitchMapping(
-                    dp_id=1,
-                    description=SwitchEntityDescription(
-                        key="water_valve",
-                        entity_registry_enabled_default=True,
-                    ),
+                        TuyaBLESwitchMapping(
+                            dp_id=130,
+                            description=SwitchEntityDescription(
+                                key="water_scale_proof",
+                                icon="mdi:water-check",
+                                entity_category=EntityCategory.CONFIG,
+                            ),
+                        ),
+                        TuyaBLESwitchMapping(
+                            dp_id=107,
+                            description=SwitchEntityDescription(
+                                key="programming_mode",
+                                icon="mdi:calendar-edit",
+                                entity_category=EntityCategory.CONFIG,
+                            ),
+                        ),
+                        TuyaBLESwitchMapping(
+                            dp_id=108,
+                            description=SwitchEntityDescription(
+                                key="programming_switch",
+                                icon="mdi:calendar-clock",
+                                entity_category=EntityCategory.CONFIG,
+                            ),
+                        ),
+                    ],
                 ),
-            ],
-            **dict.fromkeys(
-                [
-                    "hfgdqhho",
-                    "qycalacn",
-                    "fnlw6npo",
-                    "jjqi2syk",
-                ],  # Irrigation computer - dual outlet
-                [
+            },
+        ),
+        "wsdcg": TuyaBLECategorySwitchMapping(
+            products={
+                "ojzlzzsw": [  # Soil moisture sensor
                     TuyaBLESwitchMapping(
-                        dp_id=105,
+                        dp_id=21,
                         description=SwitchEntityDescription(
-                            key="water_valve_z1",
-                            name="CH1 Valve",
-                            entity_registry_enabled_default=True,
+                            key="switch",
+                            icon="mdi:thermometer",
+                            entity_category=EntityCategory.CONFIG,
+                            entity_registry_enabled_default=False,
                         ),
                     ),
+                ],
+            },
+        ),
+        "ggq": TuyaBLECategorySwitchMapping(
+            products={
+                "6pahkcau": [  # Irrigation computer PARKSIDE PPB A1
                     TuyaBLESwitchMapping(
-                        dp_id=104,
+                        dp_id=1,
                         description=SwitchEntityDescription(
-                            key="water_valve_z2",
-                            name="CH2 Valve",
+                            key="water_valve",
                             entity_registry_enabled_default=True,
                         ),
                     ),
                 ],
-            ),
-        },
-    ),
-    "dcb": TuyaBLECategorySwitchMapping(
-        products={
-            **dict.fromkeys(
-                [
-                    "ajrhf1aj",
-                    "z5ztlw3k",
-                ],
-                [  # PARKSIDE Smart battery
-                    TuyaBLESwitchMapping(
-                        dp_id=12,
-                        description=SwitchEntityDescription(
-                            key="upper_temp_switch",
-                            icon="mdi:thermometer-chevron-up",
-                            entity_category=EntityCategory.CONFIG,
+                **dict.fromkeys(
+                    [
+                        "hfgdqhho",
+                        "qycalacn",
+                        "fnlw6npo",
+                        "jjqi2syk",
+                    ],  # Irrigation computer - dual outlet
+                    [
+                        TuyaBLESwitchMapping(
+                            dp_id=105,
+                            description=SwitchEntityDescription(
+                                key="water_valve_z1",
+                                name="CH1 Valve",
+                                entity_registry_enabled_default=True,
+                            ),
                         ),
-                    ),
-                    TuyaBLESwitchMapping(
-                        dp_id=22,
-                        description=SwitchEntityDescription(
-                            key="security_switch",
-                            icon="mdi:shield-lock-outline",
-                            entity_category=EntityCategory.CONFIG,
+                        TuyaBLESwitchMapping(
+                            dp_id=104,
+                            description=SwitchEntityDescription(
+                                key="water_valve_z2",
+                                name="CH2 Valve",
+                                entity_registry_enabled_default=True,
+                            ),
                         ),
-                    ),
-                    TuyaBLESwitchMapping(
-                        dp_id=155,
-                        description=SwitchEntityDescription(
-                            key="kick_back_switch",
-                            icon="mdi:car-esp",
-                            entity_category=EntityCategory.CONFIG,
+                    ],
+                ),
+            },
+        ),
+        "dcb": TuyaBLECategorySwitchMapping(
+            products={
+                **dict.fromkeys(
+                    [
+                        "ajrhf1aj",
+                        "z5ztlw3k",
+                    ],
+                    [  # PARKSIDE Smart battery
+                        TuyaBLESwitchMapping(
+                            dp_id=12,
+                            description=SwitchEntityDescription(
+                                key="upper_temp_switch",
+                                icon="mdi:thermometer-chevron-up",
+                                entity_category=EntityCategory.CONFIG,
+                            ),
                         ),
-                    ),
-                    TuyaBLESwitchMapping(
-                        dp_id=163,
-                        description=SwitchEntityDescription(
-                            key="lamp_switch",
-                            device_class=SwitchDeviceClass.SWITCH,
-                            icon="mdi:lightbulb",
-                            entity_category=EntityCategory.CONFIG,
+                        TuyaBLESwitchMapping(
+                            dp_id=22,
+                            description=SwitchEntityDescription(
+                                key="security_switch",
+                                icon="mdi:shield-lock-outline",
+                                entity_category=EntityCategory.CONFIG,
+                            ),
                         ),
-                    ),
-                    TuyaBLESwitchMapping(
-                        dp_id=170,
-                        description=SwitchEntityDescription(
-                            key="cw_or_ccw_control",
-                            icon="mdi:rotate-right",
-                            entity_category=EntityCategory.CONFIG,
+                        TuyaBLESwitchMapping(
+                            dp_id=155,
+                            description=SwitchEntityDescription(
+                                key="kick_back_switch",
+                                icon="mdi:car-esp",
+                                entity_category=EntityCategory.CONFIG,
+                            ),
                         ),
-                    ),
-                    TuyaBLESwitchMapping(
-                        dp_id=185,
-                        description=SwitchEntityDescription(
-                            key="laser_switch",
-                            icon="mdi:laser-pointer",
-                            entity_category=EntityCategory.CONFIG,
+                        TuyaBLESwitchMapping(
+                            dp_id=163,
+                            description=SwitchEntityDescription(
+                                key="lamp_switch",
+                                device_class=SwitchDeviceClass.SWITCH,
+                                icon="mdi:lightbulb",
+                                entity_category=EntityCategory.CONFIG,
+                            ),
                         ),
-                    ),
-                    TuyaBLESwitchMapping(
-                        dp_id=186,
-                        description=SwitchEntityDescription(
-                            key="laser_pulse_switch",
-                            icon="mdi:pulse",
-                            entity_category=EntityCategory.CONFIG,
+                        TuyaBLESwitchMapping(
+                            dp_id=170,
+                            description=SwitchEntityDescription(
+                                key="cw_or_ccw_control",
+                                icon="mdi:rotate-right",
+                                entity_category=EntityCategory.CONFIG,
+                            ),
                         ),
-                    ),
-                ],
-            ),
-        },
-    ),
-}
+                        TuyaBLESwitchMapping(
+                            dp_id=185,
+                            description=SwitchEntityDescription(
+                                key="laser_switch",
+                                icon="mdi:laser-pointer",
+                                entity_category=EntityCategory.CONFIG,
+                            ),
+                        ),
+                        TuyaBLESwitchMapping(
+                            dp_id=186,
+                            description=SwitchEntityDescription(
+                                key="laser_pulse_switch",
+                                icon="mdi:pulse",
+                                entity_category=EntityCategory.CONFIG,
+                            ),
+                        ),
+                    ],
+                ),
+            },
+        ),
+    }
 
 
 def get_mapping_by_device(device: TuyaBLEDevice) -> list[TuyaBLECategorySwitchMapping]:
     """Lookup mapping for a given device"""
-    category = mapping.get(device.category)
+    category = _build_mapping().get(device.category)
     if category is not None and category.products is not None:
         product_mapping = category.products.get(device.product_id)
         if product_mapping is not None:
@@ -617,7 +621,7 @@ class TuyaBLESwitch(TuyaBLEEntity, SwitchEntity):
             )
             new_value = True
         if datapoint:
-            self._hass.create_task(datapoint.set_value(new_value))
+            self.set_dp_value(datapoint, new_value)
 
     def turn_off(self, **kwargs: Any) -> None:
         """Turn the switch off."""
@@ -644,7 +648,7 @@ class TuyaBLESwitch(TuyaBLEEntity, SwitchEntity):
             )
             new_value = False
         if datapoint:
-            self._hass.create_task(datapoint.set_value(new_value))
+            self.set_dp_value(datapoint, new_value)
 
     @property
     def available(self) -> bool:
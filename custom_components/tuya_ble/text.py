@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import cache
 
 import logging
 from struct import pack, unpack
@@ -114,82 +115,85 @@ class TuyaBLECategoryTextMapping:
     mapping: list[TuyaBLETextMapping] | None = None
 
 
-mapping: dict[str, TuyaBLECategoryTextMapping] = {
-    "szjqr": TuyaBLECategoryTextMapping(
-        products={
-            **dict.fromkeys(
-                [
-                    "blliqpsj",
-                    "ndvkgsrm",
-                    "yiihr7zh",
-                    "neq16kgd",
-                    "6jcvqwh0",
-                    "riecov42",
-                    "h8kdwywx",
-                ],  # Fingerbot Plus
-                [
-                    TuyaBLETextMapping(
-                        dp_id=121,
-                        description=TextEntityDescription(
-                            key="program",
-                            icon="mdi:repeat",
-                            pattern=r"^((\d{1,2}|100)(\/\d{1,2})?)(;((\d{1,2}|100)(\/\d{1,2})?))+$",
-                            entity_category=EntityCategory.CONFIG,
+@cache
+def _build_mapping() -> dict[str, TuyaBLECategoryTextMapping]:
+    """Mappings of all categories, built on first lookup."""
+    return {
+        "szjqr": TuyaBLECategoryTextMapping(
+            products={
+                **dict.fromkeys(
+                    [
+                        "blliqpsj",
+                        "ndvkgsrm",
+                        "yiihr7zh",
+                        "neq16kgd",
+                        "6jcvqwh0",
+                        "riecov42",
+                        "h8kdwywx",
+                    ],  # Fingerbot Plus
+                    [
+                        TuyaBLETextMapping(
+                            dp_id=121,
+                            description=TextEntityDescription(
+                                key="program",
+                                icon="mdi:repeat",
+                                pattern=r"^((\d{1,2}|100)(\/\d{1,2})?)(;((\d{1,2}|100)(\/\d{1,2})?))+$",
+                                entity_category=EntityCategory.CONFIG,
+                            ),
+                            is_available=is_fingerbot_in_program_mode,
+                            getter=get_fingerbot_program,
+                            setter=set_fingerbot_program,
                         ),
-                        is_available=is_fingerbot_in_program_mode,
-                        getter=get_fingerbot_program,
-                        setter=set_fingerbot_program,
-                    ),
-                ],
-            ),
-        },
-    ),
-    "dcb": TuyaBLECategoryTextMapping(
-        products={
-            **dict.fromkeys(
-                ["ajrhf1aj", "z5ztlw3k"],  # PARKSIDE Smart battery
-                [
-                    TuyaBLETextMapping(
-                        dp_id=106,
-                        description=TextEntityDescription(
-                            key="battery_pin",
-                            icon="mdi:key-variant",
-                            entity_category=EntityCategory.CONFIG,
+                    ],
+                ),
+            },
+        ),
+        "dcb": TuyaBLECategoryTextMapping(
+            products={
+                **dict.fromkeys(
+                    ["ajrhf1aj", "z5ztlw3k"],  # PARKSIDE Smart battery
+                    [
+                        TuyaBLETextMapping(
+                            dp_id=106,
+                            description=TextEntityDescription(
+                                key="battery_pin",
+                                icon="mdi:key-variant",
+                                entity_category=EntityCategory.CONFIG,
+                            ),
+                            dp_type=TuyaBLEDataPointType.DT_STRING,
+                            default_value="0000",  # Default PIN
                         ),
-                        dp_type=TuyaBLEDataPointType.DT_STRING,
-                        default_value="0000",  # Default PIN
-                    ),
-                ],
-            ),
-        },
-    ),
-    "kg": TuyaBLECategoryTextMapping(
-        products={
-            **dict.fromkeys(
-                ["mknd4lci", "riecov42", "bs3ubslo"],  # Fingerbot Plus
-                [
-                    TuyaBLETextMapping(
-                        dp_id=109,
-                        description=TextEntityDescription(
-                            key="program",
-                            icon="mdi:repeat",
-                            pattern=r"^((\d{1,2}|100)(\/\d{1,2})?)(;((\d{1,2}|100)(\/\d{1,2})?))+$",
-                            entity_category=EntityCategory.CONFIG,
+                    ],
+                ),
+            },
+        ),
+        "kg": TuyaBLECategoryTextMapping(
+            products={
+                **dict.fromkeys(
+                    ["mknd4lci", "riecov42", "bs3ubslo"],  # Fingerbot Plus
+                    [
+                        TuyaBLETextMapping(
+                            dp_id=109,
+                            description=TextEntityDescription(
+                                key="program",
+                                icon="mdi:repeat",
+                                pattern=r"^((\d{1,2}|100)(\/\d{1,2})?)(;((\d{1,2}|100)(\/\d{1,2})?))+$",
+                                entity_category=EntityCategory.CONFIG,
+                            ),
+                            is_available=is_fingerbot_in_program_mode,
+                            getter=get_fingerbot_program,
+                            setter=set_fingerbot_program,
                         ),
-                        is_available=is_fingerbot_in_program_mode,
-                        getter=get_fingerbot_program,
-                        setter=set_fingerbot_program,
-                    ),
-                ],
-            ),
-        },
-    ),
-}
+                    ],
+                ),
+            },
+        ),
+    }
 
 
 def get_mapping_by_device(device: TuyaBLEDevice) -> list[TuyaBLETextMapping]:
     """Lookup mapping for a given device"""
-    category = mapping.get(device.category)
+    category = _build_mapping().get(device.category)
     if category is not None and category.products is not None:
         product_mapping = category.products.get(device.product_id)
         if product_mapping is not None:
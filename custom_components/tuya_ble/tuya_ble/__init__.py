@@ -5,20 +5,33 @@ __version__ = "0.2.3"
 
 from .const import (
     SERVICE_UUID,
+    DPType,
     TuyaBLEDataPointType,
 )
 from .manager import (
     AbstaractTuyaBLEDeviceManager,
     TuyaBLEDeviceCredentials,
 )
-from .tuya_ble import TuyaBLEDataPoint, TuyaBLEDevice, TuyaBLEEntityDescription
+from .ota import TuyaBLEFirmwareImage, TuyaBLEOTAProgress
+from .routing import TuyaBLERoute
+from .tuya_ble import (
+    TuyaBLEDataPoint,
+    TuyaBLEDataPointRecord,
+    TuyaBLEDevice,
+    TuyaBLEEntityDescription,
+)
 
 
 __all__ = [
     "AbstaractTuyaBLEDeviceManager",
+    "DPType",
     "TuyaBLEDataPoint",
+    "TuyaBLEDataPointRecord",
     "TuyaBLEDataPointType",
     "TuyaBLEDevice",
     "TuyaBLEDeviceCredentials",
+    "TuyaBLEFirmwareImage",
+    "TuyaBLEOTAProgress",
+    "TuyaBLERoute",
     "SERVICE_UUID",
 ]
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Coroutine
+from enum import Enum
+import logging
+import time
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class TuyaBLEConnectionState(Enum):
+    IDLE = "idle"
+    CONNECTING = "connecting"
+    HANDSHAKING = "handshaking"
+    READY = "ready"
+    DRAINING = "draining"
+    BACKOFF = "backoff"
+    STOPPED = "stopped"
+
+
+class TuyaBLEConnection:
+    """Lifecycle of the link to one device.
+
+    Transitions are synchronous, so each one is atomic in the event loop.
+    At most one connect task and one reconnect task run at a time, callers
+    asking for another one share the running task and are counted. Time
+    spent in each state is accumulated for diagnostics. The stopped state
+    is final.
+    """
+
+    def __init__(self, name: str) -> None:
+        self._name = name
+        self._state = TuyaBLEConnectionState.IDLE
+        self._since = time.monotonic()
+        self._durations = dict.fromkeys(TuyaBLEConnectionState, 0.0)
+        self._transitions = 0
+        self._connect_task: asyncio.Task | None = None
+        self._reconnect_task: asyncio.Task | None = None
+        self._connects = 0
+        self._joined_connects = 0
+        self._reconnects = 0
+        self._joined_reconnects = 0
+
+    @property
+    def state(self) -> TuyaBLEConnectionState:
+        return self._state
+
+    @property
+    def stopped(self) -> bool:
+        return self._state is TuyaBLEConnectionState.STOPPED
+
+    def set_state(self, state: TuyaBLEConnectionState) -> None:
+        if state is self._state or self.stopped:
+            return
+        now = time.monotonic()
+        self._durations[self._state] += now - self._since
+        _LOGGER.debug(
+            "%s: Connection %s -> %s after %.2fs",
+            self._name,
+            self._state.value,
+            state.value,
+            now - self._since,
+        )
+        self._state = state
+        self._since = now
+        self._transitions += 1
+
+    def connect(self, factory: Callable[[], Coroutine[Any, Any, None]]) -> asyncio.Task:
+        """Return the running connect task, or start one."""
+        if self._connect_task is not None and not self._connect_task.done():
+            self._joined_connects += 1
+            return self._connect_task
+        self._connects += 1
+        self._connect_task = asyncio.create_task(factory())
+        return self._connect_task
+
+    def reconnect(self, factory: Callable[[], Coroutine[Any, Any, None]]) -> None:
+        """Start a reconnect task unless one is running."""
+        if self.stopped:
+            return
+        if self._reconnect_task is not None and not self._reconnect_task.done():
+            self._joined_reconnects += 1
+            return
+        self._reconnects += 1
+        self._reconnect_task = asyncio.create_task(factory())
+
+    def stop(self) -> None:
+        """Cancel the tasks, the caller drains the link and sets stopped."""
+        for task in (self._connect_task, self._reconnect_task):
+            if task is not None and task is not asyncio.current_task():
+                task.cancel()
+        self._connect_task = None
+        self._reconnect_task = None
+
+    def time_in_state(self) -> dict[TuyaBLEConnectionState, float]:
+        durations = dict(self._durations)
+        durations[self._state] += time.monotonic() - self._since
+        return durations
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "state": self._state.value,
+            "transitions": self._transitions,
+            "connects": self._connects,
+            "joined_connects": self._joined_connects,
+            "reconnects": self._reconnects,
+            "joined_reconnects": self._joined_reconnects,
+            "time_in_state": {
+                state.value: round(duration, 2)
+                for state, duration in self.time_in_state().items()
+            },
+        }
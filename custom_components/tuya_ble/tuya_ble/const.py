@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from enum import Enum
+from enum import Enum, StrEnum
 
 GATT_MTU = 20
 
@@ -16,7 +16,91 @@ SERVICE_UUID_TEMP = "0000a201-0000-1000-8000-00805f9b34fb"
 
 MANUFACTURER_DATA_ID = 0x07D0
 
+# Key used to encrypt a frame, sent as its first byte
+SECURITY_FLAG_AUTH = 1
+SECURITY_FLAG_LOGIN = 4
+SECURITY_FLAG_SESSION = 5
+
 RESPONSE_WAIT_TIMEOUT = 60
+RESPONSE_QUEUE_SIZE = 16
+
+# Notifications declaring a longer message are refused
+INPUT_MAX_LENGTH = 2048
+
+# Payloads longer than this are sent with background priority
+BULK_DATA_LENGTH = 64
+
+# Seconds a queued response or status poll may wait before it is dropped
+RESPONSE_DEADLINE = 10
+POLL_DEADLINE = 30
+
+# Fragments of a frame written back to back before a pause, and the pause
+# step and bound in seconds, adapted to lost frames
+PACING_MAX_BATCH = 8
+PACING_GAP_STEP = 0.01
+PACING_MAX_GAP = 0.2
+
+# Timestamped datapoints older than this many seconds, beyond the lag of
+# the device clock, are historical records, reported by the device for the
+# time it was offline
+DATAPOINT_HISTORICAL_AGE = 60
+# Seconds without further historical records after which the newest record
+# of each datapoint becomes its value
+DATAPOINT_BURST_DELAY = 1.0
+# Largest lag of the device clock in seconds learnt from single reports,
+# records further behind are always historical
+DATAPOINT_MAX_CLOCK_LAG = 300
+# Device timestamps outside of this range mean the clock of the device is
+# not set, the reception time is used instead
+DATAPOINT_MIN_TIMESTAMP = 1577836800  # 2020-01-01
+DATAPOINT_MAX_CLOCK_SKEW = 60
+
+# Sequence numbers of signed datapoint reports remembered to skip copies
+# sent again by the device
+DP_SEQ_WINDOW_SIZE = 16
+
+# Messages waiting for a gateway client before new ones are dropped
+GATEWAY_QUEUE_SIZE = 256
+
+# Seconds to wait for the result of a request to a worker process, it may
+# include connecting to the device
+WORKER_CALL_TIMEOUT = 90
+# Seconds a worker process gets to disconnect its devices when stopped
+WORKER_STOP_TIMEOUT = 10
+
+# Weight of a new sample in the smoothed RSSI and advertisement interval
+PRESENCE_RSSI_SMOOTHING = 0.25
+PRESENCE_INTERVAL_SMOOTHING = 0.1
+# A device is away after this many missed advertisements, at least
+# PRESENCE_MIN_TIMEOUT seconds
+PRESENCE_MISSED_ADVERTISEMENTS = 10
+PRESENCE_MIN_TIMEOUT = 5 * 60
+# Seconds between presence checks while a reconnect waits for an away device
+PRESENCE_RECHECK_INTERVAL = 30
+
+# Score of the route with the fastest connect and pair, in dB of RSSI
+ROUTE_PREFERRED_BONUS = 10
+# Score lost by a route per consecutive failed connection, in dB of RSSI
+ROUTE_FAILURE_PENALTY = 5
+# Weight of a new connection duration in the smoothed duration of a route
+ROUTE_DURATION_SMOOTHING = 0.3
+
+# A connected device silent for this many of its usual gaps between
+# frames is probed with a status request, within the interval bounds
+HEARTBEAT_MISSED_FRAMES = 3
+HEARTBEAT_MIN_INTERVAL = 30
+HEARTBEAT_MAX_INTERVAL = 5 * 60
+# Weight of a new gap between received frames in the smoothed gap
+HEARTBEAT_GAP_SMOOTHING = 0.2
+# Seconds to wait for the answer to a probe before the link is dropped
+HEARTBEAT_TIMEOUT = 10
+
+# Older history samples are reduced by groups of this many
+HISTORY_DOWNSAMPLE_FACTOR = 8
+
+OTA_TYPE_FIRMWARE = 0
+OTA_WINDOW_SIZE = 4
+OTA_READ_AHEAD = 4096
 
 
 class TuyaBLECode(Enum):
@@ -59,3 +143,14 @@ class TuyaBLEDataPointType(Enum):
     DT_STRING = 3
     DT_ENUM = 4
     DT_BITMAP = 5
+
+
+class DPType(StrEnum):
+    """Data point types."""
+
+    BOOLEAN = "Boolean"
+    ENUM = "Enum"
+    INTEGER = "Integer"
+    JSON = "Json"
+    RAW = "Raw"
+    STRING = "String"
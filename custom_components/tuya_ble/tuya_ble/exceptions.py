@@ -38,3 +38,17 @@ class TuyaBLEDeviceError(TuyaBLEError):
 
     def __init__(self, code: int) -> None:
         super().__init__(("BLE deice returned error code %s") % (code))
+
+
+class TuyaBLEOTAError(TuyaBLEError):
+    """Raised when firmware update can not be completed."""
+
+    def __init__(self, reason: str) -> None:
+        super().__init__(("Firmware update failed: %s") % (reason))
+
+
+class TuyaBLEDeadlineError(TuyaBLEError):
+    """Raised when queued command expired before it could be sent."""
+
+    def __init__(self) -> None:
+        super().__init__("Command expired while waiting for the device link")
@@ -0,0 +1,467 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+from collections.abc import Callable
+from typing import Any
+
+from bleak import BleakScanner
+from bleak.backends.device import BLEDevice
+from bleak.backends.scanner import AdvertisementData
+
+from .const import GATEWAY_QUEUE_SIZE, TuyaBLEDataPointType
+from .exceptions import TuyaBLEError
+from .manager import AbstaractTuyaBLEDeviceManager, TuyaBLEDeviceCredentials
+from .tuya_ble import (
+    BLEAK_EXCEPTIONS,
+    TuyaBLEClientFactory,
+    TuyaBLEDataPoint,
+    TuyaBLEDataPointRecord,
+    TuyaBLEDevice,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Creates a scanner of the adapter, None for the default one, calling back
+# with each advertisement
+TuyaBLEScannerFactory = Callable[
+    [Callable[[BLEDevice, AdvertisementData], None], str | None], BleakScanner
+]
+
+
+def _create_scanner(
+    detection_callback: Callable[[BLEDevice, AdvertisementData], None],
+    adapter: str | None,
+) -> BleakScanner:
+    kwargs = {"adapter": adapter} if adapter else {}
+    return BleakScanner(detection_callback=detection_callback, **kwargs)
+
+
+class TuyaBLEStaticDeviceManager(AbstaractTuyaBLEDeviceManager):
+    """Credentials of the devices given by address.
+
+    Credentials are dicts with the keys used by the integration: uuid,
+    local_key, device_id, category, product_id and optionally device_name,
+    product_model, product_name, functions and status_range.
+    """
+
+    def __init__(self) -> None:
+        self._credentials: dict[str, dict[str, Any]] = {}
+
+    @property
+    def addresses(self) -> list[str]:
+        return list(self._credentials)
+
+    def add(self, address: str, credentials: dict[str, Any]) -> None:
+        self._credentials[address.upper()] = credentials
+
+    def remove(self, address: str) -> None:
+        self._credentials.pop(address.upper(), None)
+
+    async def get_device_credentials(
+        self,
+        address: str,
+        force_update: bool = False,
+        save_data: bool = False,
+    ) -> TuyaBLEDeviceCredentials | None:
+        """Get credentials of the Tuya BLE device."""
+        credentials = self._credentials.get(address.upper())
+        if credentials is None:
+            return None
+        return self.check_and_create_device_credentials(
+            credentials.get("uuid"),
+            credentials.get("local_key"),
+            credentials.get("device_id"),
+            credentials.get("category"),
+            credentials.get("product_id"),
+            credentials.get("device_name"),
+            credentials.get("product_model"),
+            credentials.get("product_name"),
+            credentials.get("functions", []),
+            credentials.get("status_range", []),
+        )
+
+
+class TuyaBLEFileDeviceManager(TuyaBLEStaticDeviceManager):
+    """Credentials of the devices read from a JSON file keyed by address."""
+
+    def __init__(self, path: str) -> None:
+        super().__init__()
+        self._path = path
+
+    def load(self) -> None:
+        with open(self._path, encoding="utf-8") as file:
+            data = json.load(file)
+        for address, credentials in data.items():
+            self.add(address, credentials)
+
+
+def datapoint_to_json(
+    datapoint: TuyaBLEDataPoint | TuyaBLEDataPointRecord,
+) -> dict[str, Any]:
+    """Datapoint or historical record as a JSON object."""
+    return {
+        "id": datapoint.id,
+        "type": datapoint.type.name,
+        "value": value_to_json(datapoint.value),
+        "timestamp": datapoint.timestamp,
+    }
+
+
+def value_to_json(value: bytes | bool | int | str) -> bool | int | str:
+    if isinstance(value, bytes):
+        return value.hex()
+    return value
+
+
+def value_from_json(type: TuyaBLEDataPointType, value: Any) -> Any:
+    if type in (TuyaBLEDataPointType.DT_RAW, TuyaBLEDataPointType.DT_BITMAP):
+        return bytes.fromhex(value)
+    return value
+
+
+class TuyaBLEGatewayClient:
+    """Connection of a client to the gateway socket."""
+
+    def __init__(self, writer: asyncio.StreamWriter) -> None:
+        self._writer = writer
+        # Events are dropped for a client that does not read them
+        self._events: asyncio.Queue[dict[str, Any]] = asyncio.Queue(GATEWAY_QUEUE_SIZE)
+        self._sender: asyncio.Task | None = None
+        self.subscribed = False
+
+    def start(self) -> None:
+        self._sender = asyncio.create_task(self._send_events())
+
+    def close(self) -> None:
+        if self._sender is not None:
+            self._sender.cancel()
+            self._sender = None
+        self._writer.close()
+
+    def send(self, message: dict[str, Any]) -> None:
+        try:
+            self._events.put_nowait(message)
+        except asyncio.QueueFull:
+            _LOGGER.debug("Gateway client too slow, message dropped: %s", message)
+
+    async def _send_events(self) -> None:
+        while True:
+            message = await self._events.get()
+            self._writer.write(json.dumps(message).encode() + b"\n")
+            await self._writer.drain()
+
+
+class TuyaBLEGateway:
+    """Standalone service owning the devices of a credentials manager.
+
+    Advertisements are received from the given local adapters, or from the
+    default one. Clients connect to a unix socket, or are served over given
+    streams, and exchange JSON objects, one per line. Requests are executed
+    concurrently, each has an optional id echoed in its reply and a method:
+
+    - list: devices with their state
+    - get: datapoints of the device with the given address
+    - set: set datapoint dp_id of type (a TuyaBLEDataPointType name) to
+      value, raw values are hex encoded, or the datapoints of a list of such
+      objects in one command, returns whether the device acknowledged it
+    - update: request the status of the device
+    - subscribe: stream datapoints, history, connected and disconnected
+      events, connected events carry the versions of the device, datapoint
+      events only the datapoints whose value changed
+    - add: add the device with the given address and credentials
+    - remove: stop and forget the device with the given address
+
+    With autostart a device is connected once it is first heard, otherwise
+    only by update and set requests. Scanners and connections are made by
+    the given factories, by default BleakScanner and establish_connection,
+    so tests can replace the radio.
+    """
+
+    def __init__(
+        self,
+        manager: TuyaBLEStaticDeviceManager,
+        socket_path: str | None = None,
+        adapters: list[str] | None = None,
+        scanner_factory: TuyaBLEScannerFactory = _create_scanner,
+        client_factory: TuyaBLEClientFactory | None = None,
+        autostart: bool = True,
+    ) -> None:
+        self._manager = manager
+        self._autostart = autostart
+        self._scanner_factory = scanner_factory
+        self._client_factory = client_factory
+        self._socket_path = socket_path
+        self._adapters = adapters or [None]
+        self._devices: dict[str, TuyaBLEDevice] = {}
+        self._started: set[str] = set()
+        self._scanners: list[BleakScanner] = []
+        self._server: asyncio.AbstractServer | None = None
+        self._clients: set[TuyaBLEGatewayClient] = set()
+        self._unregister: dict[str, list[Callable[[], None]]] = {}
+        # Type and value of each datapoint last sent to the clients
+        self._reported: dict[str, dict[int, tuple[TuyaBLEDataPointType, Any]]] = {}
+        self._tasks: set[asyncio.Task] = set()
+
+    @property
+    def devices(self) -> dict[str, TuyaBLEDevice]:
+        return self._devices
+
+    async def start(self) -> None:
+        for address in self._manager.addresses:
+            self._add_device(address)
+
+        if self._socket_path is not None:
+            if os.path.exists(self._socket_path):
+                os.unlink(self._socket_path)
+            self._server = await asyncio.start_unix_server(
+                self.serve, self._socket_path
+            )
+
+        for adapter in self._adapters:
+            scanner = self._scanner_factory(self._advertisement, adapter)
+            await scanner.start()
+            self._scanners.append(scanner)
+        _LOGGER.info("Gateway serving %s devices", len(self._devices))
+
+    async def stop(self) -> None:
+        for scanner in self._scanners:
+            await scanner.stop()
+        self._scanners.clear()
+        if self._server is not None:
+            self._server.close()
+        for client in list(self._clients):
+            client.close()
+        if self._server is not None:
+            await self._server.wait_closed()
+            self._server = None
+        for unregister in self._unregister.values():
+            for callback in unregister:
+                callback()
+        self._unregister.clear()
+        for task in list(self._tasks):
+            task.cancel()
+        for device in self._devices.values():
+            await device.stop()
+
+    def _add_device(self, address: str) -> TuyaBLEDevice:
+        address = address.upper()
+        device = self._devices.get(address)
+        if device is None:
+            device = self._devices[address] = TuyaBLEDevice(self._manager, address)
+            device.set_client_factory(self._client_factory)
+            self._register_device_callbacks(device)
+        return device
+
+    async def _remove_device(self, address: str) -> None:
+        address = address.upper()
+        self._manager.remove(address)
+        self._started.discard(address)
+        for unregister in self._unregister.pop(address, []):
+            unregister()
+        self._reported.pop(address, None)
+        device = self._devices.pop(address, None)
+        if device is not None:
+            await device.stop()
+
+    def _register_device_callbacks(self, device: TuyaBLEDevice) -> None:
+        address = device.address
+        self._unregister[address] = [
+            device.register_callback(
+                lambda datapoints: self._report_datapoints(address, datapoints)
+            ),
+            device.register_history_callback(
+                lambda records: self._broadcast(
+                    {
+                        "event": "history",
+                        "address": address,
+                        "records": [datapoint_to_json(record) for record in records],
+                    }
+                )
+            ),
+            device.register_connected_callback(
+                lambda: self._broadcast(
+                    {
+                        "event": "connected",
+                        "address": address,
+                        "device_version": device.device_version,
+                        "hardware_version": device.hardware_version,
+                        "protocol_version": device.protocol_version,
+                    }
+                )
+            ),
+            device.register_disconnected_callback(
+                lambda: self._broadcast({"event": "disconnected", "address": address})
+            ),
+        ]
+
+    def _report_datapoints(
+        self, address: str, datapoints: list[TuyaBLEDataPoint]
+    ) -> None:
+        """Send the datapoints of a frame that changed since last sent."""
+        reported = self._reported.setdefault(address, {})
+        changed: list[TuyaBLEDataPoint] = []
+        for datapoint in datapoints:
+            state = (datapoint.type, datapoint.value)
+            if reported.get(datapoint.id) != state:
+                reported[datapoint.id] = state
+                changed.append(datapoint)
+        if changed:
+            self._broadcast(
+                {
+                    "event": "datapoints",
+                    "address": address,
+                    "datapoints": [datapoint_to_json(dp) for dp in changed],
+                }
+            )
+
+    def _broadcast(self, message: dict[str, Any]) -> None:
+        for client in self._clients:
+            if client.subscribed:
+                client.send(message)
+
+    def _advertisement(
+        self, ble_device: BLEDevice, advertisement_data: AdvertisementData
+    ) -> None:
+        device = self._devices.get(ble_device.address.upper())
+        if device is None:
+            return
+        device.set_ble_device_and_advertisement_data(ble_device, advertisement_data)
+        if self._autostart and device.address not in self._started:
+            self._started.add(device.address)
+            self._create_task(self._start_device(device))
+
+    def _create_task(self, coro) -> None:
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _start_device(self, device: TuyaBLEDevice) -> None:
+        try:
+            await device.initialize()
+            await device.update()
+        except (*BLEAK_EXCEPTIONS, TuyaBLEError) as error:
+            _LOGGER.warning("%s: Start failed: %s", device.address, error)
+            # Tried again on the next advertisement
+            self._started.discard(device.address)
+
+    async def serve(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Serve one client until it closes the stream."""
+        client = TuyaBLEGatewayClient(writer)
+        self._clients.add(client)
+        client.start()
+        try:
+            while line := await reader.readline():
+                self._create_task(self._handle_request(client, line))
+        except ConnectionError:
+            pass
+        finally:
+            self._clients.discard(client)
+            client.close()
+
+    async def _handle_request(self, client: TuyaBLEGatewayClient, line: bytes) -> None:
+        request_id = None
+        try:
+            request = json.loads(line)
+            request_id = request.get("id")
+            result = await self._execute(client, request)
+        except (
+            *BLEAK_EXCEPTIONS,
+            TuyaBLEError,
+            KeyError,
+            TypeError,
+            ValueError,
+        ) as error:
+            client.send({"id": request_id, "error": f"{type(error).__name__}: {error}"})
+        else:
+            client.send({"id": request_id, "result": result})
+
+    def _get_device(self, request: dict[str, Any]) -> TuyaBLEDevice:
+        address = request["address"].upper()
+        device = self._devices.get(address)
+        if device is None:
+            raise KeyError(f"Unknown device {address}")
+        return device
+
+    async def _execute(
+        self, client: TuyaBLEGatewayClient, request: dict[str, Any]
+    ) -> Any:
+        match request["method"]:
+            case "list":
+                return [
+                    {
+                        "address": device.address,
+                        "name": device.name,
+                        "connected": device.is_connected,
+                        "rssi": device.presence.rssi,
+                    }
+                    for device in self._devices.values()
+                ]
+            case "get":
+                device = self._get_device(request)
+                return [
+                    datapoint_to_json(datapoint)
+                    for datapoint in device.datapoints.__dict__().values()
+                ]
+            case "set":
+                device = self._get_device(request)
+                items = request.get("datapoints") or [request]
+                device.datapoints.begin_update()
+                try:
+                    for item in items:
+                        dp_type = TuyaBLEDataPointType[item["type"]]
+                        datapoint = device.datapoints.get_or_create(
+                            item["dp_id"], dp_type
+                        )
+                        await datapoint.set_value(
+                            value_from_json(dp_type, item["value"])
+                        )
+                finally:
+                    sent = await device.datapoints.end_update()
+                return sent
+            case "update":
+                await self._get_device(request).update()
+                return None
+            case "subscribe":
+                client.subscribed = True
+                return None
+            case "add":
+                self._manager.add(request["address"], request["credentials"])
+                await self._add_device(request["address"]).initialize()
+                return None
+            case "remove":
+                await self._remove_device(request["address"])
+                return None
+        raise ValueError(f"Unknown method {request['method']}")
+
+
+async def _run(args: argparse.Namespace) -> None:
+    manager = TuyaBLEFileDeviceManager(args.credentials)
+    manager.load()
+    gateway = TuyaBLEGateway(manager, args.socket, args.adapter)
+    await gateway.start()
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await gateway.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Tuya BLE gateway")
+    parser.add_argument("--credentials", required=True, help="JSON credentials file")
+    parser.add_argument("--socket", required=True, help="Path of the unix socket")
+    parser.add_argument(
+        "--adapter", action="append", help="Local adapter, may be repeated"
+    )
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.INFO)
+    try:
+        asyncio.run(_run(args))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import time
+from typing import Any
+
+from .const import (
+    HEARTBEAT_GAP_SMOOTHING,
+    HEARTBEAT_MAX_INTERVAL,
+    HEARTBEAT_MIN_INTERVAL,
+    HEARTBEAT_MISSED_FRAMES,
+)
+
+
+class TuyaBLEHeartbeat:
+    """Liveness of an established connection.
+
+    Keeps the exponentially smoothed gap between frames received over the
+    connection. A device silent for several of its usual gaps is due for
+    a probe, devices reporting often are probed sooner than quiet ones.
+    """
+
+    __slots__ = (
+        "_gap",
+        "_last_received",
+        "_probes",
+        "_failures",
+        "_last_rtt",
+    )
+
+    def __init__(self) -> None:
+        self._gap: float | None = None
+        self._last_received: float | None = None
+        self._probes = 0
+        self._failures = 0
+        self._last_rtt: float | None = None
+
+    def reset(self, now: float | None = None) -> None:
+        """Restart the idle period, the device counts as just heard."""
+        self._last_received = time.monotonic() if now is None else now
+
+    def received(self, now: float | None = None) -> None:
+        """Frame received over the connection."""
+        if now is None:
+            now = time.monotonic()
+        if self._last_received is not None:
+            gap = now - self._last_received
+            if self._gap is None:
+                self._gap = gap
+            else:
+                self._gap += HEARTBEAT_GAP_SMOOTHING * (gap - self._gap)
+        self._last_received = now
+
+    def interval(self) -> float:
+        """Seconds of silence after which the connection is probed."""
+        if self._gap is None:
+            return HEARTBEAT_MAX_INTERVAL
+        return min(
+            HEARTBEAT_MAX_INTERVAL,
+            max(HEARTBEAT_MIN_INTERVAL, self._gap * HEARTBEAT_MISSED_FRAMES),
+        )
+
+    def due_in(self, now: float | None = None) -> float:
+        """Seconds until the next probe, 0 when it is due."""
+        if self._last_received is None:
+            return self.interval()
+        if now is None:
+            now = time.monotonic()
+        return max(0.0, self._last_received + self.interval() - now)
+
+    def probed(self, rtt: float | None) -> None:
+        """Probe answered after rtt seconds, or not answered when None."""
+        self._probes += 1
+        if rtt is None:
+            self._failures += 1
+        else:
+            self._last_rtt = rtt
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "interval": round(self.interval(), 1),
+            "gap": None if self._gap is None else round(self._gap, 1),
+            "probes": self._probes,
+            "failures": self._failures,
+            "last_rtt": None if self._last_rtt is None else round(self._last_rtt, 3),
+        }
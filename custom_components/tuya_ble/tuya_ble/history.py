@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterator
+
+from .const import HISTORY_DOWNSAMPLE_FACTOR, TuyaBLEDataPointType
+
+# Types recorded, values are averaged when downsampled, states keep the most
+# frequent one
+HISTORY_TYPES = (
+    TuyaBLEDataPointType.DT_BOOL,
+    TuyaBLEDataPointType.DT_VALUE,
+    TuyaBLEDataPointType.DT_ENUM,
+)
+HISTORY_AVERAGED_TYPES = (TuyaBLEDataPointType.DT_VALUE,)
+
+
+class TuyaBLEHistoryRing:
+    """Fixed size ring of (timestamp, value) samples."""
+
+    __slots__ = ("_times", "_values", "_start", "_count")
+
+    def __init__(self, size: int) -> None:
+        self._times = array("d", bytes(8 * size))
+        self._values = array("d", bytes(8 * size))
+        self._start = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[tuple[float, float]]:
+        size = len(self._times)
+        for i in range(self._count):
+            pos = (self._start + i) % size
+            yield (self._times[pos], self._values[pos])
+
+    def append(self, timestamp: float, value: float) -> tuple[float, float] | None:
+        """Add sample, returns the oldest sample when it was pushed out."""
+        size = len(self._times)
+        evicted = None
+        if self._count < size:
+            pos = (self._start + self._count) % size
+            self._count += 1
+        else:
+            pos = self._start
+            evicted = (self._times[pos], self._values[pos])
+            self._start = (self._start + 1) % size
+        self._times[pos] = timestamp
+        self._values[pos] = value
+        return evicted
+
+
+class TuyaBLEDataPointHistory:
+    """Recent samples of one datapoint and averages of the older ones.
+
+    The last depth samples are kept as received. Samples pushed out of them
+    are reduced by groups of factor into another ring of depth entries, so
+    the history covers depth * (factor + 1) samples in fixed memory. Values
+    are reduced to their average, states such as enums and booleans to the
+    most frequent one.
+    """
+
+    __slots__ = (
+        "_recent",
+        "_older",
+        "_factor",
+        "_averaged",
+        "_sum",
+        "_counts",
+        "_count",
+        "_last",
+    )
+
+    def __init__(
+        self,
+        depth: int,
+        factor: int = HISTORY_DOWNSAMPLE_FACTOR,
+        averaged: bool = True,
+    ) -> None:
+        self._recent = TuyaBLEHistoryRing(depth)
+        self._older = TuyaBLEHistoryRing(depth)
+        self._factor = max(factor, 1)
+        self._averaged = averaged
+        self._sum = 0.0
+        # Occurrences of each state in the current group
+        self._counts: dict[float, int] = {}
+        self._count = 0
+        self._last = 0.0
+
+    def __len__(self) -> int:
+        return len(self._older) + len(self._recent)
+
+    def add(self, timestamp: float, value: float) -> None:
+        evicted = self._recent.append(timestamp, value)
+        if evicted is None:
+            return
+        self._last, evicted_value = evicted
+        self._count += 1
+        if self._averaged:
+            self._sum += evicted_value
+        else:
+            self._counts[evicted_value] = self._counts.get(evicted_value, 0) + 1
+        if self._count >= self._factor:
+            self._older.append(self._last, self._reduce(evicted_value))
+            self._sum = 0.0
+            self._counts.clear()
+            self._count = 0
+
+    def _reduce(self, last_value: float) -> float:
+        if self._averaged:
+            return self._sum / self._count
+        most = self._counts[last_value]
+        result = last_value
+        for value, count in self._counts.items():
+            if count > most:
+                most = count
+                result = value
+        return result
+
+    def query(
+        self, since: float | None = None, until: float | None = None
+    ) -> list[tuple[float, float]]:
+        """Samples from oldest to newest, older ones are reduced groups."""
+        result: list[tuple[float, float]] = []
+        for samples in (self._older, self._recent):
+            for timestamp, value in samples:
+                if since is not None and timestamp < since:
+                    continue
+                if until is not None and timestamp > until:
+                    continue
+                result.append((timestamp, value))
+        return result
+
+
+class TuyaBLEHistory:
+    """History of the numeric and state datapoints of one device."""
+
+    __slots__ = ("_depth", "_datapoints")
+
+    def __init__(self, depth: int) -> None:
+        self._depth = depth
+        self._datapoints: dict[int, TuyaBLEDataPointHistory] = {}
+
+    @property
+    def depth(self) -> int:
+        return self._depth
+
+    def __getitem__(self, dp_id: int) -> TuyaBLEDataPointHistory | None:
+        return self._datapoints.get(dp_id)
+
+    def add(
+        self,
+        dp_id: int,
+        timestamp: float,
+        type: TuyaBLEDataPointType,
+        value: bytes | bool | int | str,
+    ) -> None:
+        if type not in HISTORY_TYPES:
+            return
+        history = self._datapoints.get(dp_id)
+        if history is None:
+            history = self._datapoints[dp_id] = TuyaBLEDataPointHistory(
+                self._depth, averaged=type in HISTORY_AVERAGED_TYPES
+            )
+        history.add(timestamp, float(value))
+
+    def as_dict(self) -> dict[int, list[tuple[float, float]]]:
+        return {dp_id: history.query() for dp_id, history in self._datapoints.items()}
@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from dataclasses import dataclass
+import logging
+import time
+from typing import Any
+
+from .tuya_ble import TuyaBLEDataPoint
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class TuyaBLEPendingValue:
+    """Value set by the user and shown before the device confirmed it."""
+
+    datapoint: TuyaBLEDataPoint
+    previous: bytes | bool | int | str
+    value: bytes | bool | int | str
+    # Timestamp of the datapoint when the value was set, a report of the
+    # device changes it
+    timestamp: float
+    started: float
+    timeout_handle: asyncio.TimerHandle | None = None
+    rolled_back: bool = False
+
+    def cancel(self) -> None:
+        if self.timeout_handle is not None:
+            self.timeout_handle.cancel()
+            self.timeout_handle = None
+
+
+@dataclass
+class TuyaBLECommandStats:
+    """Outcome of the values set by the user of a device."""
+
+    confirmed: int = 0
+    rolled_back: int = 0
+    late: int = 0
+    last_latency: float | None = None
+    max_latency: float = 0.0
+    total_latency: float = 0.0
+
+    def add_latency(self, latency: float) -> None:
+        self.confirmed += 1
+        self.last_latency = latency
+        self.max_latency = max(self.max_latency, latency)
+        self.total_latency += latency
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "confirmed": self.confirmed,
+            "rolled_back": self.rolled_back,
+            "late": self.late,
+            "last_latency": self.last_latency,
+            "max_latency": round(self.max_latency, 3),
+            "average_latency": (
+                round(self.total_latency / self.confirmed, 3)
+                if self.confirmed
+                else None
+            ),
+        }
+
+
+class TuyaBLEOptimisticValues:
+    """Values set by the user, shown until the device answers.
+
+    A value is confirmed when the device acknowledges it or reports the
+    datapoint, and rolled back on an error or after the timeout without
+    either. Acknowledged after the timeout, it is shown again unless it was
+    set again or reported meanwhile. on_change is called whenever the shown
+    value of a datapoint changes.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        timeout: float,
+        stats: TuyaBLECommandStats,
+        on_change: Callable[[], None],
+    ) -> None:
+        self._name = name
+        self._timeout = timeout
+        self._stats = stats
+        self._on_change = on_change
+        self._pending: dict[int, TuyaBLEPendingValue] = {}
+
+    def set(
+        self, datapoint: TuyaBLEDataPoint, value: bytes | bool | int | str
+    ) -> TuyaBLEPendingValue:
+        """Show the value the datapoint is set to until it is settled."""
+        dp_id = datapoint.id
+        predicted = datapoint.convert_value(value)
+        # The previous value is the last confirmed one
+        previous = self._pending.pop(dp_id, None)
+        if previous is not None:
+            previous.cancel()
+        pending = TuyaBLEPendingValue(
+            datapoint,
+            previous.previous if previous else datapoint.value,
+            predicted,
+            datapoint.timestamp,
+            time.monotonic(),
+        )
+        self._pending[dp_id] = pending
+        pending.timeout_handle = asyncio.get_running_loop().call_later(
+            self._timeout, self._expired, pending
+        )
+        datapoint.reset_value(predicted)
+        self._on_change()
+        return pending
+
+    def settle(self, pending: TuyaBLEPendingValue, acknowledged: bool | None) -> None:
+        """Outcome of sending the value, None when queued in a batch.
+
+        A batched value is settled by a report of the device or the timeout.
+        """
+        if acknowledged is None:
+            return
+        if acknowledged:
+            self._confirm(pending)
+        else:
+            self._rollback(pending)
+
+    def check(self) -> None:
+        """Confirm the pending values of the datapoints reported by the device."""
+        for pending in list(self._pending.values()):
+            if pending.datapoint.timestamp != pending.timestamp:
+                self._confirm(pending)
+
+    def cancel(self) -> None:
+        for pending in self._pending.values():
+            pending.cancel()
+        self._pending.clear()
+
+    def _confirm(self, pending: TuyaBLEPendingValue) -> None:
+        datapoint = pending.datapoint
+        if pending.rolled_back:
+            # Acknowledged after the timeout, show the value again unless
+            # it was set again or reported meanwhile
+            if (
+                datapoint.id not in self._pending
+                and datapoint.timestamp == pending.timestamp
+            ):
+                self._stats.late += 1
+                datapoint.reset_value(pending.value)
+                self._on_change()
+            return
+        if self._pending.get(datapoint.id) is not pending:
+            return
+        del self._pending[datapoint.id]
+        pending.cancel()
+        self._stats.add_latency(time.monotonic() - pending.started)
+
+    def _rollback(self, pending: TuyaBLEPendingValue) -> None:
+        datapoint = pending.datapoint
+        if self._pending.get(datapoint.id) is not pending:
+            return
+        del self._pending[datapoint.id]
+        pending.cancel()
+        pending.rolled_back = True
+        # A report of the device since is its actual state
+        if datapoint.timestamp != pending.timestamp:
+            return
+        self._stats.rolled_back += 1
+        _LOGGER.debug(
+            "%s: Datapoint %s not confirmed, rolled back to %s",
+            self._name,
+            datapoint.id,
+            pending.previous,
+        )
+        datapoint.reset_value(pending.previous)
+        self._on_change()
+
+    def _expired(self, pending: TuyaBLEPendingValue) -> None:
+        pending.timeout_handle = None
+        self._rollback(pending)
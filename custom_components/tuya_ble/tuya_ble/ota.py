@@ -0,0 +1,265 @@
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass, field
+import hashlib
+import logging
+import os
+from struct import pack, unpack
+import time
+from typing import TYPE_CHECKING
+import zlib
+
+from .const import (
+    OTA_READ_AHEAD,
+    OTA_TYPE_FIRMWARE,
+    OTA_WINDOW_SIZE,
+    RESPONSE_WAIT_TIMEOUT,
+    TuyaBLECode,
+)
+from .exceptions import TuyaBLEOTAError
+from .scheduler import TuyaBLEPriority
+
+if TYPE_CHECKING:
+    from .tuya_ble import TuyaBLEDevice
+
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def parse_firmware_version(version: str) -> int:
+    """Convert "major.minor" firmware version to the OTA representation."""
+    parts = [int(part) for part in version.split(".")]
+    if len(parts) != 2 or not all(0 <= part <= 0xFF for part in parts):
+        raise ValueError(f"Unsupported firmware version: {version}")
+    return (parts[0] << 8) | parts[1]
+
+
+def _crc32_of_file(path: str, length: int | None = None) -> int:
+    """Calculate CRC32 of the file (or its prefix) reading it in blocks."""
+    crc = 0
+    with open(path, "rb") as file:
+        while length is None or length > 0:
+            size = OTA_READ_AHEAD if length is None else min(OTA_READ_AHEAD, length)
+            block = file.read(size)
+            if not block:
+                break
+            crc = zlib.crc32(block, crc)
+            if length is not None:
+                length -= len(block)
+    return crc
+
+
+@dataclass
+class TuyaBLEFirmwareImage:
+    """Firmware file on disk and its checksums."""
+
+    path: str
+    version: int
+    size: int
+    crc32: int
+    md5: bytes
+
+    @classmethod
+    def from_file(cls, path: str, version: str) -> TuyaBLEFirmwareImage:
+        """Describe firmware file, blocking, it must run in an executor."""
+        crc = 0
+        md5 = hashlib.md5()
+        with open(path, "rb") as file:
+            while block := file.read(OTA_READ_AHEAD):
+                crc = zlib.crc32(block, crc)
+                md5.update(block)
+
+        return cls(
+            path,
+            parse_firmware_version(version),
+            os.path.getsize(path),
+            crc,
+            md5.digest(),
+        )
+
+
+@dataclass
+class TuyaBLEOTAProgress:
+    """Progress of the firmware transfer."""
+
+    total: int
+    offset: int = 0
+    resumed_from: int = 0
+    started: float = field(default_factory=time.monotonic)
+
+    @property
+    def percent(self) -> float:
+        if self.total == 0:
+            return 100.0
+        return self.offset * 100.0 / self.total
+
+    @property
+    def throughput(self) -> float:
+        """Bytes per second transferred in this session."""
+        elapsed = time.monotonic() - self.started
+        if elapsed <= 0:
+            return 0.0
+        return (self.offset - self.resumed_from) / elapsed
+
+    @property
+    def eta(self) -> float | None:
+        """Estimated seconds until the transfer is complete."""
+        throughput = self.throughput
+        if throughput <= 0:
+            return None
+        return (self.total - self.offset) / throughput
+
+
+class TuyaBLEOTAUpdater:
+    """Streams firmware image to the device using FUN_SENDER_OTA_* commands."""
+
+    def __init__(
+        self,
+        device: TuyaBLEDevice,
+        image: TuyaBLEFirmwareImage,
+        window: int = OTA_WINDOW_SIZE,
+        progress_callback: Callable[[TuyaBLEOTAProgress], None] | None = None,
+    ) -> None:
+        self._device = device
+        self._image = image
+        self._window = max(window, 1)
+        self._progress_callback = progress_callback
+        self._progress = TuyaBLEOTAProgress(image.size)
+
+    @property
+    def progress(self) -> TuyaBLEOTAProgress:
+        return self._progress
+
+    async def _request(self, code: TuyaBLECode, data: bytes) -> bytes:
+        future = await self._device._send_request_locked(code, data)
+        return await self._wait(future)
+
+    async def _wait(self, future: asyncio.Future[bytes]) -> bytes:
+        try:
+            return await asyncio.wait_for(future, RESPONSE_WAIT_TIMEOUT)
+        except asyncio.TimeoutError as ex:
+            raise TuyaBLEOTAError("timeout waiting for response") from ex
+
+    async def _start(self) -> int:
+        """Request OTA mode, returns maximal length of the data package."""
+        data = await self._request(
+            TuyaBLECode.FUN_SENDER_OTA_START, pack(">B", OTA_TYPE_FIRMWARE)
+        )
+        _, ota_version, _, version, max_length = unpack(">BBBIH", data[:9])
+        _LOGGER.debug(
+            "%s: OTA started, protocol %s, firmware %x, package length %s",
+            self._device.address,
+            ota_version,
+            version,
+            max_length,
+        )
+        return max_length
+
+    async def _send_file_info(self) -> int:
+        """Describe the image, returns length of the image already on device."""
+        image = self._image
+        product_id = self._device.product_id.encode()[:8].ljust(8, b"\x00")
+        data = await self._request(
+            TuyaBLECode.FUN_SENDER_OTA_FILE,
+            pack(">B", OTA_TYPE_FIRMWARE)
+            + product_id
+            + pack(">I", image.version)
+            + image.md5
+            + pack(">II", image.size, image.crc32),
+        )
+        old_length, old_crc32 = unpack(">II", data[2:10])
+        if 0 < old_length < image.size:
+            loop = asyncio.get_running_loop()
+            crc = await loop.run_in_executor(
+                None, _crc32_of_file, image.path, old_length
+            )
+            if crc == old_crc32:
+                return old_length
+        return 0
+
+    async def _negotiate_offset(self, offset: int) -> int:
+        """Ask for resume offset, the device reports the one it accepts."""
+        data = await self._request(
+            TuyaBLECode.FUN_SENDER_OTA_OFFSET, pack(">BI", OTA_TYPE_FIRMWARE, offset)
+        )
+        (offset,) = unpack(">I", data[1:5])
+        if offset > self._image.size:
+            raise TuyaBLEOTAError(f"device requested invalid offset {offset}")
+        return offset
+
+    def _advance(self, length: int) -> None:
+        self._progress.offset += length
+        if self._progress_callback:
+            self._progress_callback(self._progress)
+
+    async def _send_image(self, offset: int, package_length: int) -> None:
+        """Send the image using a window of outstanding packages."""
+        loop = asyncio.get_running_loop()
+        pending: deque[tuple[int, asyncio.Future[bytes]]] = deque()
+        package_id = 0
+        file = await loop.run_in_executor(None, open, self._image.path, "rb")
+        try:
+            await loop.run_in_executor(None, file.seek, offset)
+            read_ahead = max(OTA_READ_AHEAD // package_length, 1) * package_length
+            while offset < self._image.size:
+                block = await loop.run_in_executor(None, file.read, read_ahead)
+                if not block:
+                    raise TuyaBLEOTAError("image is shorter than expected")
+                for pos in range(0, len(block), package_length):
+                    chunk = block[pos : pos + package_length]
+                    future = await self._device._send_request_locked(
+                        TuyaBLECode.FUN_SENDER_OTA_UPGRADE,
+                        pack(
+                            ">BHHH",
+                            OTA_TYPE_FIRMWARE,
+                            package_id,
+                            len(chunk),
+                            self._device._calc_crc16(chunk),
+                        )
+                        + chunk,
+                    )
+                    pending.append((len(chunk), future))
+                    package_id = (package_id + 1) & 0xFFFF
+                    offset += len(chunk)
+                    if len(pending) >= self._window:
+                        length, future = pending.popleft()
+                        await self._wait(future)
+                        self._advance(length)
+            while pending:
+                length, future = pending.popleft()
+                await self._wait(future)
+                self._advance(length)
+        finally:
+            for _, future in pending:
+                future.cancel()
+            await loop.run_in_executor(None, file.close)
+
+    async def run(self) -> None:
+        """Run the whole update, holding other commands off the link."""
+        device = self._device
+        await device._ensure_connected()
+        async with device._scheduler.slot(TuyaBLEPriority.BACKGROUND):
+            package_length = await self._start()
+            if package_length == 0:
+                raise TuyaBLEOTAError("device reported zero package length")
+            offset = await self._negotiate_offset(await self._send_file_info())
+            self._progress = TuyaBLEOTAProgress(self._image.size, offset, offset)
+            _LOGGER.debug(
+                "%s: OTA sending %s bytes from offset %s",
+                device.address,
+                self._image.size,
+                offset,
+            )
+            await self._send_image(offset, package_length)
+            await self._request(
+                TuyaBLECode.FUN_SENDER_OTA_OVER, pack(">B", OTA_TYPE_FIRMWARE)
+            )
+        _LOGGER.info(
+            "%s: OTA finished, %s bytes at %.0f B/s",
+            device.address,
+            self._image.size,
+            self._progress.throughput,
+        )
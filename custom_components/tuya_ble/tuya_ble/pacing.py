@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from typing import Any
+
+from .const import PACING_GAP_STEP, PACING_MAX_BATCH, PACING_MAX_GAP
+
+
+class TuyaBLEPacing:
+    """Pacing of the fragments of the frames written to one device.
+
+    Fragments are written without response, some devices and proxies drop
+    them when flooded and the device then ignores the whole frame. A frame
+    of several fragments that gets no answer counts as lost: the number of
+    fragments written back to back is halved and the pause between the
+    batches doubled. Each answered frame adds one fragment to the batch,
+    once the batch is full the pause shrinks by one step. While pausing,
+    the last fragment of a frame is written with response when the device
+    supports it, so the next frame waits until it was received.
+    """
+
+    __slots__ = ("_batch", "_gap", "_frames", "_fragments", "_delivered", "_lost")
+
+    def __init__(self) -> None:
+        self._batch = PACING_MAX_BATCH
+        self._gap = 0.0
+        self._frames = 0
+        self._fragments = 0
+        self._delivered = 0
+        self._lost = 0
+
+    @property
+    def batch(self) -> int:
+        """Fragments written back to back."""
+        return self._batch
+
+    @property
+    def gap(self) -> float:
+        """Seconds of pause after each batch, 0 writes all at once."""
+        return self._gap
+
+    @property
+    def write_with_response(self) -> bool:
+        return self._gap > 0
+
+    def sent(self, fragments: int) -> None:
+        self._frames += 1
+        self._fragments += fragments
+
+    def delivered(self) -> None:
+        """A frame of several fragments was answered."""
+        self._delivered += 1
+        if self._batch < PACING_MAX_BATCH:
+            self._batch += 1
+        elif self._gap > 0:
+            self._gap = max(0.0, self._gap - PACING_GAP_STEP)
+            if self._gap < PACING_GAP_STEP / 2:
+                self._gap = 0.0
+
+    def lost(self) -> None:
+        """A frame of several fragments was not answered."""
+        self._lost += 1
+        self._batch = max(1, self._batch // 2)
+        self._gap = min(PACING_MAX_GAP, max(PACING_GAP_STEP, self._gap * 2))
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "batch": self._batch,
+            "gap": round(self._gap, 3),
+            "write_with_response": self.write_with_response,
+            "frames": self._frames,
+            "fragments": self._fragments,
+            "delivered": self._delivered,
+            "lost": self._lost,
+        }
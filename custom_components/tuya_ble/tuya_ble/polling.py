@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+
+class TuyaBLEPollStagger:
+    """Spaces status polls of all devices apart."""
+
+    __slots__ = ("_spacing", "_next")
+
+    def __init__(self, spacing: float) -> None:
+        self._spacing = spacing
+        self._next = 0.0
+
+    def reserve(self, when: float) -> float:
+        """Return the first free poll time not earlier than when."""
+        when = max(when, self._next)
+        self._next = when + self._spacing
+        return when
+
+
+class TuyaBLEPollInterval:
+    """Adaptive interval of the status polls of one device.
+
+    The interval doubles while the device pushes data on its own, halves
+    back while it only reports when asked, and resets to the minimum after
+    user commands. Data received within the response window of a poll is
+    its result, not pushed data.
+    """
+
+    __slots__ = (
+        "_min_interval",
+        "_max_interval",
+        "_response_window",
+        "_interval",
+        "_unsolicited",
+        "_solicited_until",
+        "_after_command",
+    )
+
+    def __init__(
+        self, min_interval: float, max_interval: float, response_window: float
+    ) -> None:
+        self._min_interval = min_interval
+        self._max_interval = max_interval
+        self._response_window = response_window
+        self._interval = min_interval
+        self._unsolicited = 0
+        self._solicited_until = 0.0
+        self._after_command = False
+
+    @property
+    def interval(self) -> float:
+        return self._interval
+
+    @property
+    def min_interval(self) -> float:
+        return self._min_interval
+
+    def on_data(self, now: float) -> None:
+        """Data frame received from the device."""
+        if now >= self._solicited_until:
+            self._unsolicited += 1
+
+    def on_command(self) -> None:
+        """User command sent, the next poll checks its result."""
+        self._interval = self._min_interval
+        self._unsolicited = 0
+        self._after_command = True
+
+    def on_poll(self, now: float) -> None:
+        """Status requested, its answer is expected within the window."""
+        self._solicited_until = now + self._response_window
+
+    def back_off(self) -> bool:
+        """Skip the due poll when the device reported on its own since the last.
+
+        The interval doubles then, unless the reports followed a command.
+        """
+        if self._unsolicited == 0:
+            return False
+        self._unsolicited = 0
+        if not self._after_command:
+            self._interval = min(self._interval * 2, self._max_interval)
+        self._after_command = False
+        return True
+
+    def tighten(self) -> None:
+        """The due poll is sent, the device only reports when asked."""
+        self._after_command = False
+        self._interval = max(self._interval / 2, self._min_interval)
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import time
+from typing import Any
+
+from .const import (
+    PRESENCE_INTERVAL_SMOOTHING,
+    PRESENCE_MIN_TIMEOUT,
+    PRESENCE_MISSED_ADVERTISEMENTS,
+    PRESENCE_RSSI_SMOOTHING,
+)
+
+
+class TuyaBLEPresence:
+    """Presence of a device estimated from its advertisements.
+
+    Keeps exponentially smoothed RSSI and interval between advertisements.
+    Traffic over an established connection counts as presence too, devices
+    usually do not advertise while connected. Background connects, such as
+    reconnects, polls and first connections, wait while the device is away.
+    Commands of the user connect anyway.
+    """
+
+    __slots__ = ("_rssi", "_interval", "_last_seen")
+
+    def __init__(self) -> None:
+        self._rssi: float | None = None
+        self._interval: float | None = None
+        self._last_seen: float | None = None
+
+    @property
+    def rssi(self) -> int | None:
+        """Smoothed RSSI of the advertisements."""
+        if self._rssi is None:
+            return None
+        return round(self._rssi)
+
+    @property
+    def interval(self) -> float | None:
+        """Smoothed seconds between advertisements."""
+        return self._interval
+
+    @property
+    def last_seen(self) -> float | None:
+        """Monotonic time of the last advertisement or received frame."""
+        return self._last_seen
+
+    def seen(self, now: float | None = None) -> None:
+        """Device was heard over the connection."""
+        self._last_seen = time.monotonic() if now is None else now
+
+    def advertised(self, rssi: int | None, now: float | None = None) -> None:
+        """Device advertised with the given RSSI."""
+        if now is None:
+            now = time.monotonic()
+        if self._last_seen is not None:
+            interval = now - self._last_seen
+            if self._interval is None:
+                self._interval = interval
+            else:
+                self._interval += PRESENCE_INTERVAL_SMOOTHING * (
+                    interval - self._interval
+                )
+        self._last_seen = now
+        self._add_rssi(rssi)
+
+    def refresh(
+        self, rssi: int | None, last_seen: float, interval: float | None
+    ) -> None:
+        """Last advertisement and interval known to the scanner.
+
+        Scanners usually do not report advertisements that did not change,
+        their own records keep the time and RSSI of the last one.
+        """
+        if interval is not None:
+            self._interval = interval
+        if self._last_seen is not None and last_seen <= self._last_seen:
+            return
+        self._last_seen = last_seen
+        self._add_rssi(rssi)
+
+    def _add_rssi(self, rssi: int | None) -> None:
+        if rssi is not None:
+            if self._rssi is None:
+                self._rssi = float(rssi)
+            else:
+                self._rssi += PRESENCE_RSSI_SMOOTHING * (rssi - self._rssi)
+
+    def timeout(self) -> float:
+        """Seconds of silence after which the device is treated as away."""
+        if self._interval is None:
+            return PRESENCE_MIN_TIMEOUT
+        return max(
+            PRESENCE_MIN_TIMEOUT, self._interval * PRESENCE_MISSED_ADVERTISEMENTS
+        )
+
+    def is_present(self, now: float | None = None) -> bool:
+        """Device was heard recently, or it was not heard at all yet."""
+        if self._last_seen is None:
+            return True
+        if now is None:
+            now = time.monotonic()
+        return now - self._last_seen <= self.timeout()
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "present": self.is_present(),
+            "rssi": self.rssi,
+            "interval": None if self._interval is None else round(self._interval, 1),
+            "silent_for": (
+                None
+                if self._last_seen is None
+                else round(time.monotonic() - self._last_seen, 1)
+            ),
+        }
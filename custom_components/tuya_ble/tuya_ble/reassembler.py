@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import logging
+
+from .const import INPUT_MAX_LENGTH
+from .exceptions import TuyaBLEDataFormatError
+
+_LOGGER = logging.getLogger(__name__)
+
+
+DROP_FORMAT = "format"
+DROP_TOO_LONG = "too_long"
+DROP_UNEXPECTED = "unexpected"
+DROP_MISSING = "missing"
+DROP_RESTARTED = "restarted"
+DROP_OVERFLOW = "overflow"
+
+DROP_REASONS = (
+    DROP_FORMAT,
+    DROP_TOO_LONG,
+    DROP_UNEXPECTED,
+    DROP_MISSING,
+    DROP_RESTARTED,
+    DROP_OVERFLOW,
+)
+
+
+def unpack_int(data: bytes, start_pos: int) -> tuple[int, int]:
+    """Decode variable length integer, returns the value and the next position."""
+    result: int = 0
+    offset: int = 0
+    while offset < 5:
+        pos: int = start_pos + offset
+        if pos >= len(data):
+            raise TuyaBLEDataFormatError()
+        curr_byte: int = data[pos]
+        result |= (curr_byte & 0x7F) << (offset * 7)
+        offset += 1
+        if (curr_byte & 0x80) == 0:
+            break
+    if offset > 4:
+        raise TuyaBLEDataFormatError()
+    else:
+        return (result, start_pos + offset)
+
+
+class TuyaBLEReassembler:
+    """Joins notification fragments into complete messages.
+
+    The first fragment declares the message length, the buffer is allocated
+    once for it and fragments are copied in place. Declared lengths above
+    max_length are refused. A repeated copy of the last accepted fragment of
+    the message in progress is ignored, any other gap or overrun drops the
+    message and is counted by reason. Once a message is complete an identical
+    frame is accepted again, the device retransmits it when an ack was lost.
+    """
+
+    def __init__(self, name: str = "", max_length: int = INPUT_MAX_LENGTH) -> None:
+        self._name = name
+        self._max_length = max_length
+        self._buffer: bytearray | None = None
+        self._length = 0
+        self._expected_num = 0
+        self._last_fragment: bytes | None = None
+        self._messages = 0
+        self._duplicates = 0
+        self._drops = dict.fromkeys(DROP_REASONS, 0)
+
+    @property
+    def stats(self) -> dict[str, int]:
+        return {
+            "messages": self._messages,
+            "duplicates": self._duplicates,
+            **self._drops,
+        }
+
+    def reset(self) -> None:
+        """Forget the message in progress."""
+        self._buffer = None
+        self._length = 0
+        self._expected_num = 0
+        self._last_fragment = None
+
+    def _drop(self, reason: str, packet_num: int | None = None) -> None:
+        self._drops[reason] += 1
+        _LOGGER.debug(
+            "%s: Dropping notification (%s), packet %s, expected %s",
+            self._name,
+            reason,
+            packet_num,
+            self._expected_num,
+        )
+        self.reset()
+
+    def feed(self, fragment: bytes) -> bytearray | None:
+        """Add fragment, returns the message once it is complete."""
+        if self._buffer is not None and fragment == self._last_fragment:
+            self._duplicates += 1
+            return None
+
+        try:
+            packet_num, pos = unpack_int(fragment, 0)
+            if packet_num == 0:
+                length, pos = unpack_int(fragment, pos)
+                # Skip the protocol version byte
+                pos += 1
+        except TuyaBLEDataFormatError:
+            self._drop(DROP_FORMAT)
+            return None
+        if pos > len(fragment):
+            # First fragment shorter than its own header
+            self._drop(DROP_FORMAT, packet_num)
+            return None
+
+        if packet_num == 0:
+            if self._buffer is not None:
+                self._drop(DROP_RESTARTED, packet_num)
+            if length == 0 or length > self._max_length:
+                self._drop(DROP_TOO_LONG, packet_num)
+                return None
+            self._buffer = bytearray(length)
+            self._length = 0
+        elif self._buffer is None:
+            self._drop(DROP_UNEXPECTED, packet_num)
+            return None
+        elif packet_num != self._expected_num:
+            self._drop(DROP_MISSING, packet_num)
+            return None
+
+        end = self._length + len(fragment) - pos
+        if end > len(self._buffer):
+            self._drop(DROP_OVERFLOW, packet_num)
+            return None
+        self._buffer[self._length : end] = memoryview(fragment)[pos:]
+        self._length = end
+        self._expected_num = packet_num + 1
+        self._last_fragment = bytes(fragment)
+
+        if self._length < len(self._buffer):
+            return None
+
+        message = self._buffer
+        self._buffer = None
+        self._length = 0
+        self._expected_num = 0
+        self._last_fragment = None
+        self._messages += 1
+        return message
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from bleak.backends.device import BLEDevice
+
+from .const import (
+    ROUTE_DURATION_SMOOTHING,
+    ROUTE_FAILURE_PENALTY,
+    ROUTE_PREFERRED_BONUS,
+)
+
+NO_RSSI = -127
+
+
+@dataclass
+class TuyaBLERoute:
+    """A scanner or proxy that can connect to the device."""
+
+    source: str
+    ble_device: BLEDevice
+    rssi: int | None = None
+    free_slots: int | None = None
+
+
+@dataclass
+class TuyaBLERouteStats:
+    """Results of connections over one route."""
+
+    successes: int = 0
+    failures: int = 0
+    duration: float | None = None
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "successes": self.successes,
+            "failures": self.failures,
+            "duration": round(self.duration, 2) if self.duration is not None else None,
+        }
+
+
+TuyaBLERouteProvider = Callable[[], list[TuyaBLERoute]]
+# Source of the route a connected client went through, None when unknown
+TuyaBLERouteResolver = Callable[[Any], str | None]
+
+
+class TuyaBLERouter:
+    """Chooses the route of each connection attempt.
+
+    Routes are ranked by RSSI. The route with the fastest successful
+    connect and pair gets a bonus, consecutive failures a penalty, and
+    routes without free connection slots go last. A route that failed during
+    the current connection goes after all the others, so the next attempt
+    fails over to another one.
+
+    Under Home Assistant the BleakClient is replaced by a wrapper that picks
+    the scanner or proxy of each connection itself, the ranking does not
+    change which one is used there. Results are then credited only to the
+    route a resolver finds in the connected client, failed connects are not
+    credited as the route they went through is unknown.
+    """
+
+    def __init__(self) -> None:
+        self._stats: dict[str, TuyaBLERouteStats] = {}
+        self._failed: set[str] = set()
+        self._preferred: str | None = None
+
+    @property
+    def preferred(self) -> str | None:
+        return self._preferred
+
+    @property
+    def stats(self) -> dict[str, TuyaBLERouteStats]:
+        return self._stats
+
+    def begin(self) -> None:
+        """New connection, routes failed by the previous one are tried again."""
+        self._failed.clear()
+
+    def _score(self, route: TuyaBLERoute) -> float:
+        score = float(route.rssi if route.rssi is not None else NO_RSSI)
+        if route.source == self._preferred:
+            score += ROUTE_PREFERRED_BONUS
+        if stats := self._stats.get(route.source):
+            score -= stats.failures * ROUTE_FAILURE_PENALTY
+        return score
+
+    def rank(self, routes: list[TuyaBLERoute]) -> list[TuyaBLERoute]:
+        return sorted(
+            routes,
+            key=lambda route: (
+                route.source in self._failed,
+                route.free_slots == 0,
+                -self._score(route),
+            ),
+        )
+
+    def succeeded(self, source: str, duration: float) -> None:
+        stats = self._stats.setdefault(source, TuyaBLERouteStats())
+        stats.successes += 1
+        stats.failures = 0
+        if stats.duration is None:
+            stats.duration = duration
+        else:
+            stats.duration += ROUTE_DURATION_SMOOTHING * (duration - stats.duration)
+
+        preferred = self._stats.get(self._preferred) if self._preferred else None
+        if (
+            preferred is None
+            or preferred.duration is None
+            or stats.duration <= preferred.duration
+        ):
+            self._preferred = source
+
+    def failed(self, source: str) -> None:
+        stats = self._stats.setdefault(source, TuyaBLERouteStats())
+        stats.failures += 1
+        self._failed.add(source)
+        if source == self._preferred:
+            self._preferred = None
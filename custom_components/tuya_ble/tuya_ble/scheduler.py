@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from enum import IntEnum
+import heapq
+import itertools
+import time
+
+from .const import POLL_DEADLINE, RESPONSE_DEADLINE
+from .exceptions import TuyaBLEDeadlineError
+
+
+class TuyaBLEPriority(IntEnum):
+    """Priority classes of the outgoing traffic, lower is served first."""
+
+    INTERACTIVE = 0
+    RESPONSE = 1
+    POLL = 2
+    BACKGROUND = 3
+
+
+SCHEDULER_DEADLINES: dict[TuyaBLEPriority, float] = {
+    TuyaBLEPriority.RESPONSE: RESPONSE_DEADLINE,
+    TuyaBLEPriority.POLL: POLL_DEADLINE,
+}
+
+
+@dataclass
+class TuyaBLEQueueStats:
+    """Time spent waiting for the link by one priority class."""
+
+    count: int = 0
+    dropped: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+
+    @property
+    def average_wait(self) -> float:
+        if self.count == 0:
+            return 0.0
+        return self.total_wait / self.count
+
+    def as_dict(self) -> dict[str, float]:
+        return {
+            "count": self.count,
+            "dropped": self.dropped,
+            "average_wait": round(self.average_wait, 3),
+            "max_wait": round(self.max_wait, 3),
+        }
+
+
+class TuyaBLEScheduler:
+    """Priority lock guarding the link of one device.
+
+    Waiters are served by priority class and then in arrival order. A waiter
+    with a deadline is dropped with TuyaBLEDeadlineError when the deadline
+    passes before it gets the link.
+    """
+
+    def __init__(self) -> None:
+        self._locked = False
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._counter = itertools.count()
+        self._stats = {priority: TuyaBLEQueueStats() for priority in TuyaBLEPriority}
+
+    def locked(self) -> bool:
+        return self._locked
+
+    @property
+    def stats(self) -> dict[TuyaBLEPriority, TuyaBLEQueueStats]:
+        return self._stats
+
+    def _record(self, priority: TuyaBLEPriority, started: float) -> None:
+        wait = time.monotonic() - started
+        stats = self._stats[priority]
+        stats.count += 1
+        stats.total_wait += wait
+        stats.max_wait = max(stats.max_wait, wait)
+
+    @staticmethod
+    def _expire(future: asyncio.Future[None]) -> None:
+        if not future.done():
+            future.set_exception(TuyaBLEDeadlineError())
+
+    async def acquire(
+        self, priority: TuyaBLEPriority, timeout: float | None = None
+    ) -> None:
+        started = time.monotonic()
+        if not self._locked and not self._waiters:
+            self._locked = True
+            self._record(priority, started)
+            return
+
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[None] = loop.create_future()
+        heapq.heappush(self._waiters, (priority, next(self._counter), future))
+        handle = None
+        if timeout is not None:
+            handle = loop.call_later(timeout, self._expire, future)
+        try:
+            await future
+        except TuyaBLEDeadlineError:
+            self._stats[priority].dropped += 1
+            raise
+        except BaseException:
+            if future.done() and not future.cancelled() and not future.exception():
+                # The link was handed over but the waiter was cancelled
+                self.release()
+            raise
+        finally:
+            if handle is not None:
+                handle.cancel()
+        self._record(priority, started)
+
+    def release(self) -> None:
+        while self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                # Ownership is handed over directly, the lock stays locked
+                future.set_result(None)
+                return
+        self._locked = False
+
+    @asynccontextmanager
+    async def slot(
+        self, priority: TuyaBLEPriority, timeout: float | None = None
+    ) -> AsyncIterator[None]:
+        """Hold the link for the duration of the context."""
+        await self.acquire(priority, timeout)
+        try:
+            yield
+        finally:
+            self.release()
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from collections import deque
+
+from .const import DP_SEQ_WINDOW_SIZE
+
+
+class TuyaBLESequenceWindow:
+    """Recently received sequence numbers of signed datapoint reports.
+
+    The device sends a report again when our acknowledgement was lost, the
+    copy carries the same sequence number and only needs to be acknowledged.
+    """
+
+    __slots__ = ("_order", "_seen", "_reports", "_duplicates")
+
+    def __init__(self, size: int = DP_SEQ_WINDOW_SIZE) -> None:
+        self._order: deque[int] = deque(maxlen=size)
+        self._seen: set[int] = set()
+        self._reports = 0
+        self._duplicates = 0
+
+    @property
+    def stats(self) -> dict[str, int]:
+        return {
+            "dp_reports": self._reports,
+            "dp_duplicates": self._duplicates,
+        }
+
+    def reset(self) -> None:
+        """Forget the numbers, devices may restart them on a new connection."""
+        self._order.clear()
+        self._seen.clear()
+
+    def is_repeated(self, seq_num: int) -> bool:
+        """Whether a report with this number was received recently."""
+        if seq_num in self._seen:
+            self._duplicates += 1
+            return True
+        return False
+
+    def add(self, seq_num: int) -> None:
+        """Remember the number of a report that was parsed."""
+        if seq_num in self._seen:
+            return
+        self._reports += 1
+        if len(self._order) == self._order.maxlen:
+            self._seen.discard(self._order[0])
+        self._order.append(seq_num)
+        self._seen.add(seq_num)
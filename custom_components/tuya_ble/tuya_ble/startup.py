@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+
+from .routing import NO_RSSI
+
+
+def startup_sort_key(
+    priority: int, last_heard: float | None, rssi: int | None
+) -> tuple[int, float, int]:
+    """Order of first connections, lowest first.
+
+    By category priority, then most recently heard and strongest first.
+    Devices not heard yet go after the others of their priority.
+    """
+    if last_heard is None:
+        return (priority, 0.0, NO_RSSI)
+    return (priority, -last_heard, -(rssi or NO_RSSI))
+
+
+class TuyaBLEStartupSlots:
+    """Limits the first connections in flight.
+
+    A connection gives its slot up after the timeout, an unreachable device
+    keeps retrying in background without holding the others off.
+    """
+
+    def __init__(self, concurrency: int, timeout: float) -> None:
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._timeout = timeout
+
+    async def run(self, start: Callable[[], asyncio.Task[None]]) -> bool:
+        """Start the connection when a slot is free, True if done in time."""
+        async with self._semaphore:
+            done, _ = await asyncio.wait({start()}, timeout=self._timeout)
+            return bool(done)
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+
+class TuyaBLEStateThrottle:
+    """Decides when a changed sensor value is written.
+
+    Changes within max(deadband, deadband_relative * |value|) of the last
+    written value are not written, significant ones at most every
+    min_interval seconds, the latest one once the interval passed. After
+    max_silence seconds the value is written even without a significant
+    change. A change of availability is always written at once.
+    """
+
+    __slots__ = (
+        "_deadband",
+        "_deadband_relative",
+        "_min_interval",
+        "_max_silence",
+        "_value",
+        "_available",
+        "_written_at",
+        "_due",
+    )
+
+    def __init__(
+        self,
+        deadband: float = 0.0,
+        deadband_relative: float = 0.0,
+        min_interval: float | None = None,
+        max_silence: float | None = None,
+    ) -> None:
+        self._deadband = deadband
+        self._deadband_relative = deadband_relative
+        self._min_interval = min_interval
+        self._max_silence = max_silence
+        self._value: object = None
+        self._available: bool | None = None
+        self._written_at: float | None = None
+        self._due: float | None = None
+
+    def written(self, value: object, available: bool, now: float) -> None:
+        """The state was written."""
+        self._value = value
+        self._available = available
+        self._written_at = now
+        self._due = None
+
+    def is_significant(self, value: object) -> bool:
+        """Value changed by more than the deadband since the last write."""
+        written = self._value
+        if not isinstance(value, (int, float)) or not isinstance(written, (int, float)):
+            return value != written
+        deadband = max(self._deadband, self._deadband_relative * abs(written))
+        return abs(value - written) > deadband
+
+    def check(self, value: object, available: bool, now: float) -> float | None:
+        """Seconds until the state is to be written, zero to write at once.
+
+        None when it is not to be written, or a write is due earlier already.
+        """
+        if self._written_at is None or available != self._available:
+            return 0.0
+        elapsed = now - self._written_at
+        if self._max_silence is not None and elapsed >= self._max_silence:
+            return 0.0
+        if self.is_significant(value):
+            if self._min_interval is None or elapsed >= self._min_interval:
+                return 0.0
+            # The latest value is written when the interval passed
+            delay = self._min_interval - elapsed
+        elif self._max_silence is not None:
+            delay = self._max_silence - elapsed
+        else:
+            return None
+        if self._due is not None and self._due <= now + delay:
+            return None
+        self._due = now + delay
+        return delay
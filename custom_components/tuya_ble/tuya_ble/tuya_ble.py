@@ -1,12 +1,14 @@
 from __future__ import annotations
 
+from array import array
 import asyncio
 from datetime import datetime, timezone
 import hashlib
 import logging
 import secrets
 import time
-from collections.abc import Callable, Hashable
+from collections import deque
+from collections.abc import Awaitable, Callable, Hashable, Iterator
 from struct import pack, unpack
 from dataclasses import dataclass
 from typing import Any
@@ -24,37 +26,62 @@ from bleak_retry_connector import (
     BleakNotFoundError,
     establish_connection,
 )
-from Crypto.Cipher import AES
-
-from homeassistant.components.tuya.const import (
-    DPCode,
-    DPType,
-)
 
 from .const import (
     CHARACTERISTIC_NOTIFY,
     CHARACTERISTIC_WRITE,
     GATT_MTU,
     MANUFACTURER_DATA_ID,
+    BULK_DATA_LENGTH,
+    DATAPOINT_BURST_DELAY,
+    DATAPOINT_MAX_CLOCK_LAG,
+    DATAPOINT_HISTORICAL_AGE,
+    DATAPOINT_MAX_CLOCK_SKEW,
+    DATAPOINT_MIN_TIMESTAMP,
+    HEARTBEAT_TIMEOUT,
+    PRESENCE_RECHECK_INTERVAL,
+    RESPONSE_QUEUE_SIZE,
     RESPONSE_WAIT_TIMEOUT,
+    SECURITY_FLAG_AUTH,
+    SECURITY_FLAG_LOGIN,
+    SECURITY_FLAG_SESSION,
     SERVICE_UUID_TEMP,
+    DPType,
     TuyaBLECode,
     TuyaBLEDataPointType,
 )
 
-from ..const import (
-    DPType,
-)
-
 from .exceptions import (
     TuyaBLEError,
     TuyaBLEDataCRCError,
+    TuyaBLEDeadlineError,
     TuyaBLEDataFormatError,
     TuyaBLEDataLengthError,
     TuyaBLEDeviceError,
     TuyaBLEEnumValueError,
 )
 from .manager import AbstaractTuyaBLEDeviceManager, TuyaBLEDeviceCredentials
+from .connection import TuyaBLEConnection, TuyaBLEConnectionState
+from .crypto import TuyaBLECipher, TuyaBLECryptoContext, decrypt_advertisement_uuid
+from .heartbeat import TuyaBLEHeartbeat
+from .history import TuyaBLEHistory
+from .ota import TuyaBLEFirmwareImage, TuyaBLEOTAProgress, TuyaBLEOTAUpdater
+from .pacing import TuyaBLEPacing
+from .presence import TuyaBLEPresence
+from .routing import (
+    TuyaBLERoute,
+    TuyaBLERouteProvider,
+    TuyaBLERouter,
+    TuyaBLERouteResolver,
+)
+from .reassembler import TuyaBLEReassembler
+from .sequence import TuyaBLESequenceWindow
+from .scheduler import (
+    SCHEDULER_DEADLINES,
+    TuyaBLEPriority,
+    TuyaBLEQueueStats,
+    TuyaBLEScheduler,
+)
 
 
 _LOGGER = logging.getLogger(__name__)
@@ -77,132 +104,200 @@ class TuyaBLEEntityDescription:
 
 
 class TuyaBLEDataPoint:
-    def __init__(
-        self,
-        owner: TuyaBLEDataPoints,
-        id: int,
-        timestamp: float,
-        flags: int,
-        type: TuyaBLEDataPointType,
-        value: bytes | bool | int | str,
-    ) -> None:
-        self._owner = owner
-        self._id = id
-        self._value = value
-        self._changed_by_device = False
-        self._update_from_device(timestamp, flags, type, value)
+    """View of one datapoint in the table of its device.
+
+    Views are created on access and hold no state of their own, reading
+    and setting goes to the table, so a view stays current.
+    """
+
+    __slots__ = ("_table", "_row")
+
+    def __init__(self, table: TuyaBLEDataPoints, row: int) -> None:
+        self._table = table
+        self._row = row
 
     def __repr__(self) -> str:
         return f"<TuyaBLEDataPoint id={self.id} timestamp={self.timestamp} type={self.type} flags={self.flags} value={self.value}>"
 
-    def _update_from_device(
-        self,
-        timestamp: float,
-        flags: int,
-        type: TuyaBLEDataPointType,
-        value: bytes | bool | int | str,
-    ) -> None:
-        self._timestamp = timestamp
-        self._flags = flags
-        self._type = type
-        self._changed_by_device = self._value != value
-        self._value = value
-
     def _get_value(self) -> bytes:
-        match self._type:
+        value = self.value
+        match self.type:
             case TuyaBLEDataPointType.DT_RAW | TuyaBLEDataPointType.DT_BITMAP:
-                return self._value
+                return value
             case TuyaBLEDataPointType.DT_BOOL:
-                return pack(">B", 1 if self._value else 0)
+                return pack(">B", 1 if value else 0)
             case TuyaBLEDataPointType.DT_VALUE:
-                return pack(">i", self._value)
+                return pack(">i", value)
             case TuyaBLEDataPointType.DT_ENUM:
-                if self._value > 0xFFFF:
-                    return pack(">I", self._value)
-                if self._value > 0xFF:
-                    return pack(">H", self._value)
+                if value > 0xFFFF:
+                    return pack(">I", value)
+                if value > 0xFF:
+                    return pack(">H", value)
 
-                return pack(">B", self._value)
+                return pack(">B", value)
             case TuyaBLEDataPointType.DT_STRING:
-                return self._value.encode()
+                return value.encode()
 
     @property
     def id(self) -> int:
-        return self._id
+        return self._table._ids[self._row]
 
     @property
     def timestamp(self) -> float:
-        return self._timestamp
+        return self._table._timestamps[self._row]
 
     @property
     def flags(self) -> int:
-        return self._flags
+        return self._table._flags[self._row]
 
     @property
     def type(self) -> TuyaBLEDataPointType:
-        return self._type
+        return TuyaBLEDataPointType(self._table._types[self._row])
 
     @property
     def value(self) -> bytes | bool | int | str:
-        return self._value
+        return self._table._values[self._row]
 
     @property
     def changed_by_device(self) -> bool:
-        return self._changed_by_device
+        return bool(self._table._changed[self._row])
 
     def __str__(self):
         return f"{self}"
 
-    async def set_value(self, value: bytes | bool | int | str) -> None:
-        match self._type:
+    def convert_value(
+        self, value: bytes | bool | int | str
+    ) -> bytes | bool | int | str:
+        """Value as set_value stores it for the type of the datapoint."""
+        match self.type:
             case TuyaBLEDataPointType.DT_RAW | TuyaBLEDataPointType.DT_BITMAP:
-                self._value = bytes(value)
+                return bytes(value)
             case TuyaBLEDataPointType.DT_BOOL:
-                self._value = bool(value)
+                return bool(value)
             case TuyaBLEDataPointType.DT_VALUE:
-                self._value = int(value)
+                return int(value)
             case TuyaBLEDataPointType.DT_ENUM:
                 value = int(value)
-                if value >= 0:
-                    self._value = value
-                else:
+                if value < 0:
                     raise TuyaBLEEnumValueError()
-
+                return value
             case TuyaBLEDataPointType.DT_STRING:
-                self._value = str(value)
+                return str(value)
+        return value
+
+    async def set_value(self, value: bytes | bool | int | str) -> bool | None:
+        """Set and send the value, False when the device did not answer.
+
+        Between begin_update and end_update the value is only queued, None
+        is returned and end_update reports the result.
+        """
+        table = self._table
+        table._values[self._row] = self.convert_value(value)
+        table._changed[self._row] = 0
+        return await table._update_from_user(self.id)
+
+    def reset_value(self, value: bytes | bool | int | str) -> None:
+        """Set the value without sending it, to undo an unconfirmed change."""
+        self._table._values[self._row] = value
+
 
-        self._changed_by_device = False
-        await self._owner._update_from_user(self._id)
+@dataclass
+class TuyaBLEDataPointRecord:
+    """Value of a datapoint recorded by the device while it was offline."""
+
+    id: int
+    timestamp: float
+    type: TuyaBLEDataPointType
+    value: bytes | bool | int | str
 
 
 class TuyaBLEDataPoints:
-    """Models DPs"""
+    """Models DPs
+
+    Datapoints are kept in a table with one row per datapoint and a typed
+    column per field, TuyaBLEDataPoint views of the rows are handed out.
+    """
+
+    __slots__ = (
+        "_owner",
+        "_rows",
+        "_ids",
+        "_timestamps",
+        "_flags",
+        "_types",
+        "_values",
+        "_changed",
+        "_update_started",
+        "_updated_datapoints",
+        "_last_data_received",
+        "_history",
+    )
 
     def __init__(self, owner: TuyaBLEDevice) -> None:
         self._owner = owner
-        self._datapoints: dict[int, TuyaBLEDataPoint] = {}
+        # Row of each datapoint id
+        self._rows: dict[int, int] = {}
+        self._ids = array("i")
+        self._timestamps = array("d")
+        self._flags = array("I")
+        self._types = bytearray()
+        self._values: list[bytes | bool | int | str] = []
+        self._changed = bytearray()
         self._update_started: int = 0
         self._updated_datapoints: list[int] = []
         self._last_data_received: datetime | None = None
+        self._history: TuyaBLEHistory | None = None
 
     def __len__(self) -> int:
-        return len(self._datapoints)
+        return len(self._rows)
 
     def __getitem__(self, key: int) -> TuyaBLEDataPoint | None:
-        return self._datapoints.get(key)
+        row = self._rows.get(key)
+        if row is None:
+            return None
+        return TuyaBLEDataPoint(self, row)
 
     def __dict__(self) -> dict:
-        return self._datapoints
+        return {id: TuyaBLEDataPoint(self, row) for id, row in self._rows.items()}
 
     @property
     def last_data_received(self) -> datetime | None:
         """Last data received"""
         return self._last_data_received
 
+    @property
+    def history(self) -> TuyaBLEHistory | None:
+        """History of numeric datapoints, None when it is disabled."""
+        return self._history
+
+    def enable_history(self, depth: int) -> None:
+        """Keep depth recent samples per datapoint, 0 disables the history."""
+        if depth <= 0:
+            self._history = None
+        elif self._history is None or self._history.depth != depth:
+            self._history = TuyaBLEHistory(depth)
+
     def has_id(self, id: int, type: TuyaBLEDataPointType | None = None) -> bool:
-        return (id in self._datapoints) and (
-            (type is None) or (self._datapoints[id].type == type)
-        )
+        row = self._rows.get(id)
+        return row is not None and (type is None or self._types[row] == type.value)
+
+    def _add_row(
+        self,
+        id: int,
+        timestamp: float,
+        flags: int,
+        type: TuyaBLEDataPointType,
+        value: bytes | bool | int | str | None,
+    ) -> int:
+        row = len(self._values)
+        self._rows[id] = row
+        self._ids.append(id)
+        self._timestamps.append(timestamp)
+        self._flags.append(flags)
+        self._types.append(type.value)
+        self._values.append(value)
+        self._changed.append(0)
+        return row
 
     def get_or_create(
         self,
@@ -211,22 +306,23 @@ class TuyaBLEDataPoints:
         value: bytes | bool | int | str | None = None,
     ) -> TuyaBLEDataPoint:
         """Lazy loaded datapoint"""
-        datapoint = self._datapoints.get(id)
-        if datapoint:
-            return datapoint
-        datapoint = TuyaBLEDataPoint(self, id, time.time(), 0, type, value)
-        self._datapoints[id] = datapoint
-        return datapoint
+        row = self._rows.get(id)
+        if row is None:
+            row = self._add_row(id, time.time(), 0, type, value)
+        return TuyaBLEDataPoint(self, row)
 
     def begin_update(self) -> None:
         self._update_started += 1
 
-    async def end_update(self) -> None:
+    async def end_update(self) -> bool:
+        """Send the datapoints set since begin_update, False when unanswered."""
         if self._update_started > 0:
             self._update_started -= 1
             if self._update_started == 0 and len(self._updated_datapoints) > 0:
-                await self._owner._send_datapoints(self._updated_datapoints)
+                datapoint_ids = self._updated_datapoints
                 self._updated_datapoints = []
+                return await self._owner._send_datapoints(datapoint_ids)
+        return True
 
     def _update_from_device(
         self,
@@ -237,25 +333,35 @@ class TuyaBLEDataPoints:
         value: bytes | bool | int | str,
     ) -> None:
         self._last_data_received = datetime.now(timezone.utc)
-        dp = self._datapoints.get(dp_id)
-        if dp:
-            dp._update_from_device(timestamp, flags, type, value)
-        else:
-            self._datapoints[dp_id] = TuyaBLEDataPoint(
-                self, dp_id, timestamp, flags, type, value
-            )
+        if self._history is not None:
+            self._history.add(dp_id, timestamp, type, value)
+        row = self._rows.get(dp_id)
+        if row is None:
+            self._add_row(dp_id, timestamp, flags, type, value)
+            return
+        self._timestamps[row] = timestamp
+        self._flags[row] = flags
+        self._types[row] = type.value
+        self._changed[row] = self._values[row] != value
+        self._values[row] = value
 
-    async def _update_from_user(self, dp_id: int) -> None:
+    async def _update_from_user(self, dp_id: int) -> bool | None:
         if self._update_started > 0:
             if dp_id in self._updated_datapoints:
                 self._updated_datapoints.remove(dp_id)
             self._updated_datapoints.append(dp_id)
-        else:
-            await self._owner._send_datapoints([dp_id])
+            return None
+        return await self._owner._send_datapoints([dp_id])
 
 
 global_connect_lock = asyncio.Lock()
 
+# Connects to the BLE device, calling back with the client on disconnection
+TuyaBLEClientFactory = Callable[
+    [BLEDevice, Callable[[BleakClientWithServiceCache], None]],
+    Awaitable[BleakClientWithServiceCache],
+]
+
 
 @dataclass
 class TuyaBLEDeviceFunction:
@@ -280,24 +386,56 @@ class TuyaBLEDevice:
     def __init__(
         self,
         device_manager: AbstaractTuyaBLEDeviceManager,
-        ble_device: BLEDevice,
+        ble_device: BLEDevice | str,
         advertisement_data: AdvertisementData | None = None,
     ) -> None:
-        """Init the TuyaBLE."""
+        """Init the TuyaBLE.
+
+        The address alone may be given when the BLE device is not known yet,
+        it is attached later by set_ble_device_and_advertisement_data.
+        """
         self._device_manager = device_manager
         self._device_info: TuyaBLEDeviceCredentials | None = None
-        self._ble_device = ble_device
+        if isinstance(ble_device, str):
+            self._address = ble_device
+            self._ble_device: BLEDevice | None = None
+        else:
+            self._address = ble_device.address
+            self._ble_device = ble_device
         self._advertisement_data = advertisement_data
-        self._operation_lock = asyncio.Lock()
+        self._advertisement_key: tuple[bytes | None, bytes | None] | None = None
+        self._presence = TuyaBLEPresence()
+        self._router = TuyaBLERouter()
+        self._route_provider: TuyaBLERouteProvider | None = None
+        self._route_resolver: TuyaBLERouteResolver | None = None
+        self._route: TuyaBLERoute | None = None
+        self._client_factory: TuyaBLEClientFactory | None = None
+        self._scheduler = TuyaBLEScheduler()
         self._connect_lock = asyncio.Lock()
+        self._connection = TuyaBLEConnection(self._address)
+        self._heartbeat = TuyaBLEHeartbeat()
+        self._heartbeat_enabled = False
+        self._heartbeat_task: asyncio.Task | None = None
+        self._pacing = TuyaBLEPacing()
         self._client: BleakClientWithServiceCache | None = None
         self._expected_disconnect = False
         self._connected_callbacks: list[Callable[[], None]] = []
         self._callbacks: list[Callable[[list[TuyaBLEDataPoint]], None]] = []
+        self._history_callbacks: list[
+            Callable[[list[TuyaBLEDataPointRecord]], None]
+        ] = []
         self._disconnected_callbacks: list[Callable[[], None]] = []
+        self._command_callbacks: list[Callable[[], None]] = []
         self._current_seq_num = 1
         self._seq_num_lock = asyncio.Lock()
 
+        self._responses: deque[tuple[TuyaBLECode, bytes, int]] = deque(
+            maxlen=RESPONSE_QUEUE_SIZE
+        )
+        self._responses_pending = asyncio.Event()
+        self._response_writer_task: asyncio.Task | None = None
+        self._responses_dropped = 0
+
         self._is_bound = False
         self._flags = 0
         self._protocol_version = 2
@@ -312,13 +450,21 @@ class TuyaBLEDevice:
         self._local_key: bytes | None = None
         self._login_key: bytes | None = None
         self._session_key: bytes | None = None
+        self._crypto = TuyaBLECryptoContext()
 
         self._is_paired = False
 
-        self._input_buffer: bytearray | None = None
-        self._input_expected_packet_num = 0
-        self._input_expected_length = 0
-        self._input_expected_responses: dict[int, asyncio.Future[int] | None] = {}
+        self._reassembler = TuyaBLEReassembler(self._address)
+        self._dp_seq_window = TuyaBLESequenceWindow()
+        # Delay of the device clock learnt from single timed reports during
+        # the current connection
+        self._clock_lag: float | None = None
+        self._timed_records: list[tuple[TuyaBLEDataPointRecord, int]] = []
+        # Timed frames in the current burst and the time the last one arrived
+        self._timed_frames = 0
+        self._timed_received = 0.0
+        self._timed_records_flush: asyncio.TimerHandle | None = None
+        self._input_expected_responses: dict[int, asyncio.Future[bytes] | None] = {}
         # self._input_future: asyncio.Future[int] | None = None
 
         self._datapoints = TuyaBLEDataPoints(self)
@@ -332,6 +478,52 @@ class TuyaBLEDevice:
         """Set the ble device."""
         self._ble_device = ble_device
         self._advertisement_data = advertisement_data
+        self._presence.advertised(advertisement_data.rssi)
+        # Most advertisements repeat byte for byte, decode only the changes
+        key = (
+            advertisement_data.manufacturer_data.get(MANUFACTURER_DATA_ID),
+            advertisement_data.service_data.get(SERVICE_UUID_TEMP),
+        )
+        if key == self._advertisement_key:
+            return
+        self._advertisement_key = key
+        try:
+            self._decode_advertisement_data()
+        except ValueError:
+            _LOGGER.debug(
+                "%s: Malformed advertisement: %s", self.address, key, exc_info=True
+            )
+
+    def set_route_provider(
+        self,
+        provider: TuyaBLERouteProvider | None,
+        resolver: TuyaBLERouteResolver | None = None,
+    ) -> None:
+        """Set the source of scanners and proxies able to reach the device.
+
+        The resolver finds the route a connected client actually went
+        through, without it connections use the route that was chosen.
+        """
+        self._route_provider = provider
+        self._route_resolver = resolver
+
+    def set_client_factory(self, factory: TuyaBLEClientFactory | None) -> None:
+        """Set how connections are made, establish_connection when None."""
+        self._client_factory = factory
+
+    @property
+    def router(self) -> TuyaBLERouter:
+        return self._router
+
+    def _select_route(self) -> BLEDevice:
+        """Choose the path of the next connection attempt."""
+        self._route = None
+        if self._route_provider is not None:
+            routes = self._router.rank(self._route_provider())
+            if routes:
+                self._route = routes[0]
+                return self._route.ble_device
+        return self._ble_device
 
     async def initialize(self) -> None:
         _LOGGER.debug("%s: Initializing", self.address)
@@ -361,17 +553,31 @@ class TuyaBLEDevice:
 
     async def update(self) -> None:
         _LOGGER.debug("%s: Updating", self.address)
-        await self._send_packet(TuyaBLECode.FUN_SENDER_DEVICE_STATUS, bytes())
+        await self._send_packet(
+            TuyaBLECode.FUN_SENDER_DEVICE_STATUS,
+            bytes(),
+            priority=TuyaBLEPriority.POLL,
+        )
+
+    async def update_firmware(
+        self,
+        image: TuyaBLEFirmwareImage,
+        progress_callback: Callable[[TuyaBLEOTAProgress], None] | None = None,
+    ) -> None:
+        """Stream firmware image to the device."""
+        _LOGGER.debug("%s: Updating firmware from %s", self.address, image.path)
+        await TuyaBLEOTAUpdater(self, image, progress_callback=progress_callback).run()
 
     async def _update_device_info(self) -> bool:
         if self._device_info is None:
             if self._device_manager:
                 self._device_info = await self._device_manager.get_device_credentials(
-                    self._ble_device.address, False
+                    self.address, False
                 )
             if self._device_info:
                 self._local_key = self._device_info.local_key[:6].encode()
                 self._login_key = hashlib.md5(self._local_key).digest()
+                self._crypto.set_key(SECURITY_FLAG_LOGIN, self._login_key)
 
                 self.append_functions(
                     self._device_info.functions, self._device_info.status_range
@@ -434,19 +640,29 @@ class TuyaBLEDevice:
                     MANUFACTURER_DATA_ID
                 )
                 if manufacturer_data and len(manufacturer_data) > 6:
-                    self._is_bound = (manufacturer_data[0] & 0x80) != 0
-                    self._protocol_version = manufacturer_data[1]
+                    is_bound = (manufacturer_data[0] & 0x80) != 0
+                    protocol_version = manufacturer_data[1]
+                    if (is_bound, protocol_version) != (
+                        self._is_bound,
+                        self._protocol_version,
+                    ):
+                        _LOGGER.debug(
+                            "%s: Advertised bound: %s, protocol version: %s",
+                            self.address,
+                            is_bound,
+                            protocol_version,
+                        )
+                    self._is_bound = is_bound
+                    self._protocol_version = protocol_version
                     raw_uuid = manufacturer_data[6:]
                     if raw_product_id:
-                        key = hashlib.md5(raw_product_id).digest()
-                        cipher = AES.new(key, AES.MODE_CBC, key)
-                        raw_uuid = cipher.decrypt(raw_uuid)
+                        raw_uuid = decrypt_advertisement_uuid(raw_product_id, raw_uuid)
                         self._uuid = raw_uuid.decode("utf-8")
 
     @property
     def address(self) -> str:
         """Return the address."""
-        return self._ble_device.address
+        return self._address
 
     @property
     def name(self) -> str:
@@ -454,7 +670,19 @@ class TuyaBLEDevice:
         if self._device_info:
             return self._device_info.device_name
 
-        return self._ble_device.name or self._ble_device.address
+        if self._ble_device and self._ble_device.name:
+            return self._ble_device.name
+
+        return self.address
+
+    @property
+    def is_connected(self) -> bool:
+        """Connected and paired with the device."""
+        return bool(self._client and self._client.is_connected and self._is_paired)
+
+    @property
+    def presence(self) -> TuyaBLEPresence:
+        return self._presence
 
     @property
     def rssi(self) -> int | None:
@@ -536,6 +764,43 @@ class TuyaBLEDevice:
     def protocol_version(self) -> str:
         return self._protocol_version_str
 
+    @property
+    def queue_stats(self) -> dict[TuyaBLEPriority, TuyaBLEQueueStats]:
+        """Time spent waiting for the link per priority class."""
+        return self._scheduler.stats
+
+    @property
+    def connection_stats(self) -> dict[str, Any]:
+        """Connection state, time spent per state and shared connect tasks."""
+        return self._connection.as_dict()
+
+    @property
+    def heartbeat_stats(self) -> dict[str, Any]:
+        """Probe interval, probes sent and failed and the last round trip."""
+        return self._heartbeat.as_dict()
+
+    @property
+    def pacing_stats(self) -> dict[str, Any]:
+        """Fragment batch and pause, frames delivered and lost."""
+        return self._pacing.as_dict()
+
+    def enable_heartbeat(self, enabled: bool) -> None:
+        """Probe the connection after idle periods to detect a dead link."""
+        self._heartbeat_enabled = enabled
+        if not enabled:
+            self._stop_heartbeat()
+        elif self._is_paired:
+            self._start_heartbeat()
+
+    @property
+    def input_stats(self) -> dict[str, int]:
+        """Reassembled notifications, drops by reason and datapoint reports."""
+        return {
+            **self._reassembler.stats,
+            **self._dp_seq_window.stats,
+            "responses_dropped": self._responses_dropped,
+        }
+
     @property
     def datapoints(self) -> TuyaBLEDataPoints:
         """Get datapoints exposed by device."""
@@ -546,14 +811,14 @@ class TuyaBLEDevice:
         """Get current datapoints values."""
 
         result = {}
-        dps = self.datapoints._datapoints
+        dps = self.datapoints
         if dps:
             order = [self.status_range, self.function]
             for functions in order:
                 for dpcode in functions:
                     f = functions[dpcode]
                     dpid = f.dp_id
-                    v = dps.get(dpid)
+                    v = dps[dpid]
                     if v:
                         result[dpcode] = v.value
         return result
@@ -584,7 +849,7 @@ class TuyaBLEDevice:
 
     def _fire_connected_callbacks(self) -> None:
         """Fire the callbacks."""
-        for callback in self._connected_callbacks:
+        for callback in list(self._connected_callbacks):
             callback()
 
     def register_connected_callback(
@@ -615,6 +880,44 @@ class TuyaBLEDevice:
         self._callbacks.append(callback)
         return unregister_callback
 
+    def _fire_history_callbacks(self, records: list[TuyaBLEDataPointRecord]) -> None:
+        """Fire the callbacks."""
+        for callback in self._history_callbacks:
+            callback(records)
+
+    def register_history_callback(
+        self,
+        callback: Callable[[list[TuyaBLEDataPointRecord]], None],
+    ) -> Callable[[], None]:
+        """Register a callback to be called with historical records.
+
+        Records reported with an old device timestamp, usually after the
+        device was offline, do not change the datapoints and are passed to
+        these callbacks only.
+        """
+
+        def unregister_callback() -> None:
+            self._history_callbacks.remove(callback)
+
+        self._history_callbacks.append(callback)
+        return unregister_callback
+
+    def _fire_command_callbacks(self) -> None:
+        """Fire the callbacks."""
+        for callback in self._command_callbacks:
+            callback()
+
+    def register_command_callback(
+        self, callback: Callable[[], None]
+    ) -> Callable[[], None]:
+        """Register a callback to be called when user command is sent."""
+
+        def unregister_callback() -> None:
+            self._command_callbacks.remove(callback)
+
+        self._command_callbacks.append(callback)
+        return unregister_callback
+
     def _fire_disconnected_callbacks(self) -> None:
         """Fire the callbacks."""
         for callback in self._disconnected_callbacks:
@@ -645,6 +948,10 @@ class TuyaBLEDevice:
         """Disconnected callback."""
         was_paired = self._is_paired
         self._is_paired = False
+        self._stop_response_writer()
+        self._stop_heartbeat()
+        # The device may restart and set its clock before it is back
+        self._clock_lag = None
         if self._expected_disconnect:
             _LOGGER.debug(
                 "%s: Disconnected from device; RSSI: %s",
@@ -654,6 +961,7 @@ class TuyaBLEDevice:
             self._fire_disconnected_callbacks()
             return
         self._client = None
+        self._connection.set_state(TuyaBLEConnectionState.IDLE)
         _LOGGER.warning(
             "%s: Device unexpectedly disconnected; RSSI: %s",
             self.address,
@@ -665,7 +973,7 @@ class TuyaBLEDevice:
                 self.address,
                 self.rssi,
             )
-            asyncio.create_task(self._reconnect())
+            self._connection.reconnect(self._reconnect)
 
     def _disconnect(self) -> None:
         """Disconnect from device."""
@@ -681,146 +989,204 @@ class TuyaBLEDevice:
 
     async def _execute_disconnect(self) -> None:
         """Execute disconnection."""
+        self._connection.stop()
         async with self._connect_lock:
             client = self._client
             self._expected_disconnect = True
+            self._connection.set_state(TuyaBLEConnectionState.DRAINING)
             self._client = None
+            self._stop_response_writer()
+            self._stop_heartbeat()
             if client and client.is_connected:
                 await client.stop_notify(CHARACTERISTIC_NOTIFY)
                 await client.disconnect()
         async with self._seq_num_lock:
             self._current_seq_num = 1
+        self._connection.set_state(TuyaBLEConnectionState.STOPPED)
 
     async def _ensure_connected(self) -> None:
         """Ensure connection to device is established."""
-        global global_connect_lock
         if self._expected_disconnect:
             return
-        if self._connect_lock.locked():
-            _LOGGER.debug(
-                "%s: Connection already in progress,"
-                " waiting for it to complete; RSSI: %s",
-                self.address,
-                self.rssi,
-            )
         if self._client and self._client.is_connected and self._is_paired:
             return
-        async with self._connect_lock:
-            # Check again while holding the lock
-            await asyncio.sleep(0.01)
-            if self._client and self._client.is_connected and self._is_paired:
-                return
-            attempts_count = 100
-            while attempts_count > 0:
-                attempts_count -= 1
-                if attempts_count == 0:
-                    _LOGGER.error(
-                        "%s: Connecting, all attempts failed; RSSI: %s",
-                        self.address,
-                        self.rssi,
-                    )
-                    raise BleakNotFoundError()
-                try:
-                    async with global_connect_lock:
-                        _LOGGER.debug(
-                            "%s: Connecting; RSSI: %s", self.address, self.rssi
-                        )
-                        client = await establish_connection(
-                            BleakClientWithServiceCache,
-                            self._ble_device,
+        if self._ble_device is None:
+            raise BleakNotFoundError(f"{self.address}: device was not seen yet")
+        # Callers share one connect task, cancelling a caller does not stop it
+        await asyncio.shield(self._connection.connect(self._connect))
+
+    async def _connect(self) -> None:
+        global global_connect_lock
+        try:
+            async with self._connect_lock:
+                # Check again while holding the lock
+                await asyncio.sleep(0.01)
+                if self._client and self._client.is_connected and self._is_paired:
+                    return
+                attempts_count = 100
+                self._router.begin()
+                self._route = None
+                route_source: str | None = None
+                while attempts_count > 0:
+                    if route_source is not None:
+                        # The previous attempt did not get through this route
+                        self._router.failed(route_source)
+                        route_source = None
+                    attempts_count -= 1
+                    if attempts_count == 0:
+                        _LOGGER.error(
+                            "%s: Connecting, all attempts failed; RSSI: %s",
                             self.address,
-                            self._disconnected,
-                            use_services_cache=True,
-                            ble_device_callback=lambda: self._ble_device,
+                            self.rssi,
                         )
-                except BleakNotFoundError:
-                    _LOGGER.error(
-                        "%s: device not found, not in range, or poor RSSI: %s",
-                        self.address,
-                        self.rssi,
-                        exc_info=True,
-                    )
-                    continue
-                except BLEAK_EXCEPTIONS:
-                    _LOGGER.debug(
-                        "%s: communication failed", self.address, exc_info=True
-                    )
-                    continue
-                except:
-                    _LOGGER.debug("%s: unexpected error", self.address, exc_info=True)
-                    continue
-
-                if client and client.is_connected:
-                    _LOGGER.debug("%s: Connected; RSSI: %s", self.address, self.rssi)
-                    self._client = client
+                        raise BleakNotFoundError()
+                    ble_device = self._select_route()
+                    if self._route is not None and self._route_resolver is None:
+                        route_source = self._route.source
+                    self._connection.set_state(TuyaBLEConnectionState.CONNECTING)
                     try:
-                        await self._client.start_notify(
-                            CHARACTERISTIC_NOTIFY, self._notification_handler
-                        )
-                    except:  # [BLEAK_EXCEPTIONS, BleakNotFoundError]:
-                        self._client = None
+                        async with global_connect_lock:
+                            # Waiting for other devices does not count
+                            started = time.monotonic()
+                            _LOGGER.debug(
+                                "%s: Connecting via %s; RSSI: %s",
+                                self.address,
+                                self._route.source if self._route else None,
+                                self._route.rssi if self._route else self.rssi,
+                            )
+                            if self._client_factory is not None:
+                                client = await self._client_factory(
+                                    ble_device, self._disconnected
+                                )
+                            else:
+                                # Under Home Assistant the patched BleakClient
+                                # chooses the backend itself, the resolver
+                                # finds the route used, see TuyaBLERouter
+                                client = await establish_connection(
+                                    BleakClientWithServiceCache,
+                                    ble_device,
+                                    self.address,
+                                    self._disconnected,
+                                    use_services_cache=True,
+                                    ble_device_callback=lambda: ble_device,
+                                )
+                    except BleakNotFoundError:
                         _LOGGER.error(
-                            "%s: starting notifications failed",
+                            "%s: device not found, not in range, or poor RSSI: %s",
                             self.address,
+                            self.rssi,
                             exc_info=True,
                         )
                         continue
-                else:
-                    continue
+                    except BLEAK_EXCEPTIONS:
+                        _LOGGER.debug(
+                            "%s: communication failed", self.address, exc_info=True
+                        )
+                        continue
+                    except:
+                        _LOGGER.debug(
+                            "%s: unexpected error", self.address, exc_info=True
+                        )
+                        continue
 
-                if self._client and self._client.is_connected:
-                    _LOGGER.debug("%s: Sending device info request", self.address)
-                    try:
-                        if not await self._send_packet_while_connected(
-                            TuyaBLECode.FUN_SENDER_DEVICE_INFO,
-                            bytes(0),
-                            0,
-                            True,
-                        ):
+                    if client and client.is_connected:
+                        if self._route_resolver is not None:
+                            route_source = self._route_resolver(client)
+                        _LOGGER.debug(
+                            "%s: Connected via %s; RSSI: %s",
+                            self.address,
+                            route_source,
+                            self.rssi,
+                        )
+                        self._client = client
+                        # Sequence numbers restart with every connection
+                        self._current_seq_num = 1
+                        self._reassembler.reset()
+                        self._dp_seq_window.reset()
+                        try:
+                            await self._client.start_notify(
+                                CHARACTERISTIC_NOTIFY, self._notification_handler
+                            )
+                            self._start_response_writer()
+                            self._connection.set_state(
+                                TuyaBLEConnectionState.HANDSHAKING
+                            )
+                        except:  # [BLEAK_EXCEPTIONS, BleakNotFoundError]:
+                            self._client = None
+                            _LOGGER.error(
+                                "%s: starting notifications failed",
+                                self.address,
+                                exc_info=True,
+                            )
+                            continue
+                    else:
+                        continue
+
+                    if self._client and self._client.is_connected:
+                        _LOGGER.debug("%s: Sending device info request", self.address)
+                        try:
+                            if not await self._send_packet_while_connected(
+                                TuyaBLECode.FUN_SENDER_DEVICE_INFO,
+                                bytes(0),
+                                0,
+                                True,
+                            ):
+                                self._client = None
+                                _LOGGER.error(
+                                    "%s: Sending device info request failed",
+                                    self.address,
+                                )
+                                continue
+                        except:  # [BLEAK_EXCEPTIONS, BleakNotFoundError]:
                             self._client = None
                             _LOGGER.error(
                                 "%s: Sending device info request failed",
                                 self.address,
+                                exc_info=True,
                             )
                             continue
-                    except:  # [BLEAK_EXCEPTIONS, BleakNotFoundError]:
-                        self._client = None
-                        _LOGGER.error(
-                            "%s: Sending device info request failed",
-                            self.address,
-                            exc_info=True,
-                        )
+                    else:
                         continue
-                else:
-                    continue
 
-                if self._client and self._client.is_connected:
-                    _LOGGER.debug("%s: Sending pairing request", self.address)
-                    try:
-                        if not await self._send_packet_while_connected(
-                            TuyaBLECode.FUN_SENDER_PAIR,
-                            self._build_pairing_request(),
-                            0,
-                            True,
-                        ):
+                    if self._client and self._client.is_connected:
+                        _LOGGER.debug("%s: Sending pairing request", self.address)
+                        try:
+                            if not await self._send_packet_while_connected(
+                                TuyaBLECode.FUN_SENDER_PAIR,
+                                self._build_pairing_request(),
+                                0,
+                                True,
+                            ):
+                                self._client = None
+                                _LOGGER.error(
+                                    "%s: Sending pairing request failed",
+                                    self.address,
+                                )
+                                continue
+                        except:  # [BLEAK_EXCEPTIONS, BleakNotFoundError]:
                             self._client = None
                             _LOGGER.error(
                                 "%s: Sending pairing request failed",
                                 self.address,
+                                exc_info=True,
                             )
                             continue
-                    except:  # [BLEAK_EXCEPTIONS, BleakNotFoundError]:
-                        self._client = None
-                        _LOGGER.error(
-                            "%s: Sending pairing request failed",
-                            self.address,
-                            exc_info=True,
-                        )
+                    else:
                         continue
-                else:
-                    continue
 
-                break
+                    if route_source is not None:
+                        self._router.succeeded(route_source, time.monotonic() - started)
+                    if self._is_paired:
+                        self._connection.set_state(TuyaBLEConnectionState.READY)
+                        if self._heartbeat_enabled:
+                            self._start_heartbeat()
+                    break
+        finally:
+            if self._connection.state in (
+                TuyaBLEConnectionState.CONNECTING,
+                TuyaBLEConnectionState.HANDSHAKING,
+            ):
+                self._connection.set_state(TuyaBLEConnectionState.IDLE)
 
         if self._client:
             if self._client.is_connected:
@@ -835,26 +1201,34 @@ class TuyaBLEDevice:
             _LOGGER.error("%s: No client device", self.address)
 
     async def _reconnect(self) -> None:
-        """Attempt a reconnect"""
-        _LOGGER.debug("%s: Reconnect, ensuring connection", self.address)
-        async with self._seq_num_lock:
-            self._current_seq_num = 1
-        try:
-            if self._expected_disconnect:
-                return
-            await self._ensure_connected()
-            if self._expected_disconnect:
-                return
+        """Reconnect until connected, backing off after each failure.
+
+        Attempts wait while the device is away, it is heard again once it
+        advertises.
+        """
+        while not self._expected_disconnect:
+            if not self._presence.is_present():
+                _LOGGER.debug(
+                    "%s: Reconnect, waiting for the device to advertise",
+                    self.address,
+                )
+                self._connection.set_state(TuyaBLEConnectionState.BACKOFF)
+                await asyncio.sleep(PRESENCE_RECHECK_INTERVAL)
+                continue
+            _LOGGER.debug("%s: Reconnect, ensuring connection", self.address)
+            try:
+                await self._ensure_connected()
+            except BLEAK_EXCEPTIONS:  # BleakNotFoundError:
+                _LOGGER.debug(
+                    "%s: Reconnect, failed to ensure connection - backing off",
+                    self.address,
+                    exc_info=True,
+                )
+                self._connection.set_state(TuyaBLEConnectionState.BACKOFF)
+                await asyncio.sleep(BLEAK_BACKOFF_TIME)
+                continue
             _LOGGER.debug("%s: Reconnect, connection ensured", self.address)
-        except BLEAK_EXCEPTIONS:  # BleakNotFoundError:
-            _LOGGER.debug(
-                "%s: Reconnect, failed to ensure connection - backing off",
-                self.address,
-                exc_info=True,
-            )
-            await asyncio.sleep(BLEAK_BACKOFF_TIME)
-            _LOGGER.debug("%s: Reconnecting again", self.address)
-            asyncio.create_task(self._reconnect())
+            return
 
     @staticmethod
     def _calc_crc16(data: bytes) -> int:
@@ -882,24 +1256,6 @@ class TuyaBLEDevice:
                 break
         return result
 
-    @staticmethod
-    def _unpack_int(data: bytes, start_pos: int) -> tuple(int, int):
-        result: int = 0
-        offset: int = 0
-        while offset < 5:
-            pos: int = start_pos + offset
-            if pos >= len(data):
-                raise TuyaBLEDataFormatError()
-            curr_byte: int = data[pos]
-            result |= (curr_byte & 0x7F) << (offset * 7)
-            offset += 1
-            if (curr_byte & 0x80) == 0:
-                break
-        if offset > 4:
-            raise TuyaBLEDataFormatError()
-        else:
-            return (result, start_pos + offset)
-
     def _build_packets(
         self,
         seq_num: int,
@@ -907,15 +1263,13 @@ class TuyaBLEDevice:
         data: bytes,
         response_to: int = 0,
     ) -> list[bytes]:
-        key: bytes
         iv = secrets.token_bytes(16)
-        security_flag: bytes
+        security_flag: int
         if code == TuyaBLECode.FUN_SENDER_DEVICE_INFO:
-            key = self._login_key
-            security_flag = b"\x04"
+            security_flag = SECURITY_FLAG_LOGIN
         else:
-            key = self._session_key
-            security_flag = b"\x05"
+            security_flag = SECURITY_FLAG_SESSION
+        cipher = self._get_cipher(security_flag)
 
         raw = bytearray()
         raw += pack(">IIHH", seq_num, response_to, code.value, len(data))
@@ -925,8 +1279,7 @@ class TuyaBLEDevice:
         while len(raw) % 16 != 0:
             raw += b"\x00"
 
-        cipher = AES.new(key, AES.MODE_CBC, iv)
-        encrypted = security_flag + iv + cipher.encrypt(raw)
+        encrypted = bytes([security_flag]) + iv + cipher.encrypt(iv, raw)
 
         command = []
         packet_num = 0
@@ -953,8 +1306,13 @@ class TuyaBLEDevice:
 
     async def _get_seq_num(self) -> int:
         async with self._seq_num_lock:
-            result = self._current_seq_num
-            self._current_seq_num += 1
+            result = self._next_seq_num()
+        return result
+
+    def _next_seq_num(self) -> int:
+        # No await between read and increment, so it is atomic in the event loop
+        result = self._current_seq_num
+        self._current_seq_num += 1
         return result
 
     async def _send_packet(
@@ -963,24 +1321,172 @@ class TuyaBLEDevice:
         data: bytes,
         wait_for_response: bool = True,
         # retry: int | None = None,
-    ) -> None:
-        """Send packet to device and optional read response."""
+        priority: TuyaBLEPriority = TuyaBLEPriority.INTERACTIVE,
+    ) -> bool:
+        """Send packet to device and optional read response.
+
+        Returns False when the packet was dropped or not answered.
+        """
         if self._expected_disconnect:
-            return
+            return False
         await self._ensure_connected()
         if self._expected_disconnect:
-            return
-        await self._send_packet_while_connected(code, data, 0, wait_for_response)
+            return False
+        try:
+            return await self._send_packet_while_connected(
+                code, data, 0, wait_for_response, priority
+            )
+        except BLEAK_EXCEPTIONS:
+            if self._expected_disconnect:
+                raise
+            _LOGGER.debug(
+                "%s: Sending %s failed, retrying once reconnected",
+                self.address,
+                code.name,
+            )
+        # The frame is built again with the sequence number and session
+        # key of the new connection
+        await self._ensure_connected()
+        if self._expected_disconnect:
+            return False
+        return await self._send_packet_while_connected(
+            code, data, 0, wait_for_response, priority
+        )
 
-    async def _send_response(
+    def _queue_response(
         self,
         code: TuyaBLECode,
         data: bytes,
         response_to: int,
     ) -> None:
-        """Send response to received packet."""
-        if self._client and self._client.is_connected:
-            await self._send_packet_while_connected(code, data, response_to, False)
+        """Queue response to received packet for the response writer."""
+        if self._response_writer_task is None:
+            return
+        if len(self._responses) == self._responses.maxlen:
+            # The deque drops the oldest response to make room
+            self._responses_dropped += 1
+            _LOGGER.warning(
+                "%s: Response queue full, dropped response to #%s",
+                self.address,
+                self._responses[0][2],
+            )
+        self._responses.append((code, data, response_to))
+        self._responses_pending.set()
+
+    def _start_response_writer(self) -> None:
+        self._stop_response_writer()
+        self._response_writer_task = asyncio.create_task(self._response_writer())
+
+    def _stop_response_writer(self) -> None:
+        if self._response_writer_task is not None:
+            self._response_writer_task.cancel()
+            self._response_writer_task = None
+        self._responses.clear()
+        self._responses_pending.clear()
+
+    async def _response_writer(self) -> None:
+        """Long-lived writer of responses, one per connection."""
+        while True:
+            await self._responses_pending.wait()
+            self._responses_pending.clear()
+            if not self._responses:
+                continue
+            try:
+                async with self._scheduler.slot(
+                    TuyaBLEPriority.RESPONSE,
+                    SCHEDULER_DEADLINES.get(TuyaBLEPriority.RESPONSE),
+                ):
+                    await self._flush_responses_locked()
+            except TuyaBLEDeadlineError:
+                _LOGGER.debug("%s: Dropped expired responses", self.address)
+                self._responses.clear()
+            except BLEAK_EXCEPTIONS:
+                _LOGGER.debug(
+                    "%s: Sending responses failed", self.address, exc_info=True
+                )
+
+    async def _flush_responses_locked(self) -> None:
+        """Send queued responses ahead of the packets of the lock owner.
+
+        Called before the owner numbers its frame, responses take the lower
+        sequence numbers and leave first.
+        """
+        while self._responses:
+            code, data, response_to = self._responses.popleft()
+            seq_num = self._next_seq_num()
+            _LOGGER.debug(
+                "%s: Sending packet: #%s %s in response to #%s",
+                self.address,
+                seq_num,
+                code.name,
+                response_to,
+            )
+            await self._int_send_packets_locked(
+                self._build_packets(seq_num, code, data, response_to)
+            )
+
+    def _start_heartbeat(self) -> None:
+        self._stop_heartbeat()
+        self._heartbeat_task = asyncio.create_task(self._heartbeat_loop())
+
+    def _stop_heartbeat(self) -> None:
+        task = self._heartbeat_task
+        self._heartbeat_task = None
+        # The loop stops itself when it drops a dead connection
+        if task is not None and task is not asyncio.current_task():
+            task.cancel()
+
+    async def _heartbeat_loop(self) -> None:
+        """Probe the connection after idle periods, drop it when dead."""
+        self._heartbeat.reset()
+        while True:
+            await asyncio.sleep(self._heartbeat.due_in())
+            if self._heartbeat.due_in() > 0:
+                continue
+            started = time.monotonic()
+            try:
+                async with self._scheduler.slot(
+                    TuyaBLEPriority.POLL,
+                    SCHEDULER_DEADLINES.get(TuyaBLEPriority.POLL),
+                ):
+                    future = await self._send_request_locked(
+                        TuyaBLECode.FUN_SENDER_DEVICE_STATUS, bytes()
+                    )
+                await asyncio.wait_for(future, HEARTBEAT_TIMEOUT)
+            except TuyaBLEDeadlineError:
+                # The link is busy, the pending commands find out if it is dead
+                self._heartbeat.reset()
+                continue
+            except TuyaBLEDeviceError as error:
+                # An error reported by the device still answers the probe
+                _LOGGER.debug(
+                    "%s: Heartbeat answered with error: %s", self.address, error
+                )
+            except (*BLEAK_EXCEPTIONS, asyncio.TimeoutError):
+                self._heartbeat.probed(None)
+                break
+            self._heartbeat.probed(time.monotonic() - started)
+            _LOGGER.debug(
+                "%s: Heartbeat answered in %.2fs",
+                self.address,
+                time.monotonic() - started,
+            )
+
+        _LOGGER.warning(
+            "%s: Heartbeat not answered, reconnecting; RSSI: %s",
+            self.address,
+            self.rssi,
+        )
+        client = self._client
+        if client is None:
+            return
+        try:
+            await client.disconnect()
+        except BLEAK_EXCEPTIONS:
+            _LOGGER.debug("%s: Disconnect failed", self.address, exc_info=True)
+        if self._client is client:
+            # The disconnection was not reported by the stack
+            self._disconnected(client)
 
     async def _send_packet_while_connected(
         self,
@@ -989,32 +1495,24 @@ class TuyaBLEDevice:
         response_to: int,
         wait_for_response: bool,
         # retry: int | None = None
+        priority: TuyaBLEPriority = TuyaBLEPriority.INTERACTIVE,
     ) -> bool:
         """Send packet to device and optional read response."""
         result = True
         future: asyncio.Future | None = None
-        seq_num = await self._get_seq_num()
         if wait_for_response:
             future = asyncio.Future()
-            self._input_expected_responses[seq_num] = future
-
-        if response_to > 0:
-            _LOGGER.debug(
-                "%s: Sending packet: #%s %s in response to #%s",
-                self.address,
-                seq_num,
-                code.name,
-                response_to,
+        try:
+            seq_num = await self._int_send_packet_while_connected(
+                code, data, response_to, future, priority
             )
-        else:
+        except TuyaBLEDeadlineError:
             _LOGGER.debug(
-                "%s: Sending packet: #%s %s",
+                "%s: Dropped expired packet %s",
                 self.address,
-                seq_num,
                 code.name,
             )
-        packets: list[bytes] = self._build_packets(seq_num, code, data, response_to)
-        await self._int_send_packet_while_connected(packets)
+            return False
         if future:
             try:
                 await asyncio.wait_for(future, RESPONSE_WAIT_TIMEOUT)
@@ -1029,20 +1527,88 @@ class TuyaBLEDevice:
 
         return result
 
+    async def _send_request_locked(
+        self,
+        code: TuyaBLECode,
+        data: bytes,
+    ) -> asyncio.Future[bytes]:
+        """Send packet while holding operation lock, returns response future."""
+        await self._flush_responses_locked()
+        seq_num = await self._get_seq_num()
+        future: asyncio.Future[bytes] = asyncio.Future()
+        self._input_expected_responses[seq_num] = future
+        future.add_done_callback(
+            lambda _: self._input_expected_responses.pop(seq_num, None)
+        )
+        _LOGGER.debug(
+            "%s: Sending packet: #%s %s",
+            self.address,
+            seq_num,
+            code.name,
+        )
+        packets = self._build_packets(seq_num, code, data)
+        self._watch_delivery(future, len(packets))
+        await self._send_packets_locked(packets)
+        return future
+
+    def _watch_delivery(self, future: asyncio.Future, fragments: int) -> None:
+        """Report the answer to a frame, or its absence, to the pacing."""
+        if fragments < 2:
+            return
+
+        def done(future: asyncio.Future) -> None:
+            if not future.cancelled():
+                # An error reported by the device still means it got the frame
+                self._pacing.delivered()
+            elif self._client is not None and self._client.is_connected:
+                # Waiting timed out over a working connection
+                self._pacing.lost()
+
+        future.add_done_callback(done)
+
     async def _int_send_packet_while_connected(
         self,
-        packets: list[bytes],
-    ) -> None:
-        if self._operation_lock.locked():
+        code: TuyaBLECode,
+        data: bytes,
+        response_to: int,
+        future: asyncio.Future | None,
+        priority: TuyaBLEPriority = TuyaBLEPriority.INTERACTIVE,
+    ) -> int:
+        """Send the frame in a slot of the priority, returns its sequence number."""
+        if self._scheduler.locked():
             _LOGGER.debug(
                 "%s: Operation already in progress, "
                 "waiting for it to complete; RSSI: %s",
                 self.address,
                 self.rssi,
             )
-        async with self._operation_lock:
+        async with self._scheduler.slot(priority, SCHEDULER_DEADLINES.get(priority)):
+            await self._flush_responses_locked()
+            # Numbered once its turn came, so frames leave in sequence order
+            seq_num = await self._get_seq_num()
+            if future:
+                self._input_expected_responses[seq_num] = future
+            if response_to > 0:
+                _LOGGER.debug(
+                    "%s: Sending packet: #%s %s in response to #%s",
+                    self.address,
+                    seq_num,
+                    code.name,
+                    response_to,
+                )
+            else:
+                _LOGGER.debug(
+                    "%s: Sending packet: #%s %s",
+                    self.address,
+                    seq_num,
+                    code.name,
+                )
+            packets = self._build_packets(seq_num, code, data, response_to)
+            if future:
+                self._watch_delivery(future, len(packets))
             try:
                 await self._send_packets_locked(packets)
+                return seq_num
             except BleakNotFoundError:
                 _LOGGER.error(
                     "%s: device not found, no longer in range, or poor RSSI: %s",
@@ -1050,6 +1616,7 @@ class TuyaBLEDevice:
                     self.rssi,
                     exc_info=True,
                 )
+                self._input_expected_responses.pop(seq_num, None)
                 raise
             except BLEAK_EXCEPTIONS:
                 _LOGGER.error(
@@ -1057,16 +1624,9 @@ class TuyaBLEDevice:
                     self.address,
                     exc_info=True,
                 )
+                self._input_expected_responses.pop(seq_num, None)
                 raise
 
-    async def _resend_packets(self, packets: list[bytes]) -> None:
-        if self._expected_disconnect:
-            return
-        await self._ensure_connected()
-        if self._expected_disconnect:
-            return
-        await self._int_send_packet_while_connected(packets)
-
     async def _send_packets_locked(self, packets: list[bytes]) -> None:
         """Send command to device and read response."""
         try:
@@ -1081,10 +1641,7 @@ class TuyaBLEDevice:
                 BLEAK_BACKOFF_TIME,
                 ex,
             )
-            if self._is_paired:
-                asyncio.create_task(self._resend_packets(packets))
-            else:
-                asyncio.create_task(self._reconnect())
+            self._connection.reconnect(self._reconnect)
             raise BleakError from ex
         except BleakError as ex:
             # Disconnect so we can reset state and try again
@@ -1094,22 +1651,32 @@ class TuyaBLEDevice:
                 self.rssi,
                 ex,
             )
-            if self._is_paired:
-                asyncio.create_task(self._resend_packets(packets))
-            else:
-                asyncio.create_task(self._reconnect())
+            self._connection.reconnect(self._reconnect)
             raise
 
     async def _int_send_packets_locked(self, packets: list[bytes]) -> None:
         """Execute command and read response."""
-        for packet in packets:
+        last = len(packets) - 1
+        if last > 0:
+            self._pacing.sent(len(packets))
+        batch = self._pacing.batch
+        gap = self._pacing.gap
+        for index, packet in enumerate(packets):
+            if gap and index and index % batch == 0:
+                await asyncio.sleep(gap)
             if self._client:
+                response = (
+                    index == last
+                    and index > 0
+                    and self._pacing.write_with_response
+                    and self._can_write_with_response()
+                )
                 try:
                     # _LOGGER.debug("%s: Sending packet: %s", self.address, packet.hex())
                     await self._client.write_gatt_char(
                         CHARACTERISTIC_WRITE,
                         packet,
-                        False,
+                        response,
                     )
                 except:
                     _LOGGER.error(
@@ -1128,13 +1695,15 @@ class TuyaBLEDevice:
                 )
                 raise BleakError()
 
-    def _get_key(self, security_flag: int) -> bytes:
-        if security_flag == 1:
-            return self._auth_key
-        if security_flag == 4:
-            return self._login_key
-        if security_flag == 5:
-            return self._session_key
+    def _can_write_with_response(self) -> bool:
+        characteristic = self._client.services.get_characteristic(CHARACTERISTIC_WRITE)
+        return characteristic is not None and "write" in characteristic.properties
+
+    def _get_cipher(self, security_flag: int) -> TuyaBLECipher:
+        cipher = self._crypto.get(security_flag)
+        if cipher is None:
+            raise TuyaBLEDataFormatError()
+        return cipher
 
     def _parse_timestamp(self, data: bytes, start_pos: int) -> tuple(float, int):
         timestamp: float
@@ -1167,11 +1736,9 @@ class TuyaBLEDevice:
         )
         return (timestamp, end_pos)
 
-    def _parse_datapoints_v3(
-        self, timestamp: float, flags: int, data: bytes, start_pos: int
-    ) -> int:
-        datapoints: list[TuyaBLEDataPoint] = []
-
+    def _iter_datapoints_v3(
+        self, data: bytes, start_pos: int
+    ) -> Iterator[tuple[int, TuyaBLEDataPointType, bytes | bool | int | str]]:
         pos = start_pos
         while len(data) - pos >= 4:
             id: int = data[pos]
@@ -1204,11 +1771,107 @@ class TuyaBLEDevice:
                 type.name,
                 value,
             )
-            self._datapoints._update_from_device(id, timestamp, flags, type, value)
-            datapoints.append(self._datapoints[id])
+            yield (id, type, value)
             pos = next_pos
 
-        self._fire_callbacks(datapoints)
+    def _parse_datapoints_v3(
+        self, timestamp: float, flags: int, data: bytes, start_pos: int
+    ) -> None:
+        # Collected only when somebody listens
+        datapoints: list[TuyaBLEDataPoint] | None = [] if self._callbacks else None
+
+        for id, type, value in self._iter_datapoints_v3(data, start_pos):
+            self._datapoints._update_from_device(id, timestamp, flags, type, value)
+            if datapoints is not None:
+                datapoints.append(self._datapoints[id])
+
+        if datapoints is not None:
+            self._fire_callbacks(datapoints)
+
+    def _parse_timed_datapoints_v3(
+        self, timestamp: float, flags: int, data: bytes, start_pos: int
+    ) -> None:
+        """Parse datapoints with a device timestamp, they may be historical.
+
+        Records that look historical are collected until their burst ended,
+        the newest one of each datapoint then becomes its value and the
+        others are passed to the history callbacks. The lag of the device
+        clock is learnt from single reports, not from bursts, and is bounded
+        by DATAPOINT_MAX_CLOCK_LAG, so a clock running late does not make
+        every later report historical and a burst of old records does not
+        make later ones live.
+        """
+        now = time.time()
+        if (
+            timestamp < DATAPOINT_MIN_TIMESTAMP
+            or timestamp > now + DATAPOINT_MAX_CLOCK_SKEW
+        ):
+            _LOGGER.debug("%s: Device clock is not set", self.address)
+            self._parse_datapoints_v3(now, flags, data, start_pos)
+        elif now - timestamp <= (self._clock_lag or 0) + DATAPOINT_HISTORICAL_AGE:
+            if not self._timed_records:
+                self._learn_clock_lag(now - timestamp)
+            self._parse_datapoints_v3(timestamp, flags, data, start_pos)
+        else:
+            for id, type, value in self._iter_datapoints_v3(data, start_pos):
+                self._timed_records.append(
+                    (TuyaBLEDataPointRecord(id, timestamp, type, value), flags)
+                )
+            self._timed_frames += 1
+            self._timed_received = now
+            if self._timed_records_flush is not None:
+                self._timed_records_flush.cancel()
+            self._timed_records_flush = asyncio.get_running_loop().call_later(
+                DATAPOINT_BURST_DELAY, self._flush_timed_records
+            )
+
+    def _learn_clock_lag(self, lag: float) -> None:
+        """Take the lag of a single report, a lesser one is more accurate."""
+        lag = max(lag, 0.0)
+        if lag > DATAPOINT_MAX_CLOCK_LAG:
+            return
+        if self._clock_lag is None or lag < self._clock_lag:
+            self._clock_lag = lag
+
+    def _flush_timed_records(self) -> None:
+        """Apply the newest record of each datapoint, pass on the others."""
+        self._timed_records_flush = None
+        timed_records, self._timed_records = self._timed_records, []
+        timed_frames, self._timed_frames = self._timed_frames, 0
+        newest: dict[int, tuple[TuyaBLEDataPointRecord, int]] = {}
+        for record, flags in timed_records:
+            latest = newest.get(record.id)
+            if latest is None or record.timestamp >= latest[0].timestamp:
+                newest[record.id] = (record, flags)
+        for id, (record, _) in list(newest.items()):
+            datapoint = self._datapoints[id]
+            # A value reported meanwhile is more recent, the record is history
+            if datapoint is not None and datapoint.timestamp > record.timestamp:
+                del newest[id]
+
+        history = [
+            record
+            for record, flags in timed_records
+            if newest.get(record.id, (None,))[0] is not record
+        ]
+        if history and self._history_callbacks:
+            self._fire_history_callbacks(history)
+
+        if timed_frames == 1 and timed_records:
+            # A lone report behind the device clock, not a burst of records
+            self._learn_clock_lag(
+                self._timed_received
+                - max(record.timestamp for record, _ in timed_records)
+            )
+
+        datapoints: list[TuyaBLEDataPoint] = []
+        for record, flags in newest.values():
+            self._datapoints._update_from_device(
+                record.id, record.timestamp, flags, record.type, record.value
+            )
+            datapoints.append(self._datapoints[record.id])
+        if datapoints and self._callbacks:
+            self._fire_callbacks(datapoints)
 
     def _handle_command_or_response(
         self, seq_num: int, response_to: int, code: TuyaBLECode, data: bytes
@@ -1231,6 +1894,8 @@ class TuyaBLEDevice:
                 srand = data[6:12]
                 self._session_key = hashlib.md5(self._local_key + srand).digest()
                 self._auth_key = data[14:46]
+                self._crypto.set_key(SECURITY_FLAG_SESSION, self._session_key)
+                self._crypto.set_key(SECURITY_FLAG_AUTH, self._auth_key)
 
             case TuyaBLECode.FUN_SENDER_PAIR:
                 if len(data) != 1:
@@ -1249,6 +1914,25 @@ class TuyaBLEDevice:
                     raise TuyaBLEDataLengthError()
                 result = data[0]
 
+            case TuyaBLECode.FUN_SENDER_OTA_START:
+                if len(data) < 9:
+                    raise TuyaBLEDataLengthError()
+                result = data[0]
+
+            case TuyaBLECode.FUN_SENDER_OTA_FILE:
+                if len(data) < 26:
+                    raise TuyaBLEDataLengthError()
+                result = data[1]
+
+            case TuyaBLECode.FUN_SENDER_OTA_OFFSET:
+                if len(data) < 5:
+                    raise TuyaBLEDataLengthError()
+
+            case TuyaBLECode.FUN_SENDER_OTA_UPGRADE | TuyaBLECode.FUN_SENDER_OTA_OVER:
+                if len(data) < 2:
+                    raise TuyaBLEDataLengthError()
+                result = data[1]
+
             case TuyaBLECode.FUN_RECEIVE_TIME1_REQ:
                 if len(data) != 0:
                     raise TuyaBLEDataLengthError()
@@ -1256,7 +1940,7 @@ class TuyaBLEDevice:
                 timestamp = int(time.time_ns() / 1000000)
                 timezone = -int(time.timezone / 36)
                 data = str(timestamp).encode() + pack(">h", timezone)
-                asyncio.create_task(self._send_response(code, data, seq_num))
+                self._queue_response(code, data, seq_num)
 
             case TuyaBLECode.FUN_RECEIVE_TIME2_REQ:
                 if len(data) != 0:
@@ -1275,39 +1959,57 @@ class TuyaBLEDevice:
                     time_str.tm_wday,
                     timezone,
                 )
-                asyncio.create_task(self._send_response(code, data, seq_num))
+                self._queue_response(code, data, seq_num)
 
             case TuyaBLECode.FUN_RECEIVE_DP:
                 self._parse_datapoints_v3(time.time(), 0, data, 0)
-                asyncio.create_task(self._send_response(code, bytes(0), seq_num))
+                self._queue_response(code, bytes(0), seq_num)
 
             case TuyaBLECode.FUN_RECEIVE_SIGN_DP:
                 dp_seq_num = int.from_bytes(data[:2], "big")
                 flags = data[2]
-                self._parse_datapoints_v3(time.time(), flags, data, 2)
+                if self._dp_seq_window.is_repeated(dp_seq_num):
+                    _LOGGER.debug(
+                        "%s: Acknowledging repeated report #%s",
+                        self.address,
+                        dp_seq_num,
+                    )
+                else:
+                    self._parse_datapoints_v3(time.time(), flags, data, 2)
+                    # Only once parsed, a report failing to parse is not
+                    # acknowledged and its copy is parsed again
+                    self._dp_seq_window.add(dp_seq_num)
                 data = pack(">HBB", dp_seq_num, flags, 0)
-                asyncio.create_task(self._send_response(code, data, seq_num))
+                self._queue_response(code, data, seq_num)
 
             case TuyaBLECode.FUN_RECEIVE_TIME_DP:
                 timestamp: float
                 pos: int
                 timestamp, pos = self._parse_timestamp(data, 0)
-                self._parse_datapoints_v3(timestamp, 0, data, pos)
-                asyncio.create_task(self._send_response(code, bytes(0), seq_num))
+                self._parse_timed_datapoints_v3(timestamp, 0, data, pos)
+                self._queue_response(code, bytes(0), seq_num)
 
             case TuyaBLECode.FUN_RECEIVE_SIGN_TIME_DP:
                 timestamp: float
                 pos: int
                 dp_seq_num = int.from_bytes(data[:2], "big")
                 flags = data[2]
-                timestamp, pos = self._parse_timestamp(data, 3)
-                self._parse_datapoints_v3(time.time(), flags, data, pos)
+                if self._dp_seq_window.is_repeated(dp_seq_num):
+                    _LOGGER.debug(
+                        "%s: Acknowledging repeated report #%s",
+                        self.address,
+                        dp_seq_num,
+                    )
+                else:
+                    timestamp, pos = self._parse_timestamp(data, 3)
+                    self._parse_timed_datapoints_v3(timestamp, flags, data, pos)
+                    self._dp_seq_window.add(dp_seq_num)
                 data = pack(">HBB", dp_seq_num, flags, 0)
-                asyncio.create_task(self._send_response(code, data, seq_num))
+                self._queue_response(code, data, seq_num)
 
         if response_to != 0:
             future = self._input_expected_responses.pop(response_to, None)
-            if future:
+            if future and not future.done():
                 _LOGGER.debug(
                     "%s: Received expected response to #%s, result: %s",
                     self.address,
@@ -1315,25 +2017,17 @@ class TuyaBLEDevice:
                     result,
                 )
                 if result == 0:
-                    future.set_result(result)
+                    future.set_result(data)
                 else:
                     future.set_exception(TuyaBLEDeviceError(result))
 
-    def _clean_input(self) -> None:
-        self._input_buffer = None
-        self._input_expected_packet_num = 0
-        self._input_expected_length = 0
+    def _parse_input(self, message: bytearray) -> None:
+        security_flag = message[0]
+        cipher = self._get_cipher(security_flag)
+        iv = message[1:17]
+        encrypted = message[17:]
 
-    def _parse_input(self) -> None:
-        security_flag = self._input_buffer[0]
-        key = self._get_key(security_flag)
-        iv = self._input_buffer[1:17]
-        encrypted = self._input_buffer[17:]
-
-        self._clean_input()
-
-        cipher = AES.new(key, AES.MODE_CBC, iv)
-        raw = cipher.decrypt(encrypted)
+        raw = cipher.decrypt(iv, encrypted)
 
         seq_num: int
         response_to: int
@@ -1390,62 +2084,23 @@ class TuyaBLEDevice:
     def _notification_handler(self, _sender: int, data: bytearray) -> None:
         """Handle notification responses."""
         _LOGGER.debug("%s: Packet received: %s", self.address, data.hex())
+        self._presence.seen()
+        self._heartbeat.received()
 
-        pos: int = 0
-        packet_num: int
-
-        packet_num, pos = self._unpack_int(data, pos)
-
-        if packet_num < self._input_expected_packet_num:
-            _LOGGER.error(
-                "%s: Unexpected packet (number %s) in notifications, " "expected %s",
-                self.address,
-                packet_num,
-                self._input_expected_packet_num,
-            )
-            self._clean_input()
-
-        if packet_num == self._input_expected_packet_num:
-            if packet_num == 0:
-                self._input_buffer = bytearray()
-                self._input_expected_length, pos = self._unpack_int(data, pos)
-                pos += 1
-            self._input_buffer += data[pos:]
-            self._input_expected_packet_num += 1
-        else:
-            _LOGGER.error(
-                "%s: Missing packet (number %s) in notifications, received %s",
-                self.address,
-                self._input_expected_packet_num,
-                packet_num,
-            )
-            self._clean_input()
+        message = self._reassembler.feed(data)
+        if message is None:
             return
-
-        if len(self._input_buffer) > self._input_expected_length:
+        try:
+            self._parse_input(message)
+        except TuyaBLEError as err:
             _LOGGER.error(
-                "%s: Unexpected length of data in notifications, "
-                "received %s expected %s",
+                "%s: Error parsing input: %s",
                 self.address,
-                len(self._input_buffer),
-                self._input_expected_length,
+                err,
+                exc_info=True,
             )
-            self._clean_input()
-            return
-        elif len(self._input_buffer) == self._input_expected_length:
-            try:
-                self._parse_input()
-            except TuyaBLEError as err:
-                _LOGGER.error(
-                    "%s: Error parsing input: %s",
-                    self.address,
-                    err,
-                    exc_info=True,
-                )
-                self._clean_input()
-                return
 
-    async def _send_datapoints_v3(self, datapoint_ids: list[int]) -> None:
+    async def _send_datapoints_v3(self, datapoint_ids: list[int]) -> bool:
         """Send new values of datapoints to the device."""
         data = bytearray()
         for dp_id in datapoint_ids:
@@ -1461,11 +2116,18 @@ class TuyaBLEDevice:
             data += pack(">BBB", dp.id, int(dp.type.value), len(value))
             data += value
 
-        await self._send_packet(TuyaBLECode.FUN_SENDER_DPS, data)
+        # Large payloads (e.g. fingerbot programs) must not delay user actions
+        priority = TuyaBLEPriority.INTERACTIVE
+        if len(data) > BULK_DATA_LENGTH:
+            priority = TuyaBLEPriority.BACKGROUND
+        return await self._send_packet(
+            TuyaBLECode.FUN_SENDER_DPS, data, priority=priority
+        )
 
-    async def _send_datapoints(self, datapoint_ids: list[int]) -> None:
+    async def _send_datapoints(self, datapoint_ids: list[int]) -> bool:
         """Send new values of datapoints to the device."""
+        self._fire_command_callbacks()
         if self._protocol_version == 3:
-            await self._send_datapoints_v3(datapoint_ids)
+            return await self._send_datapoints_v3(datapoint_ids)
         else:
             raise TuyaBLEDeviceError(0)
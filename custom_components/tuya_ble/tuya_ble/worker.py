@@ -0,0 +1,324 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from dataclasses import asdict
+import json
+import logging
+import os
+import sys
+from typing import Any
+
+from .const import WORKER_CALL_TIMEOUT, WORKER_STOP_TIMEOUT, TuyaBLEDataPointType
+from .exceptions import TuyaBLEError
+from .gateway import (
+    TuyaBLEGateway,
+    TuyaBLEStaticDeviceManager,
+    value_from_json,
+    value_to_json,
+)
+from .manager import AbstaractTuyaBLEDeviceManager, TuyaBLEDeviceCredentials
+from .ota import TuyaBLEFirmwareImage, TuyaBLEOTAProgress
+from .tuya_ble import TuyaBLEDataPoint, TuyaBLEDataPointRecord, TuyaBLEDevice
+
+_LOGGER = logging.getLogger(__name__)
+
+# Appended last, the platform modules must not shadow the standard library
+WORKER_CODE = """
+import sys
+sys.path.append({path!r})
+from tuya_ble.worker import serve_stdio
+serve_stdio({adapter!r})
+"""
+
+
+class TuyaBLEWorkerError(TuyaBLEError):
+    """Raised when a worker process failed to execute a request."""
+
+
+class TuyaBLERemoteDevice(TuyaBLEDevice):
+    """Device run by a worker process.
+
+    Credentials, functions and datapoints are kept here as for a device run
+    in this process, the connection and the protocol run in the worker.
+    Datapoints set here are sent to the worker and datapoints reported by
+    the worker update them, so entities use both kinds of devices alike.
+    """
+
+    def __init__(
+        self,
+        worker: TuyaBLEWorker,
+        device_manager: AbstaractTuyaBLEDeviceManager,
+        address: str,
+    ) -> None:
+        super().__init__(device_manager, address)
+        self._worker = worker
+        self._remote_connected = False
+
+    @property
+    def is_connected(self) -> bool:
+        return self._remote_connected
+
+    @property
+    def worker(self) -> TuyaBLEWorker:
+        return self._worker
+
+    async def initialize(self) -> None:
+        _LOGGER.debug(
+            "%s: Initializing in the worker of %s", self.address, self._worker.adapter
+        )
+        if await self._update_device_info():
+            await self._worker.add_device(self, self._device_info)
+
+    async def update(self) -> None:
+        _LOGGER.debug("%s: Updating", self.address)
+        await self._worker.call("update", address=self.address)
+
+    async def update_firmware(
+        self,
+        image: TuyaBLEFirmwareImage,
+        progress_callback: Callable[[TuyaBLEOTAProgress], None] | None = None,
+    ) -> None:
+        raise TuyaBLEWorkerError("Firmware updates are not run by worker processes")
+
+    def enable_heartbeat(self, enabled: bool) -> None:
+        # The worker keeps its connections on its own
+        self._heartbeat_enabled = enabled
+
+    async def stop(self) -> None:
+        _LOGGER.debug("%s: Stop", self.address)
+        await self._worker.remove_device(self)
+
+    async def _send_datapoints(self, datapoint_ids: list[int]) -> bool:
+        """Send new values of datapoints through the worker."""
+        self._fire_command_callbacks()
+        datapoints = []
+        for dp_id in datapoint_ids:
+            datapoint = self._datapoints[dp_id]
+            datapoints.append(
+                {
+                    "dp_id": datapoint.id,
+                    "type": datapoint.type.name,
+                    "value": value_to_json(datapoint.value),
+                }
+            )
+        return bool(
+            await self._worker.call("set", address=self.address, datapoints=datapoints)
+        )
+
+    def _update_datapoints(self, items: list[dict[str, Any]]) -> None:
+        datapoints: list[TuyaBLEDataPoint] = []
+        for item in items:
+            type = TuyaBLEDataPointType[item["type"]]
+            self._datapoints._update_from_device(
+                item["id"],
+                item["timestamp"],
+                0,
+                type,
+                value_from_json(type, item["value"]),
+            )
+            datapoints.append(self._datapoints[item["id"]])
+        self._fire_callbacks(datapoints)
+
+    def _update_history(self, items: list[dict[str, Any]]) -> None:
+        records: list[TuyaBLEDataPointRecord] = []
+        for item in items:
+            type = TuyaBLEDataPointType[item["type"]]
+            records.append(
+                TuyaBLEDataPointRecord(
+                    item["id"],
+                    item["timestamp"],
+                    type,
+                    value_from_json(type, item["value"]),
+                )
+            )
+        self._fire_history_callbacks(records)
+
+    def _set_connected(self, connected: bool, message: dict[str, Any]) -> None:
+        if connected:
+            self._device_version = message.get("device_version", "")
+            self._hardware_version = message.get("hardware_version", "")
+            self._protocol_version_str = message.get("protocol_version", "")
+        if connected == self._remote_connected:
+            return
+        self._remote_connected = connected
+        if connected:
+            self._fire_connected_callbacks()
+        else:
+            self._fire_disconnected_callbacks()
+
+
+class TuyaBLEWorker:
+    """Process running the protocol stack of the devices of one adapter.
+
+    Connections, encryption, reassembly and datapoint parsing happen in the
+    worker, only changed datapoints, connection events and command results
+    are sent back, as JSON lines over the standard streams of the process.
+
+    The worker scans and connects through its local adapter with bleak
+    itself, Home Assistant neither routes these connections nor counts
+    them against the connection slots of the adapter. Devices are connected
+    only when asked to, so the caller keeps the order and number of first
+    connections under control.
+    """
+
+    def __init__(self, adapter: str | None = None) -> None:
+        self._adapter = adapter
+        self._process: asyncio.subprocess.Process | None = None
+        self._reader: asyncio.Task | None = None
+        self._next_id = 1
+        self._pending: dict[int, asyncio.Future[Any]] = {}
+        self._devices: dict[str, TuyaBLERemoteDevice] = {}
+
+    @property
+    def adapter(self) -> str | None:
+        return self._adapter
+
+    @property
+    def is_running(self) -> bool:
+        return self._process is not None and self._process.returncode is None
+
+    async def start(self) -> None:
+        path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        self._process = await asyncio.create_subprocess_exec(
+            sys.executable,
+            "-c",
+            WORKER_CODE.format(path=path, adapter=self._adapter),
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+        )
+        self._reader = asyncio.create_task(self._read())
+        await self.call("subscribe")
+        _LOGGER.debug(
+            "Worker %s started for adapter %s", self._process.pid, self._adapter
+        )
+
+    async def stop(self) -> None:
+        if self._process is None:
+            return
+        # The worker stops its devices when its input is closed
+        self._process.stdin.close()
+        try:
+            await asyncio.wait_for(self._process.wait(), WORKER_STOP_TIMEOUT)
+        except asyncio.TimeoutError:
+            self._process.kill()
+            await self._process.wait()
+        if self._reader is not None:
+            await self._reader
+            self._reader = None
+        self._process = None
+
+    @property
+    def devices(self) -> dict[str, TuyaBLERemoteDevice]:
+        return self._devices
+
+    async def add_device(
+        self, device: TuyaBLERemoteDevice, credentials: TuyaBLEDeviceCredentials
+    ) -> None:
+        """Run the device in the worker."""
+        address = device.address.upper()
+        self._devices[address] = device
+        await self.call("add", address=address, credentials=asdict(credentials))
+
+    async def remove_device(self, device: TuyaBLERemoteDevice) -> None:
+        """Stop the device in the worker."""
+        address = device.address.upper()
+        if self._devices.get(address) is not device:
+            return
+        del self._devices[address]
+        device._set_connected(False, {})
+        if not self.is_running:
+            return
+        try:
+            await self.call("remove", address=address)
+        except TuyaBLEWorkerError as error:
+            # The worker may be stopping as well
+            _LOGGER.debug("%s: Not removed from the worker: %s", address, error)
+
+    async def call(self, method: str, **params: Any) -> Any:
+        """Execute a request in the worker and return its result."""
+        if not self.is_running:
+            raise TuyaBLEWorkerError(f"Worker for {self._adapter} is not running")
+        request_id = self._next_id
+        self._next_id += 1
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        request = {"id": request_id, "method": method, **params}
+        self._process.stdin.write(json.dumps(request).encode() + b"\n")
+        try:
+            await self._process.stdin.drain()
+            return await asyncio.wait_for(future, WORKER_CALL_TIMEOUT)
+        finally:
+            self._pending.pop(request_id, None)
+
+    async def _read(self) -> None:
+        try:
+            while line := await self._process.stdout.readline():
+                try:
+                    self._handle_message(json.loads(line))
+                except (KeyError, TypeError, ValueError):
+                    _LOGGER.warning("Malformed message from worker: %s", line)
+        finally:
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(
+                        TuyaBLEWorkerError(f"Worker for {self._adapter} exited")
+                    )
+            for device in list(self._devices.values()):
+                device._set_connected(False, {})
+
+    def _handle_message(self, message: dict[str, Any]) -> None:
+        event = message.get("event")
+        if event is None:
+            future = self._pending.get(message["id"])
+            if future is None or future.done():
+                return
+            if "error" in message:
+                future.set_exception(TuyaBLEWorkerError(message["error"]))
+            else:
+                future.set_result(message["result"])
+            return
+
+        device = self._devices.get(message["address"])
+        if device is None:
+            return
+        match event:
+            case "datapoints":
+                device._update_datapoints(message["datapoints"])
+            case "history":
+                device._update_history(message["records"])
+            case "connected":
+                device._set_connected(True, message)
+            case "disconnected":
+                device._set_connected(False, message)
+
+
+async def _serve_stdio(adapter: str | None) -> None:
+    loop = asyncio.get_running_loop()
+    reader = asyncio.StreamReader()
+    await loop.connect_read_pipe(
+        lambda: asyncio.StreamReaderProtocol(reader), sys.stdin
+    )
+    transport, protocol = await loop.connect_write_pipe(
+        asyncio.streams.FlowControlMixin, sys.stdout
+    )
+    writer = asyncio.StreamWriter(transport, protocol, reader, loop)
+
+    gateway = TuyaBLEGateway(
+        TuyaBLEStaticDeviceManager(),
+        adapters=[adapter] if adapter else None,
+        autostart=False,
+    )
+    await gateway.start()
+    try:
+        await gateway.serve(reader, writer)
+    finally:
+        await gateway.stop()
+
+
+def serve_stdio(adapter: str | None) -> None:
+    """Entry point of the worker process."""
+    logging.basicConfig(
+        level=logging.INFO, format=f"worker {adapter}: %(levelname)s %(message)s"
+    )
+    asyncio.run(_serve_stdio(adapter))
@@ -0,0 +1,181 @@
+"""The Tuya BLE integration."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+import logging
+import os
+from typing import Any
+
+from homeassistant.components.update import (
+    UpdateDeviceClass,
+    UpdateEntity,
+    UpdateEntityDescription,
+    UpdateEntityFeature,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.entity import EntityCategory
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+from .const import DOMAIN, FIRMWARE_DIRECTORY, FIRMWARE_SCAN_INTERVAL
+from .devices import TuyaBLEData, TuyaBLEEntity, TuyaBLEProductInfo
+from .tuya_ble import TuyaBLEDevice, TuyaBLEFirmwareImage, TuyaBLEOTAProgress
+from .tuya_ble.exceptions import TuyaBLEError
+from .tuya_ble.ota import parse_firmware_version
+
+_LOGGER = logging.getLogger(__name__)
+
+SCAN_INTERVAL = timedelta(seconds=FIRMWARE_SCAN_INTERVAL)
+
+
+def _version_key(version: str) -> tuple[int, ...]:
+    try:
+        return tuple(int(part) for part in version.split("."))
+    except ValueError:
+        return ()
+
+
+def find_firmware(directory: str, product_id: str) -> tuple[str, str] | None:
+    """Find the newest firmware file named <product_id>_<version>.bin"""
+    result: tuple[str, str] | None = None
+    if not product_id or not os.path.isdir(directory):
+        return None
+    prefix = f"{product_id}_"
+    for name in os.listdir(directory):
+        if not name.startswith(prefix) or not name.endswith(".bin"):
+            continue
+        version = name[len(prefix) : -len(".bin")]
+        # Only versions the OTA protocol can carry
+        try:
+            parse_firmware_version(version)
+        except ValueError:
+            _LOGGER.debug("Firmware file %s has an unsupported version", name)
+            continue
+        if result is None or _version_key(version) > _version_key(result[1]):
+            result = (os.path.join(directory, name), version)
+    return result
+
+
+class TuyaBLEUpdate(TuyaBLEEntity, UpdateEntity):
+    """Firmware update of a Tuya BLE device from a local file."""
+
+    _attr_supported_features = (
+        UpdateEntityFeature.INSTALL | UpdateEntityFeature.PROGRESS
+    )
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        coordinator: DataUpdateCoordinator,
+        device: TuyaBLEDevice,
+        product: TuyaBLEProductInfo,
+    ) -> None:
+        super().__init__(
+            hass,
+            coordinator,
+            device,
+            product,
+            UpdateEntityDescription(
+                key="firmware",
+                device_class=UpdateDeviceClass.FIRMWARE,
+                entity_category=EntityCategory.CONFIG,
+            ),
+        )
+        self._firmware: tuple[str, str] | None = None
+        self._progress: TuyaBLEOTAProgress | None = None
+
+    @property
+    def should_poll(self) -> bool:
+        """Poll to find newly added firmware files."""
+        return True
+
+    async def async_update(self) -> None:
+        """Look for firmware file of this product."""
+        self._firmware = await self._hass.async_add_executor_job(
+            find_firmware,
+            self._hass.config.path(FIRMWARE_DIRECTORY),
+            self._device.product_id,
+        )
+
+    @property
+    def installed_version(self) -> str | None:
+        return self._device.device_version or None
+
+    @property
+    def latest_version(self) -> str | None:
+        installed = self.installed_version
+        if self._firmware and installed:
+            if _version_key(self._firmware[1]) > _version_key(installed):
+                return self._firmware[1]
+        return installed
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        if self._progress is None:
+            return None
+        return {
+            "throughput": round(self._progress.throughput),
+            "eta": round(self._progress.eta) if self._progress.eta else None,
+        }
+
+    @callback
+    def _handle_progress(self, progress: TuyaBLEOTAProgress) -> None:
+        self._progress = progress
+        self._attr_update_percentage = int(progress.percent)
+        self.async_write_ha_state()
+
+    async def async_install(
+        self, version: str | None, backup: bool, **kwargs: Any
+    ) -> None:
+        """Stream the firmware file to the device."""
+        await self.async_update()
+        if self._firmware is None or (version and version != self._firmware[1]):
+            raise HomeAssistantError(f"Firmware file {version} not found")
+
+        path, version = self._firmware
+        try:
+            image = await self._hass.async_add_executor_job(
+                TuyaBLEFirmwareImage.from_file, path, version
+            )
+        except (OSError, ValueError) as ex:
+            raise HomeAssistantError(
+                f"Firmware file {os.path.basename(path)} is not usable: {ex}"
+            ) from ex
+        self._attr_in_progress = True
+        self._attr_update_percentage = 0
+        self.async_write_ha_state()
+        try:
+            await self._device.update_firmware(image, self._handle_progress)
+        except TuyaBLEError as ex:
+            raise HomeAssistantError(str(ex)) from ex
+        finally:
+            self._attr_in_progress = False
+            self._attr_update_percentage = None
+            self._progress = None
+            self.async_write_ha_state()
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the Tuya BLE firmware update."""
+    data: TuyaBLEData = hass.data[DOMAIN][entry.entry_id]
+    if data.worker is not None:
+        # Worker processes do not run firmware updates
+        return
+    async_add_entities(
+        [
+            TuyaBLEUpdate(
+                hass,
+                data.coordinator,
+                data.device,
+                data.product,
+            )
+        ],
+        True,
+    )
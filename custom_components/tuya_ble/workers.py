@@ -0,0 +1,80 @@
+"""The Tuya BLE integration."""
+
+from __future__ import annotations
+
+import asyncio
+
+from homeassistant.components import bluetooth
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import Event, HomeAssistant, callback
+
+from .const import DOMAIN
+from .tuya_ble.worker import TuyaBLEWorker
+
+DATA_WORKERS = f"{DOMAIN}_workers"
+
+
+class TuyaBLEWorkers:
+    """Worker processes shared by the devices reached through one adapter.
+
+    A worker is started with its first device and stopped once it runs no
+    device anymore, or when Home Assistant stops.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._hass = hass
+        self._workers: dict[str, TuyaBLEWorker] = {}
+        self._lock = asyncio.Lock()
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, self._async_stop)
+
+    @callback
+    def async_adapter(self, address: str) -> str | None:
+        """Local adapter that hears the device best, None when none heard it.
+
+        Workers connect through local adapters only, Bluetooth proxies are
+        reachable through Home Assistant alone.
+        """
+        local = [
+            scanner_device
+            for scanner_device in bluetooth.async_scanner_devices_by_address(
+                self._hass, address, True
+            )
+            if not isinstance(scanner_device.scanner, bluetooth.BaseHaRemoteScanner)
+        ]
+        if not local:
+            return None
+        best = max(local, key=lambda scanner_device: scanner_device.advertisement.rssi)
+        return best.scanner.adapter
+
+    async def async_get(self, adapter: str) -> TuyaBLEWorker:
+        """Worker of the adapter, started when it is not running."""
+        async with self._lock:
+            worker = self._workers.get(adapter)
+            if worker is None or not worker.is_running:
+                worker = TuyaBLEWorker(adapter)
+                await worker.start()
+                self._workers[adapter] = worker
+            return worker
+
+    async def async_release(self, worker: TuyaBLEWorker) -> None:
+        """Stop the worker when it runs no device anymore."""
+        async with self._lock:
+            if worker.devices:
+                return
+            if self._workers.get(worker.adapter) is worker:
+                del self._workers[worker.adapter]
+            await worker.stop()
+
+    async def _async_stop(self, event: Event) -> None:
+        async with self._lock:
+            for worker in self._workers.values():
+                await worker.stop()
+            self._workers.clear()
+
+
+@callback
+def async_get_workers(hass: HomeAssistant) -> TuyaBLEWorkers:
+    """Worker processes of the integration."""
+    if DATA_WORKERS not in hass.data:
+        hass.data[DATA_WORKERS] = TuyaBLEWorkers(hass)
+    return hass.data[DATA_WORKERS]
@@ -0,0 +1,93 @@
+"""Compare frame encryption with a new CBC cipher per frame and cached ciphers.
+
+Usage: python scripts/bench_crypto.py [frames]
+
+The second table compares chaining blocks on the cached ECB cipher with a
+new CBC cipher by payload length, CHAIN_MAX_BLOCKS should be the longest
+payload for which chaining is clearly faster.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import time
+
+from Crypto.Cipher import AES
+
+INTEGRATION_PATH = os.path.join(
+    os.path.dirname(__file__), "..", "custom_components", "tuya_ble"
+)
+
+# Payload sizes of a status request, a single datapoint, several datapoints
+# and a fingerbot program
+FRAME_SIZES = (16, 32, 48, 128)
+CHAIN_BLOCKS = range(1, 9)
+# Speedup of chaining over a new CBC cipher that is clearly faster
+CHAIN_MIN_SPEEDUP = 1.1
+
+
+def _rate(frames: int, func) -> float:
+    started = time.perf_counter()
+    for _ in range(frames):
+        func()
+    return frames / (time.perf_counter() - started)
+
+
+def main() -> None:
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    # Appended last, the platform modules must not shadow the standard library
+    sys.path.append(INTEGRATION_PATH)
+    from tuya_ble.crypto import BLOCK_SIZE, CHAIN_MAX_BLOCKS, TuyaBLECipher
+
+    key = os.urandom(16)
+    iv = os.urandom(16)
+    cipher = TuyaBLECipher(key)
+
+    print(f"{'bytes':>6} {'op':>8} {'per frame':>12} {'cached':>12} {'ratio':>6}")
+    for size in FRAME_SIZES:
+        data = os.urandom(size)
+        encrypted = AES.new(key, AES.MODE_CBC, iv).encrypt(data)
+        assert cipher.encrypt(iv, data) == encrypted
+        assert cipher.decrypt(iv, encrypted) == data
+
+        for name, baseline, cached in (
+            (
+                "encrypt",
+                lambda: AES.new(key, AES.MODE_CBC, iv).encrypt(data),
+                lambda: cipher.encrypt(iv, data),
+            ),
+            (
+                "decrypt",
+                lambda: AES.new(key, AES.MODE_CBC, iv).decrypt(encrypted),
+                lambda: cipher.decrypt(iv, encrypted),
+            ),
+        ):
+            before = _rate(frames, baseline)
+            after = _rate(frames, cached)
+            print(
+                f"{size:>6} {name:>8} {before:>10.0f}/s {after:>10.0f}/s"
+                f" {after / before:>5.2f}x"
+            )
+
+    print()
+    print(f"{'blocks':>6} {'new CBC':>12} {'chained':>12} {'ratio':>6}")
+    fastest = 0
+    for blocks in CHAIN_BLOCKS:
+        data = os.urandom(blocks * BLOCK_SIZE)
+        assert cipher._encrypt_chained(iv, data) == (
+            AES.new(key, AES.MODE_CBC, iv).encrypt(data)
+        )
+        before = _rate(frames, lambda: AES.new(key, AES.MODE_CBC, iv).encrypt(data))
+        after = _rate(frames, lambda: cipher._encrypt_chained(iv, data))
+        if after > before * CHAIN_MIN_SPEEDUP and fastest == blocks - 1:
+            fastest = blocks
+        print(f"{blocks:>6} {before:>10.0f}/s {after:>10.0f}/s {after / before:>5.2f}x")
+    print(
+        f"Chaining is faster up to {fastest} blocks,"
+        f" CHAIN_MAX_BLOCKS is {CHAIN_MAX_BLOCKS}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""Print the import time of a module and the modules it pulls in.
+
+Usage: python scripts/profile_imports.py [module] [--top N] [--budget SECONDS]
+
+The default module is the tuya_ble protocol package, imported standalone
+without Home Assistant. Pass custom_components.tuya_ble or one of its
+platforms to profile the integration in a Home Assistant environment.
+With --budget the exit status is 1 when the import takes longer, the
+tests check the default module against IMPORT_BUDGET.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import subprocess
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+INTEGRATION_PATH = os.path.join(ROOT, "custom_components", "tuya_ble")
+
+# Seconds the standalone protocol package may take to import
+IMPORT_BUDGET = 0.5
+
+# Appended last, the platform modules must not shadow the standard library
+IMPORT_CODE = """
+import sys
+sys.path.append({path!r})
+import {module}
+"""
+
+
+def profile(module: str) -> list[tuple[str, int, int]]:
+    """(module, self us, cumulative us) in import order."""
+    path = ROOT if module.startswith("custom_components") else INTEGRATION_PATH
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            IMPORT_CODE.format(path=path, module=module),
+        ],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+
+    entries: list[tuple[str, int, int]] = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:") :].split("|")
+        if not fields[0].strip().isdigit():
+            continue
+        entries.append((fields[2].strip(), int(fields[0]), int(fields[1])))
+    return entries
+
+
+def total_time(entries: list[tuple[str, int, int]]) -> float:
+    """Seconds spent importing all modules."""
+    return sum(self_us for _, self_us, _ in entries) / 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("module", nargs="?", default="tuya_ble")
+    parser.add_argument("--top", type=int, default=25)
+    parser.add_argument("--budget", type=float)
+    args = parser.parse_args()
+
+    try:
+        entries = profile(args.module)
+    except RuntimeError as error:
+        sys.exit(str(error))
+    total = total_time(entries)
+
+    print(f"{'self':>10} {'cumulative':>12}  module")
+    for name, self_us, cumulative_us in sorted(
+        entries, key=lambda entry: entry[1], reverse=True
+    )[: args.top]:
+        print(f"{self_us / 1e3:>8.1f}ms {cumulative_us / 1e3:>10.1f}ms  {name}")
+    print(f"{len(entries)} modules imported in {total:.3f}s")
+
+    if args.budget is not None and total > args.budget:
+        print(f"Import budget of {args.budget:.3f}s exceeded")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
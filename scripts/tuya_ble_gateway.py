@@ -0,0 +1,20 @@
+"""Run the Tuya BLE gateway without Home Assistant.
+
+Usage: python scripts/tuya_ble_gateway.py --credentials devices.json
+    --socket /run/tuya_ble.sock [--adapter hci0 ...] [--verbose]
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+
+# Appended last, the platform modules must not shadow the standard library
+sys.path.append(
+    os.path.join(os.path.dirname(__file__), "..", "custom_components", "tuya_ble")
+)
+
+from tuya_ble.gateway import main  # noqa: E402
+
+if __name__ == "__main__":
+    main()
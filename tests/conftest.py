@@ -0,0 +1,9 @@
+"""Make the tuya_ble protocol package importable without Home Assistant."""
+
+import os
+import sys
+
+# Appended last, the platform modules must not shadow the standard library
+sys.path.append(
+    os.path.join(os.path.dirname(__file__), "..", "custom_components", "tuya_ble")
+)
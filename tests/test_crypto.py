@@ -0,0 +1,33 @@
+"""Known-answer tests of the cached ciphers against pycryptodome CBC."""
+
+from __future__ import annotations
+
+from Crypto.Cipher import AES
+import pytest
+
+from tuya_ble.const import SECURITY_FLAG_SESSION
+from tuya_ble.crypto import BLOCK_SIZE, TuyaBLECryptoContext
+
+KEY = bytes(range(16))
+IV = bytes(range(16, 32))
+
+
+@pytest.mark.parametrize("blocks", [1, 3, 4, 8])
+def test_matches_cbc(blocks: int) -> None:
+    context = TuyaBLECryptoContext()
+    context.set_key(SECURITY_FLAG_SESSION, KEY)
+    cipher = context.get(SECURITY_FLAG_SESSION)
+    data = bytes(i * 7 % 256 for i in range(blocks * BLOCK_SIZE))
+    encrypted = AES.new(KEY, AES.MODE_CBC, IV).encrypt(data)
+    assert cipher.encrypt(IV, data) == encrypted
+    assert cipher.decrypt(IV, encrypted) == data
+    # Repeated use of the cached cipher does not carry state over
+    assert cipher.encrypt(IV, data) == encrypted
+    assert cipher.decrypt(IV, encrypted) == data
+
+
+def test_key_removed() -> None:
+    context = TuyaBLECryptoContext()
+    context.set_key(SECURITY_FLAG_SESSION, KEY)
+    context.set_key(SECURITY_FLAG_SESSION, None)
+    assert context.get(SECURITY_FLAG_SESSION) is None
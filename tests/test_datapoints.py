@@ -0,0 +1,79 @@
+"""Tests of the datapoint table and its views."""
+
+from __future__ import annotations
+
+import asyncio
+
+from tuya_ble.const import TuyaBLEDataPointType
+from tuya_ble.tuya_ble import TuyaBLEDataPoints
+
+
+class Owner:
+    """Device side of the table, recording the datapoints sent."""
+
+    def __init__(self) -> None:
+        self.sent: list[list[int]] = []
+
+    async def _send_datapoints(self, datapoint_ids: list[int]) -> bool:
+        self.sent.append(datapoint_ids)
+        return True
+
+
+def test_views_follow_the_table() -> None:
+    datapoints = TuyaBLEDataPoints(Owner())
+    assert datapoints[1] is None
+    datapoints._update_from_device(1, 10.0, 0, TuyaBLEDataPointType.DT_VALUE, 5)
+    view = datapoints[1]
+    assert (view.id, view.timestamp, view.type, view.value) == (
+        1,
+        10.0,
+        TuyaBLEDataPointType.DT_VALUE,
+        5,
+    )
+    assert not view.changed_by_device
+
+    datapoints._update_from_device(1, 20.0, 0, TuyaBLEDataPointType.DT_VALUE, 6)
+    assert view.value == 6
+    assert view.timestamp == 20.0
+    assert view.changed_by_device
+    datapoints._update_from_device(1, 30.0, 0, TuyaBLEDataPointType.DT_VALUE, 6)
+    assert not view.changed_by_device
+
+    assert len(datapoints) == 1
+    assert datapoints.has_id(1, TuyaBLEDataPointType.DT_VALUE)
+    assert not datapoints.has_id(1, TuyaBLEDataPointType.DT_BOOL)
+    assert list(datapoints.__dict__()) == [1]
+
+
+def test_get_or_create_keeps_existing_row() -> None:
+    datapoints = TuyaBLEDataPoints(Owner())
+    created = datapoints.get_or_create(2, TuyaBLEDataPointType.DT_BOOL, False)
+    assert created.value is False
+    datapoints._update_from_device(2, 10.0, 0, TuyaBLEDataPointType.DT_BOOL, True)
+    assert datapoints.get_or_create(2, TuyaBLEDataPointType.DT_BOOL).value is True
+    assert created.value is True
+    assert len(datapoints) == 1
+
+
+def test_set_value_sends_converted_value() -> None:
+    owner = Owner()
+    datapoints = TuyaBLEDataPoints(owner)
+    datapoint = datapoints.get_or_create(3, TuyaBLEDataPointType.DT_VALUE, 0)
+
+    async def run() -> None:
+        assert await datapoint.set_value("42") is True
+        assert datapoint.value == 42
+        assert datapoint._get_value() == b"\x00\x00\x00\x2a"
+        assert owner.sent == [[3]]
+
+        # Batched values are sent once by end_update
+        other = datapoints.get_or_create(4, TuyaBLEDataPointType.DT_ENUM, 0)
+        datapoints.begin_update()
+        assert await datapoint.set_value(1) is None
+        assert await other.set_value(2) is None
+        assert await datapoint.set_value(3) is None
+        assert owner.sent == [[3]]
+        assert await datapoints.end_update() is True
+        assert owner.sent == [[3], [4, 3]]
+
+    asyncio.run(run())
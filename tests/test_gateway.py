@@ -0,0 +1,291 @@
+"""End-to-end test of the gateway against a fake peripheral."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+import hashlib
+import json
+import os
+import secrets
+from struct import pack, unpack
+import tempfile
+from unittest.mock import ANY
+
+from bleak.backends.device import BLEDevice
+from bleak.backends.scanner import AdvertisementData
+
+from tuya_ble.const import (
+    GATT_MTU,
+    SECURITY_FLAG_LOGIN,
+    SECURITY_FLAG_SESSION,
+    TuyaBLECode,
+    TuyaBLEDataPointType,
+)
+from tuya_ble.crypto import TuyaBLECryptoContext
+from tuya_ble.gateway import TuyaBLEGateway, TuyaBLEStaticDeviceManager
+from tuya_ble.reassembler import TuyaBLEReassembler
+from tuya_ble.tuya_ble import TuyaBLEDevice
+
+ADDRESS = "AA:BB:CC:DD:EE:FF"
+CREDENTIALS = {
+    "uuid": "tuya0123456789ab",
+    "local_key": "0123456789abcdef",
+    "device_id": "bf0123456789abcdef",
+    "category": "kg",
+    "product_id": "fakeprod",
+}
+TIMEOUT = 10
+
+
+class FakePeripheral:
+    """Tuya BLE device speaking protocol version 3 over a fake GATT link.
+
+    It has the BleakClient methods the device uses, answers the device
+    info, pairing, status and datapoint commands, and reports its
+    datapoints after a status request or a change.
+    """
+
+    def __init__(self) -> None:
+        self._local_key = CREDENTIALS["local_key"][:6].encode()
+        self._crypto = TuyaBLECryptoContext()
+        self._crypto.set_key(SECURITY_FLAG_LOGIN, hashlib.md5(self._local_key).digest())
+        self._reassembler = TuyaBLEReassembler("fake")
+        self._notify: Callable[[int, bytearray], None] | None = None
+        self._seq_num = 1
+        self.is_connected = False
+        self.paired = False
+        self.datapoints: dict[int, tuple[int, bytes]] = {
+            1: (TuyaBLEDataPointType.DT_BOOL.value, b"\x00"),
+        }
+
+    async def connect(
+        self,
+        ble_device: BLEDevice,
+        disconnected_callback: Callable[[FakePeripheral], None],
+    ) -> FakePeripheral:
+        assert ble_device.address == ADDRESS
+        self._reassembler.reset()
+        self.is_connected = True
+        return self
+
+    async def start_notify(
+        self, _characteristic: str, callback: Callable[[int, bytearray], None]
+    ) -> None:
+        self._notify = callback
+
+    async def stop_notify(self, _characteristic: str) -> None:
+        self._notify = None
+
+    async def disconnect(self) -> None:
+        self.is_connected = False
+
+    async def write_gatt_char(
+        self, _characteristic: str, data: bytes, response: bool = False
+    ) -> None:
+        assert self.is_connected
+        message = self._reassembler.feed(bytes(data))
+        if message is not None:
+            self._handle(message)
+
+    def _handle(self, message: bytearray) -> None:
+        security_flag = message[0]
+        raw = self._crypto.get(security_flag).decrypt(message[1:17], message[17:])
+        seq_num, _, code, length = unpack(">IIHH", raw[:12])
+        data = bytes(raw[12 : 12 + length])
+        match TuyaBLECode(code):
+            case TuyaBLECode.FUN_SENDER_DEVICE_INFO:
+                srand = secrets.token_bytes(6)
+                info = bytes([1, 2, 3, 0, 0, 1]) + srand + bytes([4, 5])
+                self._send(
+                    TuyaBLECode.FUN_SENDER_DEVICE_INFO,
+                    info + secrets.token_bytes(32),
+                    seq_num,
+                    SECURITY_FLAG_LOGIN,
+                )
+                self._crypto.set_key(
+                    SECURITY_FLAG_SESSION,
+                    hashlib.md5(self._local_key + srand).digest(),
+                )
+            case TuyaBLECode.FUN_SENDER_PAIR:
+                assert data[:16] == CREDENTIALS["uuid"].encode()
+                self.paired = True
+                self._send(TuyaBLECode.FUN_SENDER_PAIR, b"\x00", seq_num)
+            case TuyaBLECode.FUN_SENDER_DEVICE_STATUS:
+                self._send(TuyaBLECode.FUN_SENDER_DEVICE_STATUS, b"\x00", seq_num)
+                self._report(list(self.datapoints))
+            case TuyaBLECode.FUN_SENDER_DPS:
+                changed = []
+                pos = 0
+                while pos < len(data):
+                    dp_id, dp_type, dp_length = data[pos : pos + 3]
+                    value = data[pos + 3 : pos + 3 + dp_length]
+                    self.datapoints[dp_id] = (dp_type, value)
+                    changed.append(dp_id)
+                    pos += 3 + dp_length
+                self._send(TuyaBLECode.FUN_SENDER_DPS, b"\x00", seq_num)
+                self._report(changed)
+
+    def _report(self, dp_ids: list[int]) -> None:
+        data = b""
+        for dp_id in dp_ids:
+            dp_type, value = self.datapoints[dp_id]
+            data += pack(">BBB", dp_id, dp_type, len(value)) + value
+        self._send(TuyaBLECode.FUN_RECEIVE_DP, data, 0)
+
+    def _send(
+        self,
+        code: TuyaBLECode,
+        data: bytes,
+        response_to: int,
+        security_flag: int = SECURITY_FLAG_SESSION,
+    ) -> None:
+        seq_num = self._seq_num
+        self._seq_num += 1
+        raw = pack(">IIHH", seq_num, response_to, code.value, len(data)) + data
+        raw += pack(">H", TuyaBLEDevice._calc_crc16(raw))
+        raw += bytes(-len(raw) % 16)
+        iv = secrets.token_bytes(16)
+        encrypted = (
+            bytes([security_flag])
+            + iv
+            + self._crypto.get(security_flag).encrypt(iv, raw)
+        )
+        pos = 0
+        packet_num = 0
+        while pos < len(encrypted):
+            packet = TuyaBLEDevice._pack_int(packet_num)
+            if packet_num == 0:
+                packet += TuyaBLEDevice._pack_int(len(encrypted))
+                packet += bytes([3 << 4])
+            part = encrypted[pos : pos + GATT_MTU - len(packet)]
+            packet += part
+            pos += len(part)
+            packet_num += 1
+            # Notifications arrive from the event loop, as from bleak
+            asyncio.get_running_loop().call_soon(self._notify, 0, bytearray(packet))
+
+
+class FakeScanner:
+    """Scanner hearing the fake peripheral once it is started."""
+
+    def __init__(
+        self,
+        detection_callback: Callable[[BLEDevice, AdvertisementData], None],
+        adapter: str | None,
+    ) -> None:
+        self._detection_callback = detection_callback
+
+    async def start(self) -> None:
+        advertisement = AdvertisementData(
+            local_name="fake",
+            manufacturer_data={},
+            service_data={},
+            service_uuids=[],
+            tx_power=None,
+            rssi=-60,
+            platform_data=(),
+        )
+        asyncio.get_running_loop().call_soon(
+            self._detection_callback,
+            BLEDevice(ADDRESS, "fake", None),
+            advertisement,
+        )
+
+    async def stop(self) -> None:
+        pass
+
+
+class GatewayConnection:
+    """Client of the gateway socket collecting replies and events."""
+
+    def __init__(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self._reader = reader
+        self._writer = writer
+        self._next_id = 1
+        self.events: list[dict] = []
+
+    async def call(self, method: str, **params) -> object:
+        request_id = self._next_id
+        self._next_id += 1
+        request = {"id": request_id, "method": method, **params}
+        self._writer.write(json.dumps(request).encode() + b"\n")
+        await self._writer.drain()
+        while True:
+            message = await self._read()
+            if message.get("id") == request_id:
+                assert "error" not in message, message["error"]
+                return message["result"]
+
+    async def wait_event(
+        self, event: str, match: Callable[[dict], bool] = lambda _: True
+    ) -> dict:
+        while True:
+            for message in self.events:
+                if message["event"] == event and match(message):
+                    self.events.remove(message)
+                    return message
+            await self._read()
+
+    async def _read(self) -> dict:
+        line = await asyncio.wait_for(self._reader.readline(), TIMEOUT)
+        message = json.loads(line)
+        if "event" in message:
+            self.events.append(message)
+        return message
+
+
+async def _run_gateway(socket_path: str) -> None:
+    manager = TuyaBLEStaticDeviceManager()
+    manager.add(ADDRESS, CREDENTIALS)
+    peripheral = FakePeripheral()
+    gateway = TuyaBLEGateway(
+        manager,
+        socket_path,
+        scanner_factory=FakeScanner,
+        client_factory=peripheral.connect,
+    )
+    await gateway.start()
+    try:
+        connection = GatewayConnection(*await asyncio.open_unix_connection(socket_path))
+        await connection.call("subscribe")
+
+        connected = await connection.wait_event("connected")
+        assert connected["address"] == ADDRESS
+        assert connected["device_version"] == "1.2"
+        assert connected["protocol_version"] == "3.0"
+        assert peripheral.paired
+
+        # Reported after the status request of the gateway
+        report = await connection.wait_event("datapoints")
+        assert report["datapoints"] == [
+            {"id": 1, "type": "DT_BOOL", "value": False, "timestamp": ANY}
+        ]
+
+        assert await connection.call(
+            "set", address=ADDRESS, dp_id=1, type="DT_BOOL", value=True
+        )
+        assert peripheral.datapoints[1] == (TuyaBLEDataPointType.DT_BOOL.value, b"\x01")
+        # Reported by the peripheral once changed
+        await connection.wait_event(
+            "datapoints", lambda event: event["datapoints"][0]["value"] is True
+        )
+
+        # The status reported again is unchanged and not sent
+        await connection.call("update", address=ADDRESS)
+        devices = await connection.call("list")
+        assert not [event for event in connection.events if "datapoints" in event]
+
+        assert devices[0]["address"] == ADDRESS
+        assert devices[0]["connected"]
+        datapoints = await connection.call("get", address=ADDRESS)
+        assert [(dp["id"], dp["value"]) for dp in datapoints] == [(1, True)]
+    finally:
+        await gateway.stop()
+
+
+def test_gateway_drives_fake_peripheral() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        asyncio.run(_run_gateway(os.path.join(directory, "gateway.sock")))
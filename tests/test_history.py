@@ -0,0 +1,40 @@
+"""Tests of the datapoint history."""
+
+from __future__ import annotations
+
+from tuya_ble.const import HISTORY_DOWNSAMPLE_FACTOR, TuyaBLEDataPointType
+from tuya_ble.history import TuyaBLEHistory
+
+DEPTH = 2
+
+
+def _fill(type: TuyaBLEDataPointType, values: list) -> list[tuple[float, float]]:
+    history = TuyaBLEHistory(DEPTH)
+    for timestamp, value in enumerate(values):
+        history.add(1, float(timestamp), type, value)
+    return history[1].query()
+
+
+def test_values_are_averaged() -> None:
+    assert HISTORY_DOWNSAMPLE_FACTOR == 8
+    samples = _fill(TuyaBLEDataPointType.DT_VALUE, [1, 2, 3, 6, 10, 20, 30, 40, 7, 8])
+    assert samples == [(7.0, 14.0), (8.0, 7.0), (9.0, 8.0)]
+
+
+def test_enums_keep_most_frequent_state() -> None:
+    samples = _fill(TuyaBLEDataPointType.DT_ENUM, [2, 0, 2, 1, 3, 3, 1, 1, 0, 0])
+    assert samples == [(7.0, 1.0), (8.0, 0.0), (9.0, 0.0)]
+
+
+def test_bools_keep_newest_state_on_tie() -> None:
+    values = [True, False] * 4 + [True, True]
+    samples = _fill(TuyaBLEDataPointType.DT_BOOL, values)
+    assert samples == [(7.0, 0.0), (8.0, 1.0), (9.0, 1.0)]
+
+
+def test_other_types_are_not_recorded() -> None:
+    history = TuyaBLEHistory(DEPTH)
+    history.add(1, 0.0, TuyaBLEDataPointType.DT_STRING, "on")
+    history.add(2, 0.0, TuyaBLEDataPointType.DT_RAW, b"\x01")
+    assert history[1] is None
+    assert history[2] is None
@@ -0,0 +1,25 @@
+"""Test of the import time budget of the protocol package."""
+
+from __future__ import annotations
+
+import importlib.util
+import os
+
+SCRIPT = os.path.join(os.path.dirname(__file__), "..", "scripts", "profile_imports.py")
+
+
+def _load_profiler():
+    spec = importlib.util.spec_from_file_location("profile_imports", SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_import_time_within_budget() -> None:
+    profiler = _load_profiler()
+    # The first run may compile the modules, the best of a few is compared
+    total = min(profiler.total_time(profiler.profile("tuya_ble")) for _ in range(3))
+    assert total <= profiler.IMPORT_BUDGET, (
+        f"tuya_ble imported in {total:.3f}s,"
+        f" budget is {profiler.IMPORT_BUDGET:.3f}s"
+    )
@@ -0,0 +1,128 @@
+"""Tests of the values shown until the device confirms them."""
+
+from __future__ import annotations
+
+import asyncio
+
+from tuya_ble.const import TuyaBLEDataPointType
+from tuya_ble.optimistic import TuyaBLECommandStats, TuyaBLEOptimisticValues
+from tuya_ble.tuya_ble import TuyaBLEDataPoints
+
+TIMEOUT = 0.01
+
+
+class Owner:
+    """Device side of the table, the datapoints are sent elsewhere."""
+
+    async def _send_datapoints(self, datapoint_ids: list[int]) -> bool:
+        return True
+
+
+class Entity:
+    """Entity showing one datapoint through optimistic values."""
+
+    def __init__(self) -> None:
+        self.datapoints = TuyaBLEDataPoints(Owner())
+        self.datapoints._update_from_device(
+            1, 10.0, 0, TuyaBLEDataPointType.DT_BOOL, False
+        )
+        self.datapoint = self.datapoints[1]
+        self.stats = TuyaBLECommandStats()
+        self.shown: list[bool] = []
+        self.optimistic = TuyaBLEOptimisticValues(
+            "fake", TIMEOUT, self.stats, self.on_change
+        )
+
+    def on_change(self) -> None:
+        self.shown.append(self.datapoint.value)
+
+    def report(self, timestamp: float, value: bool) -> None:
+        self.datapoints._update_from_device(
+            1, timestamp, 0, TuyaBLEDataPointType.DT_BOOL, value
+        )
+        self.optimistic.check()
+
+
+def test_acknowledged_value_is_confirmed() -> None:
+    async def run() -> None:
+        entity = Entity()
+        pending = entity.optimistic.set(entity.datapoint, 1)
+        assert entity.shown == [True]
+        entity.optimistic.settle(pending, True)
+        assert entity.stats.confirmed == 1
+        await asyncio.sleep(TIMEOUT * 3)
+        # The timeout was cancelled
+        assert entity.datapoint.value is True
+        assert entity.stats.rolled_back == 0
+
+    asyncio.run(run())
+
+
+def test_reported_value_is_confirmed() -> None:
+    async def run() -> None:
+        entity = Entity()
+        pending = entity.optimistic.set(entity.datapoint, True)
+        # Queued in a batch, settled by the report
+        entity.optimistic.settle(pending, None)
+        entity.report(20.0, True)
+        assert entity.stats.confirmed == 1
+        await asyncio.sleep(TIMEOUT * 3)
+        assert entity.stats.rolled_back == 0
+
+    asyncio.run(run())
+
+
+def test_failed_value_is_rolled_back() -> None:
+    async def run() -> None:
+        entity = Entity()
+        pending = entity.optimistic.set(entity.datapoint, True)
+        entity.optimistic.settle(pending, False)
+        assert entity.shown == [True, False]
+        assert entity.stats.rolled_back == 1
+
+    asyncio.run(run())
+
+
+def test_unconfirmed_value_times_out() -> None:
+    async def run() -> None:
+        entity = Entity()
+        pending = entity.optimistic.set(entity.datapoint, True)
+        await asyncio.sleep(TIMEOUT * 3)
+        assert entity.shown == [True, False]
+        assert entity.stats.rolled_back == 1
+
+        # Acknowledged late, shown again
+        entity.optimistic.settle(pending, True)
+        assert entity.shown == [True, False, True]
+        assert (entity.stats.late, entity.stats.confirmed) == (1, 0)
+
+    asyncio.run(run())
+
+
+def test_late_acknowledgement_after_report_is_ignored() -> None:
+    async def run() -> None:
+        entity = Entity()
+        pending = entity.optimistic.set(entity.datapoint, True)
+        await asyncio.sleep(TIMEOUT * 3)
+        entity.report(20.0, False)
+        entity.optimistic.settle(pending, True)
+        assert entity.datapoint.value is False
+        assert entity.stats.late == 0
+
+    asyncio.run(run())
+
+
+def test_value_set_again_rolls_back_to_confirmed_one() -> None:
+    async def run() -> None:
+        entity = Entity()
+        first = entity.optimistic.set(entity.datapoint, True)
+        second = entity.optimistic.set(entity.datapoint, True)
+        # The first one was replaced and is not settled anymore
+        entity.optimistic.settle(first, False)
+        assert entity.shown == [True, True]
+        # Not to the value of the first one, the device did not confirm it
+        entity.optimistic.settle(second, False)
+        assert entity.shown == [True, True, False]
+        assert entity.stats.rolled_back == 1
+
+    asyncio.run(run())
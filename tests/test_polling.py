@@ -0,0 +1,65 @@
+"""Tests of the poll stagger and the adaptive poll interval."""
+
+from __future__ import annotations
+
+from tuya_ble.polling import TuyaBLEPollInterval, TuyaBLEPollStagger
+
+MIN_INTERVAL = 60
+MAX_INTERVAL = 600
+RESPONSE_WINDOW = 5
+
+
+def test_stagger_spaces_polls_apart() -> None:
+    stagger = TuyaBLEPollStagger(2)
+    assert stagger.reserve(100.0) == 100.0
+    assert stagger.reserve(100.0) == 102.0
+    assert stagger.reserve(101.0) == 104.0
+    # Free again once the spacing passed
+    assert stagger.reserve(200.0) == 200.0
+
+
+def _interval() -> TuyaBLEPollInterval:
+    return TuyaBLEPollInterval(MIN_INTERVAL, MAX_INTERVAL, RESPONSE_WINDOW)
+
+
+def test_backs_off_while_device_pushes() -> None:
+    interval = _interval()
+    assert not interval.back_off()
+    for expected in (120, 240, 480, MAX_INTERVAL, MAX_INTERVAL):
+        interval.on_data(1000.0)
+        assert interval.back_off()
+        assert interval.interval == expected
+    # Counted once per poll
+    assert not interval.back_off()
+
+
+def test_tightens_while_device_only_answers() -> None:
+    interval = _interval()
+    for _ in range(3):
+        interval.on_data(1000.0)
+        interval.back_off()
+    assert interval.interval == 480
+    for expected in (240, 120, MIN_INTERVAL, MIN_INTERVAL):
+        interval.on_poll(2000.0)
+        # The answer to the poll is not pushed data
+        interval.on_data(2000.0 + RESPONSE_WINDOW / 2)
+        assert not interval.back_off()
+        interval.tighten()
+        assert interval.interval == expected
+    interval.on_data(2000.0 + RESPONSE_WINDOW)
+    assert interval.back_off()
+
+
+def test_command_resets_without_backing_off() -> None:
+    interval = _interval()
+    interval.on_data(1000.0)
+    interval.back_off()
+    interval.on_command()
+    assert interval.interval == MIN_INTERVAL
+    # The report of the command result skips the poll but keeps the interval
+    interval.on_data(1001.0)
+    assert interval.back_off()
+    assert interval.interval == MIN_INTERVAL
+    interval.on_data(1100.0)
+    assert interval.back_off()
+    assert interval.interval == 2 * MIN_INTERVAL
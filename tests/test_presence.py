@@ -0,0 +1,92 @@
+"""Tests of the presence estimate."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+
+from tuya_ble import tuya_ble
+from tuya_ble.connection import TuyaBLEConnectionState
+from tuya_ble.const import PRESENCE_MIN_TIMEOUT, PRESENCE_MISSED_ADVERTISEMENTS
+from tuya_ble.gateway import TuyaBLEStaticDeviceManager
+from tuya_ble.presence import TuyaBLEPresence
+from tuya_ble.tuya_ble import TuyaBLEDevice
+
+
+def test_not_heard_yet_is_present() -> None:
+    presence = TuyaBLEPresence()
+    assert presence.is_present(1000.0)
+    assert presence.rssi is None
+    assert presence.timeout() == PRESENCE_MIN_TIMEOUT
+
+
+def test_advertised_smooths_interval_and_rssi() -> None:
+    presence = TuyaBLEPresence()
+    presence.advertised(-60, 100.0)
+    assert presence.interval is None
+    assert presence.rssi == -60
+    presence.advertised(-80, 110.0)
+    assert presence.interval == 10.0
+    assert -80 < presence.rssi < -60
+    presence.advertised(-80, 130.0)
+    assert 10.0 < presence.interval < 20.0
+    assert presence.last_seen == 130.0
+
+
+def test_timeout_follows_interval() -> None:
+    presence = TuyaBLEPresence()
+    presence.refresh(-60, 100.0, 1.0)
+    assert presence.timeout() == PRESENCE_MIN_TIMEOUT
+    interval = PRESENCE_MIN_TIMEOUT
+    presence.refresh(-60, 200.0, interval)
+    assert presence.timeout() == interval * PRESENCE_MISSED_ADVERTISEMENTS
+
+
+def test_is_present_until_timeout() -> None:
+    presence = TuyaBLEPresence()
+    presence.advertised(-60, 100.0)
+    assert presence.is_present(100.0 + PRESENCE_MIN_TIMEOUT)
+    assert not presence.is_present(101.0 + PRESENCE_MIN_TIMEOUT)
+    # Traffic over the connection counts as presence
+    presence.seen(500.0)
+    assert presence.is_present(500.0 + PRESENCE_MIN_TIMEOUT)
+
+
+def test_refresh_ignores_older_advertisements() -> None:
+    presence = TuyaBLEPresence()
+    presence.advertised(-60, 100.0)
+    presence.refresh(-90, 90.0, 2.0)
+    assert presence.last_seen == 100.0
+    assert presence.rssi == -60
+    # The learnt interval is taken anyway
+    assert presence.interval == 2.0
+    presence.refresh(-70, 150.0, None)
+    assert presence.last_seen == 150.0
+    assert presence.rssi == pytest.approx(-62, abs=1)
+    assert presence.interval == 2.0
+
+
+def test_reconnect_waits_while_away(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(tuya_ble, "PRESENCE_RECHECK_INTERVAL", 0.01)
+
+    async def run() -> None:
+        device = TuyaBLEDevice(TuyaBLEStaticDeviceManager(), "AA:BB:CC:DD:EE:FF")
+        attempts = 0
+
+        async def ensure_connected() -> None:
+            nonlocal attempts
+            attempts += 1
+
+        monkeypatch.setattr(device, "_ensure_connected", ensure_connected)
+        device.presence.advertised(-60, time.monotonic() - 2 * PRESENCE_MIN_TIMEOUT)
+        task = asyncio.create_task(device._reconnect())
+        await asyncio.sleep(0.05)
+        assert attempts == 0
+        assert device._connection.state is TuyaBLEConnectionState.BACKOFF
+        device.presence.advertised(-60)
+        await asyncio.wait_for(task, 1)
+        assert attempts == 1
+
+    asyncio.run(run())
@@ -0,0 +1,106 @@
+"""Tests of the notification reassembler."""
+
+from __future__ import annotations
+
+from tuya_ble.reassembler import (
+    DROP_FORMAT,
+    DROP_MISSING,
+    DROP_RESTARTED,
+    DROP_UNEXPECTED,
+    TuyaBLEReassembler,
+)
+from tuya_ble.tuya_ble import TuyaBLEDevice
+
+MESSAGE = bytes(range(40))
+
+
+def _fragments(message: bytes, size: int = 16) -> list[bytes]:
+    fragments = []
+    pos = 0
+    packet_num = 0
+    while pos < len(message):
+        fragment = TuyaBLEDevice._pack_int(packet_num)
+        if packet_num == 0:
+            fragment += TuyaBLEDevice._pack_int(len(message)) + bytes([3 << 4])
+        part = message[pos : pos + size]
+        fragments.append(bytes(fragment + part))
+        pos += len(part)
+        packet_num += 1
+    return fragments
+
+
+def test_in_order() -> None:
+    reassembler = TuyaBLEReassembler()
+    fragments = _fragments(MESSAGE)
+    assert len(fragments) == 3
+    assert reassembler.feed(fragments[0]) is None
+    assert reassembler.feed(fragments[1]) is None
+    assert reassembler.feed(fragments[2]) == MESSAGE
+    assert reassembler.stats["messages"] == 1
+
+
+def test_duplicate_fragment_is_ignored() -> None:
+    reassembler = TuyaBLEReassembler()
+    fragments = _fragments(MESSAGE)
+    assert reassembler.feed(fragments[0]) is None
+    assert reassembler.feed(fragments[1]) is None
+    assert reassembler.feed(fragments[1]) is None
+    assert reassembler.feed(fragments[2]) == MESSAGE
+    assert reassembler.stats["duplicates"] == 1
+
+
+def test_out_of_order_fragment_drops_message() -> None:
+    reassembler = TuyaBLEReassembler()
+    fragments = _fragments(MESSAGE)
+    assert reassembler.feed(fragments[0]) is None
+    assert reassembler.feed(fragments[2]) is None
+    assert reassembler.stats[DROP_MISSING] == 1
+    # The rest of the dropped message is not expected anymore
+    assert reassembler.feed(fragments[1]) is None
+    assert reassembler.stats[DROP_UNEXPECTED] == 1
+    # The next message is reassembled again
+    for fragment in fragments[:-1]:
+        assert reassembler.feed(fragment) is None
+    assert reassembler.feed(fragments[-1]) == MESSAGE
+
+
+def test_restarted_message() -> None:
+    reassembler = TuyaBLEReassembler()
+    fragments = _fragments(MESSAGE)
+    assert reassembler.feed(fragments[0]) is None
+    assert reassembler.feed(fragments[1]) is None
+    assert reassembler.feed(fragments[0]) is None
+    assert reassembler.stats[DROP_RESTARTED] == 1
+    assert reassembler.feed(fragments[1]) is None
+    assert reassembler.feed(fragments[2]) == MESSAGE
+
+
+def test_truncated_first_fragment_is_rejected() -> None:
+    reassembler = TuyaBLEReassembler()
+    fragment = _fragments(MESSAGE)[0]
+    # Packet number and length without the protocol version byte
+    assert reassembler.feed(fragment[:2]) is None
+    assert reassembler.feed(fragment[:1]) is None
+    assert reassembler.stats[DROP_FORMAT] == 2
+    assert reassembler.stats["messages"] == 0
+
+
+def test_retransmission_after_completion_is_accepted() -> None:
+    reassembler = TuyaBLEReassembler()
+    (fragment,) = _fragments(MESSAGE[:8])
+    assert reassembler.feed(fragment) == MESSAGE[:8]
+    # Sent again by the device when our ack was lost
+    assert reassembler.feed(fragment) == MESSAGE[:8]
+    assert reassembler.stats["messages"] == 2
+    assert reassembler.stats["duplicates"] == 0
+
+
+def test_reset_forgets_last_fragment() -> None:
+    reassembler = TuyaBLEReassembler()
+    fragments = _fragments(MESSAGE)
+    assert reassembler.feed(fragments[0]) is None
+    reassembler.reset()
+    assert reassembler.feed(fragments[0]) is None
+    assert reassembler.feed(fragments[1]) is None
+    assert reassembler.feed(fragments[2]) == MESSAGE
+    assert reassembler.stats["duplicates"] == 0
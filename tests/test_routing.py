@@ -0,0 +1,96 @@
+"""Tests of the route ranking and of the routes credited by connections."""
+
+from __future__ import annotations
+
+import asyncio
+
+from bleak.backends.device import BLEDevice
+from bleak.exc import BleakError
+from test_gateway import ADDRESS, CREDENTIALS, FakePeripheral
+
+from tuya_ble.gateway import TuyaBLEStaticDeviceManager
+from tuya_ble.routing import TuyaBLERoute, TuyaBLERouter
+from tuya_ble.tuya_ble import TuyaBLEDevice
+
+BLE_DEVICE = BLEDevice(ADDRESS, "fake", None)
+
+
+def _route(
+    source: str, rssi: int | None, free_slots: int | None = None
+) -> TuyaBLERoute:
+    return TuyaBLERoute(source, BLE_DEVICE, rssi, free_slots)
+
+
+def test_rank_by_rssi_slots_and_failures() -> None:
+    router = TuyaBLERouter()
+    near = _route("near", -50)
+    far = _route("far", -80)
+    full = _route("full", -40, 0)
+    assert router.rank([far, full, near]) == [near, far, full]
+
+    router.begin()
+    router.failed("near")
+    # Failed during this connection, tried last
+    assert router.rank([near, far]) == [far, near]
+    router.begin()
+    assert router.stats["near"].failures == 1
+
+
+def test_fastest_route_is_preferred() -> None:
+    router = TuyaBLERouter()
+    router.succeeded("far", 1.0)
+    router.succeeded("near", 3.0)
+    assert router.preferred == "far"
+    assert router.rank([_route("near", -60), _route("far", -65)])[0].source == "far"
+    router.failed("far")
+    assert router.preferred is None
+
+
+async def _device(peripheral: FakePeripheral) -> TuyaBLEDevice:
+    manager = TuyaBLEStaticDeviceManager()
+    manager.add(ADDRESS, CREDENTIALS)
+    device = TuyaBLEDevice(manager, BLE_DEVICE)
+    device.set_client_factory(peripheral.connect)
+    await device.initialize()
+    return device
+
+
+def test_chosen_route_is_credited_without_resolver() -> None:
+    async def run() -> None:
+        device = await _device(FakePeripheral())
+        device.set_route_provider(lambda: [_route("a", -50), _route("b", -70)])
+        await device._ensure_connected()
+        assert list(device.router.stats) == ["a"]
+        assert device.router.preferred == "a"
+        await device.stop()
+
+    asyncio.run(run())
+
+
+def test_resolved_route_is_credited() -> None:
+    async def run() -> None:
+        peripheral = FakePeripheral()
+        attempts = 0
+
+        async def connect(ble_device, disconnected_callback):
+            nonlocal attempts
+            attempts += 1
+            if attempts == 1:
+                raise BleakError("no slot")
+            return await peripheral.connect(ble_device, disconnected_callback)
+
+        device = await _device(peripheral)
+        device.set_client_factory(connect)
+        # The client went through another route than the one chosen
+        device.set_route_provider(
+            lambda: [_route("a", -50), _route("b", -70)], lambda client: "b"
+        )
+        await device._ensure_connected()
+        assert attempts == 2
+        # The failed connect went through an unknown route
+        assert list(device.router.stats) == ["b"]
+        assert device.router.stats["b"].failures == 0
+        assert device.router.preferred == "b"
+        await device.stop()
+
+    asyncio.run(run())
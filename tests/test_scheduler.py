@@ -0,0 +1,92 @@
+"""Tests of the priority lock guarding the link."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from tuya_ble.exceptions import TuyaBLEDeadlineError
+from tuya_ble.scheduler import TuyaBLEPriority, TuyaBLEScheduler
+
+
+async def _wait(
+    scheduler: TuyaBLEScheduler,
+    priority: TuyaBLEPriority,
+    served: list[str],
+    name: str,
+) -> None:
+    async with scheduler.slot(priority):
+        served.append(name)
+
+
+def test_served_by_priority_then_arrival() -> None:
+    async def run() -> None:
+        scheduler = TuyaBLEScheduler()
+        served: list[str] = []
+        await scheduler.acquire(TuyaBLEPriority.BACKGROUND)
+        tasks = [
+            asyncio.create_task(_wait(scheduler, priority, served, name))
+            for priority, name in (
+                (TuyaBLEPriority.BACKGROUND, "background"),
+                (TuyaBLEPriority.POLL, "poll 1"),
+                (TuyaBLEPriority.INTERACTIVE, "interactive"),
+                (TuyaBLEPriority.POLL, "poll 2"),
+                (TuyaBLEPriority.RESPONSE, "response"),
+            )
+        ]
+        await asyncio.sleep(0)
+        assert scheduler.locked()
+        assert served == []
+        scheduler.release()
+        await asyncio.gather(*tasks)
+        assert served == ["interactive", "response", "poll 1", "poll 2", "background"]
+        assert not scheduler.locked()
+        assert scheduler.stats[TuyaBLEPriority.POLL].count == 2
+
+    asyncio.run(run())
+
+
+def test_deadline_drops_waiter() -> None:
+    async def run() -> None:
+        scheduler = TuyaBLEScheduler()
+        await scheduler.acquire(TuyaBLEPriority.INTERACTIVE)
+        with pytest.raises(TuyaBLEDeadlineError):
+            await scheduler.acquire(TuyaBLEPriority.POLL, 0.01)
+        stats = scheduler.stats[TuyaBLEPriority.POLL]
+        assert (stats.count, stats.dropped) == (0, 1)
+
+        # The dropped waiter is skipped on release
+        served: list[str] = []
+        task = asyncio.create_task(
+            _wait(scheduler, TuyaBLEPriority.BACKGROUND, served, "background")
+        )
+        await asyncio.sleep(0)
+        scheduler.release()
+        await task
+        assert served == ["background"]
+        assert not scheduler.locked()
+
+    asyncio.run(run())
+
+
+def test_cancelled_waiter_passes_the_link_on() -> None:
+    async def run() -> None:
+        scheduler = TuyaBLEScheduler()
+        await scheduler.acquire(TuyaBLEPriority.INTERACTIVE)
+        cancelled = asyncio.create_task(scheduler.acquire(TuyaBLEPriority.RESPONSE))
+        served: list[str] = []
+        waiting = asyncio.create_task(
+            _wait(scheduler, TuyaBLEPriority.POLL, served, "poll")
+        )
+        await asyncio.sleep(0)
+        # The link is handed to the first waiter, cancelled before it runs
+        scheduler.release()
+        cancelled.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await cancelled
+        await waiting
+        assert served == ["poll"]
+        assert not scheduler.locked()
+
+    asyncio.run(run())
@@ -0,0 +1,62 @@
+"""Tests of the window of datapoint report sequence numbers."""
+
+from __future__ import annotations
+
+from struct import pack
+
+from tuya_ble.const import TuyaBLECode, TuyaBLEDataPointType
+from tuya_ble.gateway import TuyaBLEStaticDeviceManager
+from tuya_ble.sequence import TuyaBLESequenceWindow
+from tuya_ble.tuya_ble import TuyaBLEDevice
+
+
+def test_repeated_number_is_detected_once_added() -> None:
+    window = TuyaBLESequenceWindow()
+    assert not window.is_repeated(5)
+    window.add(5)
+    assert window.is_repeated(5)
+    # Adding the same number again is not another report
+    window.add(5)
+    assert window.stats == {"dp_reports": 1, "dp_duplicates": 1}
+
+
+def test_numbers_wrap_around() -> None:
+    window = TuyaBLESequenceWindow(4)
+    for seq_num in (0xFFFE, 0xFFFF, 0, 1):
+        assert not window.is_repeated(seq_num)
+        window.add(seq_num)
+    # Numbers before the wrap are still in the window
+    assert window.is_repeated(0xFFFF)
+    assert window.is_repeated(0)
+    window.add(2)
+    # The oldest number left the window, the device may use it again
+    assert not window.is_repeated(0xFFFE)
+    assert window.is_repeated(2)
+    assert window.stats["dp_reports"] == 5
+
+
+def test_reset_forgets_numbers() -> None:
+    window = TuyaBLESequenceWindow()
+    window.add(7)
+    window.reset()
+    assert not window.is_repeated(7)
+    assert window.stats["dp_reports"] == 1
+
+
+def test_repeated_report_is_parsed_once() -> None:
+    device = TuyaBLEDevice(TuyaBLEStaticDeviceManager(), "AA:BB:CC:DD:EE:FF")
+    reports: list[int] = []
+    device.register_callback(lambda datapoints: reports.append(len(datapoints)))
+
+    def report(dp_seq_num: int, value: int) -> None:
+        data = pack(">HB", dp_seq_num, 0) + pack(
+            ">BBBi", 1, TuyaBLEDataPointType.DT_VALUE.value, 4, value
+        )
+        device._handle_command_or_response(10, 0, TuyaBLECode.FUN_RECEIVE_SIGN_DP, data)
+
+    report(0xFFFF, 1)
+    report(0xFFFF, 1)
+    report(0, 2)
+    # The copy is only acknowledged
+    assert len(reports) == 2
+    assert device._dp_seq_window.stats == {"dp_reports": 2, "dp_duplicates": 1}
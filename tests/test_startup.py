@@ -0,0 +1,74 @@
+"""Tests of the order and the concurrency cap of first connections."""
+
+from __future__ import annotations
+
+import asyncio
+
+from tuya_ble.startup import TuyaBLEStartupSlots, startup_sort_key
+
+
+def test_order_by_priority_then_recency_then_rssi() -> None:
+    devices = {
+        "low priority": (1, 500.0, -40),
+        "not heard": (0, None, None),
+        "old": (0, 100.0, -40),
+        "recent weak": (0, 200.0, -90),
+        "recent strong": (0, 200.0, -50),
+    }
+    order = sorted(devices, key=lambda name: startup_sort_key(*devices[name]))
+    assert order == [
+        "recent strong",
+        "recent weak",
+        "old",
+        "not heard",
+        "low priority",
+    ]
+
+
+def test_connections_are_capped() -> None:
+    async def run() -> None:
+        slots = TuyaBLEStartupSlots(2, 1)
+        in_flight = 0
+        most = 0
+        release = asyncio.Event()
+
+        async def connect() -> None:
+            nonlocal in_flight, most
+            in_flight += 1
+            most = max(most, in_flight)
+            await release.wait()
+            in_flight -= 1
+
+        runs = [
+            asyncio.create_task(slots.run(lambda: asyncio.create_task(connect())))
+            for _ in range(5)
+        ]
+        await asyncio.sleep(0.01)
+        assert in_flight == 2
+        release.set()
+        assert await asyncio.gather(*runs) == [True] * 5
+        assert most == 2
+
+    asyncio.run(run())
+
+
+def test_slow_connection_gives_slot_up() -> None:
+    async def run() -> None:
+        slots = TuyaBLEStartupSlots(1, 0.01)
+        stuck = asyncio.Event()
+        connected: list[str] = []
+
+        async def connect(name: str) -> None:
+            if name == "unreachable":
+                await stuck.wait()
+            connected.append(name)
+
+        assert not await slots.run(lambda: asyncio.create_task(connect("unreachable")))
+        # The next device gets the slot while the first one keeps trying
+        assert await slots.run(lambda: asyncio.create_task(connect("next")))
+        assert connected == ["next"]
+        stuck.set()
+        await asyncio.sleep(0)
+        assert connected == ["next", "unreachable"]
+
+    asyncio.run(run())
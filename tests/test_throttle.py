@@ -0,0 +1,67 @@
+"""Tests of the throttle of sensor state writes."""
+
+from __future__ import annotations
+
+from tuya_ble.throttle import TuyaBLEStateThrottle
+
+MIN_INTERVAL = 10
+MAX_SILENCE = 300
+
+
+def _throttle(
+    deadband: float = 0.2, deadband_relative: float = 0.0
+) -> TuyaBLEStateThrottle:
+    throttle = TuyaBLEStateThrottle(
+        deadband, deadband_relative, MIN_INTERVAL, MAX_SILENCE
+    )
+    assert throttle.check(20.0, True, 0.0) == 0.0
+    throttle.written(20.0, True, 0.0)
+    return throttle
+
+
+def test_changes_within_deadband_wait_for_silence_flush() -> None:
+    throttle = _throttle()
+    assert throttle.check(20.1, True, 100.0) == MAX_SILENCE - 100
+    # The flush is due already
+    assert throttle.check(20.2, True, 150.0) is None
+    assert throttle.check(20.1, True, MAX_SILENCE) == 0.0
+    throttle.written(20.1, True, MAX_SILENCE)
+    assert throttle.check(20.1, True, MAX_SILENCE + 1) == MAX_SILENCE - 1
+
+
+def test_relative_deadband() -> None:
+    throttle = _throttle(0.0, 0.1)
+    assert not throttle.is_significant(21.9)
+    assert throttle.is_significant(22.5)
+    assert throttle.is_significant("unknown")
+
+
+def test_significant_change_waits_for_min_interval() -> None:
+    throttle = _throttle()
+    assert throttle.check(21.0, True, 100.0) == 0.0
+    throttle.written(21.0, True, 100.0)
+    # Too early, written when the interval passed
+    assert throttle.check(22.0, True, 104.0) == MIN_INTERVAL - 4
+    assert throttle.check(23.0, True, 106.0) is None
+    # An insignificant change does not push the write back
+    assert throttle.check(21.1, True, 107.0) is None
+
+
+def test_significant_change_brings_silence_flush_forward() -> None:
+    throttle = _throttle()
+    assert throttle.check(20.1, True, 1.0) == MAX_SILENCE - 1
+    assert throttle.check(25.0, True, 5.0) == MIN_INTERVAL - 5
+
+
+def test_availability_change_is_written_at_once() -> None:
+    throttle = _throttle()
+    assert throttle.check(20.0, False, 1.0) == 0.0
+    throttle.written(20.0, False, 1.0)
+    assert throttle.check(20.0, True, 2.0) == 0.0
+
+
+def test_without_silence_flush_small_changes_are_dropped() -> None:
+    throttle = TuyaBLEStateThrottle(1.0)
+    throttle.written(20.0, True, 0.0)
+    assert throttle.check(20.5, True, 1000.0) is None
+    assert throttle.check(21.5, True, 1000.0) == 0.0
@@ -0,0 +1,118 @@
+"""Tests of datapoints reported with a device timestamp."""
+
+from __future__ import annotations
+
+import asyncio
+from struct import pack
+import time
+
+import pytest
+
+from tuya_ble import tuya_ble
+from tuya_ble.const import TuyaBLEDataPointType
+from tuya_ble.gateway import TuyaBLEStaticDeviceManager
+from tuya_ble.tuya_ble import TuyaBLEDataPointRecord, TuyaBLEDevice
+
+ADDRESS = "AA:BB:CC:DD:EE:FF"
+BURST_DELAY = 0.01
+
+
+@pytest.fixture(autouse=True)
+def _short_burst_delay(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(tuya_ble, "DATAPOINT_BURST_DELAY", BURST_DELAY)
+
+
+def _value(dp_id: int, value: int) -> bytes:
+    return pack(">BBBi", dp_id, TuyaBLEDataPointType.DT_VALUE.value, 4, value)
+
+
+class Device:
+    """Device fed with timed reports, collecting what it passes on."""
+
+    def __init__(self) -> None:
+        self.device = TuyaBLEDevice(TuyaBLEStaticDeviceManager(), ADDRESS)
+        self.history: list[TuyaBLEDataPointRecord] = []
+        self.device.register_callback(lambda datapoints: None)
+        self.device.register_history_callback(self.history.extend)
+
+    def report(self, age: float, value: int, dp_id: int = 1) -> None:
+        self.device._parse_timed_datapoints_v3(
+            time.time() - age, 0, _value(dp_id, value), 0
+        )
+
+    def value(self, dp_id: int = 1) -> int | None:
+        datapoint = self.device.datapoints[dp_id]
+        return None if datapoint is None else datapoint.value
+
+    async def burst_ended(self) -> None:
+        await asyncio.sleep(BURST_DELAY * 5)
+
+
+def test_recent_report_is_live() -> None:
+    async def run() -> None:
+        device = Device()
+        device.report(5, 10)
+        assert device.value() == 10
+        assert device.device._clock_lag == pytest.approx(5, abs=1)
+
+    asyncio.run(run())
+
+
+def test_burst_of_records_does_not_teach_clock_lag() -> None:
+    async def run() -> None:
+        device = Device()
+        for hours in (3, 2, 1):
+            device.report(hours * 3600, hours)
+        assert device.value() is None
+        await device.burst_ended()
+        # The newest record is the value, the older ones are history
+        assert device.value() == 1
+        assert [record.value for record in device.history] == [3, 2]
+        assert device.device._clock_lag is None
+
+        # A later offline burst is historical again
+        device.report(7200, 20)
+        device.report(5400, 21)
+        assert device.value() == 1
+        await device.burst_ended()
+        assert [record.value for record in device.history] == [3, 2, 20, 21]
+
+    asyncio.run(run())
+
+
+def test_single_late_report_teaches_clock_lag() -> None:
+    async def run() -> None:
+        device = Device()
+        device.report(120, 10)
+        await device.burst_ended()
+        assert device.value() == 10
+        assert device.device._clock_lag == pytest.approx(120, abs=1)
+        # Later reports of the late clock are live at once
+        device.report(125, 11)
+        assert device.value() == 11
+
+    asyncio.run(run())
+
+
+def test_clock_lag_is_capped() -> None:
+    async def run() -> None:
+        device = Device()
+        device.report(3600, 10)
+        await device.burst_ended()
+        assert device.device._clock_lag is None
+
+    asyncio.run(run())
+
+
+def test_clock_lag_is_reset_on_disconnect() -> None:
+    async def run() -> None:
+        device = Device()
+        device.report(120, 10)
+        await device.burst_ended()
+        assert device.device._clock_lag is not None
+        device.device._disconnected(None)
+        assert device.device._clock_lag is None
+        device.report(125, 11)
+        assert device.value() == 10
+
+    asyncio.run(run())